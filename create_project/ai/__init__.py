@@ -19,6 +19,7 @@ Main Exports:
     - PromptType: Enum for different prompt types (error_help, suggestions, etc.)
     - GenerationConfig: Configuration for response generation
     - ResponseCacheManager: LRU cache manager for AI responses
+    - SQLiteCacheStore: Incremental SQLite storage for the response cache
     - PromptManager: Template-based prompt management
     - Various exception classes for error handling
 
@@ -86,6 +87,7 @@ from .cache_manager import (
     CacheStats,
     ResponseCacheManager,
 )
+from .cache_store import SQLiteCacheStore
 from .exceptions import (
     AIError,
     CacheError,
@@ -99,6 +101,7 @@ from .response_generator import (
     ResponseGenerator,
     ResponseQuality,
 )
+from .runtime import AIRuntime, get_ai_runtime
 from .types import PromptType
 
 __all__ = [
@@ -114,5 +117,8 @@ __all__ = [
     "ResponseCacheManager",
     "CacheEntry",
     "CacheStats",
+    "SQLiteCacheStore",
     "PromptManager",
+    "AIRuntime",
+    "get_ai_runtime",
 ]
@@ -18,26 +18,54 @@ The facade handles:
 - Structured logging for all operations
 """
 
+import time
 from collections.abc import AsyncGenerator
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from structlog import get_logger
 
 from ..config.config_manager import ConfigManager
 from ..templates.schema.template import Template
+from .cache_keys import error_help_cache_params, normalize_error_message
 from .cache_manager import ResponseCacheManager
 from .context_collector import ErrorContextCollector
 from .exceptions import OllamaNotFoundError
+from .fallback_index import SOURCE_CACHE, BM25Index, HelpDocument, build_help_index
+from .hedging import hedge_first_chunk, hedge_stream
 from .model_manager import ModelInfo, ModelManager
 from .ollama_client import OllamaClient
 from .ollama_detector import OllamaDetector, OllamaStatus
-from .response_generator import GenerationConfig, ResponseGenerator
+from .prompt_budget import CHARS_PER_TOKEN
+from .prompt_manager import PromptManager
+from .response_generator import FALLBACK_RESPONSES, GenerationConfig, ResponseGenerator
+from .single_flight import SingleFlight
 from .types import PromptType
 
 logger = get_logger(__name__)
 
+# Static help per error type, used when no model answer is available
+_FALLBACK_HELP = {
+    "TemplateError": "Template processing failed for '{template_name}'. Check that all required variables are provided and template syntax is correct.",
+    "PathError": "Path-related error occurred. Verify the target directory exists and you have proper permissions.",
+    "GitError": "Git operation failed. Ensure git is installed and properly configured, or disable git integration.",
+    "VirtualEnvError": "Virtual environment creation failed. Check Python installation and available tools (venv, virtualenv, uv).",
+    "ProjectGenerationError": "Project generation failed for template '{template_name}'. Review the template configuration and try again.",
+}
+
+# Share of the query words a cached answer must contain to be reused for a
+# different (but similar) error
+_CACHED_ANSWER_MIN_COVERAGE = 0.6
+
+# Shared by every AIService in the process, so identical help requests from
+# separate generators coalesce into one model call
+_help_flights = SingleFlight()
+
+# Monotonic time of the last model preload per Ollama URL, shared by every
+# AIService so back-to-back generations do not reload the model
+_preloaded_at: Dict[str, float] = {}
+
 
 @dataclass
 class AIServiceConfig:
@@ -50,9 +78,18 @@ class AIServiceConfig:
         cache_enabled: Whether response caching is enabled
         cache_ttl_hours: Cache TTL in hours
         max_cache_entries: Maximum cache entries
+        cache_backend: Cache storage backend ("sqlite" or "json")
         preferred_models: List of preferred models
         context_collection_enabled: Whether to collect error context
-        max_context_size_kb: Maximum context size in KB
+        max_context_size_kb: Maximum size in KB of the error context in
+            help prompts
+        hedge_after_seconds: Seconds to wait for the model's first token
+            before answering help requests locally (0 disables hedging)
+        help_deadline_seconds: Seconds a hedged help request waits for the
+            model's complete answer before answering locally (0 waits for
+            a model that has started answering)
+        model_keep_alive_minutes: How long a preloaded model stays in
+            Ollama's memory (0 disables preloading)
     """
 
     enabled: bool = True
@@ -61,9 +98,13 @@ class AIServiceConfig:
     cache_enabled: bool = True
     cache_ttl_hours: int = 24
     max_cache_entries: int = 100
+    cache_backend: str = "sqlite"
     preferred_models: List[str] = None
     context_collection_enabled: bool = True
     max_context_size_kb: int = 4
+    hedge_after_seconds: float = 0.75
+    help_deadline_seconds: float = 1.0
+    model_keep_alive_minutes: int = 10
 
     def __post_init__(self):
         """Initialize default preferred models."""
@@ -153,6 +194,8 @@ class AIService:
         self._response_generator: Optional[ResponseGenerator] = None
         self._cache_manager: Optional[ResponseCacheManager] = None
         self._context_collector: Optional[ErrorContextCollector] = None
+        self._in_flight = _help_flights
+        self._help_index: Optional[BM25Index] = None
 
         # Initialization flag
         self._initialized = False
@@ -224,8 +267,14 @@ class AIService:
             models = self._model_manager.get_models()
 
             # Initialize response generator
+            # Error context in prompts is limited by the model's budget and
+            # by the configured context size
+            max_context_kb = self.config.max_context_size_kb
+            max_context_tokens = max_context_kb * 1024 // CHARS_PER_TOKEN
             self._response_generator = ResponseGenerator(
-                model_manager=self._model_manager, ollama_client=self._client
+                model_manager=self._model_manager,
+                ollama_client=self._client,
+                max_context_tokens=max_context_tokens,
             )
 
             # Initialize cache manager if enabled
@@ -233,6 +282,7 @@ class AIService:
                 self._cache_manager = ResponseCacheManager(
                     max_size=self.config.max_cache_entries,
                     default_ttl_hours=self.config.cache_ttl_hours,
+                    backend=self.config.cache_backend,
                 )
 
             # Initialize context collector if enabled
@@ -278,6 +328,38 @@ class AIService:
             self._initialized = True
             return self._service_status
 
+    async def prewarm(self) -> Optional[str]:
+        """Preload the model that would answer help requests.
+
+        Loading a model from disk can take tens of seconds on the first
+        request. Calling this when a generation starts means help for a
+        failure is answered by a resident model. A preload is skipped while
+        the previous one for the same Ollama URL is still within the first
+        half of its keep-alive window.
+
+        Returns:
+            Name of the preloaded model, or None if skipped or unavailable
+        """
+        keep_alive = self.config.model_keep_alive_minutes
+        if not self.config.enabled or keep_alive <= 0:
+            return None
+
+        now = time.monotonic()
+        last = _preloaded_at.get(self.config.ollama_url)
+        if last is not None and now - last < keep_alive * 30:
+            return None
+        _preloaded_at[self.config.ollama_url] = now
+
+        try:
+            if not await self.is_available():
+                return None
+            return await self._response_generator.prewarm(
+                keep_alive_minutes=keep_alive
+            )
+        except Exception as e:
+            self.logger.warning("Failed to preload model", error=str(e))
+            return None
+
     async def get_status(self) -> AIServiceStatus:
         """Get current AI service status.
 
@@ -321,9 +403,16 @@ class AIService:
         attempted_operations: Optional[List[str]] = None,
         partial_results: Optional[Dict[str, Any]] = None,
         config: Optional[GenerationConfig] = None,
+        on_upgrade: Optional[Callable[[str], None]] = None,
     ) -> str:
         """Generate AI-powered help response for project generation errors.
 
+        The model's answer is streamed. If its first chunk has not arrived
+        within ``hedge_after_seconds``, or the complete answer within
+        ``help_deadline_seconds``, a local answer is returned instead; the
+        model's answer is still cached (and passed to ``on_upgrade``) when
+        it completes, unless it fails the quality check.
+
         Args:
             error: The error that occurred
             template: Template being processed
@@ -333,9 +422,11 @@ class AIService:
             attempted_operations: Operations that were attempted
             partial_results: Partial results from generation
             config: Generation configuration
+            on_upgrade: Receives the model's answer if it arrives after a
+                local answer was returned
 
         Returns:
-            AI-generated help response
+            AI-generated help response, or a local answer
 
         Raises:
             AIError: If response generation fails
@@ -348,7 +439,7 @@ class AIService:
 
         # Check if service is available
         if not await self.is_available():
-            return self._get_fallback_help_response(error, template)
+            return self._local_help_response(error, template)
 
         try:
             # Collect error context if enabled
@@ -379,39 +470,68 @@ class AIService:
             # Check cache if enabled
             cache_key = None
             if self.config.cache_enabled and self._cache_manager:
-                cache_params = {
-                    "error_type": type(error).__name__,
-                    "error_message": str(error),
-                    "template_name": template.name if template else None,
-                    "context_hash": hash(str(context)) if context else None,
-                }
-                cache_key = self._cache_manager.generate_key(**cache_params)
+                cache_key = self._help_cache_key(error, context, template)
                 cached_response = self._cache_manager.get(cache_key)
 
                 if cached_response:
                     self.logger.debug("Using cached response")
                     return cached_response
 
-            # Generate response using AI
+            # Generate response using AI, sharing identical requests in flight
             generation_config = config or GenerationConfig()
-            response = await self._response_generator.generate_response(
-                prompt_type=PromptType.ERROR_HELP,
-                context={
-                    "error": error,
-                    "error_context": context,
-                    "template": template,
-                    "project_variables": project_variables,
-                    "target_path": str(target_path) if target_path else None,
-                    "options": options,
-                    "attempted_operations": attempted_operations,
-                    "partial_results": partial_results,
-                },
-                config=generation_config,
+            flight_key = self._help_flight_key(
+                cache_key, error, context, template, generation_config
             )
+            prompt_context = {
+                "error": error,
+                "error_context": context,
+                "template": template,
+                "project_variables": project_variables,
+                "target_path": str(target_path) if target_path else None,
+                "options": options,
+                "attempted_operations": attempted_operations,
+                "partial_results": partial_results,
+            }
+
+            if self.config.hedge_after_seconds > 0:
+                # Stream so the budget applies to the first token rather
+                # than to the complete answer
+                stream = self._in_flight.stream(
+                    flight_key,
+                    lambda: self._response_generator.stream_model_response(
+                        prompt_type=PromptType.ERROR_HELP,
+                        context=prompt_context,
+                        config=generation_config,
+                    ),
+                )
+
+                def upgrade(late_response: str) -> None:
+                    if not late_response.strip():
+                        return
+                    self._remember_help_response(cache_key, late_response)
+                    if on_upgrade is not None:
+                        on_upgrade(late_response)
+
+                response, hedged = await hedge_first_chunk(
+                    stream,
+                    lambda: self._local_help_response(error, template),
+                    self.config.hedge_after_seconds,
+                    on_late_result=upgrade,
+                    deadline=self.config.help_deadline_seconds or None,
+                )
+                if hedged or not response.strip():
+                    return response or self._local_help_response(error, template)
+            else:
+                response = await self._in_flight.run(
+                    flight_key,
+                    lambda: self._response_generator.generate_response(
+                        prompt_type=PromptType.ERROR_HELP,
+                        context=prompt_context,
+                        config=generation_config,
+                    ),
+                )
 
-            # Cache the response if enabled
-            if self.config.cache_enabled and self._cache_manager and cache_key:
-                self._cache_manager.put(cache_key, response)
+            self._remember_help_response(cache_key, response)
 
             self.logger.info(
                 "Help response generated successfully",
@@ -427,8 +547,8 @@ class AIService:
                 error=str(e),
                 error_type=type(e).__name__,
             )
-            # Fallback to static help
-            return self._get_fallback_help_response(error, template)
+            # Fallback to local help
+            return self._local_help_response(error, template)
 
     async def stream_help_response(
         self,
@@ -453,6 +573,10 @@ class AIService:
             partial_results: Partial results from generation
             config: Generation configuration
 
+        If the model has not produced its first chunk within
+        ``hedge_after_seconds``, a local answer is streamed first and the
+        model's answer follows it after ``UPGRADE_SEPARATOR``.
+
         Yields:
             Chunks of AI-generated help response
         """
@@ -464,8 +588,7 @@ class AIService:
 
         # Check if service is available
         if not await self.is_available():
-            fallback_response = self._get_fallback_help_response(error, template)
-            yield fallback_response
+            yield self._local_help_response(error, template)
             return
 
         try:
@@ -488,37 +611,51 @@ class AIService:
                         error=str(ctx_error),
                     )
 
-            # Stream response using AI
+            # Stream response using AI; identical streams in flight fan out
+            # from one upstream response
             generation_config = config or GenerationConfig()
-            full_response = ""
-
-            async for chunk in self._response_generator.stream_response(
-                prompt_type=PromptType.ERROR_HELP,
-                context={
-                    "error": error,
-                    "error_context": context,
-                    "template": template,
-                    "project_variables": project_variables,
-                    "target_path": str(target_path) if target_path else None,
-                    "options": options,
-                    "attempted_operations": attempted_operations,
-                    "partial_results": partial_results,
-                },
-                config=generation_config,
-            ):
-                full_response += chunk
+            model_chunks: List[str] = []
+            flight_key = self._help_flight_key(
+                None, error, context, template, generation_config
+            )
+            stream = self._in_flight.stream(
+                flight_key,
+                lambda: self._response_generator.stream_response(
+                    prompt_type=PromptType.ERROR_HELP,
+                    context={
+                        "error": error,
+                        "error_context": context,
+                        "template": template,
+                        "project_variables": project_variables,
+                        "target_path": str(target_path) if target_path else None,
+                        "options": options,
+                        "attempted_operations": attempted_operations,
+                        "partial_results": partial_results,
+                    },
+                    config=generation_config,
+                ),
+            )
+
+            async def model_stream():
+                async for chunk in stream:
+                    model_chunks.append(chunk)
+                    yield chunk
+
+            chunks = model_stream()
+            if self.config.hedge_after_seconds > 0:
+                chunks = hedge_stream(
+                    chunks,
+                    lambda: self._local_help_response(error, template),
+                    self.config.hedge_after_seconds,
+                )
+            async for chunk in chunks:
                 yield chunk
 
-            # Cache the full response if enabled
+            # Cache the model's full response (without any local answer)
+            full_response = "".join(model_chunks)
             if self.config.cache_enabled and self._cache_manager and full_response:
-                cache_params = {
-                    "error_type": type(error).__name__,
-                    "error_message": str(error),
-                    "template_name": template.name if template else None,
-                    "context_hash": hash(str(context)) if context else None,
-                }
-                cache_key = self._cache_manager.generate_key(**cache_params)
-                self._cache_manager.put(cache_key, full_response)
+                cache_key = self._help_cache_key(error, context, template)
+                self._remember_help_response(cache_key, full_response)
 
             self.logger.info(
                 "Streamed help response completed", response_length=len(full_response)
@@ -530,9 +667,8 @@ class AIService:
                 error=str(e),
                 error_type=type(e).__name__,
             )
-            # Fallback to static help
-            fallback_response = self._get_fallback_help_response(error, template)
-            yield fallback_response
+            # Fallback to local help
+            yield self._local_help_response(error, template)
 
     async def get_suggestions(
         self,
@@ -610,6 +746,136 @@ class AIService:
         except Exception as e:
             self.logger.error("Error during AI service cleanup", error=str(e))
 
+    def _remember_help_response(self, cache_key: Optional[str], response: str) -> None:
+        """Cache a model answer and make it available to local answers.
+
+        Args:
+            cache_key: Cache key of the help request, if caching applies
+            response: The model's answer
+        """
+        if not (self.config.cache_enabled and self._cache_manager and cache_key):
+            return
+        self._cache_manager.put(cache_key, response)
+        if self._help_index is not None and response.strip():
+            self._help_index.add(
+                HelpDocument(f"cache:{cache_key}", response, SOURCE_CACHE)
+            )
+
+    def _get_help_index(self) -> BM25Index:
+        """Local help index, built on first use."""
+        if self._help_index is None:
+            cached_answers = []
+            if self._cache_manager is not None:
+                try:
+                    cached_answers = self._cache_manager.items()
+                except Exception as e:
+                    self.logger.warning(
+                        "Failed to read cached help answers", error=str(e)
+                    )
+            fallback_texts = [
+                text.format(template_name="the template", error="")
+                for text in _FALLBACK_HELP.values()
+            ]
+            fallback_texts += FALLBACK_RESPONSES[PromptType.ERROR_HELP]
+            fallback_texts += FALLBACK_RESPONSES[PromptType.GENERIC_HELP]
+            self._help_index = build_help_index(
+                fallback_texts, PromptManager.DEFAULT_TEMPLATE_DIR, cached_answers
+            )
+            self.logger.debug("Local help index built", documents=len(self._help_index))
+        return self._help_index
+
+    def _local_help_response(
+        self, error: Exception, template: Optional[Template] = None
+    ) -> str:
+        """Best help answer available without the model.
+
+        A cached model answer to a similar error is reused as is; otherwise
+        the static fallback help is extended with the most relevant local
+        guidance.
+
+        Args:
+            error: The error that occurred
+            template: Template being processed
+
+        Returns:
+            Local help response
+        """
+        static_response = self._get_fallback_help_response(error, template)
+        query = f"{type(error).__name__} {normalize_error_message(str(error))}"
+        try:
+            hits = self._get_help_index().search(query, limit=4)
+        except Exception as e:
+            self.logger.warning("Local help search failed", error=str(e))
+            return static_response
+
+        for hit in hits:
+            if (
+                hit.document.source == SOURCE_CACHE
+                and hit.coverage >= _CACHED_ANSWER_MIN_COVERAGE
+            ):
+                self.logger.debug("Answering from a similar cached response")
+                return hit.document.text
+
+        guidance = [
+            hit.document.text
+            for hit in hits
+            if hit.document.source != SOURCE_CACHE
+            and hit.document.text not in static_response
+        ][:3]
+        if not guidance:
+            return static_response
+        tips = "\n".join(f"- {text}" for text in guidance)
+        return f"{static_response}\n\nRelated Guidance:\n{tips}"
+
+    def _help_cache_key(
+        self, error: Exception, context: Any, template: Optional[Template]
+    ) -> str:
+        """Derive the cache key of a help response.
+
+        The key only depends on the normalized failure class, so the same
+        failure in a later run hits responses cached on disk.
+
+        Args:
+            error: The error help is requested for
+            context: Collected error context, if any
+            template: Template being processed
+
+        Returns:
+            Cache key
+        """
+        manager = self._cache_manager or ResponseCacheManager
+        return manager.generate_key(
+            **error_help_cache_params(
+                error, context, template_name=template.name if template else None
+            )
+        )
+
+    def _help_flight_key(
+        self,
+        cache_key: Optional[str],
+        error: Exception,
+        context: Any,
+        template: Optional[Template],
+        generation_config: GenerationConfig,
+    ) -> str:
+        """Key under which identical in-flight help requests are coalesced.
+
+        Requests coalesce when they share the help cache key and the
+        generation settings.
+
+        Args:
+            cache_key: Help cache key, if already derived
+            error: The error help is requested for
+            context: Collected error context, if any
+            template: Template being processed
+            generation_config: Generation settings of the request
+
+        Returns:
+            Coalescing key
+        """
+        cache_key = cache_key or self._help_cache_key(error, context, template)
+        return f"{cache_key}:{generation_config!r}"
+
     def _get_fallback_help_response(
         self, error: Exception, template: Optional[Template] = None
     ) -> str:
@@ -625,17 +891,9 @@ class AIService:
         error_type = type(error).__name__
         template_name = template.name if template else "unknown"
 
-        fallback_responses = {
-            "TemplateError": f"Template processing failed for '{template_name}'. Check that all required variables are provided and template syntax is correct.",
-            "PathError": "Path-related error occurred. Verify the target directory exists and you have proper permissions.",
-            "GitError": "Git operation failed. Ensure git is installed and properly configured, or disable git integration.",
-            "VirtualEnvError": "Virtual environment creation failed. Check Python installation and available tools (venv, virtualenv, uv).",
-            "ProjectGenerationError": f"Project generation failed for template '{template_name}'. Review the template configuration and try again.",
-        }
-
-        base_response = fallback_responses.get(
-            error_type, f"An error occurred during project generation: {str(error)}"
-        )
+        base_response = _FALLBACK_HELP.get(
+            error_type, "An error occurred during project generation: {error}"
+        ).format(template_name=template_name, error=error)
 
         return f"""
 {base_response}
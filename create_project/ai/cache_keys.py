@@ -0,0 +1,132 @@
+# ABOUTME: Stable cache key derivation for AI error-help responses
+# ABOUTME: Normalizes volatile error details so recurring failures hit the cache across runs
+
+"""
+Cache key derivation for AI error-help responses.
+
+Help responses are cached on disk, so their keys must be identical for the
+same kind of failure in a later process. Raw error messages are not: they
+embed absolute paths, temporary directories, line numbers, PIDs, object
+addresses and UUIDs, and Python's built-in ``hash()`` is randomized per
+process. This module reduces an error and its ``CompleteErrorContext`` to a
+canonical description of the failure class and hashes it with SHA-256.
+
+Only fields that describe the failure are kept: error type, normalized
+message and validation errors, the failing file (not line), template name
+and version, missing variables, attempted operations, option names, OS and
+Python minor version. Timestamps, project variables, target paths,
+environment variables and disk space are left out.
+
+``KEY_VERSION`` is part of every key. Bump it whenever the normalization
+changes so entries derived with the old rules stop matching.
+"""
+
+import hashlib
+import json
+import re
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+
+from .context_collector import CompleteErrorContext
+
+# Version of the normalization rules, recorded in every key
+KEY_VERSION = 1
+
+# Applied in order: specific shapes first, then paths, then bare numbers
+_NORMALIZATION_PATTERNS: List[Tuple[Pattern[str], str]] = [
+    (
+        re.compile(
+            r"\b[0-9a-fA-F]{8}-(?:[0-9a-fA-F]{4}-){3}[0-9a-fA-F]{12}\b"
+        ),
+        "<uuid>",
+    ),
+    (re.compile(r"\b0x[0-9a-fA-F]+\b"), "<addr>"),
+    (
+        re.compile(
+            r"[^\s'\"]*?[\\/](?:te?mp|var[\\/]folders|AppData[\\/]Local[\\/]Temp)[\\/]"
+            r"[^\s'\"]*",
+            re.IGNORECASE,
+        ),
+        "<tmp>",
+    ),
+    (re.compile(r"(?:[A-Za-z]:\\|\\\\)[^\s'\"]*"), "<path>"),
+    (re.compile(r"(?<![\w.])/[^\s'\"]+"), "<path>"),
+    (re.compile(r"\d+(?:\.\d+)*"), "<n>"),
+]
+
+
+def normalize_error_message(message: str) -> str:
+    """Mask the volatile parts of an error message.
+
+    Args:
+        message: Raw or sanitized error message
+
+    Returns:
+        Message with UUIDs, addresses, temp dirs, paths and numbers replaced
+        by placeholders, and whitespace collapsed
+    """
+    text = str(message)
+    for pattern, replacement in _NORMALIZATION_PATTERNS:
+        text = pattern.sub(replacement, text)
+    return " ".join(text.split())
+
+
+def _error_file(location: Optional[str]) -> Optional[str]:
+    """File name of a traceback location line, without directory or line."""
+    if not location:
+        return None
+    match = re.search(r'File "([^"]+)"', location)
+    if not match:
+        return None
+    return re.split(r"[\\/]", match.group(1))[-1]
+
+
+def _context_fields(context: CompleteErrorContext) -> Dict[str, Any]:
+    """Canonical, run-independent subset of an error context."""
+    python_version = ".".join(str(context.system.python_version).split(".")[:2])
+    return {
+        "os": context.system.os_name,
+        "python": python_version,
+        "error_type": context.error.error_type,
+        "error_file": _error_file(context.error.error_location),
+        "original_error": normalize_error_message(context.error.original_error)
+        if context.error.original_error
+        else None,
+        "validation_errors": sorted(
+            normalize_error_message(error)
+            for error in context.error.validation_errors or []
+        ),
+        "template": context.template.template_name,
+        "template_version": context.template.template_version,
+        "missing_variables": sorted(context.template.missing_variables or []),
+        "attempted_operations": list(context.project.attempted_operations or []),
+        "options": sorted(context.project.options or {}),
+    }
+
+
+def error_help_cache_params(
+    error: Exception,
+    context: Optional[CompleteErrorContext] = None,
+    template_name: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Build stable cache key parameters for an error-help request.
+
+    Args:
+        error: The exception help was requested for
+        context: Collected error context, if any
+        template_name: Name of the template being generated
+
+    Returns:
+        Parameters for ``ResponseCacheManager.generate_key``
+    """
+    context_hash = None
+    if isinstance(context, CompleteErrorContext):
+        canonical = json.dumps(_context_fields(context), sort_keys=True, default=str)
+        context_hash = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    return {
+        "key_version": KEY_VERSION,
+        "error_type": type(error).__name__,
+        "error_message": normalize_error_message(str(error)),
+        "template_name": template_name,
+        "context_hash": context_hash,
+    }
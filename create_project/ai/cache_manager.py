@@ -1,4 +1,4 @@
-# ABOUTME: LRU cache system for AI responses with TTL expiration and JSON persistence
+# ABOUTME: LRU cache system for AI responses with TTL expiration and JSON/SQLite persistence
 # ABOUTME: Thread-safe operations with configurable size limits and automatic cleanup
 
 """LRU cache management system for AI response caching.
@@ -13,6 +13,7 @@ Key Features:
     - TTL expiration with configurable per-entry lifetimes
     - Thread-safe operations using RLock for concurrent access
     - JSON file persistence with atomic write operations
+    - Incremental SQLite (WAL) persistence shared safely between processes
     - Automatic cache key generation from request parameters
     - Comprehensive statistics tracking (hits, misses, evictions)
     - Auto-persistence with configurable intervals
@@ -69,21 +70,33 @@ Usage Example:
 The cache manager automatically handles file persistence, creating cache files
 in the user's cache directory (platform-specific) and supports cache file
 rotation to prevent unlimited growth.
+
+Storage Backends:
+    - ``json`` (default): the whole cache is loaded at startup and rewritten
+      on persist. Cache hits only update memory; their access counts are
+      saved with the next write.
+    - ``sqlite``: entries live in a SQLite database in WAL mode (see
+      ``cache_store``). Puts and deletes write single rows, entries are
+      loaded on first use, access counts are flushed in batches by
+      ``persist()``, and several processes can share one cache file.
+      Hit/miss statistics are kept per process.
 """
 
 import hashlib
 import json
+import os
 import threading
 import time
 from collections import OrderedDict
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import structlog
 from platformdirs import user_cache_dir
 
+from .cache_store import SQLiteCacheStore
 from .exceptions import CacheError
 
 logger = structlog.get_logger(__name__)
@@ -141,27 +154,31 @@ class CacheStats:
 
 class ResponseCacheManager:
     """
-    LRU cache manager for AI responses with TTL expiration and JSON persistence.
+    LRU cache manager for AI responses with TTL expiration and persistence.
 
     Features:
     - LRU (Least Recently Used) eviction policy
     - TTL (Time To Live) expiration with 24-hour default
     - Thread-safe operations with RLock
-    - JSON file persistence in user cache directory
+    - JSON or SQLite persistence in user cache directory
     - Cache key generation from request parameters
     - Cache statistics and monitoring
     - Automatic cleanup and file rotation
     """
 
+    BACKENDS = ("json", "sqlite")
+    DEFAULT_FILENAMES = {"json": "ai_responses.json", "sqlite": "ai_responses.db"}
+
     def __init__(
         self,
         max_size: int = 100,
         default_ttl_hours: int = 24,
         cache_dir: Optional[Path] = None,
-        cache_filename: str = "ai_responses.json",
+        cache_filename: Optional[str] = None,
         auto_persist: bool = True,
-        persist_interval: int = 300,
-    ):  # 5 minutes
+        persist_interval: int = 300,  # 5 minutes
+        backend: str = "json",
+    ):
         """
         Initialize the response cache manager.
 
@@ -169,10 +186,21 @@ class ResponseCacheManager:
             max_size: Maximum number of cache entries
             default_ttl_hours: Default TTL for entries in hours
             cache_dir: Directory for cache files (default: platformdirs cache)
-            cache_filename: Name of cache file
+            cache_filename: Name of cache file (default depends on backend)
             auto_persist: Whether to auto-persist cache changes
             persist_interval: Interval between auto-persist operations (seconds)
+            backend: Storage backend, "json" or "sqlite"
+
+        Raises:
+            ValueError: If the backend is unknown
+            CacheError: If the SQLite database cannot be opened
         """
+        if backend not in self.BACKENDS:
+            raise ValueError(
+                f"Unknown cache backend '{backend}' (expected one of {self.BACKENDS})"
+            )
+
+        self.backend = backend
         self.max_size = max_size
         self.default_ttl = timedelta(hours=default_ttl_hours)
         self.auto_persist = auto_persist
@@ -185,7 +213,9 @@ class ResponseCacheManager:
             self.cache_dir = Path(cache_dir)
 
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.cache_file = self.cache_dir / cache_filename
+        self.cache_file = self.cache_dir / (
+            cache_filename or self.DEFAULT_FILENAMES[backend]
+        )
 
         # Thread safety
         self._lock = threading.RLock()
@@ -200,21 +230,34 @@ class ResponseCacheManager:
         self._last_persist_time = time.time()
         self._dirty = False
 
+        # SQLite backend: entries load lazily, access counts are batched
+        self._store: Optional[SQLiteCacheStore] = None
+        self._pending_access: Dict[str, Tuple[int, datetime]] = {}
+
         # Load existing cache
-        self._load_cache()
+        if backend == "sqlite":
+            self._store = SQLiteCacheStore(self.cache_file)
+            self._import_json_cache()
+        else:
+            self._load_cache()
 
         logger.info(
             "Cache manager initialized",
             max_size=max_size,
             cache_dir=str(self.cache_dir),
             cache_file=str(self.cache_file),
-            existing_entries=len(self._cache),
+            backend=backend,
+            existing_entries=self._entry_count(),
         )
 
-    def generate_key(self, **params: Any) -> str:
+    @staticmethod
+    def generate_key(**params: Any) -> str:
         """
         Generate a cache key from request parameters.
 
+        Keys only depend on the parameters, so this can also be called on
+        the class.
+
         Args:
             **params: Request parameters to hash
 
@@ -245,6 +288,8 @@ class ResponseCacheManager:
         """
         with self._lock:
             entry = self._cache.get(key)
+            if entry is None and self._store is not None:
+                entry = self._load_entry(key)
 
             if entry is None:
                 self._stats.misses += 1
@@ -254,15 +299,21 @@ class ResponseCacheManager:
             if entry.is_expired():
                 logger.debug("Cache entry expired", key=key[:16])
                 self._remove_entry(key)
+                self._delete_stored([key])
                 self._stats.misses += 1
                 self._stats.expired_entries += 1
                 return None
 
-            # Update access info and move to end (most recently used)
+            # Update access info and move to end (most recently used).
+            # Hits are not written on their own: the JSON backend saves
+            # them with the next write, the SQLite backend in batches.
             entry.access()
             self._cache.move_to_end(key)
             self._stats.hits += 1
-            self._mark_dirty()
+            if self._store is not None:
+                count, _ = self._pending_access.get(key, (0, entry.last_accessed))
+                self._pending_access[key] = (count + 1, entry.last_accessed)
+                self._auto_persist_if_needed()
 
             logger.debug("Cache hit", key=key[:16], access_count=entry.access_count)
             return entry.value
@@ -296,6 +347,15 @@ class ResponseCacheManager:
             self._cache[key] = entry
             self._cache.move_to_end(key)  # Mark as most recently used
 
+            if self._store is not None:
+                self._pending_access.pop(key, None)
+                try:
+                    self._store.put(entry)
+                except CacheError as e:
+                    logger.warning(
+                        "Failed to store cache entry", key=key[:16], error=str(e)
+                    )
+
             # Check if we need to evict entries
             self._evict_if_needed()
 
@@ -315,12 +375,14 @@ class ResponseCacheManager:
             True if entry was removed, False if not found
         """
         with self._lock:
-            if key in self._cache:
-                self._remove_entry(key)
+            removed = key in self._cache
+            self._remove_entry(key)
+            removed = self._delete_stored([key]) > 0 or removed
+
+            if removed:
                 self._mark_dirty()
                 logger.debug("Cache delete", key=key[:16])
-                return True
-            return False
+            return removed
 
     def clear(self) -> int:
         """
@@ -332,6 +394,9 @@ class ResponseCacheManager:
         with self._lock:
             count = len(self._cache)
             self._cache.clear()
+            if self._store is not None:
+                self._pending_access.clear()
+                count = self._store.clear()
             self._stats.total_entries = 0
             self._mark_dirty()
             logger.info("Cache cleared", entries_removed=count)
@@ -353,20 +418,47 @@ class ResponseCacheManager:
                 self._remove_entry(key)
                 self._stats.expired_entries += 1
 
+            if self._store is not None:
+                stored_keys = set(self._store.delete_expired(datetime.now()))
+                self._stats.expired_entries += len(stored_keys - set(expired_keys))
+                expired_keys = list(stored_keys | set(expired_keys))
+
             if expired_keys:
                 self._mark_dirty()
                 logger.info("Expired entries cleaned up", count=len(expired_keys))
 
             return len(expired_keys)
 
+    def items(self) -> List[Tuple[str, Any]]:
+        """
+        Keys and values of all unexpired entries.
+
+        Reading entries this way does not count as access, so it does not
+        affect hit statistics or LRU order.
+
+        Returns:
+            (key, value) pairs, least recently used first
+        """
+        with self._lock:
+            entries = (
+                [CacheEntry(*stored) for stored in self._store.entries()]
+                if self._store is not None
+                else list(self._cache.values())
+            )
+            return [
+                (entry.key, entry.value) for entry in entries if not entry.is_expired()
+            ]
+
     def get_stats(self) -> CacheStats:
         """Get current cache statistics."""
         with self._lock:
             # Update current stats
-            self._stats.total_entries = len(self._cache)
+            self._stats.total_entries = self._entry_count()
             self._stats.total_size_bytes = self._estimate_cache_size()
 
-            if self.cache_file.exists():
+            if self._store is not None:
+                self._stats.cache_file_size = self._store.file_size()
+            elif self.cache_file.exists():
                 self._stats.cache_file_size = self.cache_file.stat().st_size
 
             return self._stats
@@ -375,6 +467,9 @@ class ResponseCacheManager:
         """
         Persist cache to disk.
 
+        With the SQLite backend entries are already stored, so this only
+        flushes batched access counts.
+
         Args:
             force: Force persist even if cache is clean
 
@@ -382,6 +477,9 @@ class ResponseCacheManager:
             True if persisted, False if no changes or error
         """
         with self._lock:
+            if self._store is not None:
+                return self._flush_accesses(force)
+
             if not (self._dirty or force):
                 return False
 
@@ -407,12 +505,13 @@ class ResponseCacheManager:
                         else None,
                     }
 
-                # Write to temporary file first, then rename (atomic operation)
-                temp_file = self.cache_file.with_suffix(".tmp")
+                # Write to a per-process temporary file first, then replace
+                # (atomic, and concurrent processes never share a temp file)
+                temp_file = self.cache_file.with_suffix(f".{os.getpid()}.tmp")
                 with temp_file.open("w", encoding="utf-8") as f:
                     json.dump(cache_data, f, indent=2)
 
-                temp_file.rename(self.cache_file)
+                os.replace(temp_file, self.cache_file)
 
                 self._dirty = False
                 self._last_persist_time = time.time()
@@ -424,14 +523,99 @@ class ResponseCacheManager:
                 logger.error("Failed to persist cache", error=str(e), exc_info=True)
                 raise CacheError(f"Failed to persist cache: {e}")
 
-    def _load_cache(self) -> None:
-        """Load cache from disk."""
-        if not self.cache_file.exists():
+    def _flush_accesses(self, force: bool) -> bool:
+        """Write batched access counts to the SQLite store."""
+        if not (self._pending_access or force):
+            return False
+
+        try:
+            self._store.record_accesses(self._pending_access)
+        except CacheError as e:
+            logger.error("Failed to persist cache", error=str(e))
+            raise
+
+        flushed = len(self._pending_access)
+        self._pending_access.clear()
+        self._dirty = False
+        self._last_persist_time = time.time()
+        logger.debug("Cache access counts persisted", entries=flushed)
+        return True
+
+    def _load_entry(self, key: str) -> Optional[CacheEntry]:
+        """Load one entry from the SQLite store into memory."""
+        try:
+            stored = self._store.get(key)
+        except CacheError as e:
+            logger.warning("Failed to read cache entry", key=key[:16], error=str(e))
+            return None
+        if stored is None:
+            return None
+
+        entry = CacheEntry(*stored)
+        self._cache[key] = entry
+        # Memory holds the most recently used entries; the store holds all
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+        return entry
+
+    def _delete_stored(self, keys: List[str]) -> int:
+        """Delete entries from the SQLite store, if there is one."""
+        if self._store is None:
+            return 0
+        try:
+            return self._store.delete(keys)
+        except CacheError as e:
+            logger.warning(
+                "Failed to delete cache entries", count=len(keys), error=str(e)
+            )
+            return 0
+
+    def _entry_count(self) -> int:
+        """Number of cached entries, including ones not loaded yet."""
+        if self._store is not None:
+            try:
+                return self._store.count()
+            except CacheError:
+                pass
+        return len(self._cache)
+
+    def close(self) -> None:
+        """Persist pending changes and release the cache file."""
+        with self._lock:
+            try:
+                self.persist()
+            except CacheError as e:
+                logger.warning("Failed to persist cache on close", error=str(e))
+            if self._store is not None:
+                self._store.close()
+
+    def _import_json_cache(self) -> None:
+        """Move entries from a JSON cache file into a new SQLite store."""
+        json_file = self.cache_dir / self.DEFAULT_FILENAMES["json"]
+        if not json_file.exists() or self._store.count() > 0:
+            return
+
+        self._load_cache(json_file)
+        for entry in self._cache.values():
+            self._store.put(entry)
+        self._evict_if_needed()
+        try:
+            json_file.rename(json_file.with_suffix(".json.imported"))
+        except FileNotFoundError:
+            # Another process imported and moved the file first
+            logger.debug("JSON cache already imported by another process")
+            return
+        logger.info("JSON cache imported", entries=len(self._cache))
+
+    def _load_cache(self, cache_file: Optional[Path] = None) -> None:
+        """Load cache from disk (default: the configured cache file)."""
+        cache_file = cache_file or self.cache_file
+        if not cache_file.exists():
             logger.debug("No existing cache file found")
             return
 
         try:
-            with self.cache_file.open("r", encoding="utf-8") as f:
+            with cache_file.open("r", encoding="utf-8") as f:
                 cache_data = json.load(f)
 
             # Load entries
@@ -487,6 +671,20 @@ class ResponseCacheManager:
 
     def _evict_if_needed(self) -> None:
         """Evict least recently used entries if cache is full."""
+        if self._store is not None:
+            try:
+                # Flush first so the store's LRU order includes recent hits
+                self._flush_accesses(force=False)
+                evicted = self._store.evict_lru(self.max_size)
+            except CacheError as e:
+                logger.warning("Cache eviction failed", error=str(e))
+                return
+            for key in evicted:
+                self._remove_entry(key)
+                logger.debug("LRU eviction", evicted_key=key[:16])
+            self._stats.evictions += len(evicted)
+            return
+
         while len(self._cache) > self.max_size:
             # Get least recently used key (first item in OrderedDict)
             lru_key = next(iter(self._cache))
@@ -496,6 +694,7 @@ class ResponseCacheManager:
 
     def _remove_entry(self, key: str) -> None:
         """Remove an entry from cache."""
+        self._pending_access.pop(key, None)
         if key in self._cache:
             del self._cache[key]
             self._stats.total_entries = len(self._cache)
@@ -518,6 +717,12 @@ class ResponseCacheManager:
 
     def _estimate_cache_size(self) -> int:
         """Estimate the size of cache in bytes."""
+        if self._store is not None:
+            try:
+                return self._store.value_bytes()
+            except CacheError:
+                return 0
+
         try:
             # Rough estimation using JSON serialization
             sample_data = {}
@@ -558,7 +763,13 @@ class ResponseCacheManager:
             }
 
             # Add entry information
-            for key, entry in self._cache.items():
+            entries = (
+                [CacheEntry(*stored) for stored in self._store.entries()]
+                if self._store is not None
+                else list(self._cache.values())
+            )
+            for entry in entries:
+                key = entry.key
                 entry_info = {
                     "key": key[:16] + "..." if len(key) > 16 else key,
                     "created_at": entry.created_at.isoformat(),
@@ -582,13 +793,16 @@ class ResponseCacheManager:
         """
         Rotate cache file when it gets too large.
 
+        The SQLite backend is bounded by ``max_size`` and shared with other
+        processes, so its database is never rotated.
+
         Args:
             backup_count: Number of backup files to keep
 
         Returns:
             True if rotation occurred, False otherwise
         """
-        if not self.cache_file.exists():
+        if self._store is not None or not self.cache_file.exists():
             return False
 
         try:
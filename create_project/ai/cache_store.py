@@ -0,0 +1,303 @@
+# ABOUTME: SQLite (WAL mode) storage backend for the AI response cache
+# ABOUTME: Per-entry writes, lazy reads and batched access updates shared across processes
+
+"""SQLite storage backend for AI response caching.
+
+This module provides SQLiteCacheStore, the incremental storage used by
+ResponseCacheManager when ``backend="sqlite"``. Unlike the JSON backend,
+which rewrites the whole cache file on every persist and parses it at
+startup, the store writes and reads one entry at a time:
+
+    - ``put`` and ``delete`` write only the affected rows
+    - ``get`` loads a single entry on demand, so startup reads nothing
+    - access counts are applied as batched deltas by ``record_accesses``
+    - LRU eviction and expiry run as single SQL statements
+
+The database runs in write-ahead-log (WAL) mode, so concurrent CLI and GUI
+processes can read while another one writes, and writers wait for each
+other (up to ``timeout`` seconds) instead of overwriting each other's
+entries. Access counts are stored as increments, so hits recorded by
+several processes add up.
+
+Timestamps are stored as POSIX seconds so expiry and LRU order can use
+indexes. Values must be JSON-serializable, as with the JSON backend.
+Entries are exchanged as ``StoredEntry`` tuples in CacheEntry field order,
+so ``CacheEntry(*stored)`` rebuilds an entry.
+"""
+
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import structlog
+
+from .exceptions import CacheError
+
+logger = structlog.get_logger(__name__)
+
+# (key, value, created_at, expires_at, access_count, last_accessed)
+StoredEntry = Tuple[str, Any, datetime, datetime, int, Optional[datetime]]
+
+# Bump when the table layout changes; older databases are recreated
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    access_count INTEGER NOT NULL DEFAULT 0,
+    last_accessed REAL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used);
+CREATE INDEX IF NOT EXISTS entries_expires_at ON entries (expires_at);
+"""
+
+class SQLiteCacheStore:
+    """
+    Cache entries in a SQLite database shared between processes.
+
+    All methods are thread-safe. Database errors are raised as CacheError.
+    """
+
+    def __init__(self, path: Path, timeout: float = 5.0):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: Database file path
+            timeout: Seconds to wait for another process's write lock
+
+        Raises:
+            CacheError: If the database cannot be opened
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+        try:
+            self._conn = sqlite3.connect(
+                str(self.path), timeout=timeout, check_same_thread=False
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            # WAL with NORMAL sync stays consistent; a crash can only lose
+            # the last commits, which is acceptable for a cache
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._migrate()
+        except sqlite3.Error as e:
+            raise CacheError(f"Failed to open cache database {self.path}: {e}") from e
+
+    def _migrate(self) -> None:
+        """Create the schema, dropping tables from an older layout."""
+        with self._conn:
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != SCHEMA_VERSION:
+                self._conn.execute("DROP TABLE IF EXISTS entries")
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run statements in one transaction under the store lock."""
+        with self._lock:
+            try:
+                with self._conn:
+                    yield self._conn
+            except sqlite3.Error as e:
+                raise CacheError(f"Cache database error: {e}") from e
+
+    def get(self, key: str) -> Optional[StoredEntry]:
+        """
+        Load one entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Stored entry, or None if the key is not stored
+        """
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT key, value, created_at, expires_at, access_count, "
+                "last_accessed FROM entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+        return _decode_row(row) if row else None
+
+    def put(self, entry: Any) -> None:
+        """
+        Insert or replace one entry.
+
+        Args:
+            entry: CacheEntry (or any object with its fields) to store
+        """
+        created_at = entry.created_at.timestamp()
+        last_accessed = entry.last_accessed.timestamp() if entry.last_accessed else None
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO entries "
+                "(key, value, created_at, expires_at, access_count, last_accessed, "
+                "last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    entry.key,
+                    json.dumps(entry.value),
+                    created_at,
+                    entry.expires_at.timestamp(),
+                    entry.access_count,
+                    last_accessed,
+                    last_accessed or created_at,
+                ),
+            )
+
+    def delete(self, keys: Iterable[str]) -> int:
+        """
+        Remove entries.
+
+        Args:
+            keys: Cache keys to remove
+
+        Returns:
+            Number of entries removed
+        """
+        with self._transaction() as conn:
+            cursor = conn.executemany(
+                "DELETE FROM entries WHERE key = ?", [(key,) for key in keys]
+            )
+            return cursor.rowcount
+
+    def clear(self) -> int:
+        """
+        Remove all entries.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._transaction() as conn:
+            return conn.execute("DELETE FROM entries").rowcount
+
+    def record_accesses(self, accesses: Dict[str, Tuple[int, datetime]]) -> None:
+        """
+        Apply batched access updates.
+
+        Counts are added to the stored ones, so hits recorded by other
+        processes are kept.
+
+        Args:
+            accesses: Mapping of key to (new accesses, last access time)
+        """
+        if not accesses:
+            return
+        with self._transaction() as conn:
+            conn.executemany(
+                "UPDATE entries SET access_count = access_count + ?, "
+                "last_accessed = MAX(COALESCE(last_accessed, 0), ?), "
+                "last_used = MAX(last_used, ?) WHERE key = ?",
+                [
+                    (count, accessed.timestamp(), accessed.timestamp(), key)
+                    for key, (count, accessed) in accesses.items()
+                ],
+            )
+
+    def delete_expired(self, now: datetime) -> List[str]:
+        """
+        Remove entries that expired before ``now``.
+
+        Args:
+            now: Current time
+
+        Returns:
+            Keys of the removed entries
+        """
+        with self._transaction() as conn:
+            keys = [
+                row[0]
+                for row in conn.execute(
+                    "SELECT key FROM entries WHERE expires_at <= ?", (now.timestamp(),)
+                )
+            ]
+            conn.executemany(
+                "DELETE FROM entries WHERE key = ?", [(key,) for key in keys]
+            )
+        return keys
+
+    def evict_lru(self, max_entries: int) -> List[str]:
+        """
+        Remove least recently used entries beyond ``max_entries``.
+
+        Args:
+            max_entries: Number of entries to keep
+
+        Returns:
+            Keys of the evicted entries
+        """
+        with self._transaction() as conn:
+            count = conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            if count <= max_entries:
+                return []
+            keys = [
+                row[0]
+                for row in conn.execute(
+                    "SELECT key FROM entries ORDER BY last_used LIMIT ?",
+                    (count - max_entries,),
+                )
+            ]
+            conn.executemany(
+                "DELETE FROM entries WHERE key = ?", [(key,) for key in keys]
+            )
+        return keys
+
+    def count(self) -> int:
+        """Number of stored entries."""
+        with self._transaction() as conn:
+            return conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def entries(self) -> List[StoredEntry]:
+        """All stored entries, least recently used first."""
+        with self._transaction() as conn:
+            rows = conn.execute(
+                "SELECT key, value, created_at, expires_at, access_count, "
+                "last_accessed FROM entries ORDER BY last_used"
+            ).fetchall()
+        return [_decode_row(row) for row in rows]
+
+    def value_bytes(self) -> int:
+        """Total size of the stored (JSON-encoded) values in bytes."""
+        with self._transaction() as conn:
+            return conn.execute(
+                "SELECT COALESCE(SUM(LENGTH(value)), 0) FROM entries"
+            ).fetchone()[0]
+
+    def file_size(self) -> int:
+        """Size of the database and its write-ahead log in bytes."""
+        size = 0
+        for path in (self.path, self.path.with_name(self.path.name + "-wal")):
+            if path.exists():
+                size += path.stat().st_size
+        return size
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            try:
+                self._conn.close()
+            except sqlite3.Error as e:
+                logger.warning("Failed to close cache database", error=str(e))
+
+
+def _decode_row(row: Tuple) -> StoredEntry:
+    """Decode the JSON value and timestamps of an ``entries`` row."""
+    key, value, created_at, expires_at, access_count, last_accessed = row
+    return (
+        key,
+        json.loads(value),
+        datetime.fromtimestamp(created_at),
+        datetime.fromtimestamp(expires_at),
+        access_count,
+        datetime.fromtimestamp(last_accessed) if last_accessed else None,
+    )
@@ -0,0 +1,230 @@
+# ABOUTME: Pure-Python BM25 retrieval index over local help texts and cached AI answers
+# ABOUTME: Produces an instant local answer while the model is still thinking
+
+"""
+Local retrieval index for AI help fallbacks.
+
+Static fallback responses are generic. When a help request has to be answered
+without the model (Ollama is down, or has not answered within the hedging
+budget), the index finds the local texts most relevant to the error:
+
+    - the built-in fallback responses
+    - the guidance lines of the prompt templates (``ai/templates/*.j2``)
+    - help answers cached from earlier model responses
+
+Documents are ranked with Okapi BM25 over a simple word tokenizer that also
+splits CamelCase identifiers, so ``PermissionError`` matches "permission".
+Everything is in memory and pure Python; a few hundred documents index in
+milliseconds.
+"""
+
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Document sources
+SOURCE_FALLBACK = "fallback"
+SOURCE_TEMPLATE = "template"
+SOURCE_CACHE = "cache"
+
+_CAMEL_CASE = re.compile(r"([a-z0-9])([A-Z])")
+_WORD = re.compile(r"[a-z0-9]+")
+_JINJA = re.compile(r"\{[{%#].*?[}%#]\}")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have if in into is it its of on or "
+    "that the this to was were will with you your".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase words, without stopwords.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        Words in order of appearance
+    """
+    text = _CAMEL_CASE.sub(r"\1 \2", str(text)).lower()
+    return [word for word in _WORD.findall(text) if word not in _STOPWORDS]
+
+
+@dataclass(frozen=True)
+class HelpDocument:
+    """One retrievable help text."""
+
+    doc_id: str
+    text: str
+    source: str
+
+
+@dataclass
+class SearchHit:
+    """A ranked search result.
+
+    Attributes:
+        document: The matching document
+        score: BM25 score
+        coverage: Fraction of the distinct query words found in the document
+    """
+
+    document: HelpDocument
+    score: float
+    coverage: float
+
+
+class BM25Index:
+    """Okapi BM25 index over help documents.
+
+    Adding a document with an existing ``doc_id`` replaces it.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75) -> None:
+        """Initialize an empty index.
+
+        Args:
+            k1: Term frequency saturation
+            b: Document length normalization
+        """
+        self.k1 = k1
+        self.b = b
+        self._documents: Dict[str, HelpDocument] = {}
+        self._term_counts: Dict[str, Counter] = {}
+        self._document_frequency: Counter = Counter()
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        """Number of indexed documents."""
+        return len(self._documents)
+
+    def add(self, document: HelpDocument) -> None:
+        """Index a document, replacing one with the same id."""
+        self.remove(document.doc_id)
+        counts = Counter(tokenize(document.text))
+        self._documents[document.doc_id] = document
+        self._term_counts[document.doc_id] = counts
+        self._document_frequency.update(counts.keys())
+        self._total_length += sum(counts.values())
+
+    def remove(self, doc_id: str) -> bool:
+        """Remove a document.
+
+        Returns:
+            True if the document was indexed
+        """
+        counts = self._term_counts.pop(doc_id, None)
+        if counts is None:
+            return False
+        del self._documents[doc_id]
+        self._document_frequency.subtract(counts.keys())
+        self._document_frequency += Counter()  # drop zero counts
+        self._total_length -= sum(counts.values())
+        return True
+
+    def search(
+        self, query: str, limit: int = 3, sources: Optional[Iterable[str]] = None
+    ) -> List[SearchHit]:
+        """Rank documents against a query.
+
+        Args:
+            query: Free-text query
+            limit: Maximum number of hits
+            sources: Only consider documents from these sources
+
+        Returns:
+            Hits with a positive score, best first
+        """
+        terms = set(tokenize(query))
+        if not terms or not self._documents:
+            return []
+
+        allowed = set(sources) if sources is not None else None
+        count = len(self._documents)
+        average_length = self._total_length / count or 1.0
+        idf = {
+            term: math.log(
+                1
+                + (count - self._document_frequency[term] + 0.5)
+                / (self._document_frequency[term] + 0.5)
+            )
+            for term in terms
+        }
+
+        hits = []
+        for doc_id, counts in self._term_counts.items():
+            document = self._documents[doc_id]
+            if allowed is not None and document.source not in allowed:
+                continue
+            matched = [term for term in terms if term in counts]
+            if not matched:
+                continue
+            length = sum(counts.values())
+            norm = self.k1 * (1 - self.b + self.b * length / average_length)
+            score = sum(
+                idf[term] * counts[term] * (self.k1 + 1) / (counts[term] + norm)
+                for term in matched
+            )
+            hits.append(SearchHit(document, score, len(matched) / len(terms)))
+
+        hits.sort(key=lambda hit: hit.score, reverse=True)
+        return hits[:limit]
+
+
+def template_guidance(template_dir: Path) -> List[Tuple[str, str]]:
+    """Static guidance lines of the prompt templates.
+
+    List items are kept; Jinja expressions and lines that only hold template
+    variables are dropped.
+
+    Args:
+        template_dir: Directory with ``*.j2`` prompt templates
+
+    Returns:
+        (document id, text) pairs
+    """
+    guidance = []
+    for path in sorted(Path(template_dir).glob("*.j2")):
+        try:
+            lines = path.read_text(encoding="utf-8").splitlines()
+        except OSError:
+            continue
+        for number, line in enumerate(lines, 1):
+            if "{{" in line or "{%" in line:
+                continue
+            text = _JINJA.sub("", line).strip()
+            if not re.match(r"^(?:[-*]|\d+\.)\s+", text):
+                continue
+            text = re.sub(r"^(?:[-*]|\d+\.)\s+", "", text).replace("**", "")
+            if len(tokenize(text)) >= 3:
+                guidance.append((f"{path.stem}:{number}", text))
+    return guidance
+
+
+def build_help_index(
+    fallback_texts: Iterable[str],
+    template_dir: Optional[Path] = None,
+    cached_answers: Iterable[Tuple[str, str]] = (),
+) -> BM25Index:
+    """Index the local help sources.
+
+    Args:
+        fallback_texts: Built-in fallback responses
+        template_dir: Prompt template directory to take guidance lines from
+        cached_answers: (cache key, answer) pairs of earlier model answers
+
+    Returns:
+        The populated index
+    """
+    index = BM25Index()
+    for number, text in enumerate(dict.fromkeys(fallback_texts)):
+        index.add(HelpDocument(f"fallback:{number}", text, SOURCE_FALLBACK))
+    if template_dir is not None:
+        for doc_id, text in template_guidance(template_dir):
+            index.add(HelpDocument(f"template:{doc_id}", text, SOURCE_TEMPLATE))
+    for key, answer in cached_answers:
+        if isinstance(answer, str) and answer.strip():
+            index.add(HelpDocument(f"cache:{key}", answer, SOURCE_CACHE))
+    return index
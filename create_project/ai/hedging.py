@@ -0,0 +1,191 @@
+# ABOUTME: Hedged AI responses that fall back to a local answer after a latency budget
+# ABOUTME: The model's late answer is delivered afterwards instead of being thrown away
+
+"""
+Hedged AI responses.
+
+Waiting for a local model can take the full request timeout. A hedge gives
+the model a latency budget: if it has not produced its first chunk by then,
+the caller gets a local answer immediately. The model request is not
+cancelled:
+
+    - ``hedge_first_chunk`` returns the local answer and hands the model's
+      complete answer to ``on_late_result`` when it arrives (for example to
+      cache it); a model that has started answering is waited for, up to an
+      optional overall deadline
+    - ``hedge_stream`` yields the local answer, then a separator, then the
+      model's chunks as they arrive
+
+Either way the caller sees an answer within the budget plus the time to
+build the local one, and the better answer is not lost.
+"""
+
+import asyncio
+from typing import AsyncIterator, Callable, Optional, Set, Tuple, TypeVar
+
+from structlog import get_logger
+
+T = TypeVar("T")
+
+logger = get_logger(__name__)
+
+# Inserted between a local answer and the model answer that follows it
+UPGRADE_SEPARATOR = "\n\n---\n\n"
+
+# Model requests still running after their hedge fired; referenced here so
+# they are not garbage collected before they finish
+_late_requests: Set[asyncio.Future] = set()
+
+
+async def hedge_first_chunk(
+    primary: AsyncIterator[str],
+    fallback: Callable[[], str],
+    delay: float,
+    on_late_result: Optional[Callable[[str], None]] = None,
+    deadline: Optional[float] = None,
+) -> Tuple[str, bool]:
+    """Collect ``primary``, using ``fallback`` if it starts too slowly.
+
+    Args:
+        primary: The model's response stream
+        fallback: Builds the local answer
+        delay: Seconds to wait for the first chunk
+        on_late_result: Receives the model's complete answer if the local
+            answer was used (not called if the stream fails)
+        deadline: Seconds to wait for the complete answer, counted from the
+            call and never shorter than ``delay`` (None waits for a started
+            answer however long it takes)
+
+    Returns:
+        (answer, whether the local answer was used)
+
+    Raises:
+        Exception: Whatever ``primary`` raised, unless the local answer was
+            used
+    """
+    loop = asyncio.get_running_loop()
+    started_at = loop.time()
+    started = asyncio.Event()
+
+    async def collect() -> str:
+        chunks = []
+        async for chunk in primary:
+            chunks.append(chunk)
+            started.set()
+        return "".join(chunks)
+
+    task = asyncio.ensure_future(collect())
+    first = asyncio.ensure_future(started.wait())
+    try:
+        await asyncio.wait(
+            {task, first}, timeout=delay, return_when=asyncio.FIRST_COMPLETED
+        )
+    except asyncio.CancelledError:
+        task.cancel()
+        raise
+    finally:
+        first.cancel()
+
+    if not started.is_set() and not task.done():
+        logger.info("AI response started too slowly, answering locally", delay=delay)
+        _hand_off(task, on_late_result)
+        return fallback(), True
+
+    if deadline is not None and not task.done():
+        remaining = max(deadline, delay) - (loop.time() - started_at)
+        try:
+            await asyncio.wait({task}, timeout=max(0.0, remaining))
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        if not task.done():
+            logger.info(
+                "AI response exceeded deadline, answering locally", deadline=deadline
+            )
+            _hand_off(task, on_late_result)
+            return fallback(), True
+
+    return await task, False
+
+
+def _hand_off(
+    task: asyncio.Future, on_late_result: Optional[Callable[[T], None]]
+) -> None:
+    """Keep a hedged model request running and deliver its answer later."""
+    _late_requests.add(task)
+    task.add_done_callback(lambda done_task: _deliver(done_task, on_late_result))
+
+
+def _deliver(
+    task: asyncio.Future, on_late_result: Optional[Callable[[T], None]]
+) -> None:
+    """Hand a late model answer to its consumer."""
+    _late_requests.discard(task)
+    if task.cancelled():
+        return
+    error = task.exception()
+    if error is not None:
+        logger.debug("Hedged AI request failed", error=str(error))
+        return
+    if on_late_result is None:
+        return
+    try:
+        on_late_result(task.result())
+    except Exception as e:
+        logger.warning("Failed to deliver late AI response", error=str(e))
+
+
+async def hedge_stream(
+    primary: AsyncIterator[str],
+    fallback: Callable[[], str],
+    delay: float,
+) -> AsyncIterator[str]:
+    """Stream ``primary``, leading with a local answer if it starts slowly.
+
+    Args:
+        primary: The model's response stream
+        fallback: Builds the local answer
+        delay: Seconds to wait for the first chunk
+
+    Yields:
+        The model's chunks, preceded by the local answer and
+        ``UPGRADE_SEPARATOR`` if the first chunk missed the budget
+
+    Raises:
+        Exception: Whatever ``primary`` raised, unless the local answer was
+            already sent (then the stream just ends)
+    """
+    iterator = primary.__aiter__()
+    first = asyncio.ensure_future(iterator.__anext__())
+    try:
+        done, _ = await asyncio.wait({first}, timeout=delay)
+    except asyncio.CancelledError:
+        first.cancel()
+        raise
+
+    hedged = not done
+    if hedged:
+        logger.info("AI stream missed latency budget, answering locally", delay=delay)
+        yield fallback()
+
+    try:
+        chunk = await first
+    except StopAsyncIteration:
+        return
+    except Exception as e:
+        if not hedged:
+            raise
+        logger.debug("Hedged AI stream failed", error=str(e))
+        return
+
+    if hedged:
+        yield UPGRADE_SEPARATOR
+    yield chunk
+
+    try:
+        async for chunk in iterator:
+            yield chunk
+    except Exception as e:
+        if not hedged:
+            raise
+        logger.debug("Hedged AI stream failed", error=str(e))
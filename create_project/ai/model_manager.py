@@ -15,10 +15,16 @@ Key Features:
     - Model filtering by capability, family, or specific attributes
     - Automatic parsing of model specifications (parameter size, quantization)
     - Best model selection based on capability requirements
+    - Per-model latency statistics, persisted across runs, and selection of
+      the fastest measured model
+    - Persisted model catalog, served at startup and revalidated in the
+      background; models are only reparsed when Ollama's list changes
+    - Per-model prompt context budgets from measured prompt evaluation speed
 
 Main Classes:
     - ModelCapability: Enum defining model capabilities (text, code, chat, etc.)
     - ModelInfo: Data class containing comprehensive model information
+    - ModelLatencyStats: Observed streaming performance of a model
     - ModelManager: Main manager class for model operations
 
 Usage Example:
@@ -55,17 +61,26 @@ capabilities, making it easy to find appropriate models for specific tasks
 without needing to know exact model names.
 """
 
+import hashlib
+import json
+import math
+import os
 import threading
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, fields
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Dict, List, Optional, Set
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
+from platformdirs import user_cache_dir
 from pydantic import BaseModel, Field
 from structlog import get_logger
 
 from .exceptions import AIError, ModelNotAvailableError
 from .ollama_client import OllamaClient
+from .stream_metrics import StreamMetrics
+
+logger = get_logger("ai.model_manager")
 
 
 class ModelCapability(Enum):
@@ -91,6 +106,120 @@ class ModelInfo:
     parameter_size: Optional[str] = None
     quantization: Optional[str] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "name": self.name,
+            "size": self.size,
+            "digest": self.digest,
+            "modified_at": self.modified_at.isoformat(),
+            "capabilities": sorted(c.value for c in self.capabilities),
+            "family": self.family,
+            "parameter_size": self.parameter_size,
+            "quantization": self.quantization,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ModelInfo":
+        """Create from dictionary."""
+        return cls(
+            name=data["name"],
+            size=data["size"],
+            digest=data["digest"],
+            modified_at=datetime.fromisoformat(data["modified_at"]),
+            capabilities={ModelCapability(c) for c in data["capabilities"]},
+            family=data.get("family"),
+            parameter_size=data.get("parameter_size"),
+            quantization=data.get("quantization"),
+        )
+
+
+def _default_cache_dir() -> Path:
+    """Directory for persisted model data."""
+    return Path(user_cache_dir("create-project", "claude")) / "ai"
+
+
+def _catalog_digest(models: List[Dict[str, Any]]) -> str:
+    """Digest of Ollama's raw model list, independent of key order."""
+    raw = json.dumps(models, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _moving_average(
+    current: Optional[float], value: Optional[float], weight: float
+) -> Optional[float]:
+    """Fold a new observation into an exponential moving average."""
+    if value is None:
+        return current
+    if current is None:
+        return value
+    return current + weight * (value - current)
+
+
+@dataclass
+class ModelLatencyStats:
+    """Observed generation performance of a model on this machine.
+
+    Averages are exponentially weighted, so they follow changes such as a
+    model being unloaded between requests.
+
+    Attributes:
+        model: Model name
+        samples: Generations recorded
+        incomplete: Streams that ended before Ollama's final chunk
+        time_to_first_token: Average seconds to the first token
+        inter_token_latency: Average seconds between tokens
+        tokens_per_second: Average generation throughput
+        prompt_tokens_per_second: Average prompt evaluation throughput
+        load_duration: Average seconds Ollama spent loading the model
+    """
+
+    SMOOTHING = 0.3
+
+    model: str
+    samples: int = 0
+    incomplete: int = 0
+    time_to_first_token: Optional[float] = None
+    inter_token_latency: Optional[float] = None
+    tokens_per_second: Optional[float] = None
+    prompt_tokens_per_second: Optional[float] = None
+    load_duration: Optional[float] = None
+
+    def expected_latency(self, tokens: int) -> Optional[float]:
+        """Predicted seconds to generate an answer of ``tokens`` tokens.
+
+        Returns:
+            Time to first token plus generation time, or None before the
+            first token was ever measured
+        """
+        if self.time_to_first_token is None:
+            return None
+        if not self.tokens_per_second:
+            return self.time_to_first_token
+        return self.time_to_first_token + tokens / self.tokens_per_second
+
+    def add(self, metrics: StreamMetrics) -> None:
+        """Fold the metrics of one generation into the averages."""
+        weight = self.SMOOTHING
+        self.samples += 1
+        if not metrics.completed:
+            self.incomplete += 1
+        self.time_to_first_token = _moving_average(
+            self.time_to_first_token, metrics.time_to_first_token, weight
+        )
+        self.inter_token_latency = _moving_average(
+            self.inter_token_latency, metrics.mean_inter_token_latency, weight
+        )
+        self.tokens_per_second = _moving_average(
+            self.tokens_per_second, metrics.tokens_per_second, weight
+        )
+        self.prompt_tokens_per_second = _moving_average(
+            self.prompt_tokens_per_second, metrics.prompt_tokens_per_second, weight
+        )
+        self.load_duration = _moving_average(
+            self.load_duration, metrics.load_duration, weight
+        )
+
 
 class ModelListResponse(BaseModel):
     """Pydantic model for Ollama model list response."""
@@ -106,6 +235,24 @@ class ModelManager:
 
     CACHE_TTL_MINUTES = 10
 
+    # Persisted latency statistics
+    LATENCY_FILENAME = "model_latency.json"
+    LATENCY_VERSION = 1
+
+    # Persisted model catalog
+    CATALOG_FILENAME = "model_catalog.json"
+    CATALOG_VERSION = 1
+
+    # Typical help answer length, used to rank models by expected latency
+    EXPECTED_RESPONSE_TOKENS = 300
+
+    # Prompt context budget: the prompt evaluation time allowed for context,
+    # the budget of unmeasured models and the bounds of any budget
+    CONTEXT_EVAL_SECONDS = 2.0
+    DEFAULT_CONTEXT_TOKENS = 1024
+    MIN_CONTEXT_TOKENS = 256
+    MAX_CONTEXT_TOKENS = 4096
+
     # Known model families and their typical capabilities
     MODEL_FAMILIES = {
         "llama": {
@@ -155,12 +302,21 @@ class ModelManager:
         },
     }
 
-    def __init__(self, client: Optional[OllamaClient] = None):
+    def __init__(
+        self,
+        client: Optional[OllamaClient] = None,
+        cache_dir: Optional[Path] = None,
+        persist: bool = True,
+    ):
         """
         Initialize model manager.
 
         Args:
             client: Ollama client instance (creates default if None)
+            cache_dir: Directory for persisted model data (default:
+                platformdirs cache)
+            persist: Whether to load and save latency statistics and the
+                model catalog on disk
         """
         self.client = client or OllamaClient()
         self.logger = get_logger("ai.model_manager")
@@ -170,12 +326,32 @@ class ModelManager:
         self._cache_timestamp: Optional[datetime] = None
         self._cache_lock = threading.RLock()
 
+        # Digest of the raw model list the cache was parsed from; a catalog
+        # loaded from disk is served until a background refresh confirms it
+        self._catalog_digest: Optional[str] = None
+        self._catalog_stale = False
+        self._refresh_thread: Optional[threading.Thread] = None
+
+        # Generation performance per model name
+        self._latency: Dict[str, ModelLatencyStats] = {}
+        self.latency_file: Optional[Path] = None
+        self.catalog_file: Optional[Path] = None
+        if persist:
+            cache_dir = Path(cache_dir) if cache_dir else _default_cache_dir()
+            self.latency_file = cache_dir / self.LATENCY_FILENAME
+            self.catalog_file = cache_dir / self.CATALOG_FILENAME
+            self._load_latency()
+            self._load_catalog()
+
         self.logger.debug("Model manager initialized")
 
     def get_models(self, force_refresh: bool = False) -> List[ModelInfo]:
         """
         Get list of available models with caching.
 
+        A catalog persisted by an earlier run is returned without contacting
+        Ollama and refreshed in the background.
+
         Args:
             force_refresh: If True, bypass cache and fetch fresh data
 
@@ -191,18 +367,52 @@ class ModelManager:
                 self.logger.debug("Using cached model list")
                 return self._cache.copy()
 
-            self.logger.info("Fetching available models from Ollama")
+            if not force_refresh and self._catalog_stale:
+                self.logger.debug("Using persisted model catalog")
+                self.refresh_in_background()
+                return self._cache.copy()
 
-            # Fetch fresh model data
-            models = self._fetch_models()
+            self.logger.info("Fetching available models from Ollama")
 
-            # Cache results
-            self._cache = models
-            self._cache_timestamp = datetime.now()
+            # Fetch fresh model data and cache it
+            models, digest = self._fetch_models()
+            self._update_catalog(models, digest)
 
             self.logger.info("Model list updated", model_count=len(models))
             return models.copy()
 
+    def refresh_in_background(self) -> None:
+        """Refresh the model list on a daemon thread unless one is running."""
+        with self._cache_lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return
+            self._refresh_thread = threading.Thread(
+                target=self._refresh_catalog, name="model-catalog-refresh", daemon=True
+            )
+            self._refresh_thread.start()
+
+    def _refresh_catalog(self) -> None:
+        """Background refresh body; keeps the current catalog on failure."""
+        try:
+            models, digest = self._fetch_models()
+        except Exception as e:
+            self.logger.debug("Background model refresh failed", error=str(e))
+            return
+
+        with self._cache_lock:
+            self._update_catalog(models, digest)
+        self.logger.debug("Model catalog refreshed", model_count=len(models))
+
+    def _update_catalog(self, models: List[ModelInfo], digest: str) -> None:
+        """Cache a fetched model list, persisting it if it changed."""
+        with self._cache_lock:
+            self._cache = models
+            self._cache_timestamp = datetime.now()
+            self._catalog_stale = False
+            if digest != self._catalog_digest:
+                self._catalog_digest = digest
+                self._save_catalog()
+
     def _is_cache_valid(self) -> bool:
         """Check if cached model list is still valid."""
         if self._cache is None or self._cache_timestamp is None:
@@ -211,8 +421,14 @@ class ModelManager:
         cache_age = datetime.now() - self._cache_timestamp
         return cache_age < timedelta(minutes=self.CACHE_TTL_MINUTES)
 
-    def _fetch_models(self) -> List[ModelInfo]:
-        """Fetch model list from Ollama API."""
+    def _fetch_models(self) -> Tuple[List[ModelInfo], str]:
+        """Fetch model list from Ollama API.
+
+        Returns:
+            The models and the digest of Ollama's raw list. If the digest
+            matches the cached catalog, the cached models are returned
+            without parsing the list again.
+        """
         try:
             response = self.client.get_models()
 
@@ -222,6 +438,12 @@ class ModelManager:
             # Parse response using Pydantic
             model_list = ModelListResponse(**response.data)
 
+            digest = _catalog_digest(model_list.models)
+            with self._cache_lock:
+                if self._cache is not None and digest == self._catalog_digest:
+                    self.logger.debug("Model catalog unchanged", digest=digest[:12])
+                    return list(self._cache), digest
+
             models = []
             for model_data in model_list.models:
                 try:
@@ -235,7 +457,7 @@ class ModelManager:
                     )
                     continue
 
-            return models
+            return models, digest
 
         except Exception as e:
             self.logger.error("Failed to fetch models", error=str(e))
@@ -494,11 +716,198 @@ class ModelManager:
         # Fallback to first sorted model
         return models_sorted[0]
 
+    def record_stream_metrics(self, metrics: StreamMetrics) -> None:
+        """
+        Record the metrics of a generation and persist the statistics.
+
+        Args:
+            metrics: Metrics reported by ``OllamaClient.stream_generate``, or
+                built from a non-streamed response
+        """
+        with self._cache_lock:
+            stats = self._latency.get(metrics.model)
+            if stats is None:
+                stats = self._latency[metrics.model] = ModelLatencyStats(metrics.model)
+            stats.add(metrics)
+            self._save_latency()
+
+        self.logger.debug(
+            "Model latency updated",
+            model_name=metrics.model,
+            time_to_first_token=stats.time_to_first_token,
+            tokens_per_second=stats.tokens_per_second,
+        )
+
+    def get_latency_stats(self) -> Dict[str, ModelLatencyStats]:
+        """
+        Get the observed streaming performance of every model used so far.
+
+        Returns:
+            Copies of the statistics, by model name
+        """
+        with self._cache_lock:
+            return {
+                name: ModelLatencyStats(**vars(stats))
+                for name, stats in self._latency.items()
+            }
+
+    def select_fastest_model(
+        self, candidates: Iterable[ModelInfo], tokens: Optional[int] = None
+    ) -> Optional[ModelInfo]:
+        """
+        Pick the candidate expected to answer fastest on this machine.
+
+        Unmeasured candidates are estimated from the measured model closest
+        in size, with latency scaled by size (generation is bound by memory
+        bandwidth). An unmeasured candidate whose size is unknown, or that
+        has no measured model to compare with, is estimated at zero so it
+        is tried once and measured.
+
+        Args:
+            candidates: Models meeting the capability requirement
+            tokens: Expected answer length (default: EXPECTED_RESPONSE_TOKENS)
+
+        Returns:
+            The candidate with the lowest expected latency, or None if no
+            model was measured yet
+        """
+        tokens = tokens or self.EXPECTED_RESPONSE_TOKENS
+        measured = []
+        unmeasured = []
+        with self._cache_lock:
+            for model in candidates:
+                stats = self._latency.get(model.name)
+                latency = stats.expected_latency(tokens) if stats else None
+                if latency is not None:
+                    measured.append((latency, model))
+                else:
+                    unmeasured.append(model)
+
+        if not measured:
+            return None
+
+        references = [(latency, m) for latency, m in measured if m.size > 0]
+        timed = list(measured)
+        for model in unmeasured:
+            if model.size <= 0 or not references:
+                timed.append((0.0, model))
+                continue
+            latency, reference = min(
+                references,
+                key=lambda item: abs(math.log(model.size / item[1].size)),
+            )
+            timed.append((latency * model.size / reference.size, model))
+
+        latency, model = min(timed, key=lambda item: item[0])
+        self.logger.debug(
+            "Fastest model selected",
+            model_name=model.name,
+            expected_latency=latency,
+            estimated=model in unmeasured,
+            measured_models=len(measured),
+        )
+        return model
+
+    def context_token_budget(self, model_name: str) -> int:
+        """
+        Tokens of error context a prompt for the model should carry.
+
+        The budget is what the model evaluates in ``CONTEXT_EVAL_SECONDS`` at
+        its measured prompt evaluation speed, so slow CPU-only models get
+        shorter prompts.
+
+        Args:
+            model_name: Model that will answer
+
+        Returns:
+            Token budget between MIN_CONTEXT_TOKENS and MAX_CONTEXT_TOKENS
+        """
+        with self._cache_lock:
+            stats = self._latency.get(model_name)
+            speed = stats.prompt_tokens_per_second if stats else None
+
+        if not speed:
+            return self.DEFAULT_CONTEXT_TOKENS
+        budget = int(speed * self.CONTEXT_EVAL_SECONDS)
+        return max(self.MIN_CONTEXT_TOKENS, min(self.MAX_CONTEXT_TOKENS, budget))
+
+    def _load_latency(self) -> None:
+        """Load persisted latency statistics."""
+        if self.latency_file is None or not self.latency_file.exists():
+            return
+
+        try:
+            data = json.loads(self.latency_file.read_text(encoding="utf-8"))
+            if data.get("version") != self.LATENCY_VERSION:
+                return
+            names = {f.name for f in fields(ModelLatencyStats)}
+            for name, values in data.get("models", {}).items():
+                values = {k: v for k, v in values.items() if k in names}
+                self._latency[name] = ModelLatencyStats(**{**values, "model": name})
+        except Exception as e:
+            self.logger.debug("Failed to load model latency stats", error=str(e))
+
+    def _save_latency(self) -> None:
+        """Persist latency statistics atomically."""
+        if self.latency_file is None:
+            return
+
+        try:
+            self.latency_file.parent.mkdir(parents=True, exist_ok=True)
+            data: Dict[str, Any] = {
+                "version": self.LATENCY_VERSION,
+                "models": {name: asdict(s) for name, s in self._latency.items()},
+            }
+            temp_file = self.latency_file.with_suffix(f".{os.getpid()}.tmp")
+            temp_file.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(temp_file, self.latency_file)
+        except Exception as e:
+            self.logger.debug("Failed to persist model latency stats", error=str(e))
+
+    def _load_catalog(self) -> None:
+        """Load the model catalog persisted for this Ollama URL."""
+        if self.catalog_file is None:
+            return
+
+        catalog = _read_catalog(self.catalog_file)
+        if catalog is None or catalog[0] != self._base_url():
+            return
+
+        _, self._catalog_digest, self._cache = catalog
+        self._catalog_stale = True
+        self.logger.debug("Model catalog loaded", model_count=len(self._cache))
+
+    def _save_catalog(self) -> None:
+        """Persist the model catalog atomically."""
+        if self.catalog_file is None or self._cache is None:
+            return
+
+        try:
+            self.catalog_file.parent.mkdir(parents=True, exist_ok=True)
+            data: Dict[str, Any] = {
+                "version": self.CATALOG_VERSION,
+                "base_url": self._base_url(),
+                "digest": self._catalog_digest,
+                "models": [model.to_dict() for model in self._cache],
+            }
+            temp_file = self.catalog_file.with_suffix(f".{os.getpid()}.tmp")
+            temp_file.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(temp_file, self.catalog_file)
+        except Exception as e:
+            self.logger.debug("Failed to persist model catalog", error=str(e))
+
+    def _base_url(self) -> Optional[str]:
+        """Ollama URL the catalog belongs to."""
+        base_url = getattr(self.client, "base_url", None)
+        return base_url if isinstance(base_url, str) else None
+
     def clear_cache(self) -> None:
         """Clear cached model data."""
         with self._cache_lock:
             self._cache = None
             self._cache_timestamp = None
+            self._catalog_digest = None
+            self._catalog_stale = False
             self.logger.debug("Model cache cleared")
 
     def get_cache_info(self) -> Dict[str, any]:
@@ -523,3 +932,45 @@ class ModelManager:
                 ),
                 "cache_timestamp": self._cache_timestamp.isoformat(),
             }
+
+
+def _read_catalog(
+    path: Path,
+) -> Optional[Tuple[Optional[str], Optional[str], List[ModelInfo]]]:
+    """Read a persisted model catalog.
+
+    Returns:
+        Its Ollama URL, digest and models, or None if there is no readable
+        catalog
+    """
+    if not path.exists():
+        return None
+
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("version") != ModelManager.CATALOG_VERSION:
+            return None
+        models = [ModelInfo.from_dict(model) for model in data["models"]]
+    except Exception as e:
+        logger.debug("Failed to load model catalog", path=str(path), error=str(e))
+        return None
+    return data.get("base_url"), data.get("digest"), models
+
+
+def load_cached_models(
+    base_url: Optional[str] = None, cache_dir: Optional[Path] = None
+) -> List[ModelInfo]:
+    """Models persisted by an earlier run, read without contacting Ollama.
+
+    Args:
+        base_url: Ollama URL the catalog must belong to (any if None)
+        cache_dir: Directory of the catalog (default: platformdirs cache)
+
+    Returns:
+        The persisted models, or an empty list if there are none
+    """
+    cache_dir = Path(cache_dir) if cache_dir else _default_cache_dir()
+    catalog = _read_catalog(cache_dir / ModelManager.CATALOG_FILENAME)
+    if catalog is None or (base_url is not None and catalog[0] != base_url):
+        return []
+    return catalog[2]
@@ -18,6 +18,8 @@ Key Features:
     - Support for all Ollama API endpoints
     - Graceful cleanup and resource management
     - Request/response timing and performance metrics
+    - Incremental NDJSON streaming with time-to-first-token and throughput
+      metrics
 
 Main Classes:
     - RequestMethod: Enum for HTTP methods
@@ -89,13 +91,19 @@ import json
 import time
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, Optional, Union
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Union
 
 import httpx
 from structlog import get_logger
 
+from ..utils.performance import get_monitor
+from ..utils.tracing import traced
+
 from .exceptions import AIError, OllamaNotFoundError, ResponseTimeoutError
 from .ollama_detector import OllamaDetector
+from .ollama_monitor import OllamaMonitor
+from .runtime import current_ai_runtime
+from .stream_metrics import NDJSONDecoder, StreamMetrics, StreamTimer
 
 
 class RequestMethod(Enum):
@@ -159,6 +167,9 @@ class OllamaClient:
     DEFAULT_TIMEOUT = 30.0
     CONNECTION_TIMEOUT = 5.0
 
+    # Loading a large model from disk can take tens of seconds
+    PRELOAD_TIMEOUT = 120.0
+
     def __new__(cls, *args, **kwargs) -> "OllamaClient":
         """Singleton pattern implementation."""
         if cls._instance is None:
@@ -184,6 +195,7 @@ class OllamaClient:
             return
 
         self.detector = OllamaDetector(service_url=base_url)
+        self.monitor = OllamaMonitor(self.detector)
         self.base_url = base_url or "http://localhost:11434"
         self.timeout = timeout or self.DEFAULT_TIMEOUT
         self.retry_config = retry_config or RetryConfig()
@@ -205,9 +217,19 @@ class OllamaClient:
 
     @property
     def is_available(self) -> bool:
-        """Check if Ollama service is available."""
-        status = self.detector.detect()
-        return status.is_installed and status.is_running
+        """Check if Ollama service is available.
+
+        Served from the background monitor's cached status, so it does not
+        block on a dead service (except briefly for the first detection).
+        """
+        return self.monitor.is_available()
+
+    def _check_circuit(self) -> None:
+        """Fail fast while the availability circuit breaker is open."""
+        if not self.monitor.allow_request():
+            raise OllamaNotFoundError(
+                "Ollama service is unavailable (circuit breaker open)"
+            )
 
     @property
     def sync_client(self) -> httpx.Client:
@@ -228,16 +250,25 @@ class OllamaClient:
 
     @property
     def async_client(self) -> httpx.AsyncClient:
-        """Get or create asynchronous HTTP client."""
+        """Get or create asynchronous HTTP client.
+
+        On the AI runtime's event loop this is the runtime's persistent
+        keep-alive client, so connections are reused across requests.
+        """
+        timeout = httpx.Timeout(
+            connect=self.CONNECTION_TIMEOUT,
+            read=self.timeout,
+            write=self.timeout,
+            pool=self.timeout,
+        )
+        runtime = current_ai_runtime()
+        if runtime is not None:
+            return runtime.http_client(self.base_url, timeout)
+
         if self._async_client is None:
             self._async_client = httpx.AsyncClient(
                 base_url=self.base_url,
-                timeout=httpx.Timeout(
-                    connect=self.CONNECTION_TIMEOUT,
-                    read=self.timeout,
-                    write=self.timeout,
-                    pool=self.timeout,
-                ),
+                timeout=timeout,
                 headers={"Content-Type": "application/json"},
             )
             self.logger.debug("Created asynchronous HTTP client")
@@ -275,6 +306,7 @@ class OllamaClient:
 
         return False
 
+    @traced("ollama_request", "ai", capture=("method", "endpoint"))
     def request(
         self,
         method: Union[RequestMethod, str],
@@ -299,6 +331,8 @@ class OllamaClient:
         if isinstance(method, RequestMethod):
             method = method.value
 
+        self._check_circuit()
+
         url = f"/api/{endpoint.lstrip('/')}"
         request_timeout = timeout or self.timeout
 
@@ -336,6 +370,9 @@ class OllamaClient:
                 else:
                     raise AIError(f"Unsupported HTTP method: {method}")
 
+                # Any HTTP answer means the service is up
+                self.monitor.record_success()
+
                 # Parse response
                 response_time = time.time() - start_time
 
@@ -397,6 +434,9 @@ class OllamaClient:
                 time.sleep(delay)
 
         # All retry attempts failed
+        if isinstance(last_exception, (httpx.ConnectError, httpx.ConnectTimeout)):
+            self.monitor.record_failure()
+
         error_msg = f"Request failed after {self.retry_config.max_attempts} attempts: {last_exception}"
         self.logger.error("Request exhausted retries", error=error_msg)
 
@@ -413,6 +453,7 @@ class OllamaClient:
             response_time=time.time() - start_time,
         )
 
+    @traced("ollama_request", "ai", capture=("method", "endpoint"))
     async def request_async(
         self,
         method: Union[RequestMethod, str],
@@ -437,6 +478,8 @@ class OllamaClient:
         if isinstance(method, RequestMethod):
             method = method.value
 
+        self._check_circuit()
+
         url = f"/api/{endpoint.lstrip('/')}"
         request_timeout = timeout or self.timeout
 
@@ -474,6 +517,9 @@ class OllamaClient:
                 else:
                     raise AIError(f"Unsupported HTTP method: {method}")
 
+                # Any HTTP answer means the service is up
+                self.monitor.record_success()
+
                 # Parse response
                 response_time = time.time() - start_time
 
@@ -535,6 +581,9 @@ class OllamaClient:
                 await asyncio.sleep(delay)
 
         # All retry attempts failed
+        if isinstance(last_exception, (httpx.ConnectError, httpx.ConnectTimeout)):
+            self.monitor.record_failure()
+
         error_msg = f"Async request failed after {self.retry_config.max_attempts} attempts: {last_exception}"
         self.logger.error("Async request exhausted retries", error=error_msg)
 
@@ -614,6 +663,156 @@ class OllamaClient:
         """
         return await self.generate_completion_async(model, prompt, stream, **kwargs)
 
+    async def preload_model(
+        self, model: str, keep_alive: str = "10m"
+    ) -> OllamaResponse:
+        """
+        Load a model into memory and keep it resident.
+
+        Ollama loads the model for a generate request without a prompt and
+        answers once it is loaded; ``keep_alive`` sets how long it then stays
+        in memory while idle.
+
+        Args:
+            model: Model name
+            keep_alive: Ollama duration string, e.g. "10m"
+
+        Returns:
+            OllamaResponse of the load request
+        """
+        return await self.request_async(
+            RequestMethod.POST,
+            "generate",
+            data={"model": model, "keep_alive": keep_alive},
+            timeout=self.PRELOAD_TIMEOUT,
+        )
+
+    async def stream_generate(
+        self,
+        model: str,
+        prompt: str,
+        on_metrics: Optional[Callable[[StreamMetrics], None]] = None,
+        timeout: Optional[float] = None,
+        **kwargs,
+    ) -> AsyncIterator[OllamaResponse]:
+        """
+        Stream a completion, yielding each chunk as soon as it is decoded.
+
+        The body is decoded incrementally as NDJSON. When the stream ends
+        (also early), its time to first token and inter-token latencies are
+        recorded in the performance monitor, and its ``StreamMetrics`` are
+        passed to ``on_metrics``. Streams are not retried.
+
+        Args:
+            model: Model name
+            prompt: Input prompt
+            on_metrics: Receives the metrics of the stream
+            timeout: Read timeout between chunks
+            **kwargs: Additional parameters for generation
+
+        Yields:
+            OllamaResponse per chunk, or a single failed response if Ollama
+            answers with an HTTP error
+
+        Raises:
+            OllamaNotFoundError: If the service cannot be reached
+            ResponseTimeoutError: If a chunk does not arrive in time
+            AIError: If the stream reports an error or is not valid NDJSON
+        """
+        self._check_circuit()
+
+        data = {"model": model, "prompt": prompt, "stream": True, **kwargs}
+        request_timeout = timeout or self.timeout
+        timer = StreamTimer(model)
+        decoder = NDJSONDecoder()
+        responded = False
+
+        try:
+            async with self.async_client.stream(
+                "POST",
+                "/api/generate",
+                content=json.dumps(data),
+                timeout=request_timeout,
+            ) as response:
+                responded = True
+                self.monitor.record_success()
+
+                if response.status_code >= 400:
+                    body = (await response.aread()).decode(errors="replace")
+                    error_msg = f"HTTP {response.status_code}: {body}"
+                    self.logger.warning("Streaming request failed", error=error_msg)
+                    yield OllamaResponse(
+                        success=False,
+                        status_code=response.status_code,
+                        data=None,
+                        error_message=error_msg,
+                        response_time=timer.elapsed(),
+                    )
+                    return
+
+                async for raw in response.aiter_bytes():
+                    for chunk in decoder.feed(raw):
+                        yield self._stream_response(chunk, timer, response.status_code)
+                for chunk in decoder.flush():
+                    yield self._stream_response(chunk, timer, response.status_code)
+
+        except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+            self.monitor.record_failure()
+            raise OllamaNotFoundError("Unable to connect to Ollama service") from e
+        except httpx.TimeoutException as e:
+            raise ResponseTimeoutError(int(request_timeout)) from e
+        finally:
+            if responded:
+                self._publish_stream_metrics(timer.finish(), on_metrics)
+
+    @staticmethod
+    def _stream_response(
+        chunk: Dict[str, Any], timer: StreamTimer, status_code: int
+    ) -> OllamaResponse:
+        """Time a decoded stream chunk and wrap it in a response."""
+        timer.record_chunk(chunk)
+        if chunk.get("error"):
+            raise AIError(f"Ollama stream failed: {chunk['error']}")
+        return OllamaResponse(
+            success=True,
+            status_code=status_code,
+            data=chunk,
+            response_time=timer.elapsed(),
+        )
+
+    def _publish_stream_metrics(
+        self,
+        metrics: StreamMetrics,
+        on_metrics: Optional[Callable[[StreamMetrics], None]],
+    ) -> None:
+        """Record stream metrics in the performance monitor and log them."""
+        monitor = get_monitor()
+        if metrics.time_to_first_token is not None:
+            monitor.record_duration(
+                f"ollama_time_to_first_token:{metrics.model}",
+                metrics.time_to_first_token,
+            )
+        for latency in metrics.inter_token_latencies:
+            monitor.record_duration(f"ollama_inter_token:{metrics.model}", latency)
+
+        self.logger.info(
+            "Streaming request finished",
+            model=metrics.model,
+            completed=metrics.completed,
+            time_to_first_token=metrics.time_to_first_token,
+            mean_inter_token_latency=metrics.mean_inter_token_latency,
+            tokens_per_second=metrics.tokens_per_second,
+            prompt_tokens_per_second=metrics.prompt_tokens_per_second,
+            eval_count=metrics.eval_count,
+            prompt_eval_count=metrics.prompt_eval_count,
+        )
+
+        if on_metrics is not None:
+            try:
+                on_metrics(metrics)
+            except Exception as e:
+                self.logger.warning("Failed to record stream metrics", error=str(e))
+
     def chat_completion(
         self, model: str, messages: list, stream: bool = False, **kwargs
     ) -> OllamaResponse:
@@ -654,6 +853,8 @@ class OllamaClient:
 
     def close(self) -> None:
         """Close HTTP clients and cleanup resources."""
+        self.monitor.stop()
+
         if self._sync_client:
             self._sync_client.close()
             self._sync_client = None
@@ -672,6 +873,8 @@ class OllamaClient:
 
     async def close_async(self) -> None:
         """Close HTTP clients asynchronously."""
+        self.monitor.stop()
+
         if self._sync_client:
             self._sync_client.close()
             self._sync_client = None
@@ -32,7 +32,6 @@ Example:
 """
 
 import shutil
-import subprocess
 import threading
 from dataclasses import dataclass
 from datetime import datetime, timedelta
@@ -42,6 +41,7 @@ from typing import Optional
 import httpx
 from structlog import get_logger
 
+from ..core.tool_probe import get_tool_probe_cache
 from .exceptions import OllamaNotFoundError
 
 
@@ -178,66 +178,70 @@ class OllamaDetector:
         return None
 
     def _get_version(self, binary_path: Path) -> Optional[str]:
-        """Get Ollama version from binary."""
-        try:
-            result = subprocess.run(
-                [str(binary_path), "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10,  # 10 second timeout
-            )
+        """Get Ollama version from binary.
 
-            if result.returncode == 0:
-                # Parse version from output (usually "ollama version x.y.z")
-                version_line = result.stdout.strip()
-                if version_line:
-                    parts = version_line.split()
-                    if (
-                        len(parts) >= 3
-                        and parts[0] == "ollama"
-                        and parts[1] == "version"
-                    ):
-                        return parts[2]
-                    # Fallback: return full line
-                    return version_line
+        The ``--version`` probe is served from the shared tool probe cache
+        while the binary is unchanged.
+        """
+        result = get_tool_probe_cache().probe([str(binary_path), "--version"])
 
+        if result.error is not None:
             self.logger.warning(
-                "Ollama version command failed",
-                returncode=result.returncode,
-                stderr=result.stderr,
+                "Failed to execute Ollama version command", error=result.error
             )
             return None
 
-        except subprocess.TimeoutExpired:
-            self.logger.warning("Ollama version command timed out")
-            return None
-        except Exception as e:
-            self.logger.warning(
-                "Failed to execute Ollama version command", error=str(e)
-            )
-            return None
+        if result.returncode == 0:
+            # Parse version from output (usually "ollama version x.y.z")
+            version_line = result.stdout.strip()
+            if version_line:
+                parts = version_line.split()
+                if len(parts) >= 3 and parts[0] == "ollama" and parts[1] == "version":
+                    return parts[2]
+                # Fallback: return full line
+                return version_line
+
+        self.logger.warning(
+            "Ollama version command failed",
+            returncode=result.returncode,
+            stderr=result.stderr,
+        )
+        return None
 
     def _check_service_health(self) -> bool:
         """Check if Ollama service is running via HTTP health check."""
+        with httpx.Client(timeout=5.0) as client:
+            return self.check_health(client)
+
+    def check_health(self, client: httpx.Client) -> bool:
+        """
+        Check if the Ollama service responds, using the given HTTP client.
+
+        Args:
+            client: Client to send the request with (reused across checks
+                by callers that poll)
+
+        Returns:
+            True if the service answered the health check
+        """
         try:
-            with httpx.Client(timeout=5.0) as client:
-                response = client.get(f"{self.service_url}/api/tags")
-
-                # Service is running if we get any response (even error responses)
-                # The /api/tags endpoint should exist even with no models
-                is_running = response.status_code in [200, 404]
-
-                if is_running:
-                    self.logger.debug(
-                        "Ollama service is running", status_code=response.status_code
-                    )
-                else:
-                    self.logger.debug(
-                        "Ollama service returned unexpected status",
-                        status_code=response.status_code,
-                    )
-
-                return is_running
+            response = client.get(f"{self.service_url}/api/tags")
+
+            # Service is running if we get any response (even error responses)
+            # The /api/tags endpoint should exist even with no models
+            is_running = response.status_code in [200, 404]
+
+            if is_running:
+                self.logger.debug(
+                    "Ollama service is running", status_code=response.status_code
+                )
+            else:
+                self.logger.debug(
+                    "Ollama service returned unexpected status",
+                    status_code=response.status_code,
+                )
+
+            return is_running
 
         except httpx.ConnectError:
             self.logger.debug("Ollama service not reachable", url=self.service_url)
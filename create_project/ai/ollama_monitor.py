@@ -0,0 +1,249 @@
+# ABOUTME: Background Ollama availability monitor with a consecutive-failure circuit breaker
+# ABOUTME: Serves cached, non-blocking availability so callers fall back without waiting
+
+"""
+Background Ollama availability monitoring.
+
+``OllamaDetector.detect`` looks up the binary, runs ``ollama --version`` and
+performs an HTTP health check with a new client, which can block for
+seconds when Ollama is down. OllamaMonitor moves that work off the caller's
+path:
+
+    - a daemon thread runs the full detection once, then re-checks service
+      health every ``interval`` seconds with one reused ``httpx.Client``
+    - ``status`` and ``is_available`` return the cached result without
+      network access (only the very first call waits, briefly, for the
+      initial detection)
+    - a circuit breaker opens after ``failure_threshold`` consecutive failed
+      health checks or connection failures reported by requests; while it
+      is open callers are told to use their fallbacks immediately
+
+After ``reset_timeout`` seconds an open breaker becomes half-open and lets
+requests through again; the next success closes it and the next failure
+re-opens it.
+"""
+
+import threading
+import time
+from dataclasses import replace
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+
+import httpx
+from structlog import get_logger
+
+from .ollama_detector import OllamaDetector, OllamaStatus
+
+logger = get_logger(__name__)
+
+
+class CircuitState(str, Enum):
+    """State of the availability circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class OllamaMonitor:
+    """Cached Ollama availability refreshed by a background thread.
+
+    All public methods are thread-safe.
+
+    Attributes:
+        detector: Detector used for the initial detection and health checks
+        interval: Seconds between health checks
+        failure_threshold: Consecutive failures that open the breaker
+        reset_timeout: Seconds an open breaker waits before half-opening
+    """
+
+    DEFAULT_INTERVAL = 30.0
+    FAILURE_THRESHOLD = 3
+    RESET_TIMEOUT = 30.0
+    HEALTH_TIMEOUT = 2.0
+    STARTUP_WAIT = 2.0
+
+    def __init__(
+        self,
+        detector: OllamaDetector,
+        interval: Optional[float] = None,
+        failure_threshold: Optional[int] = None,
+        reset_timeout: Optional[float] = None,
+        health_timeout: Optional[float] = None,
+    ) -> None:
+        """Initialize a monitor that has not started checking yet.
+
+        Args:
+            detector: Detector for the Ollama service to monitor
+            interval: Seconds between health checks
+            failure_threshold: Consecutive failures that open the breaker
+            reset_timeout: Seconds before an open breaker half-opens
+            health_timeout: Timeout of each health check request
+        """
+        self.detector = detector
+        self.interval = interval or self.DEFAULT_INTERVAL
+        self.failure_threshold = failure_threshold or self.FAILURE_THRESHOLD
+        self.reset_timeout = (
+            self.RESET_TIMEOUT if reset_timeout is None else reset_timeout
+        )
+        self.health_timeout = health_timeout or self.HEALTH_TIMEOUT
+
+        self._lock = threading.Lock()
+        self._status: Optional[OllamaStatus] = None
+        self._checked = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._http: Optional[httpx.Client] = None
+
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current breaker state (open breakers half-open after the timeout)."""
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> CircuitState:
+        """Breaker state; caller holds the lock."""
+        if (
+            self._state is CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self.reset_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+            logger.info("Ollama circuit breaker half-open")
+        return self._state
+
+    def start(self) -> None:
+        """Start the background checks if they are not running."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="ollama-monitor", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """Stop the background checks and close the health check client.
+
+        Args:
+            timeout: Seconds to wait for the checking thread
+        """
+        self._stop.set()
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        with self._lock:
+            http, self._http = self._http, None
+        if http is not None:
+            http.close()
+
+    def status(self, wait: Optional[float] = None) -> Optional[OllamaStatus]:
+        """Cached availability status.
+
+        Starts (or restarts) the background checks and waits for the initial
+        detection for at most ``wait`` seconds.
+
+        Args:
+            wait: Seconds to wait for the first result (default STARTUP_WAIT)
+
+        Returns:
+            Latest status, or None if the initial detection has not finished
+        """
+        self.start()
+        if not self._checked.is_set():
+            self._checked.wait(self.STARTUP_WAIT if wait is None else wait)
+        with self._lock:
+            return self._status
+
+    def is_available(self) -> bool:
+        """Whether Ollama is installed, running and the breaker allows calls."""
+        status = self.status()
+        if status is None or not (status.is_installed and status.is_running):
+            return False
+        return self.allow_request()
+
+    def allow_request(self) -> bool:
+        """Whether callers may contact Ollama (breaker not open)."""
+        with self._lock:
+            return self._current_state() is not CircuitState.OPEN
+
+    def record_success(self) -> None:
+        """Record a successful contact with Ollama, closing the breaker."""
+        with self._lock:
+            self._failures = 0
+            if self._state is not CircuitState.CLOSED:
+                self._state = CircuitState.CLOSED
+                logger.info("Ollama circuit breaker closed")
+
+    def record_failure(self) -> None:
+        """Record a failed contact with Ollama, opening the breaker if due."""
+        with self._lock:
+            self._failures += 1
+            state = self._current_state()
+            if state is CircuitState.OPEN:
+                return
+            if (
+                state is CircuitState.HALF_OPEN
+                or self._failures >= self.failure_threshold
+            ):
+                self._state = CircuitState.OPEN
+                self._opened_at = time.monotonic()
+                logger.warning(
+                    "Ollama circuit breaker opened",
+                    consecutive_failures=self._failures,
+                    reset_timeout=self.reset_timeout,
+                )
+
+    def refresh(self) -> OllamaStatus:
+        """Check availability now and update the cached status.
+
+        The first call runs the detector's full detection; later calls only
+        repeat the health check over the reused client.
+
+        Returns:
+            The new status
+        """
+        with self._lock:
+            previous = self._status
+
+        if previous is None:
+            status = self.detector.detect()
+        else:
+            is_running = self.detector.check_health(self._health_client())
+            status = replace(
+                previous, is_running=is_running, detected_at=datetime.now()
+            )
+
+        if status.is_running:
+            self.record_success()
+        else:
+            self.record_failure()
+
+        with self._lock:
+            self._status = status
+        self._checked.set()
+        return status
+
+    def _health_client(self) -> httpx.Client:
+        """Persistent keep-alive client for health checks."""
+        with self._lock:
+            if self._http is None:
+                self._http = httpx.Client(timeout=self.health_timeout)
+            return self._http
+
+    def _run(self) -> None:
+        """Checking thread body."""
+        while True:
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.warning("Ollama availability check failed", error=str(e))
+                self._checked.set()
+            if self._stop.wait(self.interval):
+                return
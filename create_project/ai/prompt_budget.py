@@ -0,0 +1,399 @@
+# ABOUTME: Token-budgeted assembly of the context section of error help prompts
+# ABOUTME: Ranks context sections by relevance to the error and truncates them to fit
+
+"""
+Token-budgeted prompt context for error help.
+
+``ErrorContextCollector`` gathers system, project, error and template
+context. Rendering all of it makes prompts slow to evaluate on CPU-only
+Ollama, where prompt evaluation can run at a few dozen tokens per second.
+This module turns the collected context into prompt sections and keeps the
+ones that matter for the error within a token budget:
+
+    - each section's tokens are estimated from its length
+    - sections are ranked by relevance to the error's category (template,
+      git, virtual environment, filesystem or general)
+    - sections are added in rank order; one that does not fit is cut to the
+      remaining budget, keeping the end of tracebacks and operation lists
+      and the start of everything else, or dropped if too little is left
+    - long single values, such as variable dumps, are clipped
+
+The error type and message are template variables outside the budget, so
+the key facts are always in the prompt. ``PromptBudgetReport`` records which
+sections were kept, truncated or dropped.
+"""
+
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Approximate characters per token; conservative for code and paths
+CHARS_PER_TOKEN = 3
+
+# Longest error message and single value rendered into the prompt
+MAX_MESSAGE_CHARS = 1000
+MAX_VALUE_CHARS = 160
+
+# Smallest useful remainder of a truncated section
+MIN_SECTION_TOKENS = 24
+
+# Section order in the rendered prompt, with titles
+SECTION_TITLES = {
+    "error_details": "Error Details",
+    "validation": "Validation Problems",
+    "traceback": "Traceback (most recent call last)",
+    "operations": "Operations",
+    "template": "Template",
+    "variables": "Project Variables",
+    "options": "Generation Options",
+    "system": "System",
+}
+
+# Sections whose last lines matter most
+_KEEP_TAIL = {"traceback", "operations"}
+
+# Error categories, matched against the names of the error's classes
+_CATEGORY_PATTERNS: List[Tuple[str, Tuple[str, ...]]] = [
+    ("template", ("Template", "Validation", "Render", "Variable", "Undefined")),
+    ("git", ("Git",)),
+    ("venv", ("VirtualEnv", "Venv", "Dependency", "Install", "CalledProcess")),
+    (
+        "filesystem",
+        ("Path", "Permission", "FileNotFound", "FileExists", "Directory", "OSError"),
+    ),
+]
+
+# Relevance of each section by error category
+SECTION_RELEVANCE: Dict[str, Dict[str, float]] = {
+    "template": {
+        "validation": 1.0,
+        "error_details": 0.95,
+        "template": 0.9,
+        "variables": 0.8,
+        "traceback": 0.5,
+        "operations": 0.4,
+        "options": 0.3,
+        "system": 0.2,
+    },
+    "git": {
+        "error_details": 1.0,
+        "operations": 0.9,
+        "traceback": 0.7,
+        "system": 0.6,
+        "options": 0.4,
+        "template": 0.2,
+        "validation": 0.2,
+        "variables": 0.1,
+    },
+    "venv": {
+        "error_details": 1.0,
+        "system": 0.9,
+        "operations": 0.8,
+        "traceback": 0.7,
+        "options": 0.5,
+        "template": 0.3,
+        "validation": 0.2,
+        "variables": 0.2,
+    },
+    "filesystem": {
+        "error_details": 1.0,
+        "system": 0.9,
+        "traceback": 0.8,
+        "operations": 0.7,
+        "template": 0.4,
+        "options": 0.3,
+        "validation": 0.2,
+        "variables": 0.2,
+    },
+    "general": {
+        "error_details": 1.0,
+        "traceback": 0.9,
+        "operations": 0.7,
+        "validation": 0.6,
+        "template": 0.5,
+        "system": 0.5,
+        "variables": 0.4,
+        "options": 0.3,
+    },
+}
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate number of tokens in ``text``."""
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def clip(text: str, limit: int) -> str:
+    """Shorten ``text`` to at most ``limit`` characters, marking the cut."""
+    if len(text) <= limit:
+        return text
+    return text[: max(0, limit - 3)] + "..."
+
+
+def error_category(type_names: Iterable[str]) -> str:
+    """Category of an error from the names of its class and base classes."""
+    names = list(type_names)
+    for category, patterns in _CATEGORY_PATTERNS:
+        if any(pattern in name for name in names for pattern in patterns):
+            return category
+    return "general"
+
+
+@dataclass
+class PromptSection:
+    """One block of context in the prompt.
+
+    Attributes:
+        name: Section key in ``SECTION_TITLES``
+        lines: Content lines
+        relevance: Rank for the current error, higher first
+    """
+
+    name: str
+    lines: List[str]
+    relevance: float = 0.0
+
+    @property
+    def title(self) -> str:
+        """Heading of the section."""
+        return SECTION_TITLES.get(self.name, self.name.replace("_", " ").title())
+
+    @property
+    def text(self) -> str:
+        """Rendered section."""
+        return "\n".join([f"### {self.title}", *self.lines])
+
+    @property
+    def tokens(self) -> int:
+        """Estimated tokens of the rendered section."""
+        return estimate_tokens(self.text)
+
+    def truncated(self, budget: int) -> Optional["PromptSection"]:
+        """The largest part of this section that fits ``budget`` tokens.
+
+        Returns:
+            A shortened copy, or None if not even one line fits
+        """
+        keep_tail = self.name in _KEEP_TAIL
+        lines = list(reversed(self.lines)) if keep_tail else list(self.lines)
+        for count in range(len(lines) - 1, 0, -1):
+            omitted = len(lines) - count
+            marker = f"... ({omitted} {'earlier' if keep_tail else 'more'} lines)"
+            kept = lines[:count]
+            if keep_tail:
+                kept = [marker, *reversed(kept)]
+            else:
+                kept = [*kept, marker]
+            section = PromptSection(self.name, kept, self.relevance)
+            if section.tokens <= budget:
+                return section
+        return None
+
+
+@dataclass
+class PromptBudgetReport:
+    """What was kept of the prompt context.
+
+    Attributes:
+        budget_tokens: Token budget of the context sections
+        used_tokens: Estimated tokens of the kept sections
+        category: Error category used to rank the sections
+        kept: Sections included in full
+        truncated: Sections included in part
+        dropped: Sections left out
+    """
+
+    budget_tokens: int
+    used_tokens: int = 0
+    category: str = "general"
+    kept: List[str] = field(default_factory=list)
+    truncated: List[str] = field(default_factory=list)
+    dropped: List[str] = field(default_factory=list)
+
+
+def fit_sections(
+    sections: List[PromptSection], budget: int, category: str = "general"
+) -> Tuple[List[PromptSection], PromptBudgetReport]:
+    """Select and truncate sections to fit a token budget.
+
+    Args:
+        sections: Candidate sections with their relevance set
+        budget: Tokens available for all sections together
+        category: Error category, recorded in the report
+
+    Returns:
+        The kept sections in display order, and the report
+    """
+    report = PromptBudgetReport(budget_tokens=budget, category=category)
+    chosen: Dict[str, PromptSection] = {}
+    remaining = budget
+
+    for section in sorted(sections, key=lambda s: s.relevance, reverse=True):
+        if section.tokens <= remaining:
+            chosen[section.name] = section
+            report.kept.append(section.name)
+            remaining -= section.tokens
+            continue
+
+        part = (
+            section.truncated(remaining) if remaining >= MIN_SECTION_TOKENS else None
+        )
+        if part is None:
+            report.dropped.append(section.name)
+            continue
+        chosen[section.name] = part
+        report.truncated.append(section.name)
+        remaining -= part.tokens
+
+    report.used_tokens = budget - remaining
+    order = list(SECTION_TITLES)
+    kept = sorted(
+        chosen.values(),
+        key=lambda s: order.index(s.name) if s.name in order else len(order),
+    )
+    return kept, report
+
+
+def _value_text(value: Any, limit: int = MAX_VALUE_CHARS) -> str:
+    """Compact single-line rendering of a context value."""
+    if isinstance(value, str):
+        text = value
+    else:
+        try:
+            text = json.dumps(value, default=str, sort_keys=True)
+        except (TypeError, ValueError):
+            text = repr(value)
+    return clip(" ".join(text.split()), limit)
+
+
+def _mapping_lines(values: Dict[str, Any]) -> List[str]:
+    """One ``- key: value`` line per entry."""
+    return [f"- {key}: {_value_text(value)}" for key, value in values.items()]
+
+
+def _context_sections(error_context: Any) -> List[PromptSection]:
+    """Sections of a ``CompleteErrorContext``, without relevance."""
+    error = error_context.error
+    project = error_context.project
+    template = error_context.template
+    system = error_context.system
+    sections = []
+
+    details = []
+    if error.error_location:
+        details.append(f"- Location: {_value_text(error.error_location)}")
+    if error.original_error:
+        caused_by = _value_text(error.original_error, MAX_MESSAGE_CHARS)
+        details.append(f"- Caused by: {caused_by}")
+    sections.append(PromptSection("error_details", details))
+
+    validation = [f"- {_value_text(v)}" for v in error.validation_errors]
+    if template.missing_variables:
+        validation.append(
+            "- Missing required variables: " + ", ".join(template.missing_variables)
+        )
+    sections.append(PromptSection("validation", validation))
+
+    sections.append(
+        PromptSection(
+            "traceback",
+            [
+                line.rstrip()
+                for entry in error.traceback_lines
+                for line in entry.splitlines()
+                if line.strip()
+            ],
+        )
+    )
+
+    operations = [f"- {op}" for op in project.attempted_operations]
+    if project.partial_results:
+        operations.append("Partial results:")
+        operations.extend(_mapping_lines(project.partial_results))
+    sections.append(PromptSection("operations", operations))
+
+    template_lines = []
+    if template.validation_status != "no_template":
+        template_lines = [
+            f"- Name: {template.template_name} v{template.template_version}",
+            f"- Validation status: {template.validation_status}",
+        ]
+        if template.required_variables:
+            template_lines.append(
+                "- Required variables: " + ", ".join(template.required_variables)
+            )
+        if template.template_files:
+            template_lines.append("- Files: " + ", ".join(template.template_files))
+    sections.append(PromptSection("template", template_lines))
+
+    variables = _mapping_lines(project.project_variables)
+    sections.append(PromptSection("variables", variables))
+    sections.append(PromptSection("options", _mapping_lines(project.options)))
+
+    system_lines = [
+        f"- OS: {system.os_name} {clip(system.os_version, 60)} "
+        f"({system.platform_machine})",
+        f"- Python: {clip(system.python_version, 60)}",
+        f"- Free disk space: {system.available_disk_space_gb} GB",
+        f"- Working directory: {system.working_directory}",
+    ]
+    system_lines.extend(_mapping_lines(system.environment_variables))
+    sections.append(PromptSection("system", system_lines))
+
+    return [section for section in sections if section.lines]
+
+
+def assemble_error_context(
+    context: Dict[str, Any], budget: int
+) -> Tuple[Dict[str, Any], PromptBudgetReport]:
+    """Build the error help template variables within a token budget.
+
+    Args:
+        context: Context passed to the response generator, with ``error``
+            and, if context collection is enabled, ``error_context``
+        budget: Tokens available for the context sections
+
+    Returns:
+        Template variables (the error type and message, short system facts
+        and ``context_sections``) and the report of what was kept
+    """
+    error = context.get("error")
+    error_context = context.get("error_context")
+
+    if error_context is not None:
+        error_type = error_context.error.error_type
+        error_message = error_context.error.error_message
+    elif isinstance(error, BaseException):
+        error_type = type(error).__name__
+        error_message = str(error)
+    else:
+        error_type, error_message = "Unknown", str(error or "")
+
+    type_names = [error_type]
+    if isinstance(error, BaseException):
+        type_names.extend(cls.__name__ for cls in type(error).__mro__)
+    category = error_category(type_names)
+
+    variables: Dict[str, Any] = {
+        "error_type": error_type,
+        "error_message": clip(error_message, MAX_MESSAGE_CHARS),
+    }
+    if error_context is None:
+        return variables, PromptBudgetReport(budget_tokens=budget, category=category)
+
+    system = error_context.system
+    variables["python_version"] = system.python_version.split()[0]
+    variables["os_info"] = f"{system.os_name} ({system.platform_machine})"
+    if error_context.project.template_name != "unknown":
+        variables["template_name"] = error_context.project.template_name
+    if error_context.project.target_path != "unknown":
+        variables["target_path"] = error_context.project.target_path
+
+    relevance = SECTION_RELEVANCE[category]
+    sections = _context_sections(error_context)
+    for section in sections:
+        section.relevance = relevance.get(section.name, 0.0)
+
+    kept, report = fit_sections(sections, budget, category)
+    variables["context_sections"] = "\n\n".join(section.text for section in kept)
+    return variables, report
@@ -10,7 +10,9 @@ when AI services are unavailable.
 
 Key Features:
     - Multiple prompt types (error help, suggestions, explanations)
-    - Automatic model selection based on capabilities
+    - Automatic model selection based on capabilities and measured latency
+    - Model preloading so the first answer does not wait for a cold load
+    - Error help context ranked and truncated to a per-model token budget
     - Response quality validation with configurable thresholds
     - Streaming support for real-time response display
     - Fallback responses when AI is unavailable
@@ -87,7 +89,9 @@ import structlog
 from .exceptions import AIError, ModelNotAvailableError, ResponseTimeoutError
 from .model_manager import ModelCapability, ModelManager
 from .ollama_client import OllamaClient
+from .prompt_budget import PromptBudgetReport, assemble_error_context
 from .prompt_manager import PromptManager
+from .stream_metrics import response_metrics
 from .types import PromptType
 
 logger = structlog.get_logger(__name__)
@@ -116,6 +120,31 @@ class GenerationConfig:
     quality_check: bool = True
 
 
+# Static responses used when the model is unavailable
+FALLBACK_RESPONSES: Dict[PromptType, List[str]] = {
+    PromptType.ERROR_HELP: [
+        "Try checking your project template configuration and ensure all required dependencies are installed.",
+        "Verify that your system has sufficient permissions and disk space for project creation.",
+        "Review the error message for specific file paths or permission issues that need attention.",
+    ],
+    PromptType.SUGGESTIONS: [
+        "Consider using a standard Python project structure with src/ layout for better organization.",
+        "Look into popular project templates that match your use case and requirements.",
+        "Review successful projects similar to yours for inspiration and best practices.",
+    ],
+    PromptType.EXPLANATION: [
+        "Understanding the error context is key to finding the right solution.",
+        "Break down complex issues into smaller, manageable parts for easier troubleshooting.",
+        "Consult documentation and community resources for additional guidance.",
+    ],
+    PromptType.GENERIC_HELP: [
+        "Double-check your project configuration and template settings.",
+        "Ensure all required tools and dependencies are properly installed.",
+        "Consider starting with a simpler template to isolate the issue.",
+    ],
+}
+
+
 class ResponseGenerator:
     """
     AI response generator for project creation assistance.
@@ -140,6 +169,7 @@ class ResponseGenerator:
         ollama_client: Optional[OllamaClient] = None,
         model_manager: Optional[ModelManager] = None,
         prompt_manager: Optional[PromptManager] = None,
+        max_context_tokens: Optional[int] = None,
     ):
         """
         Initialize the response generator.
@@ -148,10 +178,15 @@ class ResponseGenerator:
             ollama_client: Client for Ollama API communication
             model_manager: Manager for model discovery and selection
             prompt_manager: Manager for prompt templates
+            max_context_tokens: Upper limit of the error context tokens in a
+                prompt, whatever the model's budget
         """
         self._client = ollama_client or OllamaClient()
         self._model_manager = model_manager or ModelManager()
         self._prompt_manager = prompt_manager or PromptManager()
+        self._max_context_tokens = max_context_tokens
+        # What the most recent error help prompt kept of its context
+        self.last_prompt_report: Optional[PromptBudgetReport] = None
         self._fallback_responses: Dict[PromptType, List[str]] = (
             self._load_fallback_responses()
         )
@@ -165,26 +200,8 @@ class ResponseGenerator:
     def _load_fallback_responses(self) -> Dict[PromptType, List[str]]:
         """Load fallback responses for when AI is unavailable."""
         return {
-            PromptType.ERROR_HELP: [
-                "Try checking your project template configuration and ensure all required dependencies are installed.",
-                "Verify that your system has sufficient permissions and disk space for project creation.",
-                "Review the error message for specific file paths or permission issues that need attention.",
-            ],
-            PromptType.SUGGESTIONS: [
-                "Consider using a standard Python project structure with src/ layout for better organization.",
-                "Look into popular project templates that match your use case and requirements.",
-                "Review successful projects similar to yours for inspiration and best practices.",
-            ],
-            PromptType.EXPLANATION: [
-                "Understanding the error context is key to finding the right solution.",
-                "Break down complex issues into smaller, manageable parts for easier troubleshooting.",
-                "Consult documentation and community resources for additional guidance.",
-            ],
-            PromptType.GENERIC_HELP: [
-                "Double-check your project configuration and template settings.",
-                "Ensure all required tools and dependencies are properly installed.",
-                "Consider starting with a simpler template to isolate the issue.",
-            ],
+            prompt_type: list(responses)
+            for prompt_type, responses in FALLBACK_RESPONSES.items()
         }
 
     async def generate_response(
@@ -219,12 +236,12 @@ class ResponseGenerator:
             return self._get_fallback_response(prompt_type, context)
 
         try:
-            # Render prompt template
-            prompt = self._render_prompt(prompt_type, context)
-
-            # Select appropriate model
+            # Select appropriate model, whose budget limits the prompt
             model = await self._select_model(config.model_preference)
 
+            # Render prompt template
+            prompt = self._render_prompt(prompt_type, context, model)
+
             # Generate response
             response = await self._generate_with_timeout(
                 model=model, prompt=prompt, config=config
@@ -301,9 +318,9 @@ class ResponseGenerator:
             return
 
         try:
-            # Render prompt and select model
-            prompt = self._render_prompt(prompt_type, context)
+            # Select model and render prompt
             model = await self._select_model(config.model_preference)
+            prompt = self._render_prompt(prompt_type, context, model)
 
             # Stream the response
             response_chunks = []
@@ -330,6 +347,86 @@ class ResponseGenerator:
             async for chunk in self._stream_fallback(fallback):
                 yield chunk
 
+    async def stream_model_response(
+        self,
+        prompt_type: PromptType,
+        context: Dict[str, Any],
+        config: Optional[GenerationConfig] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Stream the model's response without substituting fallback text.
+
+        Unlike ``stream_response``, failures are raised so the caller can
+        answer some other way, and a complete response that fails the
+        quality check raises once its last chunk has been yielded.
+
+        Args:
+            prompt_type: Type of prompt to generate
+            context: Context variables for prompt rendering
+            config: Generation configuration options
+
+        Yields:
+            Chunks of the generated response
+
+        Raises:
+            ResponseTimeoutError: If generation times out
+            AIError: If the client is unavailable, streaming fails or the
+                response fails the quality check
+        """
+        config = config or GenerationConfig()
+        config.stream = True
+
+        if not self._client.is_available:
+            raise AIError("Ollama client not available")
+
+        model = await self._select_model(config.model_preference)
+        prompt = self._render_prompt(prompt_type, context, model)
+
+        response_chunks = []
+        async for chunk in self._stream_with_timeout(model, prompt, config):
+            response_chunks.append(chunk)
+            yield chunk
+
+        complete_response = "".join(response_chunks)
+        if config.quality_check and not self._validate_response_quality(
+            complete_response
+        ):
+            logger.warning(
+                "Streamed response failed quality check",
+                prompt_type=prompt_type.value,
+                response_length=len(complete_response),
+            )
+            raise AIError("Response failed quality check")
+
+    async def prewarm(
+        self, model_preference: Optional[str] = None, keep_alive_minutes: int = 10
+    ) -> Optional[str]:
+        """
+        Preload the model the next response would use.
+
+        Args:
+            model_preference: Preferred model, as in ``GenerationConfig``
+            keep_alive_minutes: How long Ollama keeps the model loaded
+
+        Returns:
+            Name of the loaded model, or None if it could not be loaded
+        """
+        if not self._client.is_available:
+            return None
+
+        model = await self._select_model(model_preference)
+        response = await self._client.preload_model(
+            model, keep_alive=f"{keep_alive_minutes}m"
+        )
+        if not response.success:
+            logger.warning(
+                "Model preload failed", model=model, error=response.error_message
+            )
+            return None
+
+        logger.info("Model preloaded", model=model, load_time=response.response_time)
+        return model
+
     async def _stream_fallback(
         self, fallback: str, chunk_size: int = 100
     ) -> AsyncIterator[str]:
@@ -338,8 +435,16 @@ class ResponseGenerator:
             yield fallback[i : i + chunk_size]
             await asyncio.sleep(0.1)
 
-    def _render_prompt(self, prompt_type: PromptType, context: Dict[str, Any]) -> str:
+    def _render_prompt(
+        self,
+        prompt_type: PromptType,
+        context: Dict[str, Any],
+        model: Optional[str] = None,
+    ) -> str:
         """Render prompt template with context variables."""
+        if prompt_type == PromptType.ERROR_HELP:
+            context = self._budget_error_context(context, model)
+
         try:
             return self._prompt_manager.render_prompt(
                 prompt_type, context, validate_required=False
@@ -351,6 +456,53 @@ class ResponseGenerator:
             # Return basic prompt as fallback
             return f"Please help with: {context.get('request', 'general assistance')}"
 
+    def _budget_error_context(
+        self, context: Dict[str, Any], model: Optional[str]
+    ) -> Dict[str, Any]:
+        """
+        Add the error help variables, with the context fitted to a budget.
+
+        The assembled variables take precedence over the caller's values.
+
+        Args:
+            context: Context passed by the caller
+            model: Model that will answer, whose budget applies
+
+        Returns:
+            The context with the assembled variables added
+        """
+        error = context.get("error")
+        if context.get("error_context") is None and not isinstance(
+            error, BaseException
+        ):
+            return context
+
+        try:
+            budget = (
+                self._model_manager.context_token_budget(model)
+                if model
+                else ModelManager.DEFAULT_CONTEXT_TOKENS
+            )
+            if self._max_context_tokens:
+                budget = min(budget, self._max_context_tokens)
+            variables, report = assemble_error_context(context, budget)
+        except Exception as e:
+            logger.warning("Failed to assemble error context", error=str(e))
+            return context
+
+        self.last_prompt_report = report
+        logger.info(
+            "Error context fitted to token budget",
+            model=model,
+            category=report.category,
+            budget_tokens=report.budget_tokens,
+            used_tokens=report.used_tokens,
+            kept=report.kept,
+            truncated=report.truncated,
+            dropped=report.dropped,
+        )
+        return {**context, **variables}
+
     async def _select_model(self, preference: Optional[str]) -> str:
         """Select the best available model for text generation."""
         try:
@@ -373,7 +525,12 @@ class ResponseGenerator:
                     "No suitable text generation models available", []
                 )
 
-            # Prefer larger models for better quality
+            # Prefer the model that has answered fastest on this machine
+            fastest = self._model_manager.select_fastest_model(suitable_models)
+            if fastest is not None:
+                return fastest.name
+
+            # Without measurements, prefer larger models for better quality
             suitable_models.sort(key=lambda m: m.size, reverse=True)
 
             return suitable_models[0].name
@@ -401,6 +558,11 @@ class ResponseGenerator:
             )
 
             if response.success and response.data.get("response"):
+                metrics = response_metrics(
+                    model, response.data, response.response_time or 0.0
+                )
+                if metrics is not None:
+                    self._model_manager.record_stream_metrics(metrics)
                 return response.data["response"]
             else:
                 raise AIError(f"Generation failed: {response.error_message}")
@@ -413,34 +575,35 @@ class ResponseGenerator:
     async def _stream_with_timeout(
         self, model: str, prompt: str, config: GenerationConfig
     ) -> AsyncIterator[str]:
-        """Stream response with timeout handling."""
+        """Stream response text, failing once ``timeout_seconds`` have passed.
+
+        Each chunk must also arrive within ``timeout_seconds`` of the last
+        one (enforced by the client's read timeout). Stream metrics are
+        reported to the model manager.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + config.timeout_seconds
+        stream = self._client.stream_generate(
+            model=model,
+            prompt=prompt,
+            on_metrics=self._model_manager.record_stream_metrics,
+            timeout=config.timeout_seconds,
+            temperature=config.temperature,
+            top_p=config.top_p,
+            max_tokens=config.max_tokens,
+        )
+
         try:
-            # Create streaming task
-            stream_task = asyncio.create_task(
-                self._client.stream_generate(
-                    model=model,
-                    prompt=prompt,
-                    temperature=config.temperature,
-                    top_p=config.top_p,
-                    max_tokens=config.max_tokens,
-                )
-            )
+            async for response in stream:
+                if not response.success:
+                    raise AIError(f"Streaming failed: {response.error_message}")
 
-            # Stream with timeout
-            start_time = asyncio.get_event_loop().time()
-            async for response in stream_task:
-                # Check timeout
-                if (
-                    asyncio.get_event_loop().time() - start_time
-                    > config.timeout_seconds
-                ):
-                    stream_task.cancel()
-                    raise ResponseTimeoutError(
-                        f"Streaming timed out after {config.timeout_seconds}s"
-                    )
+                text = response.content
+                if text:
+                    yield text
 
-                if response.success and response.data.get("response"):
-                    yield response.data["response"]
+                if loop.time() > deadline:
+                    raise ResponseTimeoutError(int(config.timeout_seconds))
 
         except asyncio.CancelledError:
             logger.warning("Stream generation cancelled")
@@ -448,6 +611,8 @@ class ResponseGenerator:
         except Exception as e:
             logger.error("Stream generation error", error=str(e))
             raise
+        finally:
+            await stream.aclose()
 
     def _validate_response_quality(self, response: str) -> bool:
         """Validate the quality of a generated response."""
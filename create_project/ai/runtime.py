@@ -0,0 +1,272 @@
+# ABOUTME: Long-lived background event loop for running AI coroutines from sync code
+# ABOUTME: Owns pooled keep-alive HTTP clients so Ollama connections are reused across calls
+
+"""
+AI runtime: one event loop thread shared by all synchronous AI callers.
+
+Project generation is synchronous, but the AI service is async. Creating a
+fresh event loop for every failure (and closing it afterwards) leaves the
+OllamaClient's lazily created ``httpx.AsyncClient`` bound to a dead loop,
+so every help request pays for a new TCP connection. AIRuntime instead runs
+one event loop on a daemon thread for the life of the process:
+
+    - ``submit`` runs a coroutine on the loop with
+      ``asyncio.run_coroutine_threadsafe`` and waits for it with a timeout;
+      ``spawn`` does the same without waiting
+    - ``http_client`` returns one pooled ``httpx.AsyncClient`` per base URL,
+      created on the loop, so keep-alive connections survive between calls
+    - ``shutdown`` cancels leftover tasks, closes the clients and stops the
+      loop; it runs automatically at interpreter exit
+
+OllamaClient uses the runtime's client whenever it is called on the
+runtime's loop (see ``current_ai_runtime``).
+"""
+
+import asyncio
+import atexit
+import concurrent.futures
+import threading
+from typing import Awaitable, Dict, Optional, TypeVar
+
+import httpx
+from structlog import get_logger
+
+from .exceptions import ResponseTimeoutError
+
+T = TypeVar("T")
+
+logger = get_logger(__name__)
+
+
+class AIRuntime:
+    """Background event loop thread with persistent HTTP clients.
+
+    The loop thread starts on first use and can be restarted after
+    ``shutdown``. All public methods are thread-safe.
+    """
+
+    MAX_CONNECTIONS = 10
+    MAX_KEEPALIVE_CONNECTIONS = 5
+    KEEPALIVE_EXPIRY = 60.0
+    SHUTDOWN_TIMEOUT = 5.0
+
+    def __init__(self, name: str = "ai-runtime") -> None:
+        """Initialize a runtime whose loop has not started yet.
+
+        Args:
+            name: Name of the loop thread
+        """
+        self.name = name
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._started = threading.Event()
+        # Only touched from the loop thread
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the loop thread is alive."""
+        thread = self._thread
+        return thread is not None and thread.is_alive()
+
+    def in_loop_thread(self) -> bool:
+        """Whether the caller is running on the runtime's loop thread."""
+        return threading.current_thread() is self._thread
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        """Start the loop thread if it is not running.
+
+        Returns:
+            The runtime's event loop
+        """
+        with self._lock:
+            if self._loop is not None and self.is_running:
+                return self._loop
+
+            self._loop = asyncio.new_event_loop()
+            self._started.clear()
+            self._thread = threading.Thread(
+                target=self._run, args=(self._loop,), name=self.name, daemon=True
+            )
+            self._thread.start()
+            loop = self._loop
+
+        self._started.wait()
+        logger.debug("AI runtime started", thread=self.name)
+        return loop
+
+    def _run(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Loop thread body: run until stopped, then release everything."""
+        asyncio.set_event_loop(loop)
+        loop.call_soon(self._started.set)
+        try:
+            loop.run_forever()
+        finally:
+            try:
+                pending = asyncio.all_tasks(loop)
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    loop.run_until_complete(
+                        asyncio.gather(*pending, return_exceptions=True)
+                    )
+                loop.run_until_complete(self._close_clients())
+                loop.run_until_complete(loop.shutdown_asyncgens())
+            except Exception as e:
+                logger.warning("Error while stopping AI runtime", error=str(e))
+            finally:
+                loop.close()
+
+    def submit(self, coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """Run a coroutine on the runtime's loop and wait for its result.
+
+        Args:
+            coro: Coroutine to run
+            timeout: Seconds to wait; the coroutine is cancelled when exceeded
+
+        Returns:
+            The coroutine's result
+
+        Raises:
+            ResponseTimeoutError: If the coroutine did not finish in time
+            RuntimeError: If called from the runtime's own loop thread, where
+                waiting would deadlock
+            Exception: Whatever the coroutine raised
+        """
+        if self.in_loop_thread():
+            coro.close()
+            raise RuntimeError("AIRuntime.submit() called from its own event loop")
+
+        future = asyncio.run_coroutine_threadsafe(coro, self.start())
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise ResponseTimeoutError(timeout) from None
+
+    def spawn(self, coro: Awaitable[T]) -> "concurrent.futures.Future[T]":
+        """Run a coroutine on the runtime's loop without waiting for it.
+
+        Args:
+            coro: Coroutine to run in the background
+
+        Returns:
+            Future of the coroutine's result
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.start())
+
+    def http_client(
+        self, base_url: str, timeout: Optional[httpx.Timeout] = None
+    ) -> httpx.AsyncClient:
+        """Persistent keep-alive client for a base URL.
+
+        Must be called on the runtime's loop thread, where the client's
+        connections live.
+
+        Args:
+            base_url: Base URL of the service
+            timeout: Default timeouts for a newly created client
+
+        Returns:
+            The pooled client for ``base_url``
+        """
+        if not self.in_loop_thread():
+            raise RuntimeError("AIRuntime.http_client() used outside its event loop")
+
+        client = self._clients.get(base_url)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                base_url=base_url,
+                timeout=timeout or httpx.Timeout(30.0),
+                limits=httpx.Limits(
+                    max_connections=self.MAX_CONNECTIONS,
+                    max_keepalive_connections=self.MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=self.KEEPALIVE_EXPIRY,
+                ),
+                headers={"Content-Type": "application/json"},
+            )
+            self._clients[base_url] = client
+            logger.debug("Created pooled AI HTTP client", base_url=base_url)
+        return client
+
+    async def _close_clients(self) -> None:
+        """Close every pooled client."""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.debug("Failed to close AI HTTP client", error=str(e))
+
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        """Stop the loop, cancelling unfinished work and closing clients.
+
+        Args:
+            timeout: Seconds to wait for the loop thread to finish
+        """
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+
+        if loop is None or thread is None:
+            return
+        if thread is threading.current_thread():
+            loop.stop()
+            return
+
+        try:
+            loop.call_soon_threadsafe(loop.stop)
+        except RuntimeError:
+            # Loop already closed
+            pass
+        thread.join(self.SHUTDOWN_TIMEOUT if timeout is None else timeout)
+        if thread.is_alive():
+            logger.warning("AI runtime thread did not stop in time", thread=self.name)
+        else:
+            logger.debug("AI runtime stopped", thread=self.name)
+
+
+_runtime: Optional[AIRuntime] = None
+_runtime_lock = threading.Lock()
+_atexit_registered = False
+
+
+def get_ai_runtime() -> AIRuntime:
+    """Return the process-wide AI runtime, creating it on first use."""
+    global _runtime, _atexit_registered
+    with _runtime_lock:
+        if _runtime is None:
+            _runtime = AIRuntime()
+        if not _atexit_registered:
+            atexit.register(_shutdown_at_exit)
+            _atexit_registered = True
+        return _runtime
+
+
+def set_ai_runtime(runtime: Optional[AIRuntime]) -> None:
+    """Replace the process-wide AI runtime.
+
+    The previous runtime is not shut down. Passing None resets it so the
+    next call to get_ai_runtime() creates a fresh runtime.
+    """
+    global _runtime
+    with _runtime_lock:
+        _runtime = runtime
+
+
+def current_ai_runtime() -> Optional[AIRuntime]:
+    """The process-wide runtime if the caller runs on its loop thread."""
+    runtime = _runtime
+    if runtime is not None and runtime.in_loop_thread():
+        return runtime
+    return None
+
+
+def _shutdown_at_exit() -> None:
+    """Stop the process-wide runtime at interpreter exit."""
+    runtime = _runtime
+    if runtime is not None:
+        runtime.shutdown()
@@ -0,0 +1,213 @@
+# ABOUTME: Single-flight coalescing of identical in-flight AI requests
+# ABOUTME: Duplicate callers share one generation or fan out from one upstream stream
+
+"""
+Single-flight request coalescing.
+
+When several project generations fail the same way at the same time, each
+asks for the same help response. A local model server handles one
+generation at a time, so duplicates queue behind each other and every
+caller waits for all of them. SingleFlight lets the first caller for a key
+(the leader) do the work while concurrent callers with the same key wait
+for the leader's result:
+
+    - ``run`` shares the result (or exception) of one coroutine
+    - ``stream`` fans the chunks of one async iterator out to every
+      subscriber; late subscribers first receive the chunks already
+      produced, so everyone sees the complete response
+
+Callers may run on different threads and event loops (each failed
+generation may drive its own loop), so waiters are coordinated with
+thread-safe primitives rather than loop-bound asyncio futures. Keys are
+forgotten as soon as the leader finishes; a later call starts a new flight
+(and is expected to hit the response cache instead).
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from structlog import get_logger
+
+from .exceptions import AIError
+
+T = TypeVar("T")
+
+logger = get_logger(__name__)
+
+# Queue item marking the end of a shared stream
+_END = object()
+
+
+@dataclass
+class _Broadcast:
+    """Chunks of a shared stream and the subscribers waiting for more."""
+
+    chunks: List[str] = field(default_factory=list)
+    done: bool = False
+    error: Optional[BaseException] = None
+    subscribers: List[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]] = field(
+        default_factory=list
+    )
+
+
+class SingleFlight:
+    """Coalesces concurrent calls that share a key.
+
+    Attributes:
+        coalesced: Number of calls served by another caller's flight
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._lock = threading.Lock()
+        self._calls: Dict[str, concurrent.futures.Future] = {}
+        self._streams: Dict[str, _Broadcast] = {}
+        self.coalesced = 0
+
+    def in_flight(self) -> int:
+        """Number of keys with a call or stream in progress."""
+        with self._lock:
+            return len(self._calls) + len(self._streams)
+
+    async def run(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await ``fn()``, or the result of an identical call in progress.
+
+        Args:
+            key: Identity of the call
+            fn: Starts the work when this caller leads the flight
+
+        Returns:
+            Result of the leader's call
+
+        Raises:
+            Exception: Whatever the leader's call raised
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = concurrent.futures.Future()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            logger.debug("Joining in-flight AI request", key=key[:16])
+            # Shielded so a follower's cancellation leaves the flight alone
+            return await asyncio.shield(asyncio.wrap_future(future))
+
+        try:
+            result = await fn()
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        except BaseException:
+            # Cancelled leader: followers fail instead of waiting forever
+            future.set_exception(AIError("Shared AI request was cancelled"))
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    async def stream(
+        self, key: str, fn: Callable[[], AsyncIterator[str]]
+    ) -> AsyncIterator[str]:
+        """Iterate ``fn()``, or subscribe to an identical stream in progress.
+
+        Args:
+            key: Identity of the stream
+            fn: Opens the upstream iterator when this caller leads
+
+        Yields:
+            Every chunk of the shared stream, from the beginning
+
+        Raises:
+            Exception: Whatever the upstream iterator raised
+        """
+        with self._lock:
+            broadcast = self._streams.get(key)
+            leader = broadcast is None
+            if leader:
+                broadcast = self._streams[key] = _Broadcast()
+            else:
+                self.coalesced += 1
+
+        if leader:
+            async for chunk in self._lead(key, broadcast, fn):
+                yield chunk
+        else:
+            logger.debug("Subscribing to in-flight AI stream", key=key[:16])
+            async for chunk in self._follow(broadcast):
+                yield chunk
+
+    async def _lead(
+        self, key: str, broadcast: _Broadcast, fn: Callable[[], AsyncIterator[str]]
+    ) -> AsyncIterator[str]:
+        """Consume the upstream iterator and publish each chunk."""
+        error: Optional[BaseException] = AIError("Shared AI stream was closed early")
+        try:
+            async for chunk in fn():
+                with self._lock:
+                    broadcast.chunks.append(chunk)
+                    subscribers = list(broadcast.subscribers)
+                self._publish(subscribers, chunk)
+                yield chunk
+            error = None
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            with self._lock:
+                broadcast.done = True
+                broadcast.error = error
+                subscribers = list(broadcast.subscribers)
+                del self._streams[key]
+            self._publish(subscribers, _END)
+
+    async def _follow(self, broadcast: _Broadcast) -> AsyncIterator[str]:
+        """Replay the chunks produced so far, then wait for the rest."""
+        queue: asyncio.Queue = asyncio.Queue()
+        with self._lock:
+            replay = list(broadcast.chunks)
+            done = broadcast.done
+            if not done:
+                broadcast.subscribers.append((asyncio.get_running_loop(), queue))
+
+        for chunk in replay:
+            yield chunk
+
+        while not done:
+            item = await queue.get()
+            if item is _END:
+                break
+            yield item
+
+        if broadcast.error is not None:
+            raise broadcast.error
+
+    @staticmethod
+    def _publish(
+        subscribers: List[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]], item: Any
+    ) -> None:
+        """Hand an item to every subscriber on its own event loop."""
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, item)
+            except RuntimeError:
+                # The subscriber's loop has closed; nobody is listening
+                pass
@@ -0,0 +1,222 @@
+# ABOUTME: Incremental NDJSON decoding and per-request timing for Ollama streams
+# ABOUTME: Measures time to first token, inter-token latency and token throughput
+
+"""
+Streaming metrics for Ollama.
+
+Ollama streams generations as newline-delimited JSON. ``NDJSONDecoder``
+decodes each object as soon as its line is complete, so network chunks that
+split a line, or carry several lines, are handled without buffering the whole
+body.
+
+``StreamTimer`` timestamps every decoded chunk and produces a
+``StreamMetrics`` for the request:
+
+    - time to first token (request sent to first non-empty chunk)
+    - inter-token latency (gaps between non-empty chunks)
+    - prompt and eval token counts and durations from Ollama's final chunk
+
+Ollama reports durations in nanoseconds; ``StreamMetrics`` stores seconds.
+"""
+
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from .exceptions import AIError
+
+_NANOSECONDS = 1_000_000_000
+
+
+class NDJSONDecoder:
+    """Incremental decoder for newline-delimited JSON byte streams."""
+
+    def __init__(self) -> None:
+        """Initialize an empty decoder."""
+        self._buffer = bytearray()
+
+    def feed(self, data: bytes) -> List[Dict[str, Any]]:
+        """Add bytes and decode every line they complete.
+
+        Args:
+            data: Next piece of the stream
+
+        Returns:
+            Objects of the completed lines, in order
+
+        Raises:
+            AIError: If a completed line is not a JSON object
+        """
+        self._buffer += data
+        if b"\n" not in data:
+            return []
+        *lines, rest = self._buffer.split(b"\n")
+        self._buffer = bytearray(rest)
+        return [obj for obj in map(self._decode, lines) if obj is not None]
+
+    def flush(self) -> List[Dict[str, Any]]:
+        """Decode a final line that was not newline-terminated."""
+        line, self._buffer = bytes(self._buffer), bytearray()
+        obj = self._decode(line)
+        return [obj] if obj is not None else []
+
+    @staticmethod
+    def _decode(line: bytes) -> Optional[Dict[str, Any]]:
+        """Decode one line, ignoring blank ones."""
+        line = line.strip()
+        if not line:
+            return None
+        try:
+            obj = json.loads(line)
+        except ValueError as e:
+            raise AIError(f"Invalid JSON in Ollama stream: {line[:100]!r}") from e
+        if not isinstance(obj, dict):
+            raise AIError(f"Unexpected value in Ollama stream: {line[:100]!r}")
+        return obj
+
+
+def chunk_text(chunk: Dict[str, Any]) -> str:
+    """Generated text of a ``/api/generate`` or ``/api/chat`` stream chunk."""
+    message = chunk.get("message")
+    if isinstance(message, dict):
+        return message.get("content") or ""
+    return chunk.get("response") or ""
+
+
+@dataclass
+class StreamMetrics:
+    """Timing of one streamed generation.
+
+    Attributes:
+        model: Model name
+        time_to_first_token: Seconds until the first non-empty chunk
+        inter_token_latencies: Seconds between consecutive non-empty chunks
+        total_time: Seconds until the stream ended
+        completed: Whether Ollama's final chunk was received
+        prompt_eval_count: Prompt tokens evaluated
+        prompt_eval_duration: Seconds spent evaluating the prompt
+        eval_count: Tokens generated
+        eval_duration: Seconds spent generating
+        load_duration: Seconds spent loading the model
+    """
+
+    model: str
+    time_to_first_token: Optional[float] = None
+    inter_token_latencies: List[float] = field(default_factory=list)
+    total_time: float = 0.0
+    completed: bool = False
+    prompt_eval_count: Optional[int] = None
+    prompt_eval_duration: Optional[float] = None
+    eval_count: Optional[int] = None
+    eval_duration: Optional[float] = None
+    load_duration: Optional[float] = None
+
+    @property
+    def mean_inter_token_latency(self) -> Optional[float]:
+        """Average gap between chunks, if more than one arrived."""
+        if not self.inter_token_latencies:
+            return None
+        return sum(self.inter_token_latencies) / len(self.inter_token_latencies)
+
+    @property
+    def tokens_per_second(self) -> Optional[float]:
+        """Generation throughput reported by Ollama."""
+        return _rate(self.eval_count, self.eval_duration)
+
+    @property
+    def prompt_tokens_per_second(self) -> Optional[float]:
+        """Prompt evaluation throughput reported by Ollama."""
+        return _rate(self.prompt_eval_count, self.prompt_eval_duration)
+
+
+def _rate(count: Optional[int], duration: Optional[float]) -> Optional[float]:
+    """Tokens per second, if both values are known."""
+    if not count or not duration:
+        return None
+    return count / duration
+
+
+def _seconds(nanoseconds: Any) -> Optional[float]:
+    """Convert an Ollama duration to seconds."""
+    if not isinstance(nanoseconds, (int, float)):
+        return None
+    return nanoseconds / _NANOSECONDS
+
+
+def _apply_final_chunk(metrics: StreamMetrics, chunk: Dict[str, Any]) -> None:
+    """Take Ollama's token counts and durations from its final chunk."""
+    metrics.completed = True
+    metrics.prompt_eval_count = chunk.get("prompt_eval_count")
+    metrics.prompt_eval_duration = _seconds(chunk.get("prompt_eval_duration"))
+    metrics.eval_count = chunk.get("eval_count")
+    metrics.eval_duration = _seconds(chunk.get("eval_duration"))
+    metrics.load_duration = _seconds(chunk.get("load_duration"))
+
+
+def response_metrics(
+    model: str, data: Dict[str, Any], total_time: float
+) -> Optional[StreamMetrics]:
+    """Metrics of a non-streamed generation.
+
+    A non-streamed response is Ollama's final chunk with the whole text.
+    There is no observed first token; Ollama's model load and prompt
+    evaluation time, which precede the first token, stand in for it.
+
+    Args:
+        model: Model name
+        data: Response body
+        total_time: Seconds the request took
+
+    Returns:
+        The metrics, or None if the body carries no timings
+    """
+    if not data.get("done"):
+        return None
+    metrics = StreamMetrics(model, total_time=total_time)
+    _apply_final_chunk(metrics, data)
+    if metrics.load_duration is not None or metrics.prompt_eval_duration is not None:
+        metrics.time_to_first_token = (metrics.load_duration or 0.0) + (
+            metrics.prompt_eval_duration or 0.0
+        )
+    return metrics
+
+
+class StreamTimer:
+    """Collects ``StreamMetrics`` while a stream is consumed."""
+
+    def __init__(
+        self, model: str, clock: Callable[[], float] = time.perf_counter
+    ) -> None:
+        """Start timing a request.
+
+        Args:
+            model: Model name
+            clock: Monotonic clock in seconds
+        """
+        self.metrics = StreamMetrics(model)
+        self._clock = clock
+        self._start = clock()
+        self._last_token: Optional[float] = None
+
+    def elapsed(self) -> float:
+        """Seconds since the request started."""
+        return self._clock() - self._start
+
+    def record_chunk(self, chunk: Dict[str, Any]) -> None:
+        """Timestamp a decoded chunk and take the counts of the final one."""
+        now = self._clock()
+        if chunk_text(chunk):
+            if self._last_token is None:
+                self.metrics.time_to_first_token = now - self._start
+            else:
+                self.metrics.inter_token_latencies.append(now - self._last_token)
+            self._last_token = now
+
+        if chunk.get("done"):
+            _apply_final_chunk(self.metrics, chunk)
+
+    def finish(self) -> StreamMetrics:
+        """Stop timing and return the metrics."""
+        self.metrics.total_time = self.elapsed()
+        return self.metrics
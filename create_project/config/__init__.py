@@ -26,6 +26,7 @@ from .models import (
     OllamaConfig,
     TemplateConfig,
     UIConfig,
+    VenvConfig,
 )
 
 __all__ = [
@@ -40,4 +41,5 @@ __all__ = [
     "TemplateConfig",
     "OllamaConfig",
     "LoggingConfig",
+    "VenvConfig",
 ]
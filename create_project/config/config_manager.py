@@ -319,6 +319,10 @@ class ConfigManager:
             "APP_AI_CACHE_ENABLED": ("ai", "cache_enabled"),
             "APP_AI_CACHE_TTL_HOURS": ("ai", "cache_ttl_hours"),
             "APP_AI_MAX_CACHE_ENTRIES": ("ai", "max_cache_entries"),
+            "APP_AI_CACHE_BACKEND": ("ai", "cache_backend"),
+            "APP_AI_HEDGE_AFTER_SECONDS": ("ai", "hedge_after_seconds"),
+            "APP_AI_HELP_DEADLINE_SECONDS": ("ai", "help_deadline_seconds"),
+            "APP_AI_MODEL_KEEP_ALIVE_MINUTES": ("ai", "model_keep_alive_minutes"),
             "APP_AI_PREFERRED_MODELS": ("ai", "preferred_models"),
             "APP_AI_CONTEXT_COLLECTION_ENABLED": ("ai", "context_collection_enabled"),
             "APP_AI_MAX_CONTEXT_SIZE_KB": ("ai", "max_context_size_kb"),
@@ -328,6 +332,11 @@ class ConfigManager:
             "APP_AI_TEMPERATURE": ("ai", "temperature"),
             "APP_AI_TOP_P": ("ai", "top_p"),
             "APP_AI_STREAM_RESPONSES": ("ai", "stream_responses"),
+            # Virtual environment / dependency installation
+            "VENV_WHEELHOUSE_DIR": ("venv", "wheelhouse_dir"),
+            "VENV_OFFLINE": ("venv", "offline"),
+            "VENV_PACKAGE_CACHE_DIR": ("venv", "package_cache_dir"),
+            "VENV_UV_LINK_MODE": ("venv", "uv_link_mode"),
         }
 
         for env_var, config_path in env_mappings.items():
@@ -368,6 +377,7 @@ class ConfigManager:
                 "enable_ai_assistance",  # AI assistance
                 "response_quality_check",  # AI quality check
                 "stream_responses",  # AI streaming
+                "offline",  # Offline venv installs
             ]
             for path_part in config_path
         ):
@@ -405,7 +415,8 @@ class ConfigManager:
 
         # Handle empty string for optional fields
         if not value.strip() and any(
-            path_part in ["preferred_model"] for path_part in config_path
+            path_part in ["preferred_model", "wheelhouse_dir", "package_cache_dir"]
+            for path_part in config_path
         ):
             return None
 
@@ -42,6 +42,14 @@ class UIConfig(BaseModel):
     remember_window_state: bool = Field(
         default=True, description="Remember window position and size"
     )
+    progress_updates_per_second: float = Field(
+        default=20.0,
+        ge=0,
+        description="Maximum progress updates delivered per second (0 = unlimited)",
+    )
+    progress_history_size: int = Field(
+        default=256, ge=1, description="Recent progress events kept per operation"
+    )
 
     @field_validator("window_size")
     @classmethod
@@ -193,6 +201,64 @@ class LoggingConfig(BaseModel):
     max_files: int = Field(
         default=5, ge=1, le=100, description="Maximum number of log files to retain"
     )
+    trace_enabled: bool = Field(
+        default=False,
+        description="Record trace spans and write a Chrome trace file on exit",
+    )
+    trace_file: str = Field(
+        default="create-project-trace.json",
+        description="Chrome trace-event file written when tracing is enabled",
+    )
+
+
+class VenvConfig(BaseModel):
+    """Virtual environment and dependency installation settings."""
+
+    wheelhouse_dir: Optional[str] = Field(
+        default=None,
+        description="Local wheelhouse directory passed to installers via --find-links",
+    )
+    offline: bool = Field(
+        default=False,
+        description="Install only from the wheelhouse (--no-index, no network)",
+    )
+    package_cache_dir: Optional[str] = Field(
+        default=None,
+        description="Shared uv/pip cache directory (default: user cache directory)",
+    )
+    uv_link_mode: Literal["hardlink", "copy", "symlink", "clone"] = Field(
+        default="hardlink", description="Link mode for uv installs from the cache"
+    )
+    pool_size: int = Field(
+        default=0,
+        ge=0,
+        le=16,
+        description="Prewarmed venvs kept per Python version in the GUI (0 disables)",
+    )
+    pool_dir: Optional[str] = Field(
+        default=None,
+        description="Staging directory for prewarmed venvs (same filesystem)",
+    )
+    pool_python_versions: List[str] = Field(
+        default_factory=list,
+        description="Python versions to prewarm (empty: the default interpreter)",
+    )
+    pool_idle_seconds: float = Field(
+        default=5.0, ge=0.1, le=3600, description="Idle time before the pool refills"
+    )
+
+    @field_validator("wheelhouse_dir", "package_cache_dir", "pool_dir")
+    @classmethod
+    def validate_paths(cls, v):
+        """Expand user paths."""
+        return os.path.expanduser(v) if v else None
+
+    @model_validator(mode="after")
+    def validate_offline(self):
+        """Offline installs need a wheelhouse to install from."""
+        if self.offline and not self.wheelhouse_dir:
+            raise ValueError("Offline installs require venv.wheelhouse_dir")
+        return self
 
 
 class AIPromptTemplatesConfig(BaseModel):
@@ -227,6 +293,31 @@ class AIConfig(BaseModel):
     max_cache_entries: int = Field(
         default=100, ge=10, le=1000, description="Maximum cache entries"
     )
+    cache_backend: Literal["sqlite", "json"] = Field(
+        default="sqlite",
+        description="Response cache storage (sqlite: incremental and shared between processes)",
+    )
+    hedge_after_seconds: float = Field(
+        default=0.75,
+        ge=0,
+        le=60,
+        description="Seconds to wait for the model before answering help locally "
+        "(0 disables)",
+    )
+    help_deadline_seconds: float = Field(
+        default=1.0,
+        ge=0,
+        le=600,
+        description="Seconds to wait for the model's complete help answer before "
+        "answering locally (0 waits for a started answer)",
+    )
+    model_keep_alive_minutes: int = Field(
+        default=10,
+        ge=0,
+        le=1440,
+        description="Minutes a model preloaded at generation start stays in "
+        "Ollama's memory (0 disables preloading)",
+    )
     preferred_models: List[str] = Field(
         default_factory=lambda: [
             "codellama:13b",
@@ -284,6 +375,7 @@ class Config(BaseModel):
     ollama: OllamaConfig = Field(default_factory=OllamaConfig)
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
     ai: AIConfig = Field(default_factory=AIConfig)
+    venv: VenvConfig = Field(default_factory=VenvConfig)
 
     model_config = {
         "extra": "forbid",  # Forbid extra fields not defined in the model
@@ -15,17 +15,20 @@ from .api import (
     cancel_async_operation,
     create_project,
     create_project_async,
+    create_projects_batch,
     get_async_result,
     get_template_info,
     list_available_templates,
     validate_template,
 )
-from .command_executor import CommandExecutor, ExecutionResult
+from .command_cache import CommandResultCache
+from .command_executor import CommandExecutor, CommandSpec, ExecutionResult
 from .directory_creator import DirectoryCreator
 from .exceptions import (
     GitError,
     PathError,
     ProjectGenerationError,
+    QueueFullError,
     SecurityError,
     TemplateError,
     ThreadingError,
@@ -37,13 +40,17 @@ from .path_utils import PathHandler
 
 # Main classes - import as they are created
 from .project_generator import GenerationResult, ProjectGenerator, ProjectOptions
+from .phase_history import PhaseHistory, get_phase_history, set_phase_history
+from .process_pool import GenerationPlan, PlanResult, ProcessPoolBackend
+from .scheduler import OperationScheduler, Priority
 from .threading_model import (
     BackgroundOperation,
     OperationResult,
     ProgressUpdate,
     ThreadingModel,
 )
-from .venv_manager import VenvManager
+from .venv_manager import InstallOptions, VenvManager
+from .venv_pool import VenvPool, get_venv_pool, start_venv_pool, stop_venv_pool
 
 __all__ = [
     # Exceptions
@@ -54,6 +61,7 @@ __all__ = [
     "TemplateError",
     "SecurityError",
     "ThreadingError",
+    "QueueFullError",
     # Core classes
     "ProjectGenerator",
     "ProjectOptions",
@@ -64,18 +72,34 @@ __all__ = [
     "GitManager",
     "GitConfig",
     "VenvManager",
+    "InstallOptions",
+    "VenvPool",
     "CommandExecutor",
+    "CommandSpec",
+    "CommandResultCache",
     "ExecutionResult",
     "ThreadingModel",
+    "OperationScheduler",
+    "Priority",
     "BackgroundOperation",
     "ProgressUpdate",
     "OperationResult",
+    "ProcessPoolBackend",
+    "PhaseHistory",
+    "GenerationPlan",
+    "PlanResult",
     # Public API functions
     "create_project",
     "create_project_async",
+    "create_projects_batch",
     "get_async_result",
     "cancel_async_operation",
     "validate_template",
     "list_available_templates",
     "get_template_info",
+    "get_venv_pool",
+    "start_venv_pool",
+    "stop_venv_pool",
+    "get_phase_history",
+    "set_phase_history",
 ]
@@ -9,8 +9,9 @@ the core project generation functionality without needing to manage
 individual component instances directly.
 """
 
+import os
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 
 from ..config.config_manager import ConfigManager
 from ..templates.engine import TemplateEngine
@@ -20,6 +21,13 @@ from .project_generator import (
     ProjectGenerator,
     ProjectOptions,
 )
+from .process_pool import (
+    BatchProgressCallback,
+    GenerationPlan,
+    PlanResult,
+    ProcessPoolBackend,
+)
+from .scheduler import Priority
 from .threading_model import OperationResult, ThreadingModel
 
 
@@ -107,6 +115,7 @@ def create_project_async(
     progress_callback: Optional[Callable[[str], None]] = None,
     config_manager: Optional[ConfigManager] = None,
     threading_model: Optional[ThreadingModel] = None,
+    priority: Priority = Priority.NORMAL,
 ) -> str:
     """Create a project from a template (asynchronous).
 
@@ -123,12 +132,14 @@ def create_project_async(
         progress_callback: Optional progress callback function
         config_manager: Optional config manager instance
         threading_model: Optional threading model instance
+        priority: Scheduling priority relative to other background work
 
     Returns:
         Operation ID for tracking the background generation
 
     Raises:
         ProjectGenerationError: If template loading fails
+        QueueFullError: If too many operations are already queued
         ThreadingError: If background operation cannot be started
     """
     # Initialize components
@@ -169,9 +180,43 @@ def create_project_async(
         target_path=target_path,
         dry_run=dry_run,
         progress_callback=progress_callback,
+        priority=priority,
     )
 
 
+def create_projects_batch(
+    plans: Sequence[GenerationPlan],
+    max_workers: Optional[int] = None,
+    progress_callback: Optional[BatchProgressCallback] = None,
+    config_manager: Optional[ConfigManager] = None,
+    backend: Optional[ProcessPoolBackend] = None,
+) -> List[PlanResult]:
+    """Create many projects in parallel worker processes.
+
+    Unlike create_project_async, rendering is not limited by the GIL, so
+    large batches scale with the number of cores.
+
+    Args:
+        plans: Projects to generate
+        max_workers: Number of worker processes (default: CPU count)
+        progress_callback: Optional callback receiving plan ID, message and
+            percentage
+        config_manager: Optional config manager whose settings workers load
+        backend: Optional long-lived backend to reuse across batches
+
+    Returns:
+        One result per plan, in plan order
+    """
+    if backend is not None:
+        return backend.generate(plans, progress_callback=progress_callback)
+
+    with ProcessPoolBackend(
+        max_workers=min(max_workers or os.cpu_count() or 2, max(1, len(plans))),
+        config_manager=config_manager,
+    ) as pool:
+        return pool.generate(plans, progress_callback=progress_callback)
+
+
 def get_async_result(
     operation_id: str,
     threading_model: ThreadingModel,
@@ -0,0 +1,248 @@
+# ABOUTME: Fingerprint cache for idempotent post-creation commands
+# ABOUTME: Records successful runs in the project state directory so reruns can skip them
+
+"""
+Command result cache.
+
+This module provides the CommandResultCache class which lets
+``CommandExecutor.execute_command_graph`` skip commands that already
+succeeded. Only commands that declare ``inputs`` take part. A command's
+fingerprint covers:
+
+- the command string and its resolved executable
+- the working directory
+- the explicit environment variables and the inherited ``PATH``,
+  ``VIRTUAL_ENV`` and ``PYTHONPATH``
+- the content of every file matched by its input globs
+
+A command is skipped when its fingerprint matches the last successful run
+and every one of its output globs still matches something.
+
+Records are kept in ``<project>/.create-project/commands.json``. The state
+directory contains a ``.gitignore`` so it never ends up in commits.
+"""
+
+import hashlib
+import json
+import os
+import shlex
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
+
+from structlog import get_logger
+
+if TYPE_CHECKING:
+    from .command_executor import CommandSpec
+
+
+class CommandResultCache:
+    """Thread-safe record of successful command fingerprints for one project.
+
+    Attributes:
+        state_dir: Project state directory holding the cache file
+        state_file: JSON file with one record per command name
+        logger: Structured logger for operations
+    """
+
+    STATE_DIR_NAME = ".create-project"
+    STATE_FILE_NAME = "commands.json"
+    CACHE_VERSION = 1
+
+    # Inherited variables that change which tools a command resolves to
+    ENVIRONMENT_KEYS = ("PATH", "VIRTUAL_ENV", "PYTHONPATH")
+
+    _HASH_CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, project_dir: Union[str, Path]) -> None:
+        """Initialize the cache and load earlier records.
+
+        Args:
+            project_dir: Root directory of the generated project
+        """
+        self.logger = get_logger(__name__)
+        self.state_dir = Path(project_dir) / self.STATE_DIR_NAME
+        self.state_file = self.state_dir / self.STATE_FILE_NAME
+
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, object]] = {}
+
+        self._load()
+
+    def fingerprint(
+        self,
+        spec: "CommandSpec",
+        cwd: Union[str, Path],
+        env_vars: Optional[Dict[str, str]] = None,
+    ) -> Optional[str]:
+        """Compute the fingerprint of a command.
+
+        Input globs are resolved relative to ``cwd``. Matches outside it and
+        inside the state directory are ignored.
+
+        Args:
+            spec: Command to fingerprint
+            cwd: Directory the command runs in
+            env_vars: Explicit environment variables passed to the command
+
+        Returns:
+            Hex digest, or None if the command declares no inputs or an
+            input cannot be read (the command then always runs)
+        """
+        if not spec.inputs:
+            return None
+
+        root = Path(cwd).resolve()
+        try:
+            inputs = [
+                [pattern, self._hash_matches(root, pattern)] for pattern in spec.inputs
+            ]
+        except OSError as e:
+            self.logger.debug(
+                "Cannot fingerprint command inputs", command=spec.name, error=str(e)
+            )
+            return None
+
+        payload = {
+            "command": spec.command,
+            "executable": self._executable_fingerprint(spec.command),
+            "cwd": str(root),
+            "env": sorted((env_vars or {}).items()),
+            "inherited_env": [
+                [key, os.environ.get(key)] for key in self.ENVIRONMENT_KEYS
+            ],
+            "inputs": inputs,
+        }
+        return hashlib.sha256(
+            json.dumps(payload, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+    def is_fresh(
+        self, spec: "CommandSpec", fingerprint: str, cwd: Union[str, Path]
+    ) -> bool:
+        """Check whether a command can be skipped.
+
+        Args:
+            spec: Command to check
+            fingerprint: Fingerprint computed for the pending run
+            cwd: Directory the command runs in
+
+        Returns:
+            True if the last successful run had the same fingerprint and all
+            declared outputs still exist
+        """
+        with self._lock:
+            entry = self._entries.get(spec.name)
+            if entry is None or entry.get("fingerprint") != fingerprint:
+                return False
+
+        root = Path(cwd)
+        missing = [pattern for pattern in spec.outputs if not any(root.glob(pattern))]
+        if missing:
+            self.logger.debug(
+                "Command outputs missing", command=spec.name, outputs=missing
+            )
+            return False
+        return True
+
+    def record(self, spec: "CommandSpec", fingerprint: str, success: bool) -> None:
+        """Record the outcome of a command run.
+
+        A success stores the fingerprint; a failure forgets the command so
+        the next run executes it again.
+
+        Args:
+            spec: Command that ran
+            fingerprint: Fingerprint computed before the run
+            success: Whether the command succeeded
+        """
+        with self._lock:
+            if success:
+                self._entries[spec.name] = {
+                    "fingerprint": fingerprint,
+                    "command": spec.command,
+                    "recorded_at": time.time(),
+                }
+            elif self._entries.pop(spec.name, None) is None:
+                return
+            self._save()
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Forget one command, or every command if no name is given.
+
+        Args:
+            name: Command name to forget
+        """
+        with self._lock:
+            if name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(name, None)
+            self._save()
+
+    def _hash_matches(self, root: Path, pattern: str) -> List[List[str]]:
+        """Hash every file matching one input glob."""
+        matches = []
+        for path in sorted(root.glob(pattern)):
+            if not path.is_file():
+                continue
+            try:
+                relative = path.resolve().relative_to(root)
+            except ValueError:
+                # Symlink pointing outside the working directory
+                continue
+            if relative.parts and relative.parts[0] == self.STATE_DIR_NAME:
+                continue
+
+            digest = hashlib.sha256()
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(self._HASH_CHUNK_SIZE), b""):
+                    digest.update(chunk)
+            matches.append([relative.as_posix(), digest.hexdigest()])
+        return matches
+
+    @staticmethod
+    def _executable_fingerprint(command: str) -> Optional[List[object]]:
+        """Resolved path, modification time and size of the command's binary."""
+        try:
+            executable = shlex.split(command)[0]
+        except (ValueError, IndexError):
+            return None
+
+        resolved = shutil.which(executable)
+        if resolved is None:
+            return None
+        try:
+            resolved = os.path.realpath(resolved)
+            stat = os.stat(resolved)
+        except OSError:
+            return None
+        return [resolved, stat.st_mtime_ns, stat.st_size]
+
+    def _load(self) -> None:
+        """Load records from the state directory."""
+        if not self.state_file.exists():
+            return
+
+        try:
+            data = json.loads(self.state_file.read_text(encoding="utf-8"))
+            if data.get("version") == self.CACHE_VERSION:
+                self._entries = dict(data.get("commands", {}))
+        except Exception as e:
+            self.logger.debug("Failed to load command result cache", error=str(e))
+
+    def _save(self) -> None:
+        """Persist records atomically, creating the state directory if needed."""
+        try:
+            if not self.state_dir.exists():
+                self.state_dir.mkdir(parents=True)
+                (self.state_dir / ".gitignore").write_text("*\n", encoding="utf-8")
+
+            data = {"version": self.CACHE_VERSION, "commands": self._entries}
+            temp_file = self.state_file.with_suffix(f".{os.getpid()}.tmp")
+            temp_file.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            os.replace(temp_file, self.state_file)
+        except Exception as e:
+            self.logger.debug("Failed to persist command result cache", error=str(e))
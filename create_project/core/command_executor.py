@@ -7,18 +7,38 @@ Command executor for post-creation template commands.
 This module provides the CommandExecutor class which safely executes
 template-defined post-creation commands with comprehensive security validation,
 command whitelisting, injection attack prevention, and timeout handling.
+
+Commands can also be executed as a dependency graph (see
+``CommandExecutor.execute_command_graph``): independent commands run
+concurrently, limited per resource class such as ``network``, ``cpu`` or
+``writes-venv``.
+
+Output is read while commands run (see ``process_runner.run_streaming``):
+only a bounded head and tail of each stream is kept, lines can be forwarded
+to an output callback, and timeouts kill the command's whole process group.
+
+Graph commands that declare ``inputs`` can be skipped when a
+``CommandResultCache`` shows they already succeeded with the same inputs,
+command and environment.
 """
 
+import os
+import queue
 import shlex
 import subprocess
 import time
-from dataclasses import dataclass
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Callable, Dict, List, Optional, Set, Union
 
 from structlog import get_logger
 
+from ..utils.tracing import propagate
+from .command_cache import CommandResultCache
 from .exceptions import ProjectGenerationError, SecurityError
+from .process_runner import LineCallback, run_streaming
 
 
 @dataclass
@@ -33,6 +53,9 @@ class ExecutionResult:
         stderr: Command standard error
         duration: Execution duration in seconds
         timeout: Whether command timed out
+        skipped: Whether command was not run because of an earlier failure
+        cached: Whether command was not run because an earlier run with the
+            same fingerprint succeeded
     """
 
     success: bool
@@ -42,6 +65,38 @@ class ExecutionResult:
     stderr: str
     duration: float
     timeout: bool = False
+    skipped: bool = False
+    cached: bool = False
+
+
+@dataclass
+class CommandSpec:
+    """Command with scheduling metadata for graph execution.
+
+    Attributes:
+        name: Unique name other commands use to depend on this one
+        command: Command string to execute
+        depends_on: Names of commands that must succeed first
+        after: Names of commands that must finish first, whether or not
+            they succeed (ordering only)
+        resources: Resource classes the command occupies while running
+        timeout: Command timeout in seconds (uses the graph default if None)
+        env_vars: Additional environment variables for this command
+        cwd: Working directory (uses the graph default if None)
+        inputs: Globs of files the command reads; enables result caching
+        outputs: Globs that must exist for a cached result to be reused
+    """
+
+    name: str
+    command: str
+    depends_on: List[str] = field(default_factory=list)
+    after: List[str] = field(default_factory=list)
+    resources: List[str] = field(default_factory=list)
+    timeout: Optional[int] = None
+    env_vars: Dict[str, str] = field(default_factory=dict)
+    cwd: Optional[Path] = None
+    inputs: List[str] = field(default_factory=list)
+    outputs: List[str] = field(default_factory=list)
 
 
 class CommandExecutor:
@@ -129,6 +184,17 @@ class CommandExecutor:
         "su",
     }
 
+    # Concurrent commands allowed per resource class; unlisted classes get 1
+    DEFAULT_RESOURCE_LIMITS: Dict[str, int] = {
+        "cpu": os.cpu_count() or 2,
+        "network": 4,
+    }
+
+    DEFAULT_MAX_PARALLEL = 4
+
+    # Seconds between relaying command output to the graph's output callback
+    OUTPUT_POLL_INTERVAL = 0.1
+
     def __init__(
         self,
         additional_allowed_commands: Optional[Set[str]] = None,
@@ -165,6 +231,7 @@ class CommandExecutor:
         cwd: Union[str, Path],
         timeout: Optional[int] = None,
         env_vars: Optional[Dict[str, str]] = None,
+        output_callback: Optional[LineCallback] = None,
     ) -> ExecutionResult:
         """Execute a single command with security validation.
 
@@ -173,6 +240,8 @@ class CommandExecutor:
             cwd: Working directory for command execution
             timeout: Command timeout in seconds (uses max_timeout if None)
             env_vars: Additional environment variables
+            output_callback: Optional callback receiving (stream, line) for
+                each output line while the command runs
 
         Returns:
             ExecutionResult with execution details
@@ -205,20 +274,17 @@ class CommandExecutor:
 
         try:
             # Prepare environment
-            import os
-
             env = os.environ.copy()
             if env_vars:
                 env.update(env_vars)
 
-            # Execute command
-            process = subprocess.run(
+            # Execute command, streaming bounded output
+            process = run_streaming(
                 parsed_command,
                 cwd=cwd_path,
-                capture_output=True,
-                text=True,
-                timeout=effective_timeout,
                 env=env,
+                timeout=effective_timeout,
+                line_callback=output_callback,
             )
 
             duration = time.time() - start_time
@@ -251,14 +317,14 @@ class CommandExecutor:
 
             return result
 
-        except subprocess.TimeoutExpired:
+        except subprocess.TimeoutExpired as e:
             duration = time.time() - start_time
 
             result = ExecutionResult(
                 success=False,
                 command=command,
                 returncode=-1,
-                stdout="",
+                stdout=e.output if isinstance(e.output, str) else "",
                 stderr=f"Command timed out after {effective_timeout} seconds",
                 duration=duration,
                 timeout=True,
@@ -389,6 +455,370 @@ class CommandExecutor:
 
         return results
 
+    def execute_command_graph(
+        self,
+        commands: List[CommandSpec],
+        cwd: Union[str, Path],
+        timeout_per_command: Optional[int] = None,
+        env_vars: Optional[Dict[str, str]] = None,
+        progress_callback: Optional[Callable[[str, int, int], None]] = None,
+        status_callback: Optional[
+            Callable[[CommandSpec, str, Optional[ExecutionResult]], None]
+        ] = None,
+        stop_on_failure: bool = True,
+        max_parallel: Optional[int] = None,
+        resource_limits: Optional[Dict[str, int]] = None,
+        output_callback: Optional[Callable[[CommandSpec, str, str], None]] = None,
+        result_cache: Optional[CommandResultCache] = None,
+    ) -> List[ExecutionResult]:
+        """Execute commands as a dependency graph.
+
+        A command starts once all of its dependencies succeeded, every
+        command it runs ``after`` has finished, a worker is free and every
+        resource class it declares is below its limit. Ready commands start
+        in declaration order. Commands whose dependencies failed are skipped
+        (a failed ``after`` command does not skip anything); with
+        ``stop_on_failure`` no new command starts after the first failure,
+        but already running ones are awaited.
+
+        With a ``result_cache``, commands declaring inputs are not run when
+        their fingerprint matches an earlier success; they report the
+        status "cached" and count as succeeded for their dependents.
+
+        Callbacks are invoked from the calling thread only.
+
+        Args:
+            commands: Commands to execute
+            cwd: Default working directory
+            timeout_per_command: Default timeout per command in seconds
+            env_vars: Additional environment variables for every command
+            progress_callback: Optional progress callback (message, done, total)
+            status_callback: Optional per-command callback receiving the
+                command, its status ("running", "succeeded", "cached",
+                "failed" or "skipped") and its result once finished
+            stop_on_failure: Whether to stop starting commands after a failure
+            max_parallel: Maximum concurrently running commands
+            resource_limits: Per resource class limits overriding the defaults
+            output_callback: Optional callback receiving the command, the
+                stream name and each output line while commands run
+            result_cache: Optional cache used to skip up-to-date commands and
+                to record successful runs
+
+        Returns:
+            ExecutionResult for each command, in the order given
+
+        Raises:
+            ProjectGenerationError: If names are duplicated, a dependency is
+                unknown or the dependencies contain a cycle
+        """
+        if not commands:
+            self.logger.info("No commands to execute")
+            return []
+
+        self._validate_command_graph(commands)
+
+        limits = dict(self.DEFAULT_RESOURCE_LIMITS)
+        limits.update(resource_limits or {})
+        max_parallel = max(1, max_parallel or self.DEFAULT_MAX_PARALLEL)
+        total = len(commands)
+
+        self.logger.info(
+            "Executing command graph",
+            command_count=total,
+            cwd=str(cwd),
+            max_parallel=max_parallel,
+            stop_on_failure=stop_on_failure,
+        )
+
+        states: Dict[str, str] = {spec.name: "pending" for spec in commands}
+        results: Dict[str, ExecutionResult] = {}
+        resources_in_use: Dict[str, int] = defaultdict(int)
+        running: Dict[Future, CommandSpec] = {}
+        stopping = False
+        # Output lines from worker threads, relayed on the calling thread
+        output_lines: "queue.Queue[tuple]" = queue.Queue()
+
+        def relay_output() -> None:
+            while True:
+                try:
+                    spec, stream, line = output_lines.get_nowait()
+                except queue.Empty:
+                    return
+                if output_callback:
+                    output_callback(spec, stream, line)
+
+        def finish(spec: CommandSpec, result: ExecutionResult) -> None:
+            if result.skipped:
+                status = "skipped"
+            elif result.cached:
+                status = "cached"
+            else:
+                status = "succeeded" if result.success else "failed"
+            states[spec.name] = "succeeded" if result.success else status
+            results[spec.name] = result
+            if status_callback:
+                status_callback(spec, status, result)
+            if progress_callback:
+                progress_callback(f"{spec.name}: {status}", len(results), total)
+
+        with ThreadPoolExecutor(
+            max_workers=max_parallel, thread_name_prefix="post-command"
+        ) as executor:
+            while True:
+                # Skips cascade, so repeat until no dependent changes state
+                skipped_any = True
+                while skipped_any:
+                    skipped_any = False
+                    for spec in commands:
+                        if states[spec.name] != "pending":
+                            continue
+                        failed_dependency = next(
+                            (
+                                dependency
+                                for dependency in spec.depends_on
+                                if states[dependency] in ("failed", "skipped")
+                            ),
+                            None,
+                        )
+                        if failed_dependency is not None:
+                            finish(
+                                spec,
+                                self._skipped_result(
+                                    spec,
+                                    f"Skipped: dependency '{failed_dependency}' "
+                                    "did not succeed",
+                                ),
+                            )
+                            skipped_any = True
+
+                if not stopping:
+                    for spec in commands:
+                        if len(running) >= max_parallel:
+                            break
+                        if (
+                            states[spec.name] != "pending"
+                            or any(
+                                states[dependency] != "succeeded"
+                                for dependency in spec.depends_on
+                            )
+                            or any(
+                                states[predecessor] in ("pending", "running")
+                                for predecessor in spec.after
+                            )
+                        ):
+                            continue
+                        if not self._resources_available(
+                            spec, resources_in_use, limits
+                        ):
+                            continue
+
+                        for resource in spec.resources:
+                            resources_in_use[resource] += 1
+                        states[spec.name] = "running"
+                        if status_callback:
+                            status_callback(spec, "running", None)
+                        if progress_callback:
+                            progress_callback(
+                                f"Executing: {spec.command[:50]}...",
+                                len(results),
+                                total,
+                            )
+                        future = executor.submit(
+                            propagate(self._execute_spec),
+                            spec,
+                            cwd,
+                            timeout_per_command,
+                            env_vars,
+                            output_lines if output_callback else None,
+                            result_cache,
+                        )
+                        running[future] = spec
+
+                if not running:
+                    break
+
+                if output_callback:
+                    done, _ = wait(
+                        running,
+                        timeout=self.OUTPUT_POLL_INTERVAL,
+                        return_when=FIRST_COMPLETED,
+                    )
+                    relay_output()
+                else:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    spec = running.pop(future)
+                    for resource in spec.resources:
+                        resources_in_use[resource] -= 1
+
+                    result = future.result()
+                    finish(spec, result)
+
+                    if not result.success and stop_on_failure and not stopping:
+                        stopping = True
+                        self.logger.error(
+                            "Stopping command graph due to failure",
+                            failed_command=spec.command,
+                            running_count=len(running),
+                        )
+
+        for spec in commands:
+            if states[spec.name] == "pending":
+                finish(
+                    spec,
+                    self._skipped_result(spec, "Skipped: stopped after a failure"),
+                )
+
+        ordered_results = [results[spec.name] for spec in commands]
+        successful_count = sum(1 for result in ordered_results if result.success)
+        skipped_count = sum(1 for result in ordered_results if result.skipped)
+        cached_count = sum(1 for result in ordered_results if result.cached)
+
+        self.logger.info(
+            "Command graph completed",
+            total_commands=total,
+            successful_commands=successful_count,
+            failed_commands=total - successful_count - skipped_count,
+            skipped_commands=skipped_count,
+            cached_commands=cached_count,
+        )
+
+        return ordered_results
+
+    def _execute_spec(
+        self,
+        spec: CommandSpec,
+        cwd: Union[str, Path],
+        timeout: Optional[int],
+        env_vars: Optional[Dict[str, str]],
+        output_lines: Optional["queue.Queue[tuple]"] = None,
+        result_cache: Optional[CommandResultCache] = None,
+    ) -> ExecutionResult:
+        """Execute a graph command, converting setup errors into results."""
+        merged_env = dict(env_vars or {})
+        merged_env.update(spec.env_vars)
+        work_dir = spec.cwd or cwd
+
+        fingerprint = None
+        if result_cache is not None:
+            fingerprint = result_cache.fingerprint(spec, work_dir, merged_env)
+            if fingerprint is not None and result_cache.is_fresh(
+                spec, fingerprint, work_dir
+            ):
+                self.logger.info(
+                    "Skipping up-to-date command", name=spec.name, command=spec.command
+                )
+                return ExecutionResult(
+                    success=True,
+                    command=spec.command,
+                    returncode=0,
+                    stdout="",
+                    stderr="",
+                    duration=0.0,
+                    cached=True,
+                )
+
+        output_callback: Optional[LineCallback] = None
+        if output_lines is not None:
+
+            def output_callback(stream: str, line: str) -> None:
+                output_lines.put((spec, stream, line))
+
+        try:
+            result = self.execute_command(
+                command=spec.command,
+                cwd=work_dir,
+                timeout=spec.timeout or timeout,
+                env_vars=merged_env or None,
+                output_callback=output_callback,
+            )
+        except Exception as e:
+            result = ExecutionResult(
+                success=False,
+                command=spec.command,
+                returncode=-1,
+                stdout="",
+                stderr=f"Command validation or setup failed: {e}",
+                duration=0.0,
+            )
+
+        if result_cache is not None and fingerprint is not None:
+            result_cache.record(spec, fingerprint, result.success)
+        return result
+
+    @staticmethod
+    def _resources_available(
+        spec: CommandSpec, in_use: Dict[str, int], limits: Dict[str, int]
+    ) -> bool:
+        """Check every resource class of a command is below its limit."""
+        return all(
+            in_use[resource] < max(1, limits.get(resource, 1))
+            for resource in spec.resources
+        )
+
+    @staticmethod
+    def _skipped_result(spec: CommandSpec, reason: str) -> ExecutionResult:
+        """Result for a command that was never started."""
+        return ExecutionResult(
+            success=False,
+            command=spec.command,
+            returncode=-1,
+            stdout="",
+            stderr=reason,
+            duration=0.0,
+            skipped=True,
+        )
+
+    def _validate_command_graph(self, commands: List[CommandSpec]) -> None:
+        """Check command names and dependencies form a valid DAG.
+
+        Raises:
+            ProjectGenerationError: If the graph is invalid
+        """
+        names = [spec.name for spec in commands]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ProjectGenerationError(
+                f"Duplicate command names: {duplicates}",
+                details={"duplicates": duplicates},
+            )
+
+        specs_by_name = {spec.name: spec for spec in commands}
+        for spec in commands:
+            unknown = [
+                dep
+                for dep in spec.depends_on + spec.after
+                if dep not in specs_by_name
+            ]
+            if unknown:
+                raise ProjectGenerationError(
+                    f"Command '{spec.name}' depends on unknown commands: {unknown}",
+                    details={"command": spec.name, "unknown": unknown},
+                )
+
+        # Depth-first search for cycles
+        visiting: Set[str] = set()
+        visited: Set[str] = set()
+
+        def visit(name: str, path: List[str]) -> None:
+            if name in visited:
+                return
+            if name in visiting:
+                cycle = path[path.index(name) :] + [name]
+                raise ProjectGenerationError(
+                    f"Command dependency cycle: {' -> '.join(cycle)}",
+                    details={"cycle": cycle},
+                )
+            visiting.add(name)
+            spec = specs_by_name[name]
+            for dependency in spec.depends_on + spec.after:
+                visit(dependency, path + [name])
+            visiting.discard(name)
+            visited.add(name)
+
+        for name in names:
+            visit(name, [])
+
     def _validate_and_parse_command(self, command: str) -> List[str]:
         """Validate and parse command string for security.
 
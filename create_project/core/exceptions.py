@@ -102,6 +102,16 @@ class ThreadingError(ProjectGenerationError):
     pass
 
 
+class QueueFullError(ThreadingError):
+    """Background work rejected by admission control.
+
+    Raised when the operation scheduler's queue is full. Callers should
+    retry later or submit the work with interactive priority.
+    """
+
+    pass
+
+
 class AIAssistanceError(ProjectGenerationError):
     """AI assistance errors.
 
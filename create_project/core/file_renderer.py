@@ -19,6 +19,7 @@ from structlog import get_logger
 
 from ..templates.engine import TemplateEngine
 from ..templates.loader import TemplateLoader
+from ..utils.tracing import traced
 from .exceptions import ProjectGenerationError, TemplateError
 from .path_utils import PathHandler
 
@@ -36,6 +37,7 @@ class FileRenderer:
         template_loader: TemplateLoader from Milestone 2
         logger: Structured logger for operations
         rendered_files: List of files rendered (for tracking/rollback)
+        rendered_contents: Bytes written for each rendered file
     """
 
     def __init__(
@@ -56,6 +58,7 @@ class FileRenderer:
         self.template_loader = template_loader or TemplateLoader()
         self.logger = get_logger(__name__)
         self.rendered_files: List[Path] = []
+        self.rendered_contents: Dict[Path, bytes] = {}
 
         self.logger.info(
             "FileRenderer initialized",
@@ -283,6 +286,7 @@ class FileRenderer:
                     progress_callback=progress_callback,
                 )
 
+    @traced("render_file", "render", capture=("target_path",))
     def _render_text_file(
         self,
         template_path: Path,
@@ -318,6 +322,7 @@ class FileRenderer:
 
             # Write rendered content
             target_path.write_text(rendered_content, encoding=encoding)
+            self.rendered_contents[target_path] = rendered_content.encode(encoding)
 
             # Set file permissions
             self._set_file_permissions(target_path, executable)
@@ -338,6 +343,7 @@ class FileRenderer:
                 f"Failed to render text file '{template_path}': {e}"
             ) from e
 
+    @traced("copy_file", "render", capture=("target_path",))
     def _copy_binary_file(
         self, template_path: Path, target_path: Path, executable: bool = False
     ) -> None:
@@ -354,8 +360,10 @@ class FileRenderer:
 
             # Copy binary file
             with open(template_path, "rb") as source:
-                with open(target_path, "wb") as target:
-                    target.write(source.read())
+                content = source.read()
+            with open(target_path, "wb") as target:
+                target.write(content)
+            self.rendered_contents[target_path] = content
 
             # Set file permissions
             self._set_file_permissions(target_path, executable)
@@ -371,6 +379,7 @@ class FileRenderer:
                 f"Failed to copy binary file '{template_path}': {e}"
             ) from e
 
+    @traced("render_file", "render", capture=("target_path",))
     def _render_inline_content(
         self,
         content: str,
@@ -402,6 +411,7 @@ class FileRenderer:
 
             # Write rendered content
             target_path.write_text(rendered_content, encoding="utf-8")
+            self.rendered_contents[target_path] = rendered_content.encode("utf-8")
 
             # Set file permissions
             self._set_file_permissions(target_path, executable)
@@ -595,6 +605,7 @@ class FileRenderer:
     def clear_rendered_files(self) -> None:
         """Clear the list of rendered files."""
         self.rendered_files.clear()
+        self.rendered_contents.clear()
         self.logger.debug("Rendered files list cleared")
 
     def rollback_rendered_files(self) -> None:
@@ -631,6 +642,7 @@ class FileRenderer:
 
         # Clear the rendered files list
         self.rendered_files.clear()
+        self.rendered_contents.clear()
 
         if rollback_errors:
             combined_error = "File rollback completed with errors:\n" + "\n".join(
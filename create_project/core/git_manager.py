@@ -7,16 +7,27 @@ Git repository manager for project generation.
 This module provides the GitManager class which handles git repository
 operations including initialization, configuration, and initial commit
 creation with proper error handling for missing git installations.
+
+When the generator still holds the rendered files in memory, the repository
+and its first commit can be created with a single ``git fast-import``
+process instead of separate init/config/add/commit calls (see
+``GitManager.bootstrap_repository``).
 """
 
+import hashlib
+import os
 import shutil
+import struct
 import subprocess
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
 
 from structlog import get_logger
 
 from .exceptions import GitError
+from .process_runner import DEFAULT_HEAD_LINES, run_streaming
+from .tool_probe import ToolProbeCache, get_tool_probe_cache
 
 
 class GitConfig:
@@ -59,12 +70,18 @@ class GitManager:
     Attributes:
         logger: Structured logger for operations
         git_path: Path to git executable (cached after first check)
+        probe_cache: Shared cache of tool version probes
     """
 
-    def __init__(self) -> None:
-        """Initialize the GitManager."""
+    def __init__(self, probe_cache: Optional[ToolProbeCache] = None) -> None:
+        """Initialize the GitManager.
+
+        Args:
+            probe_cache: Optional tool probe cache (uses the shared cache if None)
+        """
         self.logger = get_logger(__name__)
         self.git_path: Optional[str] = None
+        self.probe_cache = probe_cache or get_tool_probe_cache()
 
         # Cache git availability check
         self._git_available = self.is_git_available()
@@ -87,10 +104,12 @@ class GitManager:
                 self.logger.warning("Git executable not found in PATH")
                 return False
 
-            # Verify git works by getting version
-            result = subprocess.run(
-                [git_path, "--version"], capture_output=True, text=True, timeout=10
-            )
+            # Verify git works by getting version (cached across instances)
+            result = self.probe_cache.probe([git_path, "--version"], timeout=10)
+
+            if result.error is not None:
+                self.logger.warning("Git version check failed", error=result.error)
+                return False
 
             if result.returncode != 0:
                 self.logger.warning(
@@ -105,12 +124,10 @@ class GitManager:
                 "Git availability confirmed",
                 git_path=git_path,
                 version_output=result.stdout.strip(),
+                cached=result.cached,
             )
             return True
 
-        except subprocess.TimeoutExpired:
-            self.logger.warning("Git version check timed out")
-            return False
         except Exception as e:
             self.logger.warning("Git availability check failed", error=str(e))
             return False
@@ -277,6 +294,119 @@ class GitManager:
                 original_error=e,
             ) from e
 
+    def bootstrap_repository(
+        self,
+        project_path: Path,
+        files: Mapping[str, bytes],
+        message: Optional[str] = None,
+        git_config: Optional[GitConfig] = None,
+    ) -> None:
+        """Create a repository and its initial commit without init/add/commit.
+
+        The repository skeleton and ``.git/config`` are written directly, the
+        given file contents are streamed into ``git fast-import`` and the
+        index is written from the same in-memory data, so the working tree is
+        never read back. Files matched by the project's ignore rules are
+        left out, as ``git add .`` would. On failure the partially created
+        ``.git`` directory is removed so callers can fall back to
+        init_repository() and create_initial_commit().
+
+        Args:
+            project_path: Path to project directory
+            files: File contents keyed by POSIX path relative to project_path
+            message: Commit message (uses config default if None)
+            git_config: Optional git configuration
+
+        Raises:
+            GitError: If git is not available or the bootstrap fails
+        """
+        self._check_bootstrap_target(project_path, files)
+
+        git_dir = project_path / ".git"
+        user_config = self._read_user_config(project_path)
+        name, email = self._resolve_identity(git_config, user_config)
+        if not name or not email:
+            raise GitError(
+                "Git identity is not configured",
+                details={"project_path": str(project_path)},
+            )
+
+        commit_message = message
+        if not commit_message and git_config:
+            commit_message = git_config.initial_commit_message
+        if not commit_message:
+            commit_message = "Initial commit"
+
+        branch = user_config.get("init.defaultbranch") or "master"
+
+        self.logger.info(
+            "Bootstrapping git repository",
+            project_path=str(project_path),
+            files=len(files),
+            branch=branch,
+        )
+
+        try:
+            self._write_repository_skeleton(git_dir, branch, git_config)
+            ignored = self._ignored_paths(project_path, files)
+            entries = self._stat_entries(
+                project_path,
+                {path: data for path, data in files.items() if path not in ignored},
+            )
+            if not entries:
+                raise GitError(
+                    "No files to commit", details={"project_path": str(project_path)}
+                )
+
+            stream = self._build_fast_import_stream(
+                entries, branch, name, email, commit_message
+            )
+            result = subprocess.run(
+                [self.git_path, "fast-import", "--quiet", "--done"],
+                cwd=project_path,
+                input=stream,
+                capture_output=True,
+                timeout=60,
+            )
+
+            if result.returncode != 0:
+                stderr = result.stderr
+                if isinstance(stderr, bytes):
+                    stderr = stderr.decode("utf-8", errors="replace")
+                raise GitError(
+                    f"Git fast-import failed: {stderr}",
+                    details={
+                        "project_path": str(project_path),
+                        "command": "git fast-import",
+                        "stderr": stderr,
+                    },
+                )
+
+            self._write_index(git_dir, entries)
+
+        except subprocess.TimeoutExpired:
+            shutil.rmtree(git_dir, ignore_errors=True)
+            raise GitError(
+                "Git fast-import timed out",
+                details={"project_path": str(project_path)},
+            ) from None
+        except GitError:
+            shutil.rmtree(git_dir, ignore_errors=True)
+            raise
+        except Exception as e:
+            shutil.rmtree(git_dir, ignore_errors=True)
+            raise GitError(
+                f"Failed to bootstrap git repository: {e}",
+                details={"project_path": str(project_path)},
+                original_error=e,
+            ) from e
+
+        self.logger.info(
+            "Git repository bootstrapped successfully",
+            project_path=str(project_path),
+            message=commit_message,
+        )
+
     def get_repository_status(self, project_path: Path) -> Dict[str, Any]:
         """Get git repository status information.
 
@@ -307,7 +437,10 @@ class GitManager:
 
             # Get status
             result = self._run_git_command(
-                ["status", "--porcelain"], cwd=project_path, timeout=30
+                ["status", "--porcelain"],
+                cwd=project_path,
+                timeout=30,
+                capture_all=True,
             )
 
             if result.returncode != 0:
@@ -386,15 +519,285 @@ class GitManager:
             user_email=git_config.user_email,
         )
 
+    def _check_bootstrap_target(
+        self, project_path: Path, files: Mapping[str, bytes]
+    ) -> None:
+        """Check a repository can be bootstrapped in the project directory.
+
+        Raises:
+            GitError: If git is missing, the directory is unusable or there
+                is nothing to commit
+        """
+        if not self._git_available:
+            raise GitError(
+                "Git is not available - repository bootstrap skipped",
+                details={"project_path": str(project_path)},
+            )
+
+        if not project_path.is_dir():
+            raise GitError(
+                f"Project directory does not exist: {project_path}",
+                details={"project_path": str(project_path)},
+            )
+
+        if (project_path / ".git").exists():
+            raise GitError(
+                "Git repository already exists",
+                details={"project_path": str(project_path)},
+            )
+
+        if not files:
+            raise GitError(
+                "No files to commit", details={"project_path": str(project_path)}
+            )
+
+    def _ignored_paths(
+        self, project_path: Path, files: Mapping[str, bytes]
+    ) -> Set[str]:
+        """Paths git would not add because of .gitignore or exclude rules.
+
+        Runs ``git check-ignore`` in the freshly written repository skeleton,
+        so the project's .gitignore files, .git/info/exclude and the user's
+        core.excludesFile all apply.
+
+        Raises:
+            GitError: If git cannot evaluate the ignore rules
+        """
+        result = subprocess.run(
+            [self.git_path, "check-ignore", "--stdin", "-z", "--no-index"],
+            cwd=project_path,
+            input=b"\0".join(path.encode("utf-8") for path in files) + b"\0",
+            capture_output=True,
+            timeout=30,
+        )
+        # Exit status 1 means no path is ignored
+        if result.returncode not in (0, 1):
+            stderr = result.stderr.decode("utf-8", errors="replace")
+            raise GitError(
+                f"Git check-ignore failed: {stderr}",
+                details={"project_path": str(project_path), "stderr": stderr},
+            )
+
+        ignored = {
+            path.decode("utf-8") for path in result.stdout.split(b"\0") if path
+        }
+        if ignored:
+            self.logger.debug(
+                "Ignored files left out of initial commit", ignored=sorted(ignored)
+            )
+        return ignored
+
+    def _read_user_config(self, project_path: Path) -> Dict[str, str]:
+        """Read the identity and default branch settings from git config.
+
+        Git resolves them itself, so includes and conditional includes
+        apply exactly as they would for ``git commit``.
+
+        Args:
+            project_path: Directory git is run in
+
+        Returns:
+            Lowercase ``section.key`` names mapped to their values
+        """
+        result = self._run_git_command(
+            [
+                "config",
+                "--get-regexp",
+                r"^(user\.name|user\.email|init\.defaultbranch)$",
+            ],
+            cwd=project_path,
+            timeout=15,
+            capture_all=True,
+        )
+        # Exit status 1 means none of the keys is set
+        values: Dict[str, str] = {}
+        for line in result.stdout.splitlines():
+            key, _, value = line.partition(" ")
+            values[key.lower()] = value
+        return values
+
+    def _resolve_identity(
+        self, git_config: Optional[GitConfig], user_config: Dict[str, str]
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Resolve the commit author the way git would.
+
+        Args:
+            git_config: Optional git configuration
+            user_config: Values read from git config
+
+        Returns:
+            Tuple of (name, email), either of which may be None
+        """
+        name = (
+            (git_config.user_name if git_config else None)
+            or os.environ.get("GIT_AUTHOR_NAME")
+            or user_config.get("user.name")
+        )
+        email = (
+            (git_config.user_email if git_config else None)
+            or os.environ.get("GIT_AUTHOR_EMAIL")
+            or user_config.get("user.email")
+        )
+        return name, email
+
+    def _stat_entries(
+        self, project_path: Path, files: Mapping[str, bytes]
+    ) -> List[Tuple[str, bytes, os.stat_result]]:
+        """Pair file contents with their on-disk stat data, sorted for git.
+
+        Raises:
+            GitError: If a file is missing or changed since it was rendered
+        """
+        entries = []
+        for relative_path, data in files.items():
+            file_stat = os.stat(project_path / relative_path)
+            if file_stat.st_size != len(data):
+                raise GitError(
+                    f"File changed after rendering: {relative_path}",
+                    details={"project_path": str(project_path)},
+                )
+            entries.append((relative_path, data, file_stat))
+
+        entries.sort(key=lambda entry: entry[0].encode("utf-8"))
+        return entries
+
+    @staticmethod
+    def _file_mode(file_stat: os.stat_result) -> int:
+        """Git file mode for a regular file."""
+        if os.name != "nt" and file_stat.st_mode & 0o111:
+            return 0o100755
+        return 0o100644
+
+    def _write_repository_skeleton(
+        self, git_dir: Path, branch: str, git_config: Optional[GitConfig]
+    ) -> None:
+        """Write the minimal .git layout and config that ``git init`` creates."""
+        for subdir in ("objects/info", "objects/pack", "refs/heads", "refs/tags"):
+            (git_dir / subdir).mkdir(parents=True, exist_ok=True)
+
+        (git_dir / "HEAD").write_text(f"ref: refs/heads/{branch}\n", encoding="utf-8")
+
+        config_lines = [
+            "[core]",
+            "\trepositoryformatversion = 0",
+            f"\tfilemode = {'false' if os.name == 'nt' else 'true'}",
+            "\tbare = false",
+            "\tlogallrefupdates = true",
+        ]
+        if git_config and (git_config.user_name or git_config.user_email):
+            config_lines.append("[user]")
+            if git_config.user_name:
+                config_lines.append(
+                    f"\tname = {self._quote_config(git_config.user_name)}"
+                )
+            if git_config.user_email:
+                config_lines.append(
+                    f"\temail = {self._quote_config(git_config.user_email)}"
+                )
+
+        (git_dir / "config").write_text(
+            "\n".join(config_lines) + "\n", encoding="utf-8"
+        )
+
+    @staticmethod
+    def _quote_config(value: str) -> str:
+        """Quote a value for a git config file."""
+        escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+        return f'"{escaped}"'
+
+    def _build_fast_import_stream(
+        self,
+        entries: List[Tuple[str, bytes, os.stat_result]],
+        branch: str,
+        name: str,
+        email: str,
+        message: str,
+    ) -> bytes:
+        """Build a fast-import stream holding every blob and a single commit."""
+        offset = time.localtime().tm_gmtoff
+        sign = "-" if offset < 0 else "+"
+        offset = abs(offset) // 60
+        timezone = f"{sign}{offset // 60:02d}{offset % 60:02d}"
+        signature = f"{name} <{email}> {int(time.time())} {timezone}".encode()
+        message_bytes = message.encode("utf-8")
+
+        parts: List[bytes] = []
+        for mark, (_, data, _) in enumerate(entries, start=1):
+            parts.append(b"blob\nmark :%d\ndata %d\n" % (mark, len(data)))
+            parts.append(data)
+            parts.append(b"\n")
+
+        parts.append(b"commit refs/heads/" + branch.encode("utf-8") + b"\n")
+        parts.append(b"author " + signature + b"\n")
+        parts.append(b"committer " + signature + b"\n")
+        parts.append(b"data %d\n" % len(message_bytes) + message_bytes + b"\n")
+        for mark, (relative_path, _, file_stat) in enumerate(entries, start=1):
+            path = relative_path.replace("\\", "\\\\").replace('"', '\\"')
+            parts.append(
+                b'M %o :%d "%s"\n'
+                % (self._file_mode(file_stat), mark, path.encode("utf-8"))
+            )
+        parts.append(b"\ndone\n")
+
+        return b"".join(parts)
+
+    def _write_index(
+        self, git_dir: Path, entries: List[Tuple[str, bytes, os.stat_result]]
+    ) -> None:
+        """Write a version 2 index matching the committed tree.
+
+        Stat data comes from the files already on disk and object ids are
+        hashed from memory, so ``git status`` is clean without a rescan.
+        """
+        body = [b"DIRC", struct.pack(">II", 2, len(entries))]
+        for relative_path, data, file_stat in entries:
+            object_id = hashlib.sha1(
+                b"blob %d\0" % len(data) + data, usedforsecurity=False
+            ).digest()
+            path = relative_path.encode("utf-8")
+            fields = (
+                int(file_stat.st_ctime),
+                file_stat.st_ctime_ns % 1_000_000_000,
+                int(file_stat.st_mtime),
+                file_stat.st_mtime_ns % 1_000_000_000,
+                file_stat.st_dev,
+                file_stat.st_ino,
+                self._file_mode(file_stat),
+                file_stat.st_uid,
+                file_stat.st_gid,
+                file_stat.st_size,
+            )
+            entry = struct.pack(">10I", *(value & 0xFFFFFFFF for value in fields))
+            entry += object_id + struct.pack(">H", min(len(path), 0xFFF)) + path
+            # Entries are NUL-terminated and padded to a multiple of 8 bytes
+            entry += b"\0" * (8 - len(entry) % 8)
+            body.append(entry)
+
+        content = b"".join(body)
+        temp_index = git_dir / "index.lock"
+        checksum = hashlib.sha1(content, usedforsecurity=False).digest()
+        temp_index.write_bytes(content + checksum)
+        os.replace(temp_index, git_dir / "index")
+
     def _run_git_command(
-        self, args: List[str], cwd: Path, timeout: int = 60
+        self,
+        args: List[str],
+        cwd: Path,
+        timeout: int = 60,
+        *,
+        capture_all: bool = False,
     ) -> subprocess.CompletedProcess:
         """Run a git command with error handling.
 
+        Output is streamed with bounded capture, and a timeout kills git
+        together with any helpers it spawned (hooks, credential helpers).
+
         Args:
             args: Git command arguments (without 'git')
             cwd: Working directory
             timeout: Command timeout in seconds
+            capture_all: Capture the complete output instead of a bounded
+                head and tail; needed when the output is parsed
 
         Returns:
             CompletedProcess result
@@ -408,6 +811,9 @@ class GitManager:
             "Running git command", command=command, cwd=str(cwd), timeout=timeout
         )
 
-        return subprocess.run(
-            command, cwd=cwd, capture_output=True, text=True, timeout=timeout
+        return run_streaming(
+            command,
+            cwd=cwd,
+            timeout=timeout,
+            head_lines=None if capture_all else DEFAULT_HEAD_LINES,
         )
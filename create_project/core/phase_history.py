@@ -0,0 +1,353 @@
+# ABOUTME: Local history of per-phase project generation durations
+# ABOUTME: Predicts phase durations per template and host for ETAs and capacity planning
+
+"""
+Generation phase history.
+
+This module provides the PhaseHistory class which records how long each
+generation phase took together with the size of the work (files, bytes,
+directories, venv tool, post-creation commands). Predictions come from a
+least-squares fit of each phase's duration against its size driver, over
+recent runs of the same template on the same host, so progress percentages
+and remaining time follow what this machine actually does instead of fixed
+phase weights.
+
+Records are appended to a JSON Lines file, one run per line, so generations
+running in several processes never overwrite each other's runs. The file is
+compacted to the newest ``max_records`` runs when it is loaded, and runs can
+be queried and summarized for capacity planning.
+"""
+
+import json
+import os
+import platform
+import statistics
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from platformdirs import user_data_dir
+from structlog import get_logger
+
+
+class PhaseHistory:
+    """Persistent store of generation phase durations.
+
+    Attributes:
+        history_file: On-disk location (None keeps history in memory only)
+        max_records: Number of most recent runs kept
+        host: Name of this host, used to separate machines sharing a home
+        logger: Structured logger for operations
+    """
+
+    DEFAULT_MAX_RECORDS = 1000
+
+    # Lines on disk, as a multiple of max_records, before a load compacts them
+    COMPACT_FACTOR = 2
+
+    # Runs needed before predictions replace the fixed phase weights
+    MIN_SAMPLES = 3
+
+    # Most recent matching runs used for a prediction
+    WINDOW = 50
+
+    # Count each phase's duration scales with (None = constant per template)
+    PHASE_DRIVERS: Dict[str, Optional[str]] = {
+        "validation": None,
+        "directory_creation": "directories",
+        "file_rendering": "files",
+        "git_initialization": "files",
+        "venv_creation": None,
+        "post_commands": "commands",
+    }
+
+    def __init__(
+        self,
+        history_dir: Optional[Path] = None,
+        max_records: int = DEFAULT_MAX_RECORDS,
+        persist: bool = True,
+        host: Optional[str] = None,
+    ) -> None:
+        """Initialize the history store.
+
+        Args:
+            history_dir: Directory for the history file (default: platformdirs data dir)
+            max_records: Number of most recent runs kept
+            persist: Whether to load and save the history on disk
+            host: Host name recorded with runs (default: platform node name)
+        """
+        self.logger = get_logger(__name__)
+        self.max_records = max_records
+        self.host = host or platform.node() or "unknown"
+        self.history_file: Optional[Path] = None
+
+        if persist:
+            if history_dir is None:
+                history_dir = (
+                    Path(user_data_dir("create-project", "claude")) / "history"
+                )
+            self.history_file = Path(history_dir) / "phases.jsonl"
+
+        self._lock = threading.RLock()
+        self._records: List[Dict[str, Any]] = []
+
+        self._load()
+
+    def record(
+        self,
+        template_name: str,
+        phase_durations: Dict[str, float],
+        counts: Dict[str, Any],
+        total_duration: Optional[float] = None,
+    ) -> None:
+        """Record one completed generation.
+
+        Args:
+            template_name: Name of the template used
+            phase_durations: Seconds spent in each phase
+            counts: Size of the work (files, bytes, directories, commands,
+                venv_tool)
+            total_duration: Total generation time in seconds
+        """
+        entry = {
+            "template": template_name,
+            "host": self.host,
+            "timestamp": time.time(),
+            "phases": {
+                phase: round(float(d), 4) for phase, d in phase_durations.items()
+            },
+            "counts": dict(counts),
+            "total": round(float(total_duration), 4)
+            if total_duration is not None
+            else round(sum(phase_durations.values()), 4),
+        }
+
+        with self._lock:
+            self._records.append(entry)
+            del self._records[: -self.max_records]
+            self._append(entry)
+
+    def estimate(
+        self, template_name: str, counts: Dict[str, Any]
+    ) -> Optional[Dict[str, float]]:
+        """Predict phase durations for a generation.
+
+        Uses runs of the template on this host, or on any host when this
+        host has too few. The venv phase only uses runs with the same venv
+        tool when the tool is known.
+
+        Args:
+            template_name: Name of the template to be used
+            counts: Size of the work, as passed to record()
+
+        Returns:
+            Predicted seconds per phase, or None without enough history
+        """
+        with self._lock:
+            runs = [r for r in self._records if r["template"] == template_name]
+
+        local = [r for r in runs if r["host"] == self.host]
+        runs = (local if len(local) >= self.MIN_SAMPLES else runs)[-self.WINDOW :]
+        if len(runs) < self.MIN_SAMPLES:
+            return None
+
+        estimates = {}
+        for phase, driver in self.PHASE_DRIVERS.items():
+            samples = runs
+            if phase == "venv_creation" and counts.get("venv_tool"):
+                same_tool = [
+                    r
+                    for r in runs
+                    if r["counts"].get("venv_tool") == counts["venv_tool"]
+                ]
+                samples = same_tool or runs
+
+            points = [
+                (self._driver_value(r["counts"], driver), r["phases"][phase])
+                for r in samples
+                if phase in r["phases"]
+            ]
+            if points:
+                estimates[phase] = self._predict(
+                    points, self._driver_value(counts, driver)
+                )
+
+        return estimates
+
+    def query(
+        self,
+        template_name: Optional[str] = None,
+        host: Optional[str] = None,
+        since: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get recorded runs, oldest first.
+
+        Args:
+            template_name: Only runs of this template
+            host: Only runs on this host
+            since: Only runs recorded after this Unix timestamp
+
+        Returns:
+            Copies of the matching records
+        """
+        with self._lock:
+            return [
+                json.loads(json.dumps(r))
+                for r in self._records
+                if (template_name is None or r["template"] == template_name)
+                and (host is None or r["host"] == host)
+                and (since is None or r["timestamp"] >= since)
+            ]
+
+    def summary(self, template_name: Optional[str] = None) -> Dict[str, Any]:
+        """Summarize durations per template and phase for capacity planning.
+
+        Args:
+            template_name: Only summarize this template
+
+        Returns:
+            Mapping of template name to run count, hosts and per-phase and
+            total mean/p95/max seconds
+        """
+
+        def describe(values: List[float]) -> Dict[str, float]:
+            ordered = sorted(values)
+            return {
+                "mean": round(statistics.fmean(ordered), 4),
+                "p95": ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))],
+                "max": ordered[-1],
+            }
+
+        grouped: Dict[str, List[Dict[str, Any]]] = {}
+        for record in self.query(template_name=template_name):
+            grouped.setdefault(record["template"], []).append(record)
+
+        summary = {}
+        for name, runs in grouped.items():
+            phases: Dict[str, List[float]] = {}
+            for run in runs:
+                for phase, duration in run["phases"].items():
+                    phases.setdefault(phase, []).append(duration)
+            summary[name] = {
+                "runs": len(runs),
+                "hosts": sorted({r["host"] for r in runs}),
+                "total": describe([r["total"] for r in runs]),
+                "phases": {phase: describe(v) for phase, v in phases.items()},
+            }
+        return summary
+
+    def clear(self) -> None:
+        """Forget all recorded runs."""
+        with self._lock:
+            self._records = []
+            self._rewrite()
+
+    @staticmethod
+    def _driver_value(counts: Dict[str, Any], driver: Optional[str]) -> float:
+        """Numeric size driver of a run (0 for constant phases)."""
+        if driver is None:
+            return 0.0
+        value = counts.get(driver, 0)
+        return float(value) if isinstance(value, (int, float)) else 0.0
+
+    @staticmethod
+    def _predict(points: List[tuple], x: float) -> float:
+        """Least-squares line through (size, seconds) points evaluated at x."""
+        xs = [p[0] for p in points]
+        ys = [p[1] for p in points]
+        mean_x = statistics.fmean(xs)
+        mean_y = statistics.fmean(ys)
+        variance = sum((v - mean_x) ** 2 for v in xs)
+        if variance == 0:
+            return max(0.0, mean_y)
+
+        slope = sum((a - mean_x) * (b - mean_y) for a, b in points) / variance
+        return max(0.0, mean_y + slope * (x - mean_x))
+
+    def _load(self) -> None:
+        """Load persisted history from disk, compacting an oversized file."""
+        if self.history_file is None or not self.history_file.exists():
+            return
+
+        try:
+            lines = self.history_file.read_text(encoding="utf-8").splitlines()
+        except Exception as e:
+            self.logger.debug("Failed to load phase history", error=str(e))
+            return
+
+        records = []
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # Torn or corrupt line, e.g. from a crash mid-write
+                continue
+            if isinstance(record, dict) and "template" in record:
+                records.append(record)
+
+        self._records = records[-self.max_records :]
+        if len(lines) > self.COMPACT_FACTOR * self.max_records:
+            self._rewrite()
+
+    def _append(self, entry: Dict[str, Any]) -> None:
+        """Append one run to the history file.
+
+        The line is written with a single call on a file opened for
+        appending, so concurrent writers each add their own line.
+        """
+        if self.history_file is None:
+            return
+
+        try:
+            self.history_file.parent.mkdir(parents=True, exist_ok=True)
+            line = (json.dumps(entry) + "\n").encode("utf-8")
+            fd = os.open(
+                self.history_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+            )
+            try:
+                os.write(fd, line)
+            finally:
+                os.close(fd)
+        except Exception as e:
+            self.logger.debug("Failed to persist phase history", error=str(e))
+
+    def _rewrite(self) -> None:
+        """Replace the history file with the in-memory runs atomically."""
+        if self.history_file is None:
+            return
+
+        try:
+            self.history_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.history_file.with_suffix(f".{os.getpid()}.tmp")
+            temp_file.write_text(
+                "".join(json.dumps(r) + "\n" for r in self._records),
+                encoding="utf-8",
+            )
+            os.replace(temp_file, self.history_file)
+        except Exception as e:
+            self.logger.debug("Failed to persist phase history", error=str(e))
+
+
+_phase_history: Optional[PhaseHistory] = None
+_phase_history_lock = threading.Lock()
+
+
+def get_phase_history() -> PhaseHistory:
+    """Return the process-wide phase history, creating it on first use."""
+    global _phase_history
+    with _phase_history_lock:
+        if _phase_history is None:
+            _phase_history = PhaseHistory()
+        return _phase_history
+
+
+def set_phase_history(history: Optional[PhaseHistory]) -> None:
+    """Replace the process-wide phase history.
+
+    Passing None resets it so the next call to get_phase_history()
+    creates a fresh default store.
+    """
+    global _phase_history
+    with _phase_history_lock:
+        _phase_history = history
@@ -0,0 +1,403 @@
+# ABOUTME: Process pool backend for generating many projects in parallel
+# ABOUTME: Runs picklable generation plans in preloaded worker processes
+
+"""
+Process pool backend for batch project generation.
+
+Template loading, Pydantic validation, Jinja2 rendering and encoding
+detection are CPU bound, so generating many projects on the thread pool of
+ThreadingModel is serialized by the GIL. This module provides the
+ProcessPoolBackend class which runs each project in a worker process
+instead, so batch generation scales with the number of cores.
+
+Each worker builds its template catalog, template engine and project
+generator once and reuses them for every plan it receives. Templates are
+looked up by name once per worker and their inline file contents are
+compiled up front, so later plans only render. Plans and results are small
+picklable dataclasses, and progress messages come back over a shared queue.
+
+With the ``fork`` start method the catalog is loaded once in the parent and
+inherited by every worker. The default ``forkserver`` method (``spawn``
+where unavailable) imports this module once in the fork server and loads
+the catalog in each worker, which avoids forking a multi-threaded parent.
+"""
+
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+from jinja2 import TemplateSyntaxError
+from structlog import get_logger
+
+from ..config.config_manager import ConfigManager
+from ..templates.engine import TemplateEngine
+from ..templates.loader import TemplateLoader
+from ..templates.schema.structure import DirectoryItem
+from ..templates.schema.template import Template
+from .exceptions import TemplateError
+from .file_renderer import FileRenderer
+from .project_generator import ProjectGenerator, ProjectOptions
+
+# Progress callback receiving plan ID, message and optional percentage
+BatchProgressCallback = Callable[[str, str, Optional[int]], None]
+
+
+@dataclass
+class GenerationPlan:
+    """Picklable description of one project to generate.
+
+    Attributes:
+        template_name: Template name, ID or file basename
+        variables: Template variables for substitution
+        target_path: Where to create the project
+        options: Project generation options
+        dry_run: If True, validate but don't create files
+        plan_id: Identifier used in results and progress (default: target path)
+    """
+
+    template_name: str
+    variables: Dict[str, Any]
+    target_path: str
+    options: ProjectOptions = field(default_factory=ProjectOptions)
+    dry_run: bool = False
+    plan_id: str = ""
+
+    def __post_init__(self) -> None:
+        """Normalize the target path and default the plan ID."""
+        self.target_path = str(self.target_path)
+        self.plan_id = self.plan_id or self.target_path
+
+
+@dataclass
+class PlanResult:
+    """Compact result of one generation plan.
+
+    Attributes:
+        plan_id: Identifier of the plan
+        success: Whether generation was successful
+        target_path: Path where the project was generated
+        template_name: Name of template used
+        files_created: Number of files that were created
+        errors: Error messages if any
+        duration: Generation duration in seconds
+        worker_pid: Process ID of the worker that ran the plan
+    """
+
+    plan_id: str
+    success: bool
+    target_path: str
+    template_name: str
+    files_created: int = 0
+    errors: List[str] = field(default_factory=list)
+    duration: float = 0.0
+    worker_pid: int = 0
+
+
+class _WorkerState:
+    """Per-process template catalog, engine and generator."""
+
+    def __init__(self, config_path: Optional[str], preload: bool) -> None:
+        self.logger = get_logger(__name__)
+        config_manager = ConfigManager(config_path)
+        self.engine = TemplateEngine(config_manager=config_manager)
+        self.loader = TemplateLoader(config_manager=config_manager)
+        self.generator = ProjectGenerator(
+            config_manager=config_manager,
+            template_loader=self.loader,
+            file_renderer=FileRenderer(
+                template_engine=self.engine, template_loader=self.loader
+            ),
+        )
+        self.templates: Dict[str, Template] = {}
+
+        if preload:
+            self.preload()
+
+    def preload(self) -> None:
+        """Load every discoverable template and compile its file contents."""
+        loaded = 0
+        for template_path in self.loader.discover_templates():
+            try:
+                template = self.engine.load_template(template_path)
+            except Exception as e:
+                self.logger.debug(
+                    "Skipping template during preload",
+                    template_path=str(template_path),
+                    error=str(e),
+                )
+                continue
+
+            for source in _template_sources(template):
+                try:
+                    self.engine.compile_template_string(source)
+                except TemplateSyntaxError:
+                    # Reported with context when the file is rendered
+                    pass
+            loaded += 1
+
+        self.logger.debug("Worker templates preloaded", templates=loaded)
+
+    def template(self, name: str) -> Template:
+        """Look up a template by name, caching the result per worker.
+
+        Raises:
+            TemplateError: If no template matches the name
+        """
+        template = self.templates.get(name)
+        if template is None:
+            template_path = self.loader.find_template_by_name(name)
+            if template_path is None:
+                raise TemplateError(f"Template '{name}' not found")
+            template = self.templates[name] = self.engine.load_template(template_path)
+        return template
+
+
+_worker_state: Optional[_WorkerState] = None
+_progress_queue: Any = None
+
+
+def _template_sources(template: Template) -> Iterator[str]:
+    """Yield the inline Jinja2 sources of a template."""
+    directories: List[DirectoryItem] = [template.structure.root_directory]
+    while directories:
+        directory = directories.pop()
+        directories.extend(directory.directories)
+        for item in directory.files:
+            if item.content is not None:
+                yield item.content
+    for template_file in template.template_files.files:
+        yield template_file.content
+
+
+def _initialize_worker(
+    config_path: Optional[str],
+    preload: bool,
+    progress_queue: Any,
+    state: Optional[_WorkerState],
+) -> None:
+    """Set up a worker process, reusing state inherited from a forked parent."""
+    global _worker_state, _progress_queue
+
+    _progress_queue = progress_queue
+    _worker_state = state or _WorkerState(config_path, preload)
+
+
+def _generate_plan(plan: GenerationPlan) -> PlanResult:
+    """Run one plan in a worker process."""
+    started = time.perf_counter()
+    result = PlanResult(
+        plan_id=plan.plan_id,
+        success=False,
+        target_path=plan.target_path,
+        template_name=plan.template_name,
+        worker_pid=os.getpid(),
+    )
+
+    def report(message: str, percentage: Optional[int] = None) -> None:
+        if _progress_queue is not None:
+            _progress_queue.put((plan.plan_id, message, percentage))
+
+    try:
+        template = _worker_state.template(plan.template_name)
+        generated = _worker_state.generator.generate_project(
+            template=template,
+            variables=dict(plan.variables),
+            target_path=plan.target_path,
+            options=plan.options,
+            dry_run=plan.dry_run,
+            progress_callback=report,
+        )
+    except Exception as e:
+        result.errors = [str(e)]
+    else:
+        result.success = generated.success
+        result.target_path = str(generated.target_path)
+        result.files_created = len(generated.files_created)
+        result.errors = list(generated.errors)
+
+    result.duration = time.perf_counter() - started
+    return result
+
+
+class ProcessPoolBackend:
+    """Generates batches of projects in preloaded worker processes.
+
+    Batches run one at a time; plans within a batch run in parallel across
+    the workers. Worker processes are started on the first batch and kept
+    until shutdown so later batches reuse their loaded catalog.
+
+    Attributes:
+        max_workers: Number of worker processes
+        start_method: Multiprocessing start method
+        preload: Whether workers load the whole template catalog up front
+        logger: Structured logger for operations
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        config_manager: Optional[ConfigManager] = None,
+        start_method: Optional[str] = None,
+        preload: bool = True,
+    ) -> None:
+        """Initialize the backend.
+
+        Args:
+            max_workers: Number of worker processes (default: CPU count)
+            config_manager: Configuration whose directory workers load
+            start_method: ``fork``, ``forkserver`` or ``spawn``
+                (default: ``forkserver`` where available, else ``spawn``)
+            preload: Whether workers load the whole template catalog up front
+        """
+        self.logger = get_logger(__name__)
+        self.max_workers = max_workers or os.cpu_count() or 2
+
+        available = multiprocessing.get_all_start_methods()
+        if start_method is None:
+            start_method = "forkserver" if "forkserver" in available else "spawn"
+        if start_method not in available:
+            raise ValueError(f"Unsupported start method: {start_method}")
+        self.start_method = start_method
+        self.preload = preload
+
+        self._config_path = (
+            str(config_manager.config_directory)
+            if isinstance(config_manager, ConfigManager)
+            else None
+        )
+        self._context = multiprocessing.get_context(start_method)
+        if start_method == "forkserver":
+            self._context.set_forkserver_preload([__name__])
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._progress_queue: Any = None
+        self._batch_lock = threading.Lock()
+
+    def generate(
+        self,
+        plans: Sequence[GenerationPlan],
+        progress_callback: Optional[BatchProgressCallback] = None,
+    ) -> List[PlanResult]:
+        """Generate a batch of projects.
+
+        Args:
+            plans: Projects to generate
+            progress_callback: Optional callback receiving plan ID, message
+                and percentage, called on a background thread
+
+        Returns:
+            One result per plan, in plan order
+        """
+        with self._batch_lock:
+            executor = self._ensure_executor()
+            drainer = threading.Thread(
+                target=self._drain_progress,
+                args=(progress_callback,),
+                name="batch-progress",
+                daemon=True,
+            )
+            drainer.start()
+
+            started = time.perf_counter()
+            broken = False
+            try:
+                futures = [executor.submit(_generate_plan, plan) for plan in plans]
+                results = []
+                for plan, future in zip(plans, futures):
+                    try:
+                        results.append(future.result())
+                    except Exception as e:
+                        # Worker crashed or plan could not be pickled
+                        broken = broken or isinstance(e, BrokenProcessPool)
+                        results.append(
+                            PlanResult(
+                                plan_id=plan.plan_id,
+                                success=False,
+                                target_path=plan.target_path,
+                                template_name=plan.template_name,
+                                errors=[f"Worker failed: {e}"],
+                            )
+                        )
+            finally:
+                self._progress_queue.put(None)
+                drainer.join()
+                if broken:
+                    # Start fresh workers for the next batch
+                    self._stop_executor(wait=False)
+
+        self.logger.info(
+            "Batch generation finished",
+            plans=len(plans),
+            succeeded=sum(1 for r in results if r.success),
+            workers=len({r.worker_pid for r in results if r.worker_pid}),
+            duration=round(time.perf_counter() - started, 3),
+        )
+        return results
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes.
+
+        Args:
+            wait: Whether to wait for running plans to finish
+        """
+        with self._batch_lock:
+            self._stop_executor(wait)
+
+    def __enter__(self) -> "ProcessPoolBackend":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        self.shutdown(wait=True)
+
+    def _ensure_executor(self) -> ProcessPoolExecutor:
+        """Start the worker processes on first use."""
+        if self._executor is None:
+            # Forked workers inherit a catalog loaded here; other start
+            # methods would have to pickle it, so they load their own
+            state = (
+                _WorkerState(self._config_path, self.preload)
+                if self.start_method == "fork"
+                else None
+            )
+            self._progress_queue = self._context.SimpleQueue()
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=self._context,
+                initializer=_initialize_worker,
+                initargs=(self._config_path, self.preload, self._progress_queue, state),
+            )
+            self.logger.info(
+                "Process pool started",
+                max_workers=self.max_workers,
+                start_method=self.start_method,
+                preload=self.preload,
+            )
+        return self._executor
+
+    def _stop_executor(self, wait: bool) -> None:
+        """Shut down the worker processes if they are running."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=not wait)
+            self._executor = None
+            self._progress_queue.close()
+            self._progress_queue = None
+
+    def _drain_progress(self, callback: Optional[BatchProgressCallback]) -> None:
+        """Forward worker progress messages until the batch ends."""
+        while True:
+            message = self._progress_queue.get()
+            if message is None:
+                return
+            if callback is None:
+                continue
+            try:
+                callback(*message)
+            except Exception as e:
+                self.logger.warning("Batch progress callback failed", error=str(e))
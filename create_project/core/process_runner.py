@@ -0,0 +1,333 @@
+# ABOUTME: Streaming subprocess runner with bounded output capture
+# ABOUTME: Reads stdout/stderr incrementally and kills whole process groups on timeout
+
+"""
+Streaming subprocess runner.
+
+This module provides ``run_streaming``, a replacement for
+``subprocess.run(capture_output=True)`` that reads both pipes while the
+process runs. Every line is forwarded to an optional callback, and each
+stream keeps only a bounded head and tail (see ``OutputBuffer``), so chatty
+installers cannot grow memory without limit.
+
+Processes are started in their own process group (session on POSIX). On
+timeout, on an exception in the caller, or when processes left behind by an
+exited command keep the pipes open, the whole group is terminated, so
+installers and build tools cannot leave orphaned children behind.
+"""
+
+import os
+import queue
+import signal
+import subprocess
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import IO, Callable, Deque, Dict, List, Optional, Sequence, Union
+
+from structlog import get_logger
+
+from ..utils.tracing import traced
+
+# Called with the stream name ("stdout" or "stderr") and the line without
+# its trailing newline
+LineCallback = Callable[[str, str], None]
+
+DEFAULT_HEAD_LINES = 200
+DEFAULT_TAIL_LINES = 1000
+MAX_LINE_LENGTH = 8192
+
+# Seconds between SIGTERM and SIGKILL when terminating a process group
+KILL_GRACE_SECONDS = 2.0
+
+# Seconds to keep reading after the command exited while descendants still
+# hold its pipes open
+EXIT_LINGER_SECONDS = 1.0
+
+_POLL_INTERVAL = 0.1
+
+logger = get_logger(__name__)
+
+
+class OutputBuffer:
+    """Bounded capture of one output stream.
+
+    Keeps the first ``head_lines`` and the last ``tail_lines`` lines; lines
+    in between are counted but dropped. Lines longer than ``MAX_LINE_LENGTH``
+    arrive as several chunks, so memory use is bounded by
+    ``(head_lines + tail_lines) * MAX_LINE_LENGTH`` characters. With
+    ``head_lines`` None every line is kept, for output that gets parsed.
+
+    Attributes:
+        head_lines: Number of leading lines to keep (None keeps all lines)
+        tail_lines: Number of trailing lines to keep
+        dropped_lines: Number of lines discarded between head and tail
+    """
+
+    def __init__(
+        self,
+        head_lines: Optional[int] = DEFAULT_HEAD_LINES,
+        tail_lines: int = DEFAULT_TAIL_LINES,
+    ) -> None:
+        """Initialize the buffer.
+
+        Args:
+            head_lines: Number of leading lines to keep (None keeps all lines)
+            tail_lines: Number of trailing lines to keep
+        """
+        self.head_lines = head_lines
+        self.tail_lines = tail_lines
+        self.dropped_lines = 0
+        self._head: List[str] = []
+        self._tail: Deque[str] = deque(maxlen=tail_lines)
+
+    @property
+    def truncated(self) -> bool:
+        """Whether any lines were dropped."""
+        return self.dropped_lines > 0
+
+    def append(self, line: str) -> None:
+        """Add a line, including its trailing newline if it had one."""
+        if self.head_lines is None or len(self._head) < self.head_lines:
+            self._head.append(line)
+            return
+
+        if self.tail_lines <= 0:
+            self.dropped_lines += 1
+            return
+
+        if len(self._tail) == self.tail_lines:
+            self.dropped_lines += 1
+        self._tail.append(line)
+
+    def getvalue(self) -> str:
+        """Captured text with a marker where lines were dropped."""
+        parts = list(self._head)
+        if self.dropped_lines:
+            parts.append(f"\n... [{self.dropped_lines} lines omitted] ...\n")
+        parts.extend(self._tail)
+        return "".join(parts)
+
+
+@traced("subprocess", "subprocess", capture=("args", "cwd"))
+def run_streaming(
+    args: Sequence[str],
+    cwd: Optional[Union[str, Path]] = None,
+    env: Optional[Dict[str, str]] = None,
+    timeout: Optional[float] = None,
+    line_callback: Optional[LineCallback] = None,
+    head_lines: Optional[int] = DEFAULT_HEAD_LINES,
+    tail_lines: int = DEFAULT_TAIL_LINES,
+) -> subprocess.CompletedProcess:
+    """Run a command, streaming its output.
+
+    Standard input is closed. The line callback is invoked from the calling
+    thread, in the order lines were read from each pipe.
+
+    Args:
+        args: Command and arguments
+        cwd: Working directory
+        env: Environment (inherits the current environment if None)
+        timeout: Seconds before the process group is killed (None waits forever)
+        line_callback: Optional callback receiving (stream, line)
+        head_lines: Leading lines to keep per stream (None captures the
+            complete output, for commands whose output is parsed)
+        tail_lines: Trailing lines to keep per stream
+
+    Returns:
+        CompletedProcess with the bounded stdout and stderr text
+
+    Raises:
+        subprocess.TimeoutExpired: If the timeout elapsed; the process group
+            was killed and the exception carries the captured output
+        OSError: If the process could not be started
+    """
+    command = list(args)
+    process = subprocess.Popen(
+        command,
+        cwd=cwd,
+        env=env,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace",
+        **_process_group_options(),
+    )
+
+    buffers = {
+        "stdout": OutputBuffer(head_lines, tail_lines),
+        "stderr": OutputBuffer(head_lines, tail_lines),
+    }
+    events: queue.Queue[tuple] = queue.Queue()
+    readers = [
+        threading.Thread(
+            target=_pump,
+            args=(name, pipe, events),
+            name=f"process-{name}",
+            daemon=True,
+        )
+        for name, pipe in (("stdout", process.stdout), ("stderr", process.stderr))
+    ]
+    for reader in readers:
+        reader.start()
+
+    deadline = time.monotonic() + timeout if timeout is not None else None
+
+    try:
+        _collect_output(process, command, events, buffers, deadline, line_callback)
+        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+        returncode = process.wait(timeout=remaining)
+
+    except subprocess.TimeoutExpired:
+        kill_process_group(process)
+        _close(process, readers)
+        logger.warning("Process timed out", command=command, timeout=timeout)
+        raise subprocess.TimeoutExpired(
+            command,
+            timeout,
+            output=buffers["stdout"].getvalue(),
+            stderr=buffers["stderr"].getvalue(),
+        ) from None
+
+    except BaseException:
+        kill_process_group(process)
+        _close(process, readers)
+        raise
+
+    _close(process, readers)
+
+    truncated = {name: b.dropped_lines for name, b in buffers.items() if b.truncated}
+    if truncated:
+        logger.debug(
+            "Process output truncated", command=command, dropped_lines=truncated
+        )
+
+    return subprocess.CompletedProcess(
+        command,
+        returncode,
+        stdout=buffers["stdout"].getvalue(),
+        stderr=buffers["stderr"].getvalue(),
+    )
+
+
+def _collect_output(
+    process: subprocess.Popen,
+    command: List[str],
+    events: "queue.Queue[tuple]",
+    buffers: Dict[str, OutputBuffer],
+    deadline: Optional[float],
+    line_callback: Optional[LineCallback],
+) -> None:
+    """Move lines from the pipe readers into the buffers until both pipes close.
+
+    Raises:
+        subprocess.TimeoutExpired: If the deadline passed (without output;
+            the caller attaches the captured text)
+    """
+    exited_at: Optional[float] = None
+    leftovers_killed = False
+    open_streams = len(buffers)
+
+    while open_streams:
+        now = time.monotonic()
+        if deadline is not None and now >= deadline:
+            raise subprocess.TimeoutExpired(command, 0)
+
+        if exited_at is None and process.poll() is not None:
+            exited_at = now
+        if exited_at is not None and now - exited_at > EXIT_LINGER_SECONDS:
+            if leftovers_killed:
+                # Pipes are held by processes outside the group
+                return
+            # Descendants inherited the pipes and outlived the command
+            logger.debug("Killing processes left behind by command", command=command)
+            kill_process_group(process)
+            leftovers_killed = True
+            exited_at = now
+
+        try:
+            name, line = events.get(timeout=_POLL_INTERVAL)
+        except queue.Empty:
+            continue
+
+        if line is None:
+            open_streams -= 1
+            continue
+
+        buffers[name].append(line)
+        if line_callback:
+            line_callback(name, line.rstrip("\n"))
+
+
+def kill_process_group(process: subprocess.Popen) -> None:
+    """Terminate a process started by ``run_streaming`` and its descendants.
+
+    Sends SIGTERM to the process group, then SIGKILL if it is still alive
+    after ``KILL_GRACE_SECONDS``. On Windows the process tree is killed.
+
+    Args:
+        process: Process whose group should be terminated
+    """
+    if os.name == "nt":
+        if process.poll() is None:
+            # The command leads its own process group, which gets the break
+            process.send_signal(signal.CTRL_BREAK_EVENT)
+            try:
+                process.wait(timeout=KILL_GRACE_SECONDS)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        return
+
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+    except (ProcessLookupError, PermissionError):
+        return
+
+    try:
+        process.wait(timeout=KILL_GRACE_SECONDS)
+    except subprocess.TimeoutExpired:
+        pass
+
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def _process_group_options() -> Dict[str, object]:
+    """Popen arguments that start the command in a new process group."""
+    if os.name == "nt":
+        return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    return {"start_new_session": True}
+
+
+def _pump(name: str, pipe: IO[str], events: "queue.Queue[tuple]") -> None:
+    """Forward lines from a pipe to the event queue until EOF."""
+    try:
+        for line in iter(lambda: pipe.readline(MAX_LINE_LENGTH), ""):
+            events.put((name, line))
+    except (OSError, ValueError):
+        # Pipe closed while the process group was being killed
+        pass
+    finally:
+        events.put((name, None))
+
+
+def _close(process: subprocess.Popen, readers: List[threading.Thread]) -> None:
+    """Reap the process and release its pipes."""
+    try:
+        process.wait(timeout=KILL_GRACE_SECONDS)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+    for reader, pipe in zip(readers, (process.stdout, process.stderr)):
+        reader.join(timeout=_POLL_INTERVAL)
+        # Closing a pipe a reader is blocked on would wait for the reader
+        if pipe is not None and not reader.is_alive():
+            try:
+                pipe.close()
+            except OSError:
+                pass
@@ -7,11 +7,20 @@ Progress tracking utilities for project generation.
 This module provides dataclasses and utilities for tracking detailed progress
 during project generation, including percentage completion, time estimation,
 and phase tracking.
+
+Progress is published per file, so templates with thousands of files produce
+thousands of events. ProgressBus sits between producers and subscribers
+(loggers, GUI signals) and coalesces events to a maximum delivery rate, so
+the cost of reporting does not grow with the number of files.
 """
 
+import threading
 import time
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Callable, List, Optional
+from typing import Any, Callable, Deque, Dict, Generic, Hashable, List, Optional, TypeVar
+
+T = TypeVar("T")
 
 
 @dataclass
@@ -47,7 +56,10 @@ class ProgressTracker:
     """Tracks progress across multiple phases of an operation.
     
     This class helps calculate accurate progress percentages and time estimates
-    across different phases of project generation.
+    across different phases of project generation. With expected phase
+    durations (learned from earlier runs), phase weights follow those
+    durations and the remaining time counts down through long phases that
+    report little progress of their own, such as dependency installs.
     """
 
     # Phase weights (percentage of total time)
@@ -66,6 +78,8 @@ class ProgressTracker:
     phase_progress: dict[str, float] = field(default_factory=dict)
     phase_start_times: dict[str, float] = field(default_factory=dict)
     completed_phases: List[str] = field(default_factory=list)
+    phase_durations: dict[str, float] = field(default_factory=dict)
+    expected_durations: dict[str, float] = field(default_factory=dict)
 
     # Callbacks
     progress_callback: Optional[Callable[[DetailedProgress], None]] = None
@@ -105,11 +119,32 @@ class ProgressTracker:
         """
         phase = phase or self.current_phase
         self.phase_progress[phase] = 1.0
+        self.phase_durations[phase] = time.time() - self.phase_start_times.get(
+            phase, self.start_time
+        )
         if phase not in self.completed_phases:
             self.completed_phases.append(phase)
 
         self._report_progress(f"Completed {phase.replace('_', ' ').title()}")
 
+    def set_expected_durations(self, durations: dict[str, float]) -> None:
+        """Use expected phase durations for weights and time estimates.
+        
+        Phases missing from ``durations`` are expected to be skipped.
+        
+        Args:
+            durations: Expected seconds per phase
+        """
+        total = sum(max(0.0, d) for d in durations.values())
+        if total <= 0:
+            return
+
+        self.expected_durations = {p: max(0.0, d) for p, d in durations.items()}
+        self.phase_weights = {
+            phase: 100.0 * self.expected_durations.get(phase, 0.0) / total
+            for phase in self.phase_weights
+        }
+
     def get_current_phase(self) -> str:
         """Get the current phase name.
         
@@ -124,23 +159,27 @@ class ProgressTracker:
         Returns:
             DetailedProgress object with current status
         """
+        now = time.time()
+
         # Calculate weighted progress
-        total_weight = sum(self.phase_weights.values())
+        total_weight = sum(self.phase_weights.values()) or 1.0
         weighted_progress = 0.0
 
         for phase, weight in self.phase_weights.items():
-            phase_prog = self.phase_progress.get(phase, 0.0)
+            phase_prog = self._phase_fraction(phase, now)
             weighted_progress += (phase_prog * weight) / total_weight
 
         # Calculate percentage
         percentage = int(weighted_progress * 100)
 
         # Calculate time elapsed
-        time_elapsed = time.time() - self.start_time
+        time_elapsed = now - self.start_time
 
         # Estimate remaining time
         estimated_remaining = None
-        if percentage > 0 and percentage < 100:
+        if self.expected_durations:
+            estimated_remaining = self._expected_remaining(now)
+        elif percentage > 0 and percentage < 100:
             estimated_total = time_elapsed / (percentage / 100.0)
             estimated_remaining = estimated_total - time_elapsed
 
@@ -158,6 +197,41 @@ class ProgressTracker:
             estimated_remaining=estimated_remaining,
         )
 
+    def _phase_fraction(self, phase: str, now: float) -> float:
+        """Progress of a phase, interpolated by time for the current phase."""
+        reported = self.phase_progress.get(phase, 0.0)
+        expected = self.expected_durations.get(phase, 0.0)
+        if (
+            phase != self.current_phase
+            or phase in self.completed_phases
+            or expected <= 0
+        ):
+            return reported
+
+        # Keep moving through phases that report little progress, without
+        # claiming completion before the phase actually ends
+        elapsed = now - self.phase_start_times.get(phase, now)
+        return max(reported, min(0.95, elapsed / expected))
+
+    def _expected_remaining(self, now: float) -> float:
+        """Remaining seconds from expected durations of unfinished phases."""
+        remaining = 0.0
+        for phase, expected in self.expected_durations.items():
+            if phase in self.completed_phases:
+                continue
+            if phase != self.current_phase:
+                remaining += expected
+                continue
+
+            elapsed = now - self.phase_start_times.get(phase, now)
+            reported = self.phase_progress.get(phase, 0.0)
+            if elapsed < expected:
+                remaining += expected - elapsed
+            elif 0 < reported < 1:
+                # Running over the expectation: extrapolate from progress
+                remaining += elapsed * (1 - reported) / reported
+        return remaining
+
     def _report_progress(self, message: str) -> None:
         """Report progress through callback.
         
@@ -242,3 +316,149 @@ class StepTracker:
         remaining_items = self.total_items - self.completed_items
 
         return avg_time_per_item * remaining_items
+
+
+class ProgressBus(Generic[T]):
+    """Coalescing, rate-limited delivery of progress events.
+
+    Every published event is kept in a fixed-size ring buffer, but
+    subscribers are called at most ``max_rate`` times per second. Events
+    arriving in between replace each other, and the latest one is delivered
+    on the next publish after the interval or on ``flush()``. Events are
+    delivered immediately when forced or when their transition key (for
+    example the phase) differs from the previous event's.
+
+    Subscribers run on the publishing thread, and exceptions they raise
+    propagate to the publisher so callbacks can still cancel an operation.
+    """
+
+    DEFAULT_MAX_RATE = 20.0
+    DEFAULT_HISTORY_SIZE = 256
+
+    def __init__(
+        self,
+        max_rate: float = DEFAULT_MAX_RATE,
+        history_size: int = DEFAULT_HISTORY_SIZE,
+        transition_key: Optional[Callable[[T], Hashable]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the bus.
+        
+        Args:
+            max_rate: Maximum deliveries per second (0 disables coalescing)
+            history_size: Number of recent events kept
+            transition_key: Function returning a key whose change forces delivery
+            clock: Monotonic clock in seconds
+        """
+        self.min_interval = 1.0 / max_rate if max_rate > 0 else 0.0
+        self.transition_key = transition_key
+        self._clock = clock
+        self._subscribers: List[Callable[[T], None]] = []
+        self._history: Deque[T] = deque(maxlen=max(1, history_size))
+        self._pending: Optional[T] = None
+        self._has_pending = False
+        self._last_delivery: Optional[float] = None
+        self._last_key: Any = None
+        self._lock = threading.Lock()
+        self._counters = {"published": 0, "delivered": 0, "coalesced": 0}
+
+    def subscribe(self, callback: Callable[[T], None]) -> None:
+        """Register a subscriber.
+        
+        Args:
+            callback: Function called with delivered events
+        """
+        with self._lock:
+            if callback not in self._subscribers:
+                self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[T], None]) -> None:
+        """Remove a subscriber.
+        
+        Args:
+            callback: Previously registered function
+        """
+        with self._lock:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+    def publish(self, event: T, force: bool = False) -> bool:
+        """Publish an event.
+        
+        Args:
+            event: Progress event
+            force: Deliver immediately regardless of the rate limit
+            
+        Returns:
+            True if the event was delivered, False if it was coalesced
+        """
+        with self._lock:
+            self._counters["published"] += 1
+            self._history.append(event)
+
+            now = self._clock()
+            if self.transition_key is not None:
+                key = self.transition_key(event)
+                if key != self._last_key:
+                    force = True
+                self._last_key = key
+
+            due = (
+                self._last_delivery is None
+                or now - self._last_delivery >= self.min_interval
+            )
+            if not (force or due):
+                if self._has_pending:
+                    self._counters["coalesced"] += 1
+                self._pending = event
+                self._has_pending = True
+                return False
+
+            if self._has_pending:
+                # Superseded by the event being delivered now
+                self._counters["coalesced"] += 1
+            self._pending = None
+            self._has_pending = False
+            self._last_delivery = now
+
+        self._deliver(event)
+        return True
+
+    def flush(self) -> None:
+        """Deliver the latest coalesced event, if any."""
+        with self._lock:
+            if not self._has_pending:
+                return
+            event = self._pending
+            self._pending = None
+            self._has_pending = False
+            self._last_delivery = self._clock()
+
+        self._deliver(event)
+
+    def recent(self) -> List[T]:
+        """Get the most recent events, oldest first.
+        
+        Returns:
+            Up to ``history_size`` published events
+        """
+        with self._lock:
+            return list(self._history)
+
+    def stats(self) -> Dict[str, int]:
+        """Get publish, delivery and coalescing counts.
+        
+        Returns:
+            Dictionary with published, delivered and coalesced counts
+        """
+        with self._lock:
+            return dict(self._counters)
+
+    def _deliver(self, event: T) -> None:
+        """Call every subscriber with an event."""
+        with self._lock:
+            subscribers = list(self._subscribers)
+            self._counters["delivered"] += 1
+
+        for callback in subscribers:
+            callback(event)
@@ -10,7 +10,8 @@ file rendering, and error handling with atomic rollback capabilities.
 """
 
 import asyncio
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Union
 
@@ -18,8 +19,12 @@ from structlog import get_logger
 
 from ..config.config_manager import ConfigManager
 from ..templates.loader import TemplateLoader
+from ..templates.schema.actions import ActionType, TemplateAction
+from ..templates.schema.structure import ProjectStructure
 from ..templates.schema.template import Template
-from .command_executor import CommandExecutor
+from ..utils.tracing import current_span, traced
+from .command_cache import CommandResultCache
+from .command_executor import CommandExecutor, CommandSpec, ExecutionResult
 from .directory_creator import DirectoryCreator
 from .error_recovery import RecoveryContext, RecoveryManager
 from .exceptions import (
@@ -32,8 +37,10 @@ from .exceptions import (
 from .file_renderer import FileRenderer
 from .git_manager import GitConfig, GitManager
 from .path_utils import PathHandler
-from .progress import DetailedProgress, ProgressTracker, StepTracker
-from .venv_manager import VenvManager
+from .phase_history import PhaseHistory, get_phase_history
+from .progress import DetailedProgress, ProgressBus, ProgressTracker, StepTracker
+from .tool_probe import prewarm_tool_probes
+from .venv_manager import InstallOptions, VenvManager, VenvTool
 
 
 @dataclass
@@ -48,6 +55,9 @@ class ProjectOptions:
         execute_post_commands: Whether to execute post-creation commands
         git_config: Git configuration for repository setup
         enable_ai_assistance: Whether to enable AI assistance on errors
+        cache_post_commands: Whether to record post-creation command results
+            in the project state directory and skip commands whose declared
+            inputs are unchanged since they last succeeded
     """
 
     create_git_repo: bool = True
@@ -57,6 +67,7 @@ class ProjectOptions:
     execute_post_commands: bool = True
     git_config: Optional[GitConfig] = None
     enable_ai_assistance: bool = True
+    cache_post_commands: bool = False
 
 
 @dataclass
@@ -74,6 +85,7 @@ class GenerationResult:
         venv_created: Whether virtual environment was created
         commands_executed: Number of post-creation commands executed
         ai_suggestions: AI-generated suggestions for fixing errors (if any)
+        venv_timings: Seconds spent creating the venv and installing requirements
     """
 
     success: bool
@@ -87,6 +99,7 @@ class GenerationResult:
     commands_executed: int = 0
     ai_suggestions: Optional[str] = None
     recovery_context: Optional[RecoveryContext] = None
+    venv_timings: Dict[str, float] = field(default_factory=dict)
 
 
 class ProjectGenerator:
@@ -121,6 +134,14 @@ class ProjectGenerator:
         logger: Structured logger for operations
     """
 
+    # Minimum seconds between progress updates carrying live command output
+    OUTPUT_PROGRESS_INTERVAL = 0.1
+    OUTPUT_MESSAGE_LENGTH = 80
+    # Seconds to wait for AI help before giving up on it
+    AI_ASSISTANCE_TIMEOUT = 120.0
+    # Preload the AI help model in the background when a generation starts
+    PREWARM_AI_MODEL = True
+
     def __init__(
         self,
         config_manager: Optional[ConfigManager] = None,
@@ -132,6 +153,7 @@ class ProjectGenerator:
         venv_manager: Optional[VenvManager] = None,
         command_executor: Optional[CommandExecutor] = None,
         ai_service: Optional["AIService"] = None,  # Forward reference
+        phase_history: Optional[PhaseHistory] = None,
     ) -> None:
         """Initialize the ProjectGenerator.
 
@@ -145,6 +167,7 @@ class ProjectGenerator:
             venv_manager: Optional VenvManager (creates new if None)
             command_executor: Optional CommandExecutor (creates new if None)
             ai_service: Optional AI service for error assistance
+            phase_history: Optional PhaseHistory (uses the shared one if None)
         """
         self.config_manager = config_manager or ConfigManager()
         self.template_loader = template_loader or TemplateLoader()
@@ -152,13 +175,23 @@ class ProjectGenerator:
         # DirectoryCreator needs a base_path - we'll initialize it per project
         self.directory_creator = directory_creator
         self.file_renderer = file_renderer or FileRenderer()
+
+        # Run the external tool probes concurrently (or serve them from the
+        # probe cache) before the managers below ask for them one by one
+        if git_manager is None or venv_manager is None:
+            prewarm_tool_probes()
+
         self.git_manager = git_manager or GitManager()
-        self.venv_manager = venv_manager or VenvManager()
+        self.venv_manager = venv_manager or VenvManager(
+            install_options=self._build_install_options()
+        )
         self.command_executor = command_executor or CommandExecutor()
         self.ai_service = ai_service
+        self.phase_history = phase_history or get_phase_history()
 
         self.generation_errors: List[str] = []
         self.rollback_handlers: List[Callable[[], None]] = []
+        self.venv_timings: Dict[str, float] = {}
         self.logger = get_logger(__name__)
         self.recovery_manager = RecoveryManager()
 
@@ -184,6 +217,18 @@ class ProjectGenerator:
                     max_cache_entries=self.config_manager.get_setting(
                         "ai.max_cache_entries", 100
                     ),
+                    cache_backend=self.config_manager.get_setting(
+                        "ai.cache_backend", "sqlite"
+                    ),
+                    hedge_after_seconds=self.config_manager.get_setting(
+                        "ai.hedge_after_seconds", 0.75
+                    ),
+                    help_deadline_seconds=self.config_manager.get_setting(
+                        "ai.help_deadline_seconds", 1.0
+                    ),
+                    model_keep_alive_minutes=self.config_manager.get_setting(
+                        "ai.model_keep_alive_minutes", 10
+                    ),
                     preferred_models=self.config_manager.get_setting(
                         "ai.preferred_models"
                     ),
@@ -217,6 +262,53 @@ class ProjectGenerator:
             ai_service_available=self.ai_service is not None,
         )
 
+    def _build_install_options(self) -> InstallOptions:
+        """Build dependency install options from the ``venv`` config section.
+
+        Returns:
+            InstallOptions with wheelhouse, offline and cache settings
+        """
+        wheelhouse_dir = self.config_manager.get_setting("venv.wheelhouse_dir")
+        offline = self.config_manager.get_setting("venv.offline", False)
+        cache_dir = self.config_manager.get_setting("venv.package_cache_dir")
+        link_mode = self.config_manager.get_setting("venv.uv_link_mode", "hardlink")
+
+        return InstallOptions(
+            wheelhouse_dir=Path(wheelhouse_dir)
+            if isinstance(wheelhouse_dir, str)
+            else None,
+            offline=offline is True,
+            cache_dir=Path(cache_dir) if isinstance(cache_dir, str) else None,
+            uv_link_mode=link_mode if isinstance(link_mode, str) else "hardlink",
+        )
+
+    def _build_progress_bus(self) -> ProgressBus[DetailedProgress]:
+        """Build the bus coalescing progress events for one generation.
+
+        Phase starts and completions are always delivered; updates within a
+        phase are limited to ``ui.progress_updates_per_second``.
+
+        Returns:
+            ProgressBus configured from the ``ui`` config section
+        """
+        max_rate = self.config_manager.get_setting(
+            "ui.progress_updates_per_second", ProgressBus.DEFAULT_MAX_RATE
+        )
+        history_size = self.config_manager.get_setting(
+            "ui.progress_history_size", ProgressBus.DEFAULT_HISTORY_SIZE
+        )
+
+        return ProgressBus(
+            max_rate=max_rate
+            if isinstance(max_rate, (int, float))
+            else ProgressBus.DEFAULT_MAX_RATE,
+            history_size=history_size
+            if isinstance(history_size, int)
+            else ProgressBus.DEFAULT_HISTORY_SIZE,
+            transition_key=lambda progress: (progress.phase, progress.current_step),
+        )
+
+    @traced("generate_project", "generator", capture=("target_path", "dry_run"))
     def generate_project(
         self,
         template: Template,
@@ -255,11 +347,13 @@ class ProjectGenerator:
         # Reset state for new generation
         self.generation_errors.clear()
         self.rollback_handlers.clear()
+        self.venv_timings = {}
 
         target_path = self.path_handler.normalize_path(target_path)
 
         # Initialize result tracking
         git_initialized = False
+        git_committed = False
         venv_created = False
         commands_executed = 0
 
@@ -273,6 +367,13 @@ class ProjectGenerator:
             execute_post_commands=options.execute_post_commands,
         )
 
+        trace_span = current_span()
+        if trace_span is not None:
+            trace_span.set(template=template.name)
+
+        if options.enable_ai_assistance and not dry_run:
+            self._prewarm_ai_model()
+
         try:
             # Initialize progress tracker
             progress_tracker = ProgressTracker()
@@ -290,7 +391,20 @@ class ProjectGenerator:
                     remaining=progress.estimated_remaining,
                 )
 
-            progress_tracker.progress_callback = detailed_progress_callback
+            # Coalesce per-file updates so large templates do not flood
+            # the callback and the log
+            progress_bus = self._build_progress_bus()
+            progress_bus.subscribe(detailed_progress_callback)
+            progress_tracker.progress_callback = progress_bus.publish
+
+            # Weight phases and estimate remaining time from earlier runs
+            counts = self._generation_counts(template, options)
+            expected = self.phase_history.estimate(str(template.name), counts)
+            if expected:
+                planned = self._planned_phases(template, options, dry_run)
+                progress_tracker.set_expected_durations(
+                    {phase: d for phase, d in expected.items() if phase in planned}
+                )
 
             # Calculate total steps for basic progress tracking
             total_steps = 6  # Base steps
@@ -353,9 +467,17 @@ class ProjectGenerator:
                 # Post-creation steps
                 if options.create_git_repo:
                     progress_tracker.start_phase("git_initialization")
-                    git_initialized = self._initialize_git_repository(
-                        target_path, options.git_config, progress_tracker
-                    )
+                    # Post-commands may change the tree, so only commit the
+                    # rendered files right away when none will run
+                    if not self._has_post_commands(template, options):
+                        git_committed = self._bootstrap_git_repository(
+                            target_path, options.git_config, progress_tracker
+                        )
+                        git_initialized = git_committed
+                    if not git_initialized:
+                        git_initialized = self._initialize_git_repository(
+                            target_path, options.git_config, progress_tracker
+                        )
                     progress_tracker.complete_phase("git_initialization")
 
                 if options.create_venv:
@@ -365,19 +487,20 @@ class ProjectGenerator:
                     )
                     progress_tracker.complete_phase("venv_creation")
 
-                if (
-                    options.execute_post_commands
-                    and hasattr(template, "hooks")
-                    and hasattr(template.hooks, "post_generation")
+                if options.execute_post_commands and self._post_generate_commands(
+                    template
                 ):
                     progress_tracker.start_phase("post_commands")
                     commands_executed = self._execute_post_commands(
-                        template, target_path, progress_tracker
+                        template,
+                        target_path,
+                        progress_tracker,
+                        use_cache=options.cache_post_commands,
                     )
                     progress_tracker.complete_phase("post_commands")
 
                 # Create initial git commit if git was initialized
-                if git_initialized:
+                if git_initialized and not git_committed:
                     progress_tracker.update_phase_progress(0.9, "Creating initial git commit...")
                     self._create_initial_commit(target_path, options.git_config)
             else:
@@ -387,6 +510,7 @@ class ProjectGenerator:
 
             # Final progress update
             final_progress = progress_tracker.get_overall_progress()
+            progress_bus.flush()
             if progress_callback:
                 progress_callback("Project generation completed successfully", 100)
 
@@ -397,6 +521,20 @@ class ProjectGenerator:
 
             duration = time.time() - start_time
 
+            if not dry_run:
+                rendered = getattr(self.file_renderer, "rendered_contents", None)
+                counts["bytes"] = (
+                    sum(len(c) for c in rendered.values())
+                    if isinstance(rendered, dict)
+                    else 0
+                )
+                self.phase_history.record(
+                    str(template.name),
+                    progress_tracker.phase_durations,
+                    counts,
+                    total_duration=duration,
+                )
+
             result = GenerationResult(
                 success=True,
                 target_path=target_path,
@@ -407,6 +545,7 @@ class ProjectGenerator:
                 git_initialized=git_initialized,
                 venv_created=venv_created,
                 commands_executed=commands_executed,
+                venv_timings=dict(self.venv_timings),
             )
 
             self.logger.info(
@@ -486,6 +625,7 @@ class ProjectGenerator:
                 commands_executed=commands_executed,
                 ai_suggestions=ai_suggestions,
                 recovery_context=recovery_context if "recovery_context" in locals() else None,
+                venv_timings=dict(self.venv_timings),
             )
 
         except Exception as e:
@@ -510,6 +650,7 @@ class ProjectGenerator:
                 original_error=e,
             ) from e
 
+    @traced("validate_target_path", "generator")
     def _validate_target_path(self, target_path: Path) -> None:
         """Validate target path for project creation.
 
@@ -557,6 +698,7 @@ class ProjectGenerator:
                 f"Path validation failed for '{target_path}': {e}"
             ) from e
 
+    @traced("prepare_variables", "generator")
     def _prepare_template_variables(
         self, template: Template, variables: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -642,6 +784,7 @@ class ProjectGenerator:
                 f"Failed to prepare template variables: {e}"
             ) from e
 
+    @traced("create_directories", "generator")
     def _create_directories(
         self,
         template: Template,
@@ -719,6 +862,7 @@ class ProjectGenerator:
             self.generation_errors.append(f"Directory creation failed: {e}")
             raise TemplateError(f"Failed to create directory structure: {e}") from e
 
+    @traced("render_files", "generator")
     def _render_files(
         self,
         template: Template,
@@ -977,6 +1121,19 @@ class ProjectGenerator:
                     directory.directories, structure[dir_name], variables
                 )
 
+    def _prewarm_ai_model(self) -> None:
+        """Start loading the AI help model so failure help is answered warm."""
+        if not self.PREWARM_AI_MODEL or self.ai_service is None:
+            return
+
+        try:
+            from ..ai.runtime import get_ai_runtime
+
+            get_ai_runtime().spawn(self.ai_service.prewarm())
+        except Exception as e:
+            self.logger.debug("AI model preload not started", error=str(e))
+
+    @traced("ai_assistance", "ai")
     def _get_ai_assistance(
         self,
         error: Exception,
@@ -1003,48 +1160,43 @@ class ProjectGenerator:
             return None
 
         try:
-            # Run async method in sync context
-            try:
-                loop = asyncio.get_running_loop()
-                # If there's already a loop running, we can't use run_until_complete
-                # This typically happens in test environments
-                self.logger.debug(
-                    "Existing event loop detected, skipping AI assistance"
-                )
-                return None
-            except RuntimeError:
-                # No loop running, we can create our own
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            # Blocking on the AI runtime here would stall the caller's loop
+            self.logger.debug("Existing event loop detected, skipping AI assistance")
+            return None
 
-            try:
-                ai_help = loop.run_until_complete(
-                    self.ai_service.generate_help_response(
-                        error=error,
-                        template=template,
-                        project_variables=variables,
-                        target_path=target_path,
-                        options={
-                            "create_git_repo": options.create_git_repo,
-                            "create_venv": options.create_venv,
-                            "venv_name": options.venv_name,
-                            "python_version": options.python_version,
-                        },
-                        attempted_operations=self.generation_errors,
-                        partial_results=partial_results,
-                    )
-                )
+        try:
+            from ..ai.runtime import get_ai_runtime
 
-                self.logger.info(
-                    "AI assistance generated",
-                    error_type=type(error).__name__,
-                    help_length=len(ai_help) if ai_help else 0,
-                )
+            # Run on the shared AI loop so pooled connections are reused
+            ai_help = get_ai_runtime().submit(
+                self.ai_service.generate_help_response(
+                    error=error,
+                    template=template,
+                    project_variables=variables,
+                    target_path=target_path,
+                    options={
+                        "create_git_repo": options.create_git_repo,
+                        "create_venv": options.create_venv,
+                        "venv_name": options.venv_name,
+                        "python_version": options.python_version,
+                    },
+                    attempted_operations=self.generation_errors,
+                    partial_results=partial_results,
+                ),
+                timeout=self.AI_ASSISTANCE_TIMEOUT,
+            )
 
-                return ai_help
+            self.logger.info(
+                "AI assistance generated",
+                error_type=type(error).__name__,
+                help_length=len(ai_help) if ai_help else 0,
+            )
 
-            finally:
-                loop.close()
+            return ai_help
 
         except Exception as e:
             self.logger.warning(
@@ -1088,6 +1240,133 @@ class ProjectGenerator:
         self.rollback_handlers.clear()
         self.logger.info("Rollback execution completed")
 
+    def _generation_counts(
+        self, template: Template, options: ProjectOptions
+    ) -> Dict[str, Any]:
+        """Size of the work a generation does, used to learn phase durations.
+
+        Returns:
+            Files, directories and post-creation commands in the template and
+            the venv tool that will be used
+        """
+        structure = getattr(template, "structure", None)
+        preferred_tool = self.venv_manager.preferred_tool
+
+        return {
+            "files": len(structure.get_all_files())
+            if isinstance(structure, ProjectStructure)
+            else 0,
+            "directories": len(structure.get_all_directories())
+            if isinstance(structure, ProjectStructure)
+            else 0,
+            "commands": len(self._post_generate_commands(template))
+            if options.execute_post_commands
+            else 0,
+            "venv_tool": preferred_tool.value
+            if options.create_venv and isinstance(preferred_tool, VenvTool)
+            else None,
+        }
+
+    def _planned_phases(
+        self, template: Template, options: ProjectOptions, dry_run: bool
+    ) -> List[str]:
+        """Phases generate_project will run with these options."""
+        if dry_run:
+            return ["validation"]
+
+        phases = ["validation", "directory_creation", "file_rendering"]
+        if options.create_git_repo:
+            phases.append("git_initialization")
+        if options.create_venv:
+            phases.append("venv_creation")
+        if options.execute_post_commands and self._post_generate_commands(template):
+            phases.append("post_commands")
+        return phases
+
+    def _has_post_commands(self, template: Template, options: ProjectOptions) -> bool:
+        """Check whether post-generation commands will run for a template."""
+        if not options.execute_post_commands:
+            return False
+        return bool(self._post_generate_commands(template))
+
+    def _post_generate_commands(self, template: Template) -> List[TemplateAction]:
+        """Shell and git actions from the template's ``post_generate`` hook."""
+        hooks = getattr(template, "hooks", None)
+        actions = getattr(hooks, "post_generate", None)
+        if not isinstance(actions, list):
+            return []
+        return [
+            action
+            for action in actions
+            if getattr(action, "type", None) in (ActionType.COMMAND, ActionType.GIT)
+        ]
+
+    @traced("git_bootstrap", "generator")
+    def _bootstrap_git_repository(
+        self,
+        target_path: Path,
+        git_config: Optional[GitConfig],
+        progress_tracker: Optional[ProgressTracker] = None,
+    ) -> bool:
+        """Create the git repository and initial commit from rendered files.
+
+        Streams the contents the file renderer still holds in memory into a
+        single git process. Failures are not recorded as generation errors
+        because the caller falls back to the regular init and commit path.
+
+        Args:
+            target_path: Project directory path
+            git_config: Optional git configuration
+            progress_tracker: Optional progress tracker
+
+        Returns:
+            True if the repository and initial commit were created
+        """
+        rendered_contents = getattr(self.file_renderer, "rendered_contents", None)
+        if not isinstance(rendered_contents, dict):
+            return False
+
+        files: Dict[str, bytes] = {}
+        for file_path, content in rendered_contents.items():
+            try:
+                relative_path = Path(file_path).relative_to(target_path)
+            except ValueError:
+                continue
+            files[relative_path.as_posix()] = content
+
+        if not files:
+            return False
+
+        try:
+            if progress_tracker:
+                progress_tracker.update_phase_progress(
+                    0.5, "Creating git repository and initial commit..."
+                )
+
+            commit_message = "Initial commit"
+            if git_config and git_config.initial_commit_message:
+                commit_message = git_config.initial_commit_message
+
+            self.git_manager.bootstrap_repository(
+                target_path, files, message=commit_message, git_config=git_config
+            )
+
+            self.logger.info(
+                "Git repository bootstrapped with initial commit",
+                target_path=str(target_path),
+                files=len(files),
+            )
+            return True
+
+        except Exception as e:
+            self.logger.info(
+                "Git bootstrap unavailable, using init and commit",
+                target_path=str(target_path),
+                reason=str(e),
+            )
+            return False
+
+    @traced("git_init", "generator")
     def _initialize_git_repository(
         self,
         target_path: Path,
@@ -1138,6 +1417,7 @@ class ProjectGenerator:
 
             return False
 
+    @traced("create_venv", "generator")
     def _create_virtual_environment(
         self,
         target_path: Path,
@@ -1169,14 +1449,27 @@ class ProjectGenerator:
             if progress_tracker:
                 progress_tracker.update_phase_progress(0.3, "Creating virtual environment...")
 
+            report_output = self._output_reporter(progress_tracker)
+
+            def install_output(stream: str, line: str) -> None:
+                report_output(0.5, "Installing", line)
+
             result = self.venv_manager.create_venv(
                 project_path=target_path,
                 venv_name=options.venv_name,
                 python_version=options.python_version,
                 requirements_file=requirements_file,
+                output_callback=install_output if progress_tracker else None,
             )
 
             if result["success"]:
+                self.venv_timings = dict(result.get("timings", {}))
+                install = result.get("requirements_install")
+                if install and not install.get("success"):
+                    self.generation_errors.append(
+                        f"Requirements installation failed: {install.get('error')}"
+                    )
+
                 self.logger.info(
                     "Virtual environment created",
                     target_path=str(target_path),
@@ -1185,6 +1478,7 @@ class ProjectGenerator:
                     requirements_file=str(requirements_file)
                     if requirements_file
                     else None,
+                    timings=self.venv_timings,
                 )
 
                 return True
@@ -1223,11 +1517,13 @@ class ProjectGenerator:
 
             return False
 
+    @traced("post_commands", "generator")
     def _execute_post_commands(
         self,
         template: Template,
         target_path: Path,
         progress_tracker: Optional[ProgressTracker] = None,
+        use_cache: bool = False,
     ) -> int:
         """Execute post-creation commands from template.
 
@@ -1235,6 +1531,8 @@ class ProjectGenerator:
             template: Template with post-creation commands
             target_path: Project directory path
             progress_callback: Optional progress callback
+            use_cache: Whether to skip commands recorded as up to date in the
+                project state directory
 
         Returns:
             Number of commands executed successfully
@@ -1242,23 +1540,9 @@ class ProjectGenerator:
         commands_executed = 0
 
         try:
-            if not hasattr(template, "hooks") or not hasattr(
-                template.hooks, "post_generation"
-            ):
-                self.logger.debug("No post-generation commands in template")
-                return 0
-
-            post_commands = template.hooks.post_generation
-            if not post_commands or not hasattr(post_commands, "commands"):
-                self.logger.debug("No post-generation commands to execute")
-                return 0
-
-            commands = (
-                post_commands.commands if hasattr(post_commands, "commands") else []
-            )
-
+            commands = self._post_generate_commands(template)
             if not commands:
-                self.logger.debug("Empty post-generation commands list")
+                self.logger.debug("No post-generation commands in template")
                 return 0
 
             self.logger.info(
@@ -1274,25 +1558,42 @@ class ProjectGenerator:
                 progress_tracker=progress_tracker
             )
 
-            def command_progress(message: str, current: int, total: int) -> None:
-                command_tracker.complete_item(f"Command {current + 1}/{total}")
+            def command_status(
+                spec: CommandSpec, status: str, result: Optional[ExecutionResult]
+            ) -> None:
+                if result is None:
+                    if progress_tracker:
+                        progress_tracker.update_phase_progress(
+                            command_tracker.get_progress(), f"Running: {spec.name}"
+                        )
+                else:
+                    command_tracker.complete_item(f"{spec.name} {status}")
+
+            report_output = self._output_reporter(progress_tracker)
 
-            results = self.command_executor.execute_commands(
-                commands=commands,
+            def command_output(spec: CommandSpec, stream: str, line: str) -> None:
+                report_output(command_tracker.get_progress(), spec.name, line)
+
+            results = self.command_executor.execute_command_graph(
+                commands=self._build_command_specs(commands, target_path),
                 cwd=target_path,
                 timeout_per_command=120,  # 2 minutes per command
-                progress_callback=command_progress,
+                status_callback=command_status,
                 stop_on_failure=False,  # Continue with remaining commands even if one fails
+                output_callback=command_output if progress_tracker else None,
+                result_cache=CommandResultCache(target_path) if use_cache else None,
             )
 
             # Count successful commands
             commands_executed = sum(1 for result in results if result.success)
+            commands_cached = sum(1 for result in results if result.cached)
 
             # Log failures
             failed_commands = [result for result in results if not result.success]
             if failed_commands:
                 for failed in failed_commands:
-                    error_msg = f"Post-creation command failed: {failed.command} - {failed.stderr}"
+                    outcome = "skipped" if failed.skipped else "failed"
+                    error_msg = f"Post-creation command {outcome}: {failed.command} - {failed.stderr}"
                     self.generation_errors.append(error_msg)
                     self.logger.warning(
                         "Post-creation command failed",
@@ -1305,6 +1606,7 @@ class ProjectGenerator:
                 "Post-creation commands completed",
                 target_path=str(target_path),
                 commands_executed=commands_executed,
+                commands_cached=commands_cached,
                 total_commands=len(commands),
                 failed_commands=len(failed_commands),
             )
@@ -1323,6 +1625,94 @@ class ProjectGenerator:
 
             return commands_executed
 
+    def _output_reporter(
+        self, progress_tracker: Optional[ProgressTracker]
+    ) -> Callable[[float, str, str], None]:
+        """Create a throttled reporter showing live command output as progress.
+
+        Args:
+            progress_tracker: Tracker receiving the messages (None disables it)
+
+        Returns:
+            Function taking phase progress, a label and an output line
+        """
+        last_report = 0.0
+
+        def report(progress: float, label: str, line: str) -> None:
+            nonlocal last_report
+            line = line.strip()
+            now = time.monotonic()
+            if (
+                progress_tracker is None
+                or not line
+                or now - last_report < self.OUTPUT_PROGRESS_INTERVAL
+            ):
+                return
+            last_report = now
+            progress_tracker.update_phase_progress(
+                progress, f"{label}: {line[: self.OUTPUT_MESSAGE_LENGTH]}"
+            )
+
+        return report
+
+    def _build_command_specs(
+        self, commands: List[Any], target_path: Path
+    ) -> List[CommandSpec]:
+        """Convert template post-commands into executor command specs.
+
+        Commands are plain strings or actions with ``name``, ``command`` and
+        optional ``depends_on``, ``resources``, ``timeout``, ``environment``,
+        ``working_directory``, ``inputs`` and ``outputs``. When no command
+        declares dependencies or resources, each one runs after its
+        predecessor so templates written for sequential execution keep their
+        ordering; a failed command does not skip the ones that follow.
+
+        Args:
+            commands: Post-generation commands from the template
+            target_path: Project directory path
+
+        Returns:
+            Command specs in template order
+        """
+        specs: List[CommandSpec] = []
+        for index, item in enumerate(commands, start=1):
+            if isinstance(item, str):
+                specs.append(CommandSpec(name=f"command-{index}", command=item))
+                continue
+
+            name = getattr(item, "name", None)
+            depends_on = getattr(item, "depends_on", None)
+            resources = getattr(item, "resources", None)
+            timeout = getattr(item, "timeout", None)
+            environment = getattr(item, "environment", None)
+            working_directory = getattr(item, "working_directory", None)
+            inputs = getattr(item, "inputs", None)
+            outputs = getattr(item, "outputs", None)
+            specs.append(
+                CommandSpec(
+                    name=name if isinstance(name, str) and name else f"command-{index}",
+                    command=str(item.command),
+                    depends_on=list(depends_on) if isinstance(depends_on, list) else [],
+                    resources=list(resources) if isinstance(resources, list) else [],
+                    timeout=timeout if isinstance(timeout, int) else None,
+                    env_vars=dict(environment) if isinstance(environment, dict) else {},
+                    cwd=(
+                        target_path / working_directory
+                        if isinstance(working_directory, str)
+                        else None
+                    ),
+                    inputs=list(inputs) if isinstance(inputs, list) else [],
+                    outputs=list(outputs) if isinstance(outputs, list) else [],
+                )
+            )
+
+        if not any(spec.depends_on or spec.resources for spec in specs):
+            for previous, spec in zip(specs, specs[1:]):
+                spec.after = [previous.name]
+
+        return specs
+
+    @traced("git_initial_commit", "generator")
     def _create_initial_commit(
         self, target_path: Path, git_config: Optional[GitConfig]
     ) -> None:
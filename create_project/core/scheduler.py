@@ -0,0 +1,370 @@
+# ABOUTME: Priority scheduler with per-resource concurrency caps for background work
+# ABOUTME: Provides admission control, aging and queue-wait/run-time metrics
+
+"""
+Priority scheduler for background operations.
+
+This module provides the OperationScheduler class which sits in front of a
+thread pool and decides which queued task runs next. It provides:
+
+- priorities, so interactive work is not stuck behind batch jobs
+- per resource class concurrency caps (``disk``, ``subprocess``,
+  ``network``, ``ai``)
+- admission control that rejects new work once the queue is too deep
+- queue-wait and run-time metrics
+
+Tasks waiting longer than the aging interval move up one priority level per
+interval, so batch work still makes progress under constant interactive load.
+"""
+
+import itertools
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+from structlog import get_logger
+
+from ..utils.tracing import propagate
+from .exceptions import QueueFullError, ThreadingError
+
+
+class Priority(IntEnum):
+    """Scheduling priority; lower values run first."""
+
+    INTERACTIVE = 0
+    NORMAL = 1
+    BATCH = 2
+
+
+@dataclass(eq=False)
+class _Task:
+    """Queued unit of work."""
+
+    priority: Priority
+    sequence: int
+    func: Callable[..., Any]
+    args: Tuple[Any, ...]
+    kwargs: Dict[str, Any]
+    resources: Tuple[str, ...]
+    label: str
+    future: Future = field(default_factory=Future)
+    queued_at: float = field(default_factory=time.monotonic)
+
+
+class TimingStats:
+    """Running statistics over a window of recent durations.
+
+    Attributes:
+        count: Number of samples recorded
+        total: Sum of all samples in seconds
+        max: Largest sample in seconds
+    """
+
+    WINDOW = 256
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._recent: Deque[float] = deque(maxlen=self.WINDOW)
+
+    def add(self, seconds: float) -> None:
+        """Record one duration."""
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self._recent.append(seconds)
+
+    def summary(self) -> Dict[str, float]:
+        """Count, mean, max and recent p50/p95 in seconds."""
+        recent = sorted(self._recent)
+
+        def percentile(fraction: float) -> float:
+            if not recent:
+                return 0.0
+            return recent[min(len(recent) - 1, int(fraction * len(recent)))]
+
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.max,
+            "p50": percentile(0.5),
+            "p95": percentile(0.95),
+        }
+
+
+class OperationScheduler:
+    """Thread-safe priority scheduler on top of a thread pool.
+
+    A queued task starts once a worker is free and every resource class it
+    declares is below its limit. Among startable tasks, the one with the best
+    priority (after aging) runs first, and ties go to the earliest submitted.
+    Resource classes without a configured limit allow one task at a time.
+
+    Attributes:
+        max_workers: Maximum concurrently running tasks
+        resource_limits: Concurrent tasks allowed per resource class
+        max_queue_depth: Queued tasks beyond which new work is rejected
+        aging_seconds: Wait after which a task is promoted one priority level
+        logger: Structured logger for operations
+    """
+
+    DEFAULT_RESOURCE_LIMITS: Dict[str, int] = {
+        "disk": 4,
+        "subprocess": max(2, (os.cpu_count() or 2) // 2),
+        "network": 4,
+        "ai": 2,
+    }
+
+    DEFAULT_MAX_QUEUE_DEPTH = 64
+    DEFAULT_AGING_SECONDS = 30.0
+
+    def __init__(
+        self,
+        max_workers: int,
+        resource_limits: Optional[Dict[str, int]] = None,
+        max_queue_depth: int = DEFAULT_MAX_QUEUE_DEPTH,
+        aging_seconds: float = DEFAULT_AGING_SECONDS,
+        thread_name_prefix: str = "operation",
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            max_workers: Maximum concurrently running tasks
+            resource_limits: Per resource class limits overriding the defaults
+            max_queue_depth: Queued tasks beyond which new work is rejected
+            aging_seconds: Wait after which a task is promoted one priority
+                level (0 disables aging)
+            thread_name_prefix: Name prefix for worker threads
+        """
+        self.logger = get_logger(__name__)
+        self.max_workers = max(1, max_workers)
+        self.resource_limits = dict(self.DEFAULT_RESOURCE_LIMITS)
+        self.resource_limits.update(resource_limits or {})
+        self.max_queue_depth = max_queue_depth
+        self.aging_seconds = aging_seconds
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix=thread_name_prefix
+        )
+        # Reentrant: cancelling a future runs _discard on the same thread
+        self._lock = threading.RLock()
+        self._idle = threading.Condition(self._lock)
+        self._pending: List[_Task] = []
+        self._running = 0
+        self._in_use: Dict[str, int] = defaultdict(int)
+        self._sequence = itertools.count()
+        self._shutdown = False
+
+        self._counters: Dict[str, int] = defaultdict(int)
+        self._queue_wait: Dict[str, TimingStats] = defaultdict(TimingStats)
+        self._run_time: Dict[str, TimingStats] = defaultdict(TimingStats)
+
+    def schedule(
+        self,
+        func: Callable[..., Any],
+        args: Sequence[Any] = (),
+        kwargs: Optional[Dict[str, Any]] = None,
+        priority: Priority = Priority.NORMAL,
+        resources: Sequence[str] = (),
+        label: Optional[str] = None,
+    ) -> Future:
+        """Queue a task.
+
+        Interactive tasks are always admitted; other tasks are rejected while
+        ``max_queue_depth`` tasks are already waiting. Cancelling the
+        returned future while the task is queued removes it from the queue.
+        The task runs in a copy of the caller's context, so its trace spans
+        nest under the span that scheduled it.
+
+        Args:
+            func: Function to run on a worker thread
+            args: Positional arguments for ``func``
+            kwargs: Keyword arguments for ``func``
+            priority: Scheduling priority
+            resources: Resource classes the task occupies while running
+            label: Name used in logs (defaults to the function name)
+
+        Returns:
+            Future for the task's result
+
+        Raises:
+            QueueFullError: If the queue is full
+            ThreadingError: If the scheduler has been shut down
+        """
+        task = _Task(
+            priority=Priority(priority),
+            sequence=next(self._sequence),
+            func=propagate(func),
+            args=tuple(args),
+            kwargs=dict(kwargs or {}),
+            resources=tuple(dict.fromkeys(resources)),
+            label=label or getattr(func, "__name__", "task"),
+        )
+
+        with self._lock:
+            if self._shutdown:
+                raise ThreadingError(
+                    "Scheduler has been shut down", details={"task": task.label}
+                )
+            if (
+                task.priority != Priority.INTERACTIVE
+                and len(self._pending) >= self.max_queue_depth
+            ):
+                self._counters["rejected"] += 1
+                self.logger.warning(
+                    "Rejecting task, scheduler queue is full",
+                    task=task.label,
+                    queue_depth=len(self._pending),
+                )
+                raise QueueFullError(
+                    f"Scheduler queue is full ({len(self._pending)} tasks waiting)",
+                    details={
+                        "task": task.label,
+                        "queue_depth": len(self._pending),
+                        "max_queue_depth": self.max_queue_depth,
+                    },
+                )
+
+            self._pending.append(task)
+            self._counters["submitted"] += 1
+            self._dispatch_locked()
+
+        task.future.add_done_callback(lambda _: self._discard(task))
+        return task.future
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """Queue a task with normal priority, like ``Executor.submit``."""
+        return self.schedule(fn, args=args, kwargs=kwargs)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of queue state, counters and timing statistics.
+
+        Returns:
+            Dictionary with queue depth, running tasks, resource usage,
+            counters and per-priority queue-wait and run-time statistics
+        """
+        with self._lock:
+            return {
+                "queue_depth": len(self._pending),
+                "running": self._running,
+                "max_workers": self.max_workers,
+                "resources_in_use": {k: v for k, v in self._in_use.items() if v},
+                "resource_limits": dict(self.resource_limits),
+                "submitted": self._counters["submitted"],
+                "rejected": self._counters["rejected"],
+                "completed": self._counters["completed"],
+                "failed": self._counters["failed"],
+                "cancelled": self._counters["cancelled"],
+                "queue_wait": {
+                    name: stats.summary() for name, stats in self._queue_wait.items()
+                },
+                "run_time": {
+                    name: stats.summary() for name, stats in self._run_time.items()
+                },
+            }
+
+    def shutdown(self, wait: bool = True, cancel_pending: bool = False) -> None:
+        """Stop accepting tasks and release the worker threads.
+
+        Args:
+            wait: Whether to wait for queued and running tasks to finish
+            cancel_pending: Whether to cancel tasks that have not started
+        """
+        with self._lock:
+            self._shutdown = True
+            pending = list(self._pending) if cancel_pending or not wait else []
+
+        for task in pending:
+            task.future.cancel()
+
+        if wait:
+            with self._idle:
+                while self._pending or self._running:
+                    self._idle.wait()
+
+        self._executor.shutdown(wait=wait)
+
+    def _dispatch_locked(self) -> None:
+        """Start queued tasks while workers and resources are available."""
+        while self._running < self.max_workers and self._pending:
+            now = time.monotonic()
+            candidates = sorted(
+                self._pending,
+                key=lambda task: (self._effective_priority(task, now), task.sequence),
+            )
+            task = next((t for t in candidates if self._resources_available(t)), None)
+            if task is None:
+                return
+
+            self._pending.remove(task)
+            try:
+                self._executor.submit(self._run, task)
+            except RuntimeError:
+                # Worker pool already shut down
+                task.future.cancel()
+                self._counters["cancelled"] += 1
+                continue
+            self._running += 1
+            for resource in task.resources:
+                self._in_use[resource] += 1
+
+    def _run(self, task: _Task) -> None:
+        """Run a task on a worker thread and release its slot afterwards."""
+        priority = task.priority.name.lower()
+        outcome = "cancelled"
+        try:
+            if not task.future.set_running_or_notify_cancel():
+                return
+
+            started = time.monotonic()
+            with self._lock:
+                self._queue_wait[priority].add(started - task.queued_at)
+
+            try:
+                result = task.func(*task.args, **task.kwargs)
+            except BaseException as e:
+                outcome = "failed"
+                task.future.set_exception(e)
+            else:
+                outcome = "completed"
+                task.future.set_result(result)
+            finally:
+                with self._lock:
+                    self._run_time[priority].add(time.monotonic() - started)
+        finally:
+            with self._lock:
+                self._counters[outcome] += 1
+                self._running -= 1
+                for resource in task.resources:
+                    self._in_use[resource] -= 1
+                self._dispatch_locked()
+                self._idle.notify_all()
+
+    def _discard(self, task: _Task) -> None:
+        """Drop a task cancelled while it was still queued."""
+        with self._lock:
+            if task in self._pending:
+                self._pending.remove(task)
+                self._counters["cancelled"] += 1
+                self._idle.notify_all()
+
+    def _effective_priority(self, task: _Task, now: float) -> int:
+        """Priority after promoting the task for time spent waiting."""
+        if self.aging_seconds <= 0:
+            return int(task.priority)
+        promoted = int((now - task.queued_at) / self.aging_seconds)
+        return max(0, int(task.priority) - promoted)
+
+    def _resources_available(self, task: _Task) -> bool:
+        """Check every resource class of a task is below its limit."""
+        return all(
+            self._in_use[resource] < max(1, self.resource_limits.get(resource, 1))
+            for resource in task.resources
+        )
@@ -7,6 +7,11 @@ Threading model for background project generation operations.
 This module provides the ThreadingModel class which manages background
 project generation with thread-safe progress reporting, cancellation support,
 error propagation, and proper resource cleanup.
+
+Operations run through an ``OperationScheduler``: they are queued by
+priority, limited per resource class, and rejected with ``QueueFullError``
+when the queue is too deep. Finished operations whose results are never
+collected are evicted after ``operation_ttl`` seconds.
 """
 
 import threading
@@ -15,19 +20,23 @@ from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 
 from structlog import get_logger
 
 from ..templates.schema.template import Template
-from .exceptions import ThreadingError
+from ..utils.tracing import propagate, span
+from .exceptions import QueueFullError, ThreadingError
+from .progress import ProgressBus
 from .project_generator import ProjectGenerator
+from .scheduler import OperationScheduler, Priority
 
 
 class OperationStatus(Enum):
     """Status of background operation."""
 
     PENDING = "pending"
+    QUEUED = "queued"
     RUNNING = "running"
     COMPLETED = "completed"
     FAILED = "failed"
@@ -67,7 +76,7 @@ class OperationResult:
         result: Operation result (if successful)
         error: Error information (if failed)
         duration: Operation duration in seconds
-        progress_updates: List of all progress updates
+        progress_updates: Most recent progress updates
     """
 
     operation_id: str
@@ -88,6 +97,8 @@ class BackgroundOperation:
         operation_args: tuple,
         operation_kwargs: dict,
         progress_callback: Optional[Callable[[ProgressUpdate], None]] = None,
+        priority: Priority = Priority.NORMAL,
+        resources: Sequence[str] = (),
     ) -> None:
         """Initialize background operation.
 
@@ -97,32 +108,54 @@ class BackgroundOperation:
             operation_args: Function arguments
             operation_kwargs: Function keyword arguments
             progress_callback: Optional progress callback
+            priority: Scheduling priority when started on a scheduler
+            resources: Resource classes occupied while running on a scheduler
         """
         self.operation_id = operation_id
         self.operation_func = operation_func
         self.operation_args = operation_args
         self.operation_kwargs = operation_kwargs
         self.progress_callback = progress_callback
+        self.priority = priority
+        self.resources = tuple(resources)
 
         self.status = OperationStatus.PENDING
         self.future: Optional[Future] = None
         self.result: Optional[Any] = None
         self.error: Optional[Exception] = None
+        self.queued_time: Optional[float] = None
         self.start_time: Optional[float] = None
         self.end_time: Optional[float] = None
-        self.progress_updates: List[ProgressUpdate] = []
         self.cancellation_event = threading.Event()
 
         # Thread-safe lock for status updates
         self._lock = threading.Lock()
 
+        # Progress history is bounded and callbacks are rate limited so
+        # per-file updates cost the same regardless of template size
+        self._progress_count = 0
+        self._progress_bus: ProgressBus[ProgressUpdate] = ProgressBus()
+        self._progress_bus.subscribe(self._notify_progress)
+
         self.logger = get_logger(__name__)
 
-    def start(self, executor: ThreadPoolExecutor) -> None:
+    @property
+    def progress_updates(self) -> List[ProgressUpdate]:
+        """Most recent progress updates, oldest first."""
+        return self._progress_bus.recent()
+
+    def start(self, executor: Union[ThreadPoolExecutor, OperationScheduler]) -> None:
         """Start the operation in background thread.
 
+        On a scheduler the operation is queued with its priority and
+        resources, and stays QUEUED until a worker picks it up.
+
         Args:
-            executor: Thread pool executor
+            executor: Thread pool executor or operation scheduler
+
+        Raises:
+            ThreadingError: If the operation was already started
+            QueueFullError: If the scheduler rejected the operation
         """
         with self._lock:
             if self.status != OperationStatus.PENDING:
@@ -131,14 +164,27 @@ class BackgroundOperation:
                     details={"operation_id": self.operation_id},
                 )
 
-            self.status = OperationStatus.RUNNING
-            self.start_time = time.time()
+            if isinstance(executor, OperationScheduler):
+                self.queued_time = time.time()
+                self.future = executor.schedule(
+                    self._run_traced,
+                    priority=self.priority,
+                    resources=self.resources,
+                    label=self.operation_id,
+                )
+                if self.status == OperationStatus.PENDING:
+                    self.status = OperationStatus.QUEUED
+            else:
+                self.status = OperationStatus.RUNNING
+                self.start_time = time.time()
 
-            # Submit to thread pool
-            self.future = executor.submit(self._run_operation)
+                # Submit to thread pool
+                self.future = executor.submit(propagate(self._run_traced))
 
             self.logger.info(
-                "Background operation started", operation_id=self.operation_id
+                "Background operation started",
+                operation_id=self.operation_id,
+                status=self.status.value,
             )
 
     def cancel(self) -> bool:
@@ -205,7 +251,7 @@ class BackgroundOperation:
                     duration=self.end_time - self.start_time
                     if self.start_time and self.end_time
                     else None,
-                    progress_updates=self.progress_updates.copy(),
+                    progress_updates=self.progress_updates,
                 )
 
         except Exception as e:
@@ -218,7 +264,7 @@ class BackgroundOperation:
                     duration=self.end_time - self.start_time
                     if self.start_time and self.end_time
                     else None,
-                    progress_updates=self.progress_updates.copy(),
+                    progress_updates=self.progress_updates,
                 )
 
     def add_progress_update(
@@ -249,9 +295,17 @@ class BackgroundOperation:
         )
 
         with self._lock:
-            self.progress_updates.append(update)
+            self._progress_count += 1
 
-        # Call progress callback if provided
+        # Completion is always delivered, intermediate updates are coalesced
+        self._progress_bus.publish(update, force=percentage >= 100.0)
+
+    def _notify_progress(self, update: ProgressUpdate) -> None:
+        """Deliver a coalesced progress update to the callback.
+
+        Args:
+            update: Progress update to deliver
+        """
         if self.progress_callback:
             try:
                 self.progress_callback(update)
@@ -265,12 +319,22 @@ class BackgroundOperation:
         self.logger.debug(
             "Progress update",
             operation_id=self.operation_id,
-            message=message,
-            percentage=percentage,
+            message=update.message,
+            percentage=update.percentage,
         )
 
+    def _run_traced(self) -> Any:
+        """Run the operation inside a trace span."""
+        with span("background_operation", "threading", operation_id=self.operation_id):
+            return self._run_operation()
+
     def _run_operation(self) -> Any:
         """Run the actual operation with error handling."""
+        with self._lock:
+            if self.status in (OperationStatus.PENDING, OperationStatus.QUEUED):
+                self.status = OperationStatus.RUNNING
+                self.start_time = time.time()
+
         try:
             # Create progress callback that checks for cancellation
             def progress_wrapper(message: str) -> None:
@@ -280,7 +344,7 @@ class BackgroundOperation:
                 # Extract step info from message if available
                 # This is a simple heuristic - in practice, operations would
                 # provide more structured progress information
-                current_step = len(self.progress_updates)
+                current_step = self._progress_count
                 total_steps = 10  # Default estimate
 
                 self.add_progress_update(message, current_step, total_steps)
@@ -298,6 +362,7 @@ class BackgroundOperation:
 
             # Execute the operation
             result = self.operation_func(*self.operation_args, **self.operation_kwargs)
+            self._progress_bus.flush()
 
             # Update final status
             with self._lock:
@@ -317,6 +382,7 @@ class BackgroundOperation:
             return result
 
         except Exception as e:
+            self._progress_bus.flush()
             with self._lock:
                 if not self.is_cancelled():
                     self.status = OperationStatus.FAILED
@@ -344,16 +410,34 @@ class ThreadingModel:
 
     Attributes:
         logger: Structured logger for operations
-        executor: Thread pool executor for background operations
+        scheduler: Priority scheduler running background operations
         operations: Dictionary of active operations
         max_workers: Maximum number of worker threads
+        operation_ttl: Seconds finished operations are kept (None keeps them)
     """
 
-    def __init__(self, max_workers: Optional[int] = None) -> None:
+    # Resource classes a project generation occupies while running
+    GENERATION_RESOURCES = ("disk", "subprocess")
+
+    DEFAULT_OPERATION_TTL = 15 * 60
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        resource_limits: Optional[Dict[str, int]] = None,
+        max_queue_depth: int = OperationScheduler.DEFAULT_MAX_QUEUE_DEPTH,
+        operation_ttl: Optional[float] = DEFAULT_OPERATION_TTL,
+    ) -> None:
         """Initialize the ThreadingModel.
 
         Args:
             max_workers: Maximum number of worker threads (defaults to CPU count)
+            resource_limits: Per resource class limits overriding the
+                scheduler defaults
+            max_queue_depth: Queued operations beyond which non-interactive
+                operations are rejected
+            operation_ttl: Seconds finished operations are kept before being
+                evicted (None keeps them until collected)
         """
         self.logger = get_logger(__name__)
 
@@ -364,8 +448,15 @@ class ThreadingModel:
             max_workers = max(2, min(os.cpu_count() or 2, 8))
 
         self.max_workers = max_workers
-        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.operation_ttl = operation_ttl
+        self.scheduler = OperationScheduler(
+            max_workers=max_workers,
+            resource_limits=resource_limits,
+            max_queue_depth=max_queue_depth,
+            thread_name_prefix="background-operation",
+        )
         self.operations: Dict[str, BackgroundOperation] = {}
+        self._evicted_count = 0
 
         # Thread-safe lock for operations dictionary
         self._operations_lock = threading.Lock()
@@ -381,6 +472,7 @@ class ThreadingModel:
         target_path: Union[str, Path],
         dry_run: bool = False,
         progress_callback: Optional[Callable[[ProgressUpdate], None]] = None,
+        priority: Priority = Priority.NORMAL,
     ) -> str:
         """Start project generation in background.
 
@@ -392,13 +484,18 @@ class ThreadingModel:
             target_path: Target directory path
             dry_run: Whether to run in dry-run mode
             progress_callback: Optional progress callback
+            priority: Scheduling priority (INTERACTIVE for user-facing
+                generations, BATCH for bulk jobs)
 
         Returns:
             Operation ID for tracking
 
         Raises:
+            QueueFullError: If the scheduler queue is full
             ThreadingError: If operation cannot be started
         """
+        self._evict_expired_operations()
+
         with self._operations_lock:
             if operation_id in self.operations:
                 raise ThreadingError(
@@ -416,6 +513,8 @@ class ThreadingModel:
                 "progress_callback": None,
             },  # We'll handle progress internally
             progress_callback=progress_callback,
+            priority=priority,
+            resources=self.GENERATION_RESOURCES,
         )
 
         # Add to operations dictionary
@@ -424,7 +523,7 @@ class ThreadingModel:
 
         # Start the operation
         try:
-            operation.start(self.executor)
+            operation.start(self.scheduler)
 
             self.logger.info(
                 "Project generation started in background",
@@ -432,10 +531,16 @@ class ThreadingModel:
                 template_name=template.name,
                 target_path=str(target_path),
                 dry_run=dry_run,
+                priority=Priority(priority).name,
             )
 
             return operation_id
 
+        except QueueFullError:
+            with self._operations_lock:
+                self.operations.pop(operation_id, None)
+            raise
+
         except Exception as e:
             # Remove from operations if start failed
             with self._operations_lock:
@@ -546,6 +651,8 @@ class ThreadingModel:
         Returns:
             Dictionary mapping operation IDs to their current status
         """
+        self._evict_expired_operations()
+
         with self._operations_lock:
             return {
                 op_id: operation.status for op_id, operation in self.operations.items()
@@ -582,6 +689,54 @@ class ThreadingModel:
 
         return removed_count
 
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get scheduler and operation metrics.
+
+        Returns:
+            Scheduler metrics (queue depth, running tasks, resource usage,
+            counters, queue-wait and run-time statistics per priority) plus
+            the number of tracked and evicted operations
+        """
+        self._evict_expired_operations()
+
+        metrics = self.scheduler.metrics()
+        with self._operations_lock:
+            metrics["operations"] = len(self.operations)
+            metrics["evicted_operations"] = self._evicted_count
+        return metrics
+
+    def _evict_expired_operations(self) -> int:
+        """Remove finished operations older than the TTL.
+
+        Returns:
+            Number of operations removed
+        """
+        if self.operation_ttl is None:
+            return 0
+
+        cutoff = time.time() - self.operation_ttl
+        with self._operations_lock:
+            expired = [
+                op_id
+                for op_id, operation in self.operations.items()
+                if operation.status
+                in (
+                    OperationStatus.COMPLETED,
+                    OperationStatus.FAILED,
+                    OperationStatus.CANCELLED,
+                )
+                and operation.end_time is not None
+                and operation.end_time < cutoff
+            ]
+            for op_id in expired:
+                del self.operations[op_id]
+            self._evicted_count += len(expired)
+
+        if expired:
+            self.logger.debug("Evicted expired operations", count=len(expired))
+
+        return len(expired)
+
     def shutdown(self, wait: bool = True, timeout: Optional[float] = None) -> None:
         """Shutdown the threading model and cleanup resources.
 
@@ -604,8 +759,8 @@ class ThreadingModel:
             for op_id in operation_ids:
                 self.cancel_operation(op_id)
 
-        # Shutdown executor
-        self.executor.shutdown(wait=wait)
+        # Shutdown scheduler; without waiting, queued operations never start
+        self.scheduler.shutdown(wait=wait, cancel_pending=not wait)
 
         # Clear operations
         with self._operations_lock:
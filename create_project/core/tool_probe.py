@@ -0,0 +1,340 @@
+# ABOUTME: Process-wide and on-disk cache for external tool version probes
+# ABOUTME: Avoids re-running --version subprocesses for git, uv, virtualenv and ollama
+
+"""
+External tool probe cache.
+
+This module provides the ToolProbeCache class which runs ``--version`` style
+probes for external tools (git, uv, virtualenv, venv, ollama) and caches the
+outcome both in memory and on disk. Entries are keyed by the resolved binary
+path together with its modification time and size, so upgrading a tool
+invalidates its entry automatically. The whole cache is dropped when ``PATH``
+changes or an entry outlives its TTL.
+
+Probes that have not been cached yet run concurrently, so first-use cost is
+the slowest probe rather than the sum of all of them.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from platformdirs import user_cache_dir
+from structlog import get_logger
+
+
+@dataclass
+class ProbeResult:
+    """Outcome of a single tool probe.
+
+    Attributes:
+        args: Command that was executed
+        returncode: Exit code, or None if the probe could not run
+        stdout: Captured standard output
+        stderr: Captured standard error
+        probed_at: Epoch timestamp when the probe ran
+        cached: Whether the result was served from the cache
+        error: Error description if the probe could not run
+    """
+
+    args: List[str]
+    returncode: Optional[int]
+    stdout: str = ""
+    stderr: str = ""
+    probed_at: float = 0.0
+    cached: bool = False
+    error: Optional[str] = None
+
+    @property
+    def success(self) -> bool:
+        """Whether the probe ran and exited successfully."""
+        return self.returncode == 0
+
+
+class ToolProbeCache:
+    """Thread-safe cache of external tool probe results.
+
+    Attributes:
+        cache_file: On-disk cache location (None disables persistence)
+        ttl_seconds: Maximum age of a cached probe
+        logger: Structured logger for operations
+    """
+
+    DEFAULT_TTL_SECONDS = 24 * 60 * 60
+    CACHE_VERSION = 1
+    MAX_WORKERS = 4
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        persist: bool = True,
+    ) -> None:
+        """Initialize the probe cache.
+
+        Args:
+            cache_dir: Directory for the cache file (default: platformdirs cache)
+            ttl_seconds: Maximum age of a cached probe in seconds
+            persist: Whether to load and save the cache on disk
+        """
+        self.logger = get_logger(__name__)
+        self.ttl_seconds = ttl_seconds
+        self.cache_file: Optional[Path] = None
+
+        if persist:
+            if cache_dir is None:
+                cache_dir = Path(user_cache_dir("create-project", "claude")) / "tools"
+            self.cache_file = Path(cache_dir) / "probes.json"
+
+        self._lock = threading.RLock()
+        self._entries: Dict[str, Dict[str, object]] = {}
+        self._path_digest = self._current_path_digest()
+
+        self._load()
+
+    def probe(self, args: Sequence[str], timeout: float = 10) -> ProbeResult:
+        """Run a probe command, serving it from the cache when possible.
+
+        Args:
+            args: Command to execute; ``args[0]`` is the binary to fingerprint
+            timeout: Probe timeout in seconds
+
+        Returns:
+            ProbeResult for the command
+        """
+        return self.probe_many([args], timeout=timeout)[0]
+
+    def probe_many(
+        self, commands: Sequence[Sequence[str]], timeout: float = 10
+    ) -> List[ProbeResult]:
+        """Run several probe commands, executing cache misses concurrently.
+
+        Args:
+            commands: Commands to execute
+            timeout: Per-probe timeout in seconds
+
+        Returns:
+            ProbeResults in the same order as ``commands``
+        """
+        results: List[Optional[ProbeResult]] = [None] * len(commands)
+        misses: List[int] = []
+
+        with self._lock:
+            self._check_path()
+            for index, args in enumerate(commands):
+                cached = self._lookup(list(args))
+                if cached is not None:
+                    results[index] = cached
+                else:
+                    misses.append(index)
+
+        if misses:
+            if len(misses) == 1:
+                fresh = [self._run(list(commands[misses[0]]), timeout)]
+            else:
+                with ThreadPoolExecutor(
+                    max_workers=min(self.MAX_WORKERS, len(misses)),
+                    thread_name_prefix="tool-probe",
+                ) as executor:
+                    fresh = list(
+                        executor.map(
+                            lambda i: self._run(list(commands[i]), timeout), misses
+                        )
+                    )
+
+            with self._lock:
+                for index, result in zip(misses, fresh):
+                    results[index] = result
+                    self._store(result)
+                self._save()
+
+        return [result for result in results if result is not None]
+
+    def invalidate(self) -> None:
+        """Drop all cached probes, in memory and on disk."""
+        with self._lock:
+            self._entries.clear()
+            self._save()
+            self.logger.debug("Tool probe cache invalidated")
+
+    def _lookup(self, args: List[str]) -> Optional[ProbeResult]:
+        """Return a cached probe for ``args`` if it is still valid."""
+        key = self._cache_key(args)
+        if key is None:
+            return None
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if time.time() - float(entry.get("probed_at", 0)) > self.ttl_seconds:
+            del self._entries[key]
+            return None
+
+        return ProbeResult(
+            args=args,
+            returncode=entry.get("returncode"),  # type: ignore[arg-type]
+            stdout=str(entry.get("stdout", "")),
+            stderr=str(entry.get("stderr", "")),
+            probed_at=float(entry.get("probed_at", 0)),
+            cached=True,
+        )
+
+    def _store(self, result: ProbeResult) -> None:
+        """Record a probe result if it is deterministic enough to cache."""
+        # Timeouts and launch failures are usually transient - retry next time
+        if result.error is not None:
+            return
+
+        key = self._cache_key(result.args)
+        if key is None:
+            return
+
+        entry = asdict(result)
+        entry.pop("cached", None)
+        entry.pop("error", None)
+        self._entries[key] = entry
+
+    def _run(self, args: List[str], timeout: float) -> ProbeResult:
+        """Execute a probe command."""
+        try:
+            completed = subprocess.run(
+                args, capture_output=True, text=True, timeout=timeout
+            )
+            return ProbeResult(
+                args=args,
+                returncode=completed.returncode,
+                stdout=completed.stdout if isinstance(completed.stdout, str) else "",
+                stderr=completed.stderr if isinstance(completed.stderr, str) else "",
+                probed_at=time.time(),
+            )
+        except subprocess.TimeoutExpired:
+            self.logger.debug("Tool probe timed out", command=args, timeout=timeout)
+            return ProbeResult(
+                args=args,
+                returncode=None,
+                probed_at=time.time(),
+                error=f"Probe timed out after {timeout} seconds",
+            )
+        except Exception as e:
+            self.logger.debug("Tool probe failed", command=args, error=str(e))
+            return ProbeResult(
+                args=args, returncode=None, probed_at=time.time(), error=str(e)
+            )
+
+    def _cache_key(self, args: List[str]) -> Optional[str]:
+        """Build a cache key from the binary fingerprint and arguments.
+
+        Returns None when the binary cannot be fingerprinted, in which case
+        the probe is always executed.
+        """
+        if not args:
+            return None
+
+        try:
+            resolved = os.path.realpath(args[0])
+            stat = os.stat(resolved)
+        except OSError:
+            return None
+
+        return json.dumps(
+            [resolved, stat.st_mtime_ns, stat.st_size, list(args[1:])]
+        )
+
+    def _check_path(self) -> None:
+        """Invalidate all entries when PATH has changed."""
+        digest = self._current_path_digest()
+        if digest != self._path_digest:
+            self.logger.debug("PATH changed, invalidating tool probe cache")
+            self._entries.clear()
+            self._path_digest = digest
+
+    @staticmethod
+    def _current_path_digest() -> str:
+        """Digest of the current PATH environment variable."""
+        return hashlib.sha256(os.environ.get("PATH", "").encode()).hexdigest()
+
+    def _load(self) -> None:
+        """Load persisted probes from disk."""
+        if self.cache_file is None or not self.cache_file.exists():
+            return
+
+        try:
+            data = json.loads(self.cache_file.read_text(encoding="utf-8"))
+            if (
+                data.get("version") == self.CACHE_VERSION
+                and data.get("path_digest") == self._path_digest
+            ):
+                self._entries = dict(data.get("entries", {}))
+        except Exception as e:
+            self.logger.debug("Failed to load tool probe cache", error=str(e))
+
+    def _save(self) -> None:
+        """Persist probes to disk atomically."""
+        if self.cache_file is None:
+            return
+
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            data = {
+                "version": self.CACHE_VERSION,
+                "path_digest": self._path_digest,
+                "entries": self._entries,
+            }
+            temp_file = self.cache_file.with_suffix(f".{os.getpid()}.tmp")
+            temp_file.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(temp_file, self.cache_file)
+        except Exception as e:
+            self.logger.debug("Failed to persist tool probe cache", error=str(e))
+
+
+_probe_cache: Optional[ToolProbeCache] = None
+_probe_cache_lock = threading.Lock()
+
+
+def get_tool_probe_cache() -> ToolProbeCache:
+    """Return the process-wide tool probe cache, creating it on first use."""
+    global _probe_cache
+    with _probe_cache_lock:
+        if _probe_cache is None:
+            _probe_cache = ToolProbeCache()
+        return _probe_cache
+
+
+def set_tool_probe_cache(cache: Optional[ToolProbeCache]) -> None:
+    """Replace the process-wide tool probe cache.
+
+    Passing None resets it so the next call to get_tool_probe_cache()
+    creates a fresh default cache.
+    """
+    global _probe_cache
+    with _probe_cache_lock:
+        _probe_cache = cache
+
+
+def prewarm_tool_probes(cache: Optional[ToolProbeCache] = None) -> None:
+    """Probe git and the virtual environment tools concurrently.
+
+    The commands match the ones GitManager and VenvManager issue, so
+    managers constructed afterwards are served entirely from the cache.
+
+    Args:
+        cache: Probe cache to warm (uses the shared cache if None)
+    """
+    commands: List[List[str]] = []
+    for tool in ("git", "uv", "virtualenv"):
+        tool_path = shutil.which(tool)
+        if tool_path:
+            commands.append([tool_path, "--version"])
+    commands.append([sys.executable, "-m", "venv", "--help"])
+
+    (cache or get_tool_probe_cache()).probe_many(commands)
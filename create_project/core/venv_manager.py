@@ -12,13 +12,18 @@ fallback mechanisms, and cross-platform compatibility.
 import shutil
 import subprocess
 import sys
+import time
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from platformdirs import user_cache_dir
 from structlog import get_logger
 
 from .exceptions import VirtualEnvError
+from .process_runner import LineCallback, run_streaming
+from .tool_probe import ToolProbeCache, get_tool_probe_cache
+from .venv_pool import VenvPool, get_venv_pool
 
 
 class VenvTool(Enum):
@@ -29,6 +34,50 @@ class VenvTool(Enum):
     VENV = "venv"
 
 
+class InstallOptions:
+    """Dependency installation options for virtual environments.
+
+    Attributes:
+        wheelhouse_dir: Local wheelhouse passed to installers via --find-links
+        offline: Whether to install only from the wheelhouse (--no-index)
+        cache_dir: Shared uv/pip cache directory managed by the tool
+        uv_link_mode: How uv links packages from its cache into the venv
+    """
+
+    def __init__(
+        self,
+        wheelhouse_dir: Optional[Path] = None,
+        offline: bool = False,
+        cache_dir: Optional[Path] = None,
+        uv_link_mode: str = "hardlink",
+    ) -> None:
+        """Initialize install options.
+
+        Args:
+            wheelhouse_dir: Optional local wheelhouse directory
+            offline: Install without contacting a package index
+            cache_dir: Shared package cache (uses the user cache dir if None)
+            uv_link_mode: uv ``--link-mode`` value
+        """
+        self.wheelhouse_dir = Path(wheelhouse_dir) if wheelhouse_dir else None
+        self.offline = offline
+        self.cache_dir = (
+            Path(cache_dir)
+            if cache_dir
+            else Path(user_cache_dir("create-project", "claude")) / "packages"
+        )
+        self.uv_link_mode = uv_link_mode
+
+    def index_args(self) -> List[str]:
+        """Installer arguments for wheelhouse and index selection."""
+        args: List[str] = []
+        if self.wheelhouse_dir:
+            args.extend(["--find-links", str(self.wheelhouse_dir)])
+        if self.offline:
+            args.append("--no-index")
+        return args
+
+
 class VenvManager:
     """Virtual environment manager with multiple tool support.
 
@@ -41,14 +90,31 @@ class VenvManager:
         logger: Structured logger for operations
         available_tools: Dictionary of available tools and their paths
         preferred_tool: Currently preferred tool for creation
+        probe_cache: Shared cache of tool version probes
+        install_options: Wheelhouse, offline and cache settings for installs
+        pool: Prewarmed venv pool to claim from (falls back to the shared pool)
     """
 
     # Tool priority order (first available will be preferred)
     TOOL_PRIORITY = [VenvTool.UV, VenvTool.VIRTUALENV, VenvTool.VENV]
 
-    def __init__(self) -> None:
-        """Initialize the VenvManager."""
+    def __init__(
+        self,
+        probe_cache: Optional[ToolProbeCache] = None,
+        install_options: Optional[InstallOptions] = None,
+        pool: Optional[VenvPool] = None,
+    ) -> None:
+        """Initialize the VenvManager.
+
+        Args:
+            probe_cache: Optional tool probe cache (uses the shared cache if None)
+            install_options: Optional install options (defaults if None)
+            pool: Optional venv pool (uses the shared pool, if started, if None)
+        """
         self.logger = get_logger(__name__)
+        self.probe_cache = probe_cache or get_tool_probe_cache()
+        self.install_options = install_options or InstallOptions()
+        self.pool = pool
         self.available_tools: Dict[VenvTool, Optional[str]] = {}
         self.preferred_tool: Optional[VenvTool] = None
 
@@ -70,6 +136,7 @@ class VenvManager:
         venv_name: str = ".venv",
         python_version: Optional[str] = None,
         requirements_file: Optional[Path] = None,
+        output_callback: Optional[LineCallback] = None,
     ) -> Dict[str, Any]:
         """Create virtual environment in project directory.
 
@@ -78,6 +145,8 @@ class VenvManager:
             venv_name: Name of virtual environment directory
             python_version: Specific Python version (e.g., "3.11")
             requirements_file: Optional requirements file to install
+            output_callback: Optional callback receiving (stream, line) for
+                installer output while requirements are installed
 
         Returns:
             Dictionary with creation result and environment information
@@ -119,16 +188,30 @@ class VenvManager:
             python_version=python_version,
         )
 
+        # Claim a prewarmed environment if a pool is running
+        pooled = self._claim_from_pool(
+            venv_path, python_version, requirements_file, output_callback
+        )
+        if pooled is not None:
+            return pooled
+
         try:
             # Try creating with preferred tool first
+            start_time = time.perf_counter()
             result = self._create_with_tool(
                 self.preferred_tool, project_path, venv_name, python_version
             )
+            result["timings"] = {"creation": time.perf_counter() - start_time}
 
             if result["success"]:
                 # Optionally install requirements
                 if requirements_file and requirements_file.exists():
-                    self._install_requirements(venv_path, requirements_file)
+                    self._record_install(
+                        result,
+                        self._install_requirements(
+                            venv_path, requirements_file, output_callback
+                        ),
+                    )
 
                 self.logger.info(
                     "Virtual environment created successfully",
@@ -154,13 +237,20 @@ class VenvManager:
                 )
 
                 try:
+                    start_time = time.perf_counter()
                     result = self._create_with_tool(
                         tool, project_path, venv_name, python_version
                     )
+                    result["timings"] = {"creation": time.perf_counter() - start_time}
 
                     if result["success"]:
                         if requirements_file and requirements_file.exists():
-                            self._install_requirements(venv_path, requirements_file)
+                            self._record_install(
+                                result,
+                                self._install_requirements(
+                                    venv_path, requirements_file, output_callback
+                                ),
+                            )
 
                         self.logger.info(
                             "Virtual environment created with fallback tool",
@@ -217,6 +307,49 @@ class VenvManager:
                 original_error=e,
             ) from e
 
+    def _claim_from_pool(
+        self,
+        venv_path: Path,
+        python_version: Optional[str],
+        requirements_file: Optional[Path],
+        output_callback: Optional[LineCallback] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Claim a prewarmed environment from the venv pool.
+
+        Args:
+            venv_path: Destination virtual environment path
+            python_version: Requested Python version
+            requirements_file: Optional requirements file to install
+            output_callback: Optional callback for installer output lines
+
+        Returns:
+            Creation result, or None if no pooled environment was claimed
+        """
+        pool = self.pool or get_venv_pool()
+        if pool is None:
+            return None
+
+        start_time = time.perf_counter()
+        try:
+            result = pool.claim(venv_path, python_version)
+        except Exception as e:
+            self.logger.warning("Venv pool claim failed", error=str(e))
+            return None
+
+        if result is None:
+            return None
+
+        result["timings"] = {"creation": time.perf_counter() - start_time}
+        if requirements_file and requirements_file.exists():
+            self._record_install(
+                result,
+                self._install_requirements(
+                    venv_path, requirements_file, output_callback
+                ),
+            )
+
+        return result
+
     def get_activation_instructions(
         self, project_path: Path, venv_name: str = ".venv"
     ) -> Dict[str, str]:
@@ -255,55 +388,50 @@ class VenvManager:
             }
 
     def _detect_available_tools(self) -> None:
-        """Detect which virtual environment tools are available."""
-        # Check uv
+        """Detect which virtual environment tools are available.
+
+        Version probes go through the shared tool probe cache, so only the
+        first detection in a process (or after a tool upgrade) spawns
+        subprocesses, and those run concurrently.
+        """
+        candidates: List[Tuple[VenvTool, str, List[str]]] = []
+
         uv_path = shutil.which("uv")
         if uv_path:
-            try:
-                result = subprocess.run(
-                    [uv_path, "--version"], capture_output=True, text=True, timeout=10
-                )
-                if result.returncode == 0:
-                    self.available_tools[VenvTool.UV] = uv_path
-                    self.logger.debug(
-                        "uv detected", path=uv_path, version=result.stdout.strip()
-                    )
-            except (subprocess.TimeoutExpired, Exception) as e:
-                self.logger.debug("uv detection failed", error=str(e))
+            candidates.append((VenvTool.UV, uv_path, [uv_path, "--version"]))
 
-        # Check virtualenv
         virtualenv_path = shutil.which("virtualenv")
         if virtualenv_path:
-            try:
-                result = subprocess.run(
+            candidates.append(
+                (
+                    VenvTool.VIRTUALENV,
+                    virtualenv_path,
                     [virtualenv_path, "--version"],
-                    capture_output=True,
-                    text=True,
-                    timeout=10,
                 )
-                if result.returncode == 0:
-                    self.available_tools[VenvTool.VIRTUALENV] = virtualenv_path
-                    self.logger.debug(
-                        "virtualenv detected",
-                        path=virtualenv_path,
-                        version=result.stdout.strip(),
-                    )
-            except (subprocess.TimeoutExpired, Exception) as e:
-                self.logger.debug("virtualenv detection failed", error=str(e))
-
-        # Check venv (standard library)
-        try:
-            result = subprocess.run(
-                [sys.executable, "-m", "venv", "--help"],
-                capture_output=True,
-                text=True,
-                timeout=10,
             )
-            if result.returncode == 0:
-                self.available_tools[VenvTool.VENV] = sys.executable
-                self.logger.debug("venv detected", python_executable=sys.executable)
-        except (subprocess.TimeoutExpired, Exception) as e:
-            self.logger.debug("venv detection failed", error=str(e))
+
+        candidates.append(
+            (VenvTool.VENV, sys.executable, [sys.executable, "-m", "venv", "--help"])
+        )
+
+        results = self.probe_cache.probe_many(
+            [command for _, _, command in candidates], timeout=10
+        )
+
+        for (tool, tool_path, _), result in zip(candidates, results):
+            if result.success:
+                self.available_tools[tool] = tool_path
+                self.logger.debug(
+                    f"{tool.value} detected",
+                    path=tool_path,
+                    version=result.stdout.strip(),
+                    cached=result.cached,
+                )
+            else:
+                self.logger.debug(
+                    f"{tool.value} detection failed",
+                    error=result.error or result.stderr.strip(),
+                )
 
     def _select_preferred_tool(self) -> None:
         """Select preferred tool based on priority and availability."""
@@ -469,56 +597,150 @@ class VenvManager:
             ),
         }
 
-    def _install_requirements(self, venv_path: Path, requirements_file: Path) -> None:
+    def _install_requirements(
+        self,
+        venv_path: Path,
+        requirements_file: Path,
+        output_callback: Optional[LineCallback] = None,
+    ) -> Dict[str, Any]:
         """Install requirements in virtual environment.
 
+        Uses ``uv pip install`` (parallel resolver and downloads, hardlinked
+        from the shared cache) when uv is available, otherwise the pip inside
+        the environment. Both honour the configured wheelhouse, offline mode
+        and shared cache directory. Installer output is streamed and only its
+        head and tail are kept.
+
         Args:
             venv_path: Path to virtual environment
             requirements_file: Path to requirements file
+            output_callback: Optional callback receiving (stream, line)
+
+        Returns:
+            Dictionary with installer, command, success flag and duration
         """
         try:
-            # Determine pip executable path
-            if sys.platform == "win32":
-                pip_path = venv_path / "Scripts" / "pip.exe"
-            else:
-                pip_path = venv_path / "bin" / "pip"
+            install_command = self._build_install_command(venv_path, requirements_file)
+            if install_command is None:
+                return {"success": False, "error": "No installer available"}
 
-            if not pip_path.exists():
-                self.logger.warning(
-                    "pip not found in virtual environment",
-                    venv_path=str(venv_path),
-                    expected_pip_path=str(pip_path),
-                )
-                return
+            installer, command = install_command
 
             self.logger.info(
                 "Installing requirements",
                 requirements_file=str(requirements_file),
                 venv_path=str(venv_path),
+                installer=installer,
+                wheelhouse=str(self.install_options.wheelhouse_dir)
+                if self.install_options.wheelhouse_dir
+                else None,
+                offline=self.install_options.offline,
             )
 
-            result = subprocess.run(
-                [str(pip_path), "install", "-r", str(requirements_file)],
-                capture_output=True,
-                text=True,
+            self.install_options.cache_dir.mkdir(parents=True, exist_ok=True)
+
+            start_time = time.perf_counter()
+            result = run_streaming(
+                command,
                 timeout=300,  # 5 minutes for installations
+                line_callback=output_callback,
             )
+            duration = time.perf_counter() - start_time
+
+            install_result: Dict[str, Any] = {
+                "success": result.returncode == 0,
+                "installer": installer,
+                "command": " ".join(command),
+                "duration": duration,
+                "offline": self.install_options.offline,
+            }
 
             if result.returncode != 0:
+                install_result["error"] = result.stderr
                 self.logger.error(
                     "Requirements installation failed",
                     requirements_file=str(requirements_file),
                     stderr=result.stderr,
+                    duration=duration,
                 )
             else:
                 self.logger.info(
                     "Requirements installed successfully",
                     requirements_file=str(requirements_file),
+                    installer=installer,
+                    duration=duration,
                 )
 
+            return install_result
+
         except Exception as e:
             self.logger.error(
                 "Failed to install requirements",
                 requirements_file=str(requirements_file),
                 error=str(e),
             )
+            return {"success": False, "error": str(e)}
+
+    def _build_install_command(
+        self, venv_path: Path, requirements_file: Path
+    ) -> Optional[Tuple[str, List[str]]]:
+        """Build the installer command for a requirements file.
+
+        Args:
+            venv_path: Path to virtual environment
+            requirements_file: Path to requirements file
+
+        Returns:
+            Tuple of installer name and command, or None if neither uv nor
+            pip can be used
+        """
+        if sys.platform == "win32":
+            python_path = venv_path / "Scripts" / "python.exe"
+            pip_path = venv_path / "Scripts" / "pip.exe"
+        else:
+            python_path = venv_path / "bin" / "python"
+            pip_path = venv_path / "bin" / "pip"
+
+        options = self.install_options
+        uv_path = self.available_tools.get(VenvTool.UV)
+
+        if uv_path and python_path.exists():
+            return "uv", [
+                uv_path,
+                "pip",
+                "install",
+                "--python",
+                str(python_path),
+                "--link-mode",
+                options.uv_link_mode,
+                "--cache-dir",
+                str(options.cache_dir),
+                *options.index_args(),
+                "-r",
+                str(requirements_file),
+            ]
+
+        if not pip_path.exists():
+            self.logger.warning(
+                "pip not found in virtual environment",
+                venv_path=str(venv_path),
+                expected_pip_path=str(pip_path),
+            )
+            return None
+
+        return "pip", [
+            str(pip_path),
+            "install",
+            "--cache-dir",
+            str(options.cache_dir),
+            *options.index_args(),
+            "-r",
+            str(requirements_file),
+        ]
+
+    @staticmethod
+    def _record_install(result: Dict[str, Any], install: Dict[str, Any]) -> None:
+        """Attach requirements installation outcome and timing to a result."""
+        result["requirements_install"] = install
+        if "duration" in install:
+            result.setdefault("timings", {})["install"] = install["duration"]
@@ -0,0 +1,406 @@
+# ABOUTME: Background pool of prewarmed, empty virtual environments
+# ABOUTME: Lets generation claim a ready venv with an atomic rename instead of bootstrapping one
+
+"""
+Prewarmed virtual environment pool.
+
+This module provides the VenvPool class which keeps a small number of empty,
+ready-to-use virtual environments per configured Python version in a staging
+directory. A background thread refills the pool whenever it has been idle for
+a while, and VenvManager claims an environment by renaming it into the project
+directory, so interactive generation does not wait for interpreter bootstrap.
+
+Staging layout::
+
+    <pool_dir>/<python-version|default>/.building-<id>/.venv   (being created)
+    <pool_dir>/<python-version|default>/ready-<tool>-<id>/.venv (claimable)
+    <pool_dir>/<python-version|default>/ready-<tool>-<id>/origin (build path)
+
+Slots only become visible under their ``ready-`` name once creation finished,
+and a claim is a single ``os.rename``, so several processes can share the
+same staging directory safely. Renames only work within one filesystem; when
+the project lives elsewhere the claim is declined and the caller creates the
+environment normally.
+"""
+
+import errno
+import os
+import shutil
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from platformdirs import user_cache_dir
+from structlog import get_logger
+
+if TYPE_CHECKING:
+    from .venv_manager import VenvManager
+
+
+class VenvPool:
+    """Pool of prewarmed empty virtual environments.
+
+    Attributes:
+        venv_manager: Manager used to create pooled environments
+        pool_dir: Staging directory holding pooled environments
+        size: Number of ready environments to keep per Python version
+        python_versions: Python versions to keep environments for (None = default)
+        idle_delay: Seconds without claims before refilling starts
+        venv_name: Directory name pooled environments are created with
+        logger: Structured logger for operations
+    """
+
+    READY_PREFIX = "ready-"
+    BUILDING_PREFIX = ".building-"
+    DEFAULT_KEY = "default"
+    ORIGIN_FILE = "origin"
+    STALE_BUILD_SECONDS = 3600
+
+    def __init__(
+        self,
+        venv_manager: "VenvManager",
+        pool_dir: Optional[Path] = None,
+        size: int = 2,
+        python_versions: Optional[List[Optional[str]]] = None,
+        idle_delay: float = 5.0,
+        venv_name: str = ".venv",
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            venv_manager: Manager used to create pooled environments
+            pool_dir: Staging directory (default: user cache dir/venv-pool)
+            size: Ready environments to keep per Python version
+            python_versions: Python versions to prewarm (None means default)
+            idle_delay: Seconds without claims before refilling
+            venv_name: Directory name of pooled environments
+        """
+        self.logger = get_logger(__name__)
+        self.venv_manager = venv_manager
+        self.pool_dir = (
+            Path(pool_dir)
+            if pool_dir
+            else Path(user_cache_dir("create-project", "claude")) / "venv-pool"
+        )
+        self.size = size
+        self.python_versions: List[Optional[str]] = python_versions or [None]
+        self.idle_delay = idle_delay
+        self.venv_name = venv_name
+
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_claim = 0.0
+
+    def start(self) -> None:
+        """Start the background refill thread."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+
+            self.pool_dir.mkdir(parents=True, exist_ok=True)
+            self._remove_stale_builds()
+
+            self._stop.clear()
+            self._wake.set()
+            self._thread = threading.Thread(
+                target=self._refill_loop, name="venv-pool", daemon=True
+            )
+            self._thread.start()
+
+        self.logger.info(
+            "Venv pool started",
+            pool_dir=str(self.pool_dir),
+            size=self.size,
+            python_versions=[v or self.DEFAULT_KEY for v in self.python_versions],
+        )
+
+    def stop(self, timeout: Optional[float] = 10.0) -> None:
+        """Stop the background refill thread.
+
+        Ready environments are kept on disk for the next session.
+
+        Args:
+            timeout: Seconds to wait for an in-progress build to finish
+        """
+        self._stop.set()
+        self._wake.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        self._thread = None
+        self.logger.debug("Venv pool stopped")
+
+    def available(self, python_version: Optional[str] = None) -> int:
+        """Number of ready environments for a Python version."""
+        return len(self._ready_slots(python_version))
+
+    def claim(
+        self, venv_path: Path, python_version: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Move a ready environment to ``venv_path``.
+
+        Args:
+            venv_path: Destination virtual environment directory
+            python_version: Requested Python version (None for default)
+
+        Returns:
+            Creation result in VenvManager format, or None if no environment
+            could be claimed
+        """
+        if venv_path.name != self.venv_name or venv_path.exists():
+            return None
+
+        for slot in self._ready_slots(python_version):
+            source = slot / self.venv_name
+            try:
+                origin = (slot / self.ORIGIN_FILE).read_text(encoding="utf-8")
+                os.rename(source, venv_path)
+            except FileNotFoundError:
+                # Claimed concurrently by another generation or process
+                continue
+            except OSError as e:
+                if e.errno == errno.EXDEV:
+                    self.logger.info(
+                        "Venv pool is on a different filesystem than the project",
+                        pool_dir=str(self.pool_dir),
+                        venv_path=str(venv_path),
+                    )
+                else:
+                    self.logger.warning(
+                        "Failed to claim pooled venv", slot=str(slot), error=str(e)
+                    )
+                return None
+
+            shutil.rmtree(slot, ignore_errors=True)
+            self._relocate(venv_path, Path(origin))
+
+            self._last_claim = time.monotonic()
+            self._wake.set()
+
+            tool = slot.name[len(self.READY_PREFIX) :].rsplit("-", 1)[0]
+            self.logger.info(
+                "Claimed pooled virtual environment",
+                venv_path=str(venv_path),
+                tool=tool,
+                python_version=python_version,
+            )
+
+            instructions = self.venv_manager.get_activation_instructions(
+                venv_path.parent, venv_path.name
+            )
+            return {
+                "success": True,
+                "venv_path": str(venv_path),
+                "tool": tool,
+                "python_version": python_version,
+                "pooled": True,
+                "activation_instructions": instructions,
+            }
+
+        return None
+
+    def fill(self) -> int:
+        """Synchronously top up every Python version to the pool size.
+
+        Returns:
+            Number of environments created
+        """
+        created = 0
+        while not self._stop.is_set() and self._build_one():
+            created += 1
+        return created
+
+    def _refill_loop(self) -> None:
+        """Background loop refilling the pool when generation is idle."""
+        while not self._stop.is_set():
+            self._wake.wait(self.idle_delay)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+
+            # Keep out of the way while generations are claiming
+            idle_for = time.monotonic() - self._last_claim
+            if self._last_claim and idle_for < self.idle_delay:
+                self._stop.wait(self.idle_delay - idle_for)
+                self._wake.set()
+                continue
+
+            try:
+                if self._build_one():
+                    self._wake.set()
+            except Exception as e:
+                self.logger.warning("Venv pool refill failed", error=str(e))
+
+    def _build_one(self) -> bool:
+        """Create one environment for the first under-filled Python version.
+
+        Returns:
+            True if an environment was created
+        """
+        tool = self.venv_manager.preferred_tool
+        if tool is None:
+            return False
+
+        for python_version in self.python_versions:
+            if self.available(python_version) >= self.size:
+                continue
+
+            key_dir = self._key_dir(python_version)
+            key_dir.mkdir(parents=True, exist_ok=True)
+            slot_id = uuid.uuid4().hex[:12]
+            building = key_dir / f"{self.BUILDING_PREFIX}{slot_id}"
+            building.mkdir()
+
+            start_time = time.perf_counter()
+            result = self.venv_manager._create_with_tool(
+                tool, building, self.venv_name, python_version
+            )
+
+            if not result.get("success"):
+                shutil.rmtree(building, ignore_errors=True)
+                self.logger.warning(
+                    "Failed to prewarm virtual environment",
+                    python_version=python_version,
+                    error=result.get("error"),
+                )
+                return False
+
+            # Scripts embed the build path; remember it for relocation on claim
+            (building / self.ORIGIN_FILE).write_text(
+                str(building / self.venv_name), encoding="utf-8"
+            )
+            ready = key_dir / f"{self.READY_PREFIX}{tool.value}-{slot_id}"
+            os.rename(building, ready)
+            self.logger.debug(
+                "Prewarmed virtual environment",
+                python_version=python_version,
+                tool=tool.value,
+                duration=time.perf_counter() - start_time,
+            )
+            return True
+
+        return False
+
+    def _ready_slots(self, python_version: Optional[str]) -> List[Path]:
+        """Ready slot directories for a Python version, oldest first."""
+        key_dir = self._key_dir(python_version)
+        try:
+            slots = [
+                entry
+                for entry in key_dir.iterdir()
+                if entry.name.startswith(self.READY_PREFIX)
+            ]
+        except OSError:
+            return []
+
+        def created_at(slot: Path) -> float:
+            try:
+                return slot.stat().st_mtime
+            except OSError:
+                return 0.0
+
+        return sorted(slots, key=created_at)
+
+    def _key_dir(self, python_version: Optional[str]) -> Path:
+        """Staging directory for a Python version."""
+        return self.pool_dir / (python_version or self.DEFAULT_KEY)
+
+    def _remove_stale_builds(self) -> None:
+        """Remove half-built environments left behind by crashed sessions."""
+        cutoff = time.time() - self.STALE_BUILD_SECONDS
+        for building in self.pool_dir.glob(f"*/{self.BUILDING_PREFIX}*"):
+            try:
+                if building.stat().st_mtime < cutoff:
+                    shutil.rmtree(building, ignore_errors=True)
+            except OSError:
+                continue
+
+    def _relocate(self, venv_path: Path, old_path: Path) -> None:
+        """Rewrite absolute staging paths after moving an environment.
+
+        Activation scripts, console-script shebangs and pyvenv.cfg embed the
+        environment's absolute path; interpreter symlinks and binaries are
+        left untouched.
+        """
+        old = str(old_path).encode()
+        new = str(venv_path).encode()
+        scripts_dir = venv_path / ("Scripts" if os.name == "nt" else "bin")
+
+        candidates = [venv_path / "pyvenv.cfg"]
+        if scripts_dir.is_dir():
+            candidates.extend(scripts_dir.iterdir())
+
+        for path in candidates:
+            try:
+                if path.is_symlink() or not path.is_file():
+                    continue
+                data = path.read_bytes()
+                if old not in data:
+                    continue
+                mode = path.stat().st_mode
+                path.write_bytes(data.replace(old, new))
+                os.chmod(path, mode)
+            except OSError as e:
+                self.logger.warning(
+                    "Failed to relocate pooled venv file", path=str(path), error=str(e)
+                )
+
+
+_venv_pool: Optional[VenvPool] = None
+_venv_pool_lock = threading.Lock()
+
+
+def get_venv_pool() -> Optional[VenvPool]:
+    """Return the process-wide venv pool, or None if it was not started."""
+    return _venv_pool
+
+
+def start_venv_pool(
+    venv_manager: Optional["VenvManager"] = None,
+    pool_dir: Optional[Path] = None,
+    size: int = 2,
+    python_versions: Optional[List[Optional[str]]] = None,
+    idle_delay: float = 5.0,
+) -> VenvPool:
+    """Create and start the process-wide venv pool.
+
+    Args:
+        venv_manager: Manager used to build environments (creates one if None)
+        pool_dir: Staging directory (default: user cache dir/venv-pool)
+        size: Ready environments to keep per Python version
+        python_versions: Python versions to prewarm (None means default)
+        idle_delay: Seconds without claims before refilling
+
+    Returns:
+        The running VenvPool
+    """
+    global _venv_pool
+    with _venv_pool_lock:
+        if _venv_pool is None:
+            if venv_manager is None:
+                from .venv_manager import VenvManager
+
+                venv_manager = VenvManager()
+
+            _venv_pool = VenvPool(
+                venv_manager,
+                pool_dir=pool_dir,
+                size=size,
+                python_versions=python_versions,
+                idle_delay=idle_delay,
+            )
+        _venv_pool.start()
+        return _venv_pool
+
+
+def stop_venv_pool() -> None:
+    """Stop and discard the process-wide venv pool."""
+    global _venv_pool
+    with _venv_pool_lock:
+        if _venv_pool is not None:
+            _venv_pool.stop()
+            _venv_pool = None
@@ -18,18 +18,28 @@ from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QApplication, QMessageBox
 
 from create_project.ai.ai_service import AIService
+from create_project.ai.runtime import get_ai_runtime
 from create_project.config.config_manager import ConfigManager
+from create_project.core.venv_pool import start_venv_pool, stop_venv_pool
 from create_project.gui.dialogs.performance_dialog import PerformanceDialog
 from create_project.resources.styles import StyleManager
 from create_project.templates.engine import TemplateEngine
 from create_project.templates.loader import TemplateLoader
 from create_project.utils.logger import get_logger
-from create_project.utils.performance import enable_monitoring
+from create_project.utils.performance import (
+    MonitoringTier,
+    enable_allocation_tracing,
+    enable_monitoring,
+)
+from create_project.utils.tracing import enable_tracing, get_tracer
 
 from .wizard.wizard import ProjectWizard
 
 logger = get_logger(__name__)
 
+# Seconds to wait for each AI service startup step
+AI_INIT_TIMEOUT = 30.0
+
 
 def setup_application() -> QApplication:
     """
@@ -120,17 +130,14 @@ def initialize_services(
     ai_service = None
     if config_manager.get_setting("ai.enabled", True):
         try:
-            import asyncio
             ai_service = AIService(config_manager)
-            # Run async initialization synchronously
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(ai_service.initialize())
-            if loop.run_until_complete(ai_service.is_available()):
+            # Initialize on the shared AI loop that later help requests use
+            runtime = get_ai_runtime()
+            runtime.submit(ai_service.initialize(), timeout=AI_INIT_TIMEOUT)
+            if runtime.submit(ai_service.is_available(), timeout=AI_INIT_TIMEOUT):
                 logger.info("AI service initialized and available")
             else:
                 logger.warning("AI service initialized but not available")
-            loop.close()
         except Exception as e:
             logger.warning(f"Failed to initialize AI service: {e}")
             # Continue without AI service
@@ -138,6 +145,35 @@ def initialize_services(
     return template_engine, template_loader, ai_service
 
 
+def start_background_services(config_manager: ConfigManager) -> None:
+    """
+    Start optional background services for interactive generation.
+
+    Currently this is the prewarmed virtual environment pool, enabled with
+    the ``venv.pool_size`` setting.
+
+    Args:
+        config_manager: Configuration manager instance
+    """
+    pool_size = config_manager.get_setting("venv.pool_size", 0)
+    if not pool_size:
+        return
+
+    try:
+        pool_dir = config_manager.get_setting("venv.pool_dir")
+        python_versions = config_manager.get_setting("venv.pool_python_versions", [])
+        start_venv_pool(
+            pool_dir=Path(pool_dir) if pool_dir else None,
+            size=pool_size,
+            python_versions=list(python_versions) or None,
+            idle_delay=config_manager.get_setting("venv.pool_idle_seconds", 5.0),
+        )
+        logger.info("Prewarmed venv pool started", size=pool_size)
+    except Exception as e:
+        logger.warning(f"Failed to start venv pool: {e}")
+        # Continue without the pool - venvs are created on demand
+
+
 def parse_arguments() -> argparse.Namespace:
     """
     Parse command-line arguments.
@@ -155,6 +191,12 @@ def parse_arguments() -> argparse.Namespace:
 
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
 
+    parser.add_argument(
+        "--profile-allocations",
+        action="store_true",
+        help="Record top allocation sites per operation (slow, implies --debug)",
+    )
+
     parser.add_argument("--no-ai", action="store_true", help="Disable AI assistance")
 
     # Accept --gui flag (when called from main module) but ignore it
@@ -181,6 +223,9 @@ def main(args=None) -> int:
         parsed_args = args
     else:
         parsed_args = parse_arguments()
+    if getattr(parsed_args, "profile_allocations", False):
+        parsed_args.debug = True
+
     # Set up logging
     if hasattr(parsed_args, "debug") and parsed_args.debug:
         import logging
@@ -198,16 +243,34 @@ def main(args=None) -> int:
         if hasattr(parsed_args, "no_ai") and parsed_args.no_ai:
             config_manager.set_setting("ai.enabled", False)
 
+        # Enable tracing from the logging configuration, unless the CLI
+        # entry point already owns the tracer and will export it itself
+        trace_file = None
+        if (
+            not get_tracer().enabled
+            and config_manager.get_setting("logging.trace_enabled", False) is True
+        ):
+            trace_file = Path(
+                config_manager.get_setting(
+                    "logging.trace_file", "create-project-trace.json"
+                )
+            )
+            enable_tracing()
+
         # Enable performance monitoring in debug mode
         if hasattr(parsed_args, "debug") and parsed_args.debug:
-            enable_monitoring()
+            enable_monitoring(MonitoringTier.FULL)
             logger.info("Performance monitoring enabled for debug mode")
+            if getattr(parsed_args, "profile_allocations", False):
+                enable_allocation_tracing()
 
         # Initialize services
         template_engine, template_loader, ai_service = initialize_services(
             config_manager
         )
 
+        start_background_services(config_manager)
+
         # Create and show wizard
         wizard = ProjectWizard(
             config_manager=config_manager,
@@ -242,6 +305,16 @@ def main(args=None) -> int:
         # Run event loop
         result = app.exec()
 
+        stop_venv_pool()
+        get_ai_runtime().shutdown()
+
+        if trace_file is not None:
+            try:
+                get_tracer().export(trace_file)
+                logger.info(f"Trace written to {trace_file}")
+            except OSError as e:
+                logger.error(f"Failed to write trace file: {e}")
+
         # Log performance summary if monitoring was enabled
         if hasattr(parsed_args, "debug") and parsed_args.debug:
             from create_project.utils.performance import log_performance_summary
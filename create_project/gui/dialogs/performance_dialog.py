@@ -5,10 +5,12 @@
 Performance dashboard dialog.
 
 This module provides a debug-mode dialog for monitoring application performance
-including memory usage, operation timing, system metrics, and detailed reports.
+including memory usage, allocation sites, operation timing, latency
+percentiles, system metrics, and detailed reports.
 """
 
 import json
+from dataclasses import asdict
 from typing import Optional
 
 from PyQt6.QtCore import QTimer, pyqtSignal
@@ -82,6 +84,7 @@ class PerformanceDialog(QDialog):
         self._create_overview_tab()
         self._create_memory_tab()
         self._create_operations_tab()
+        self._create_latency_tab()
         self._create_system_tab()
         self._create_raw_data_tab()
 
@@ -202,6 +205,23 @@ class PerformanceDialog(QDialog):
 
         layout.addWidget(details_group)
 
+        # Allocation sites of the most recent operation profiled with tracemalloc
+        allocations_group = QGroupBox("Top Allocation Sites")
+        allocations_layout = QVBoxLayout(allocations_group)
+
+        self.allocations_label = QLabel("")
+        self.allocations_label.setWordWrap(True)
+        allocations_layout.addWidget(self.allocations_label)
+
+        self.allocations_table = QTableWidget()
+        self.allocations_table.setColumnCount(3)
+        self.allocations_table.setHorizontalHeaderLabels([
+            "Location", "Size Δ (KB)", "Blocks Δ"
+        ])
+        allocations_layout.addWidget(self.allocations_table)
+
+        layout.addWidget(allocations_group)
+
         layout.addStretch()
         tab.setWidget(content)
         self.tab_widget.addTab(tab, "Memory")
@@ -234,6 +254,21 @@ class PerformanceDialog(QDialog):
 
         self.tab_widget.addTab(tab, "Operations")
 
+    def _create_latency_tab(self):
+        """Create latency percentiles tab."""
+        tab = QWidget()
+        layout = QVBoxLayout(tab)
+
+        # One row per operation name, over every measured call
+        self.latency_table = QTableWidget()
+        self.latency_table.setColumnCount(7)
+        self.latency_table.setHorizontalHeaderLabels([
+            "Operation", "Calls", "Failures", "p50 (ms)", "p90 (ms)", "p99 (ms)", "Max (ms)"
+        ])
+        layout.addWidget(self.latency_table)
+
+        self.tab_widget.addTab(tab, "Latency")
+
     def _create_system_tab(self):
         """Create system information tab."""
         tab = QScrollArea()
@@ -287,6 +322,7 @@ class PerformanceDialog(QDialog):
             self._update_overview()
             self._update_memory()
             self._update_operations()
+            self._update_latency()
             self._update_system_info()
             self._update_raw_data()
         except Exception as e:
@@ -352,6 +388,37 @@ Total Delta: {self.monitor.get_total_memory_delta():+.2f} MB
 
         self.memory_info_label.setText(info_text)
 
+        self._update_allocations()
+
+    def _update_allocations(self):
+        """Show the allocation sites of the latest profiled operation."""
+        profiled = [op for op in self.monitor.operations if op.allocations]
+        if not profiled:
+            self.allocations_label.setText(
+                "No profiled operations yet"
+                if self.monitor.trace_allocations
+                else "Allocation tracing is off (run with --profile-allocations)"
+            )
+            self.allocations_table.setRowCount(0)
+            return
+
+        op = profiled[-1]
+        self.allocations_label.setText(
+            f"Operation '{op.operation_name}' ({op.duration:.3f}s), "
+            "hover a location for its traceback"
+        )
+        self.allocations_table.setRowCount(len(op.allocations))
+        for i, site in enumerate(op.allocations):
+            location = QTableWidgetItem(site.location)
+            location.setToolTip("\n".join(site.traceback))
+            self.allocations_table.setItem(i, 0, location)
+            self.allocations_table.setItem(
+                i, 1, QTableWidgetItem(f"{site.size_diff / 1024:+.1f}")
+            )
+            self.allocations_table.setItem(i, 2, QTableWidgetItem(f"{site.count_diff:+d}"))
+
+        self.allocations_table.resizeColumnsToContents()
+
     def _update_operations(self):
         """Update operations tab data."""
         operations = self.monitor.operations
@@ -372,6 +439,22 @@ Total Delta: {self.monitor.get_total_memory_delta():+.2f} MB
         # Auto-resize columns
         self.operations_table.resizeColumnsToContents()
 
+    def _update_latency(self):
+        """Update latency tab data."""
+        latency = self.monitor.get_latency_summary()
+        self.latency_table.setRowCount(len(latency))
+
+        for i, (name, summary) in enumerate(latency.items()):
+            self.latency_table.setItem(i, 0, QTableWidgetItem(name))
+            self.latency_table.setItem(i, 1, QTableWidgetItem(str(summary["count"])))
+            self.latency_table.setItem(i, 2, QTableWidgetItem(str(summary["failures"])))
+            for column, key in enumerate(("p50", "p90", "p99", "max"), start=3):
+                self.latency_table.setItem(
+                    i, column, QTableWidgetItem(f"{summary[key] * 1000:.2f}")
+                )
+
+        self.latency_table.resizeColumnsToContents()
+
     def _update_system_info(self):
         """Update system information tab."""
         report = self.monitor.generate_report()
@@ -411,6 +494,7 @@ Total Delta: {self.monitor.get_total_memory_delta():+.2f} MB
             "avg_cpu_percent": report.avg_cpu_percent,
             "gc_collections": report.gc_collections,
             "system_info": report.system_info,
+            "latency": report.latency,
             "operations": [
                 {
                     "operation_name": op.operation_name,
@@ -419,7 +503,8 @@ Total Delta: {self.monitor.get_total_memory_delta():+.2f} MB
                     "cpu_percent": op.cpu_percent,
                     "success": op.success,
                     "error_message": op.error_message,
-                    "metadata": op.metadata
+                    "metadata": op.metadata,
+                    "allocations": [asdict(site) for site in op.allocations]
                 }
                 for op in report.operations
             ]
@@ -479,10 +564,27 @@ Total Delta: {self.monitor.get_total_memory_delta():+.2f} MB
             self,
             "Export Performance Report",
             f"performance_report_{int(self.monitor.start_time)}.json",
-            "JSON Files (*.json);;All Files (*)"
+            "JSON Files (*.json);;OpenMetrics Text (*.prom);;All Files (*)"
         )
 
-        if file_path:
+        if file_path and file_path.endswith(".prom"):
+            try:
+                self.monitor.write_openmetrics(file_path)
+                QMessageBox.information(
+                    self,
+                    "Export Successful",
+                    f"Operation latencies exported to:\n{file_path}"
+                )
+                self.export_requested.emit(file_path)
+                logger.info(f"Operation latencies exported to: {file_path}")
+            except Exception as e:
+                QMessageBox.critical(
+                    self,
+                    "Export Failed",
+                    f"Failed to export operation latencies:\n{e}"
+                )
+                logger.error(f"Failed to export operation latencies: {e}")
+        elif file_path:
             try:
                 report = self.monitor.generate_report()
 
@@ -497,6 +599,7 @@ Total Delta: {self.monitor.get_total_memory_delta():+.2f} MB
                     "avg_cpu_percent": report.avg_cpu_percent,
                     "gc_collections": report.gc_collections,
                     "system_info": report.system_info,
+                    "latency": report.latency,
                     "operations": [
                         {
                             "operation_name": op.operation_name,
@@ -508,6 +611,7 @@ Total Delta: {self.monitor.get_total_memory_delta():+.2f} MB
                             "success": op.success,
                             "error_message": op.error_message,
                             "metadata": op.metadata,
+                            "allocations": [asdict(site) for site in op.allocations],
                             "memory_before": {
                                 "timestamp": op.memory_before.timestamp,
                                 "rss_mb": op.memory_before.rss_mb,
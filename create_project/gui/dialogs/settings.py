@@ -31,6 +31,7 @@ from PyQt6.QtWidgets import (
 )
 
 from create_project.ai.ai_service import AIService
+from create_project.ai.model_manager import load_cached_models
 from create_project.config import ConfigManager
 from create_project.gui.widgets import FilePathEdit, SelectionMode, ValidatedLineEdit
 from create_project.utils.logger import get_logger
@@ -351,10 +352,15 @@ class SettingsDialog(QDialog):
         try:
             self.model_combo.clear()
 
-            # For now, just add some common models
-            # TODO: Make this async or use a worker thread for actual model discovery
-            common_models = ["llama2", "codellama", "mistral", "phi", "neural-chat"]
-            self.model_combo.addItems(common_models)
+            # Models from the catalog persisted by the AI service, which does
+            # not need a request to Ollama; common models if there is none
+            models = [
+                model.name
+                for model in load_cached_models(self.ollama_url_edit.text() or None)
+            ]
+            if not models:
+                models = ["llama2", "codellama", "mistral", "phi", "neural-chat"]
+            self.model_combo.addItems(models)
 
             # Restore previously selected model if available
             current_model = self.config_manager.get_setting("ai.model", "")
@@ -26,6 +26,7 @@ from create_project.core.project_generator import ProjectOptions
 from create_project.templates.engine import TemplateEngine
 from create_project.utils.logger import get_logger
 from create_project.utils.performance import measure_operation
+from create_project.utils.tracing import span
 
 from ..steps.basic_info import BasicInfoStep
 from ..steps.location import LocationStep
@@ -210,7 +211,9 @@ class ProjectGenerationThread(QThread):
             generator.add_progress_callback(detailed_progress_callback)
 
             # Generate project with performance monitoring
-            with measure_operation("gui_project_generation", perf_metadata):
+            with measure_operation("gui_project_generation", perf_metadata), span(
+                "gui_project_generation", "gui", **perf_metadata
+            ):
                 result = generator.generate_project(
                     template_path=template_path,
                     target_path=self.project_path,
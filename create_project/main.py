@@ -19,6 +19,7 @@ from .core.api import create_project
 from .templates.engine import TemplateEngine
 from .templates.loader import TemplateLoader
 from .utils.logger import get_logger, init_logging
+from .utils.tracing import enable_tracing, get_tracer
 
 logger = get_logger(__name__)
 
@@ -112,6 +113,13 @@ def parse_cli_arguments(args: Optional[List[str]] = None) -> argparse.Namespace:
         help="Enable debug logging"
     )
 
+    parser.add_argument(
+        "--trace",
+        type=Path,
+        metavar="FILE",
+        help="Write a Chrome trace of the run to FILE (open in ui.perfetto.dev)"
+    )
+
     parser.add_argument(
         "--list-templates",
         action="store_true",
@@ -288,13 +296,30 @@ def main(args: Optional[List[str]] = None) -> int:
         print(f"Error: Failed to load configuration: {e}")
         return 1
 
-    # Determine mode: GUI if --gui flag or no project name provided
-    if parsed_args.gui or (not parsed_args.project_name and not parsed_args.list_templates):
-        logger.info("Launching GUI mode")
-        return run_gui_mode(parsed_args, config_manager)
-    else:
-        logger.info("Running in CLI mode")
-        return run_cli_mode(parsed_args, config_manager)
+    # Enable tracing from --trace or the logging configuration
+    trace_file = parsed_args.trace
+    if trace_file is None and config_manager.get_setting("logging.trace_enabled", False) is True:
+        trace_file = Path(
+            config_manager.get_setting("logging.trace_file", "create-project-trace.json")
+        )
+    if trace_file is not None:
+        enable_tracing()
+
+    try:
+        # Determine mode: GUI if --gui flag or no project name provided
+        if parsed_args.gui or (not parsed_args.project_name and not parsed_args.list_templates):
+            logger.info("Launching GUI mode")
+            return run_gui_mode(parsed_args, config_manager)
+        else:
+            logger.info("Running in CLI mode")
+            return run_cli_mode(parsed_args, config_manager)
+    finally:
+        if trace_file is not None:
+            try:
+                get_tracer().export(trace_file)
+                print(f"Trace written to {trace_file}")
+            except OSError as e:
+                logger.error(f"Failed to write trace file: {e}")
 
 
 if __name__ == "__main__":
@@ -10,6 +10,7 @@ and provides Jinja2-based templating with variable substitution.
 """
 
 import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Dict, Optional, Set, Union
 
@@ -51,6 +52,9 @@ class RenderingError(TemplateEngineError):
 class TemplateEngine:
     """Core template engine for processing templates and generating projects."""
 
+    # Compiled Jinja2 templates kept per engine, least recently used evicted
+    COMPILED_CACHE_SIZE = 512
+
     def __init__(self, config_manager: Optional[ConfigManager] = None):
         """Initialize the template engine.
 
@@ -62,6 +66,7 @@ class TemplateEngine:
 
         # Template cache for performance
         self._template_cache: Dict[str, Template] = {}
+        self._compiled_cache: "OrderedDict[str, jinja2.Template]" = OrderedDict()
         self._cache_lock = threading.RLock()
 
         # Jinja2 environment for rendering
@@ -360,13 +365,42 @@ class TemplateEngine:
             RenderingError: If rendering fails
         """
         try:
-            template = self.jinja_env.from_string(template_string)
+            template = self.compile_template_string(template_string)
             return template.render(**variables)
         except jinja2.TemplateError as e:
             raise RenderingError(f"Template rendering failed: {e}")
         except Exception as e:
             raise RenderingError(f"Unexpected rendering error: {e}")
 
+    def compile_template_string(self, template_string: str) -> jinja2.Template:
+        """Compile a template string, reusing earlier compilations.
+
+        Generating many projects from one template renders the same file
+        contents over and over, so compiled templates are cached by source.
+
+        Args:
+            template_string: Jinja2 template string
+
+        Returns:
+            Compiled Jinja2 template
+
+        Raises:
+            jinja2.TemplateSyntaxError: If the template string is invalid
+        """
+        with self._cache_lock:
+            template = self._compiled_cache.get(template_string)
+            if template is not None:
+                self._compiled_cache.move_to_end(template_string)
+                return template
+
+        template = self.jinja_env.from_string(template_string)
+
+        with self._cache_lock:
+            self._compiled_cache[template_string] = template
+            while len(self._compiled_cache) > self.COMPILED_CACHE_SIZE:
+                self._compiled_cache.popitem(last=False)
+        return template
+
     def get_template_variables(self, template_string: str) -> Set[str]:
         """Extract variable names from a template string.
 
@@ -387,6 +421,7 @@ class TemplateEngine:
         """Clear the template cache."""
         with self._cache_lock:
             self._template_cache.clear()
+            self._compiled_cache.clear()
         self.logger.info("Template cache cleared")
 
     def get_cache_stats(self) -> Dict[str, Any]:
@@ -399,4 +434,5 @@ class TemplateEngine:
             return {
                 "cached_templates": len(self._template_cache),
                 "template_paths": list(self._template_cache.keys()),
+                "compiled_templates": len(self._compiled_cache),
             }
@@ -70,6 +70,26 @@ class TemplateAction(BaseModel):
         default_factory=list, description="Additional arguments for the action"
     )
 
+    depends_on: List[str] = Field(
+        default_factory=list,
+        description="Names of actions that must succeed before this one runs",
+    )
+
+    resources: List[str] = Field(
+        default_factory=list,
+        description="Resource classes the action occupies (network, cpu, ...)",
+    )
+
+    inputs: List[str] = Field(
+        default_factory=list,
+        description="Globs of files the action reads; lets unchanged reruns be skipped",
+    )
+
+    outputs: List[str] = Field(
+        default_factory=list,
+        description="Globs the action creates; must exist for a run to be skipped",
+    )
+
     @field_validator("command")
     @classmethod
     def validate_command(cls, v):
@@ -120,6 +140,19 @@ class TemplateAction(BaseModel):
 
         return v.strip()
 
+    @field_validator("inputs", "outputs")
+    @classmethod
+    def validate_file_globs(cls, v):
+        """Validate input and output globs stay inside the project."""
+        for pattern in v:
+            if not pattern or not pattern.strip():
+                raise ValueError("File glob cannot be empty")
+            if pattern.startswith("/") or ":" in pattern:
+                raise ValueError("File glob must be a relative path")
+            if ".." in pattern.replace("\\", "/").split("/"):
+                raise ValueError("File glob cannot contain '..'")
+        return [pattern.strip() for pattern in v]
+
     @field_validator("timeout")
     @classmethod
     def validate_timeout(cls, v):
@@ -266,6 +299,23 @@ class TemplateHooks(BaseModel):
             duplicates = [name for name in set(names) if names.count(name) > 1]
             errors.append(f"Duplicate action names across hooks: {duplicates}")
 
+        # Dependencies must refer to actions of the same stage
+        for stage in (
+            self.pre_generate,
+            self.post_generate,
+            self.pre_file,
+            self.post_file,
+            self.on_error,
+            self.cleanup,
+        ):
+            stage_names = {action.name for action in stage}
+            for action in stage:
+                unknown = [dep for dep in action.depends_on if dep not in stage_names]
+                if unknown:
+                    errors.append(
+                        f"Action '{action.name}' depends on unknown actions: {unknown}"
+                    )
+
         return errors
 
 
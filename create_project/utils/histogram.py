@@ -0,0 +1,153 @@
+# ABOUTME: Fixed-memory log-linear latency histogram with percentile queries
+# ABOUTME: Backs per-operation latency percentiles and OpenMetrics export
+
+"""
+Latency histogram module.
+
+This module provides the LatencyHistogram class, a fixed-size log-linear
+histogram in the style of HdrHistogram. Each power-of-two range of
+durations (an octave) is split into ``SUB_BUCKETS`` equal-width buckets, so
+any recorded duration lands in a bucket within ``1 / SUB_BUCKETS`` (6.25%)
+of its value. Memory does not grow with the number of recorded values,
+which keeps long-running sessions bounded while still giving p50/p90/p99
+percentiles that are suitable for alerting.
+"""
+
+import math
+from typing import Dict, Iterator, List, Tuple
+
+
+class LatencyHistogram:
+    """Log-linear histogram of durations in seconds.
+
+    Durations from about 1µs (``2**MIN_EXPONENT``) to about 68 minutes
+    (``2**MAX_EXPONENT``) are bucketed; shorter ones fall in the first
+    bucket and longer ones are only counted as overflow. Count, sum, min
+    and max are exact.
+
+    Attributes:
+        count: Number of recorded durations
+        total: Sum of recorded durations
+        min: Shortest recorded duration
+        max: Longest recorded duration
+    """
+
+    MIN_EXPONENT = -20
+    MAX_EXPONENT = 12
+    SUB_BUCKETS = 16
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        octaves = self.MAX_EXPONENT - self.MIN_EXPONENT
+        self._counts: List[int] = [0] * (octaves * self.SUB_BUCKETS)
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        """Record one duration.
+
+        Args:
+            value: Duration in seconds (negative values count as 0)
+        """
+        value = max(0.0, value)
+        index = self._index(value)
+        if index < len(self._counts):
+            self._counts[index] += 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, percent: float) -> float:
+        """Estimate a percentile.
+
+        Args:
+            percent: Percentile between 0 and 100
+
+        Returns:
+            Upper bound of the bucket holding the percentile, capped at the
+            recorded maximum (0 if nothing was recorded)
+        """
+        if self.count == 0:
+            return 0.0
+
+        rank = max(1, math.ceil(self.count * min(100.0, max(0.0, percent)) / 100.0))
+        seen = 0
+        for index, bucket_count in enumerate(self._counts):
+            seen += bucket_count
+            if seen >= rank:
+                return max(self.min, min(self.max, self._upper_bound(index)))
+        # Percentile lies in the overflow range
+        return self.max
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add another histogram's values to this one."""
+        for index, bucket_count in enumerate(other._counts):
+            self._counts[index] += bucket_count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def copy(self) -> "LatencyHistogram":
+        """Independent copy of this histogram."""
+        clone = LatencyHistogram()
+        clone.merge(self)
+        return clone
+
+    def reset(self) -> None:
+        """Forget all recorded values."""
+        self._counts = [0] * len(self._counts)
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def cumulative_buckets(self) -> Iterator[Tuple[float, int]]:
+        """Cumulative counts at each octave boundary, for histogram export.
+
+        Octave boundaries are fixed, so exported bucket sets stay the same
+        from scrape to scrape.
+
+        Yields:
+            (upper bound in seconds, number of durations at or below it)
+        """
+        seen = 0
+        for octave in range(self.MAX_EXPONENT - self.MIN_EXPONENT):
+            start = octave * self.SUB_BUCKETS
+            seen += sum(self._counts[start : start + self.SUB_BUCKETS])
+            yield 2.0 ** (self.MIN_EXPONENT + octave + 1), seen
+
+    def summary(self) -> Dict[str, float]:
+        """Count, mean, percentiles and max, in seconds."""
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": self.max,
+        }
+
+    def _index(self, value: float) -> int:
+        """Bucket index of a duration (``len(_counts)`` for overflow)."""
+        if value <= 0:
+            return 0
+        mantissa, exponent = math.frexp(value)  # value = mantissa * 2**exponent
+        octave = exponent - 1 - self.MIN_EXPONENT
+        if octave < 0:
+            return 0
+        if octave >= self.MAX_EXPONENT - self.MIN_EXPONENT:
+            return len(self._counts)
+        sub_bucket = int((mantissa * 2 - 1) * self.SUB_BUCKETS)
+        return octave * self.SUB_BUCKETS + sub_bucket
+
+    def _upper_bound(self, index: int) -> float:
+        """Largest duration that falls in a bucket."""
+        octave, sub_bucket = divmod(index, self.SUB_BUCKETS)
+        base = 2.0 ** (self.MIN_EXPONENT + octave)
+        return base * (1 + (sub_bucket + 1) / self.SUB_BUCKETS)
@@ -10,23 +10,62 @@ This module provides utilities for tracking application performance including:
 - System resource utilization
 - Performance metrics collection and reporting
 - Debug mode performance dashboard data
+- Per-operation latency histograms with OpenMetrics and JSON export
+
+Measuring an operation can cost more than the operation itself: a full
+measurement takes two memory snapshots (psutil queries and a count of every
+object on the heap). ``MonitoringTier`` selects how much is recorded:
+
+- ``COUNTERS``: call count, failures and monotonic duration per operation
+- ``SAMPLED``: counters, plus full metrics for 1 in ``sample_rate`` calls
+  of each operation (the first call is always sampled)
+- ``FULL``: full metrics for every call
+
+The global monitor uses ``SAMPLED``, which is cheap enough to leave on.
+Per-call overhead of each tier is measured by
+``tests/performance/test_monitoring_overhead.py``.
+
+In every tier each call is also recorded in a fixed-size latency histogram
+per operation name, which provides p50/p90/p99/max and exports in
+OpenMetrics text format. Only the most recent ``max_operations`` full
+measurements are kept, so memory stays bounded in long sessions.
+
+Allocation profiling is opt-in (``trace_allocations`` or
+``enable_allocation_tracing()``). While it is on, every fully measured call
+also compares ``tracemalloc`` snapshots taken around the operation and keeps
+the top allocation sites by size delta, with their tracebacks. Snapshots are
+process-wide, so allocations made by other threads during the operation are
+included, and tracemalloc slows every allocation while it runs: use it to
+hunt a specific regression, not as an always-on setting.
 """
 
 import gc
 import os
 import threading
 import time
+import tracemalloc
 from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
 
 import psutil
 
+from create_project.utils.histogram import LatencyHistogram
 from create_project.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+class MonitoringTier(Enum):
+    """How much is recorded per measured operation, cheapest first."""
+
+    COUNTERS = "counters"
+    SAMPLED = "sampled"
+    FULL = "full"
+
+
 @dataclass
 class MemorySnapshot:
     """Memory usage snapshot at a point in time."""
@@ -40,6 +79,22 @@ class MemorySnapshot:
     gc_stats: Dict[str, int]  # Garbage collection statistics
 
 
+@dataclass
+class AllocationSite:
+    """Change in traced allocations at one site during an operation."""
+
+    filename: str
+    lineno: int
+    size_diff: int  # Bytes allocated (negative when freed)
+    count_diff: int  # Memory blocks allocated (negative when freed)
+    traceback: List[str] = field(default_factory=list)  # "file:line", oldest first
+
+    @property
+    def location(self) -> str:
+        """Site as ``file:line``."""
+        return f"{self.filename}:{self.lineno}"
+
+
 @dataclass
 class OperationMetrics:
     """Metrics for a single operation."""
@@ -55,6 +110,23 @@ class OperationMetrics:
     success: bool = True
     error_message: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    allocations: List[AllocationSite] = field(default_factory=list)
+
+
+@dataclass
+class OperationStats:
+    """Running counters for all calls of one operation."""
+
+    operation_name: str
+    count: int = 0
+    failures: int = 0
+    total_duration: float = 0.0
+    max_duration: float = 0.0
+
+    @property
+    def mean_duration(self) -> float:
+        """Mean duration in seconds."""
+        return self.total_duration / self.count if self.count else 0.0
 
 
 @dataclass
@@ -71,6 +143,8 @@ class PerformanceReport:
     avg_cpu_percent: float
     gc_collections: int
     system_info: Dict[str, Any]
+    operation_stats: Dict[str, OperationStats] = field(default_factory=dict)
+    latency: Dict[str, Dict[str, float]] = field(default_factory=dict)
 
 
 class PerformanceMonitor:
@@ -81,17 +155,50 @@ class PerformanceMonitor:
     during application execution.
     """
 
-    def __init__(self, enabled: bool = True):
+    DEFAULT_SAMPLE_RATE = 100
+    DEFAULT_MAX_OPERATIONS = 1000
+    DEFAULT_ALLOCATION_TOP_N = 10
+    DEFAULT_TRACEBACK_DEPTH = 5
+
+    # OpenMetrics metric family names
+    METRIC_PREFIX = "create_project_operation"
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        tier: Union[MonitoringTier, str] = MonitoringTier.FULL,
+        sample_rate: int = DEFAULT_SAMPLE_RATE,
+        max_operations: int = DEFAULT_MAX_OPERATIONS,
+        trace_allocations: bool = False,
+        allocation_top_n: int = DEFAULT_ALLOCATION_TOP_N,
+        traceback_depth: int = DEFAULT_TRACEBACK_DEPTH,
+    ):
         """
         Initialize performance monitor.
         
         Args:
             enabled: Whether to enable performance monitoring
+            tier: How much to record per measured operation
+            sample_rate: Calls per full measurement in the sampled tier
+            max_operations: Most recent full measurements kept
+            trace_allocations: Whether to record top allocation sites per
+                fully measured call with tracemalloc
+            allocation_top_n: Allocation sites kept per operation
+            traceback_depth: Frames stored per allocation traceback
         """
         self.enabled = enabled
+        self.tier = MonitoringTier(tier)
+        self.sample_rate = max(1, sample_rate)
+        self.max_operations = max(1, max_operations)
         self.operations: List[OperationMetrics] = []
+        self._stats: Dict[str, OperationStats] = {}
+        self._histograms: Dict[str, LatencyHistogram] = {}
         self.start_time = time.time()
         self._lock = threading.Lock()
+        self.trace_allocations = False
+        self.allocation_top_n = max(1, allocation_top_n)
+        self.traceback_depth = max(1, traceback_depth)
+        self._started_tracemalloc = False
 
         # System info
         try:
@@ -102,6 +209,9 @@ class PerformanceMonitor:
 
         self.system_info = self._get_system_info()
 
+        if trace_allocations:
+            self.start_allocation_tracing()
+
         logger.debug(f"Performance monitor initialized (enabled: {enabled})")
 
     def _get_system_info(self) -> Dict[str, Any]:
@@ -178,11 +288,85 @@ class PerformanceMonitor:
             logger.error(f"Failed to take memory snapshot: {e}")
             return MemorySnapshot(time.time(), 0, 0, 0, 0, 0, {"error": str(e)})
 
+    def start_allocation_tracing(
+        self,
+        top_n: Optional[int] = None,
+        traceback_depth: Optional[int] = None,
+    ) -> None:
+        """
+        Record top allocation sites for fully measured calls.
+        
+        Starts tracemalloc unless it is already running, in which case its
+        existing traceback limit is kept.
+        
+        Args:
+            top_n: Allocation sites kept per operation
+            traceback_depth: Frames stored per allocation traceback
+        """
+        if top_n is not None:
+            self.allocation_top_n = max(1, top_n)
+        if traceback_depth is not None:
+            self.traceback_depth = max(1, traceback_depth)
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.traceback_depth)
+            self._started_tracemalloc = True
+        self.trace_allocations = True
+        logger.debug(
+            f"Allocation tracing enabled (top {self.allocation_top_n}, "
+            f"depth {tracemalloc.get_traceback_limit()})"
+        )
+
+    def stop_allocation_tracing(self) -> None:
+        """Stop recording allocation sites (and tracemalloc, if started here)."""
+        self.trace_allocations = False
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        logger.debug("Allocation tracing disabled")
+
+    def _allocation_sites(
+        self, before: tracemalloc.Snapshot, after: tracemalloc.Snapshot
+    ) -> List[AllocationSite]:
+        """Top allocation sites by size delta between two snapshots."""
+        # Leave out tracemalloc's own bookkeeping and the monitor's
+        ignored = (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__, all_frames=True),
+        )
+        key_type = "traceback" if self.traceback_depth > 1 else "lineno"
+        differences = after.filter_traces(ignored).compare_to(
+            before.filter_traces(ignored), key_type
+        )
+
+        sites = []
+        for difference in differences:
+            if difference.size_diff == 0:
+                continue
+            frames = list(difference.traceback)[-self.traceback_depth :]
+            site = frames[-1]
+            sites.append(
+                AllocationSite(
+                    filename=site.filename,
+                    lineno=site.lineno,
+                    size_diff=difference.size_diff,
+                    count_diff=difference.count_diff,
+                    traceback=[f"{frame.filename}:{frame.lineno}" for frame in frames],
+                )
+            )
+            if len(sites) == self.allocation_top_n:
+                break
+        return sites
+
     @contextmanager
     def measure_operation(self, operation_name: str, metadata: Optional[Dict[str, Any]] = None):
         """
         Context manager to measure operation performance.
         
+        Every call updates the operation's counters; whether it also gets
+        memory snapshots and CPU usage depends on ``tier``. Fully measured
+        calls also record top allocation sites while allocation tracing is
+        on.
+        
         Args:
             operation_name: Name of the operation being measured
             metadata: Additional metadata about the operation
@@ -196,13 +380,21 @@ class PerformanceMonitor:
             yield
             return
 
-        metadata = metadata or {}
-        start_time = time.time()
-        memory_before = self.take_memory_snapshot()
-        cpu_before = self.process.cpu_percent()
+        sampled = self._start_call(operation_name)
+        if sampled:
+            metadata = metadata or {}
+            start_time = time.time()
+            memory_before = self.take_memory_snapshot()
+            cpu_before = self.process.cpu_percent()
+            allocations_before = (
+                tracemalloc.take_snapshot()
+                if self.trace_allocations and tracemalloc.is_tracing()
+                else None
+            )
 
         error_message = None
         success = True
+        started = time.perf_counter()
 
         try:
             yield
@@ -212,38 +404,217 @@ class PerformanceMonitor:
             logger.error(f"Operation '{operation_name}' failed: {e}")
             raise
         finally:
-            end_time = time.time()
-            memory_after = self.take_memory_snapshot()
-            cpu_after = self.process.cpu_percent()
-
-            # Calculate metrics
-            duration = end_time - start_time
-            memory_delta = memory_after.rss_mb - memory_before.rss_mb
-            avg_cpu = (cpu_before + cpu_after) / 2
-
-            # Create operation metrics
-            metrics = OperationMetrics(
-                operation_name=operation_name,
-                start_time=start_time,
-                end_time=end_time,
-                duration=duration,
-                memory_before=memory_before,
-                memory_after=memory_after,
-                memory_delta=memory_delta,
-                cpu_percent=avg_cpu,
-                success=success,
-                error_message=error_message,
-                metadata=metadata
-            )
+            duration = time.perf_counter() - started
+            allocations = []
+            if sampled and allocations_before is not None and tracemalloc.is_tracing():
+                allocations = self._allocation_sites(
+                    allocations_before, tracemalloc.take_snapshot()
+                )
+            self._finish_call(operation_name, duration, success)
+            if sampled:
+                self._record_metrics(
+                    operation_name,
+                    start_time,
+                    duration,
+                    memory_before,
+                    cpu_before,
+                    success,
+                    error_message,
+                    metadata,
+                    allocations,
+                )
 
-            # Store metrics thread-safely
-            with self._lock:
-                self.operations.append(metrics)
+    def record_duration(
+        self, operation_name: str, duration: float, success: bool = True
+    ) -> None:
+        """
+        Record a duration measured elsewhere.
 
-            logger.info(
-                f"Operation '{operation_name}' completed in {duration:.3f}s "
-                f"(memory: {memory_delta:+.2f}MB, CPU: {avg_cpu:.1f}%)"
-            )
+        Only the operation's counters and latency histogram are updated (no
+        snapshots, in any tier), so this is cheap enough to call for every
+        token of a streamed response.
+
+        Args:
+            operation_name: Name of the operation
+            duration: Duration in seconds
+            success: Whether the operation succeeded
+        """
+        if self.enabled:
+            self._finish_call(operation_name, duration, success)
+
+    def _start_call(self, operation_name: str) -> bool:
+        """Count a call and decide whether it gets full metrics."""
+        if self.tier is MonitoringTier.FULL:
+            return True
+        if self.tier is MonitoringTier.COUNTERS:
+            return False
+
+        with self._lock:
+            stats = self._stats.get(operation_name)
+            calls = stats.count if stats is not None else 0
+        return calls % self.sample_rate == 0
+
+    def _finish_call(self, operation_name: str, duration: float, success: bool) -> None:
+        """Update the counters of an operation."""
+        with self._lock:
+            stats = self._stats.get(operation_name)
+            if stats is None:
+                stats = self._stats[operation_name] = OperationStats(operation_name)
+                self._histograms[operation_name] = LatencyHistogram()
+            self._histograms[operation_name].record(duration)
+            stats.count += 1
+            stats.total_duration += duration
+            if duration > stats.max_duration:
+                stats.max_duration = duration
+            if not success:
+                stats.failures += 1
+
+    def _record_metrics(
+        self,
+        operation_name: str,
+        start_time: float,
+        duration: float,
+        memory_before: MemorySnapshot,
+        cpu_before: float,
+        success: bool,
+        error_message: Optional[str],
+        metadata: Dict[str, Any],
+        allocations: Optional[List[AllocationSite]] = None,
+    ) -> None:
+        """Take the closing snapshot and store full metrics for one call."""
+        memory_after = self.take_memory_snapshot()
+        cpu_after = self.process.cpu_percent()
+
+        # Calculate metrics
+        memory_delta = memory_after.rss_mb - memory_before.rss_mb
+        avg_cpu = (cpu_before + cpu_after) / 2
+
+        # Create operation metrics
+        metrics = OperationMetrics(
+            operation_name=operation_name,
+            start_time=start_time,
+            end_time=start_time + duration,
+            duration=duration,
+            memory_before=memory_before,
+            memory_after=memory_after,
+            memory_delta=memory_delta,
+            cpu_percent=avg_cpu,
+            success=success,
+            error_message=error_message,
+            metadata=metadata,
+            allocations=allocations or [],
+        )
+
+        # Store metrics thread-safely
+        with self._lock:
+            self.operations.append(metrics)
+            if len(self.operations) > self.max_operations:
+                del self.operations[: len(self.operations) - self.max_operations]
+
+        logger.info(
+            f"Operation '{operation_name}' completed in {duration:.3f}s "
+            f"(memory: {memory_delta:+.2f}MB, CPU: {avg_cpu:.1f}%)"
+        )
+
+    def get_operation_stats(self) -> Dict[str, OperationStats]:
+        """Get counters for every measured operation, in all tiers."""
+        with self._lock:
+            return {
+                name: OperationStats(**vars(stats)) for name, stats in self._stats.items()
+            }
+
+    def get_latency_histograms(self) -> Dict[str, LatencyHistogram]:
+        """Get copies of the latency histogram of every measured operation."""
+        with self._lock:
+            return {name: hist.copy() for name, hist in self._histograms.items()}
+
+    def get_latency_summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get latency percentiles per operation, as JSON-ready data.
+        
+        Returns:
+            Mapping of operation name to count, failures, and mean, p50,
+            p90, p99 and max durations in seconds
+        """
+        stats = self.get_operation_stats()
+        return {
+            name: {**hist.summary(), "failures": stats[name].failures}
+            for name, hist in sorted(self.get_latency_histograms().items())
+        }
+
+    def to_openmetrics(self) -> str:
+        """
+        Render operation latencies in OpenMetrics text format.
+        
+        Exports a histogram with fixed power-of-two buckets, a summary with
+        p50/p90/p99 quantiles and a failure counter, each labelled with the
+        operation name.
+        
+        Returns:
+            OpenMetrics exposition text, ending with ``# EOF``
+        """
+        histograms = self.get_latency_histograms()
+        stats = self.get_operation_stats()
+        duration = f"{self.METRIC_PREFIX}_duration_seconds"
+        latency = f"{self.METRIC_PREFIX}_latency_seconds"
+        failures = f"{self.METRIC_PREFIX}_failures"
+
+        lines = [
+            f"# TYPE {duration} histogram",
+            f"# UNIT {duration} seconds",
+            f"# HELP {duration} Duration of measured operations.",
+        ]
+        for name, hist in sorted(histograms.items()):
+            label = f'operation="{_escape_label(name)}"'
+            for bound, cumulative in hist.cumulative_buckets():
+                lines.append(f'{duration}_bucket{{{label},le="{bound!r}"}} {cumulative}')
+            lines.append(f'{duration}_bucket{{{label},le="+Inf"}} {hist.count}')
+            lines.append(f"{duration}_count{{{label}}} {hist.count}")
+            lines.append(f"{duration}_sum{{{label}}} {hist.total!r}")
+
+        lines += [
+            f"# TYPE {latency} summary",
+            f"# UNIT {latency} seconds",
+            f"# HELP {latency} Latency percentiles of measured operations.",
+        ]
+        for name, hist in sorted(histograms.items()):
+            label = f'operation="{_escape_label(name)}"'
+            for quantile in (0.5, 0.9, 0.99):
+                value = hist.percentile(quantile * 100)
+                lines.append(f'{latency}{{{label},quantile="{quantile}"}} {value!r}')
+            lines.append(f"{latency}_count{{{label}}} {hist.count}")
+            lines.append(f"{latency}_sum{{{label}}} {hist.total!r}")
+
+        lines += [
+            f"# TYPE {failures} counter",
+            f"# HELP {failures} Measured operations that raised.",
+        ]
+        for name, operation_stats in sorted(stats.items()):
+            label = f'operation="{_escape_label(name)}"'
+            lines.append(f"{failures}_total{{{label}}} {operation_stats.failures}")
+
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def write_openmetrics(self, path: Union[str, Path]) -> Path:
+        """
+        Write operation latencies to an OpenMetrics text file.
+        
+        The file is replaced atomically, so a node exporter textfile
+        collector never reads a partial file.
+        
+        Args:
+            path: Output file path
+            
+        Returns:
+            Path that was written
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        temp_path.write_text(self.to_openmetrics(), encoding="utf-8")
+        os.replace(temp_path, path)
+        return path
 
     def get_peak_memory(self) -> float:
         """Get peak memory usage across all operations."""
@@ -289,29 +660,34 @@ class PerformanceMonitor:
             start_time=self.start_time,
             end_time=end_time,
             total_duration=total_duration,
-            operations=self.operations.copy(),
+            operations=list(self.operations),
             peak_memory_mb=self.get_peak_memory(),
             total_memory_delta=self.get_total_memory_delta(),
             avg_cpu_percent=self.get_average_cpu(),
             gc_collections=gc_collections,
-            system_info=self.system_info
+            system_info=self.system_info,
+            operation_stats=self.get_operation_stats(),
+            latency=self.get_latency_summary(),
         )
 
     def reset(self):
         """Reset all performance data."""
         with self._lock:
             self.operations.clear()
+            self._stats.clear()
+            self._histograms.clear()
             self.start_time = time.time()
         logger.debug("Performance monitor reset")
 
     def log_summary(self):
         """Log performance summary to logger."""
-        if not self.enabled or not self.operations:
+        if not self.enabled or not (self.operations or self._stats):
             return
 
         report = self.generate_report()
 
         logger.info("Performance Summary:")
+        logger.info(f"  Measured calls: {sum(s.count for s in self.get_operation_stats().values())}")
         logger.info(f"  Total operations: {len(report.operations)}")
         logger.info(f"  Total duration: {report.total_duration:.3f}s")
         logger.info(f"  Peak memory: {report.peak_memory_mb:.2f}MB")
@@ -326,6 +702,11 @@ class PerformanceMonitor:
                 logger.info(f"    {op.operation_name}: {op.duration:.3f}s")
 
 
+def _escape_label(value: str) -> str:
+    """Escape an OpenMetrics label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
 # Global performance monitor instance
 _global_monitor: Optional[PerformanceMonitor] = None
 
@@ -334,14 +715,21 @@ def get_monitor() -> PerformanceMonitor:
     """Get the global performance monitor instance."""
     global _global_monitor
     if _global_monitor is None:
-        _global_monitor = PerformanceMonitor()
+        _global_monitor = PerformanceMonitor(tier=MonitoringTier.SAMPLED)
     return _global_monitor
 
 
-def enable_monitoring():
-    """Enable global performance monitoring."""
+def enable_monitoring(tier: Optional[Union[MonitoringTier, str]] = None):
+    """
+    Enable global performance monitoring.
+
+    Args:
+        tier: Optional tier to switch to (keeps the current tier if None)
+    """
     monitor = get_monitor()
     monitor.enabled = True
+    if tier is not None:
+        monitor.tier = MonitoringTier(tier)
     logger.info("Performance monitoring enabled")
 
 
@@ -352,6 +740,26 @@ def disable_monitoring():
     logger.info("Performance monitoring disabled")
 
 
+def enable_allocation_tracing(
+    top_n: Optional[int] = None, traceback_depth: Optional[int] = None
+):
+    """
+    Record top allocation sites for operations measured by the global monitor.
+
+    Args:
+        top_n: Allocation sites kept per operation
+        traceback_depth: Frames stored per allocation traceback
+    """
+    get_monitor().start_allocation_tracing(top_n, traceback_depth)
+    logger.info("Allocation tracing enabled")
+
+
+def disable_allocation_tracing():
+    """Stop recording allocation sites on the global monitor."""
+    get_monitor().stop_allocation_tracing()
+    logger.info("Allocation tracing disabled")
+
+
 def measure_operation(operation_name: str, metadata: Optional[Dict[str, Any]] = None):
     """
     Decorator/context manager for measuring operation performance.
@@ -386,3 +794,8 @@ def log_performance_summary():
 def reset_monitoring():
     """Reset global performance monitoring data."""
     get_monitor().reset()
+
+
+def export_openmetrics(path: Union[str, Path]) -> Path:
+    """Write global operation latencies to an OpenMetrics text file."""
+    return get_monitor().write_openmetrics(path)
@@ -0,0 +1,401 @@
+# ABOUTME: Lightweight hierarchical tracing with Chrome trace-event export
+# ABOUTME: Records nested spans across threads for inspecting a single generation
+
+"""
+Tracing module.
+
+This module provides the Tracer class which records nested, timed spans
+(generation phases, per-file renders, subprocess runs, AI requests) and
+exports them as Chrome trace-event JSON. The file opens in
+``chrome://tracing`` and in the Perfetto UI (https://ui.perfetto.dev), so a
+single slow generation can be inspected on a timeline.
+
+The current span is kept in a context variable. Work handed to another
+thread keeps its parent when the callable is wrapped with ``propagate()``;
+ThreadingModel, OperationScheduler and the post-command pool do this.
+
+Tracing is off by default. While disabled, ``span()`` returns a shared no-op
+context manager and ``traced`` functions call straight through, so
+instrumented code costs one attribute check.
+"""
+
+import contextvars
+import functools
+import inspect
+import itertools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+)
+
+from create_project.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclass
+class Span:
+    """A timed, named unit of work."""
+
+    name: str
+    category: str
+    span_id: int
+    parent_id: Optional[int]
+    start_ns: int
+    thread_id: int
+    thread_name: str
+    end_ns: Optional[int] = None
+    args: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def duration(self) -> float:
+        """Duration in seconds (0 while the span is open)."""
+        if self.end_ns is None:
+            return 0.0
+        return (self.end_ns - self.start_ns) / 1e9
+
+    def set(self, **args: Any) -> None:
+        """Attach attributes discovered while the span is open."""
+        self.args.update(args)
+
+
+class _NullSpan:
+    """No-op stand-in returned while tracing is disabled."""
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar(
+    "create_project_current_span", default=None
+)
+
+
+class Tracer:
+    """Collects spans and exports them as Chrome trace events.
+
+    Attributes:
+        enabled: Whether spans are recorded
+        max_spans: Number of most recent finished spans kept
+        dropped: Finished spans discarded because the buffer was full
+    """
+
+    DEFAULT_MAX_SPANS = 100_000
+
+    def __init__(
+        self, enabled: bool = False, max_spans: int = DEFAULT_MAX_SPANS
+    ) -> None:
+        """Initialize the tracer.
+
+        Args:
+            enabled: Whether to start recording immediately
+            max_spans: Number of most recent finished spans kept
+        """
+        self.enabled = enabled
+        self.max_spans = max_spans
+        self.dropped = 0
+        self._spans: Deque[Span] = deque(maxlen=max_spans)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._origin_ns = time.perf_counter_ns()
+
+    @contextmanager
+    def _record(self, name: str, category: str, args: Dict[str, Any]) -> Iterator[Span]:
+        """Open a span as a child of the current one and close it on exit."""
+        parent = _current_span.get()
+        thread = threading.current_thread()
+        span = Span(
+            name=name,
+            category=category,
+            span_id=next(self._ids),
+            parent_id=parent.span_id if parent is not None else None,
+            start_ns=time.perf_counter_ns(),
+            thread_id=threading.get_native_id(),
+            thread_name=thread.name,
+            args=args,
+        )
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            span.end_ns = time.perf_counter_ns()
+            _current_span.reset(token)
+            with self._lock:
+                if len(self._spans) == self.max_spans:
+                    self.dropped += 1
+                self._spans.append(span)
+
+    def span(self, name: str, category: str = "app", **args: Any):
+        """Context manager timing a block as a span.
+
+        Args:
+            name: Span name shown on the timeline
+            category: Trace category (e.g. ``generator``, ``render``)
+            **args: Attributes shown with the span
+
+        Returns:
+            Context manager yielding the Span, or None while disabled
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return self._record(name, category, args)
+
+    def spans(self) -> List[Span]:
+        """Finished spans, in the order they ended."""
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self) -> None:
+        """Discard recorded spans."""
+        with self._lock:
+            self._spans.clear()
+            self.dropped = 0
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Build a Chrome trace-event document from the recorded spans.
+
+        Spans become complete (``X``) events. A child started on a
+        different thread than its parent is linked to it by a flow arrow.
+
+        Returns:
+            Trace document accepted by chrome://tracing and Perfetto
+        """
+        spans = self.spans()
+        by_id = {span.span_id: span for span in spans}
+        pid = os.getpid()
+
+        def micros(ns: int) -> float:
+            return (ns - self._origin_ns) / 1000.0
+
+        events: List[Dict[str, Any]] = [
+            {
+                "ph": "M",
+                "name": "process_name",
+                "pid": pid,
+                "tid": 0,
+                "args": {"name": "create-project"},
+            }
+        ]
+        for tid, name in sorted({(s.thread_id, s.thread_name) for s in spans}):
+            events.append(
+                {
+                    "ph": "M",
+                    "name": "thread_name",
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"name": name},
+                }
+            )
+
+        for span in sorted(spans, key=lambda s: s.start_ns):
+            args = {key: _json_safe(value) for key, value in span.args.items()}
+            if span.error:
+                args["error"] = span.error
+            events.append(
+                {
+                    "ph": "X",
+                    "name": span.name,
+                    "cat": span.category,
+                    "pid": pid,
+                    "tid": span.thread_id,
+                    "ts": micros(span.start_ns),
+                    "dur": (span.end_ns - span.start_ns) / 1000.0,
+                    "args": args,
+                }
+            )
+
+            parent = by_id.get(span.parent_id)
+            if parent is not None and parent.thread_id != span.thread_id:
+                flow = {
+                    "name": "handoff",
+                    "cat": "flow",
+                    "id": span.span_id,
+                    "pid": pid,
+                }
+                events.append(
+                    {
+                        **flow,
+                        "ph": "s",
+                        "tid": parent.thread_id,
+                        "ts": micros(span.start_ns),
+                    }
+                )
+                events.append(
+                    {
+                        **flow,
+                        "ph": "f",
+                        "bp": "e",
+                        "tid": span.thread_id,
+                        "ts": micros(span.start_ns),
+                    }
+                )
+
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {"dropped_spans": self.dropped},
+        }
+
+    def export(self, path: Union[str, Path]) -> Path:
+        """Write the trace to a JSON file.
+
+        Args:
+            path: Output file (open it in chrome://tracing or ui.perfetto.dev)
+
+        Returns:
+            Path that was written
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_chrome_trace()), encoding="utf-8")
+        logger.info(f"Trace written to {path} ({len(self._spans)} spans)")
+        return path
+
+
+def _json_safe(value: Any) -> Any:
+    """Convert span attributes to JSON values."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+
+def propagate(fn: F) -> F:
+    """Run ``fn`` in a copy of the current context, wherever it is called.
+
+    Wrap callables submitted to other threads so spans they open are
+    children of the submitting span.
+    """
+    context = contextvars.copy_context()
+
+    @functools.wraps(fn)
+    def run_in_context(*args: Any, **kwargs: Any) -> Any:
+        return context.run(fn, *args, **kwargs)
+
+    return run_in_context  # type: ignore[return-value]
+
+
+def traced(
+    name: Optional[str] = None,
+    category: str = "app",
+    capture: Sequence[str] = (),
+) -> Callable[[F], F]:
+    """Decorator recording each call of a function as a span.
+
+    Works on plain and ``async`` functions.
+
+    Args:
+        name: Span name (default: the function's qualified name)
+        category: Trace category
+        capture: Names of call arguments to attach to the span
+    """
+
+    def decorator(fn: F) -> F:
+        span_name = name or fn.__qualname__
+        signature = inspect.signature(fn) if capture else None
+
+        def span_args(args: tuple, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+            if signature is None:
+                return {}
+            bound = signature.bind_partial(*args, **kwargs).arguments
+            return {key: bound[key] for key in capture if key in bound}
+
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                tracer = get_tracer()
+                if not tracer.enabled:
+                    return await fn(*args, **kwargs)
+                with tracer.span(span_name, category, **span_args(args, kwargs)):
+                    return await fn(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            tracer = get_tracer()
+            if not tracer.enabled:
+                return fn(*args, **kwargs)
+            with tracer.span(span_name, category, **span_args(args, kwargs)):
+                return fn(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+# Global tracer instance
+_global_tracer: Optional[Tracer] = None
+_global_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> Tracer:
+    """Get the global tracer, creating a disabled one on first use."""
+    global _global_tracer
+    if _global_tracer is None:
+        with _global_tracer_lock:
+            if _global_tracer is None:
+                _global_tracer = Tracer()
+    return _global_tracer
+
+
+def set_tracer(tracer: Optional[Tracer]) -> None:
+    """Replace the global tracer (None resets it to a disabled default)."""
+    global _global_tracer
+    with _global_tracer_lock:
+        _global_tracer = tracer
+
+
+def current_span() -> Optional[Span]:
+    """The innermost open span in this context, if any."""
+    return _current_span.get()
+
+
+def span(name: str, category: str = "app", **args: Any):
+    """Time a block as a span on the global tracer.
+
+    Usage:
+        with span("render_file", "render", path=str(target)):
+            render()
+    """
+    return get_tracer().span(name, category, **args)
+
+
+def enable_tracing() -> Tracer:
+    """Start recording spans on the global tracer."""
+    tracer = get_tracer()
+    tracer.enabled = True
+    logger.info("Tracing enabled")
+    return tracer
+
+
+def disable_tracing() -> None:
+    """Stop recording spans on the global tracer."""
+    get_tracer().enabled = False
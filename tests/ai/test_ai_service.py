@@ -450,9 +450,12 @@ class TestAIService:
 
         # Mock response generator
         mock_response_generator = AsyncMock()
-        mock_response_generator.generate_response.return_value = (
-            "AI generated help response"
-        )
+
+        async def mock_stream_response(*args, **kwargs):
+            for chunk in ["AI generated ", "help response"]:
+                yield chunk
+
+        mock_response_generator.stream_model_response = mock_stream_response
         self.service._response_generator = mock_response_generator
 
         # Mock cache manager
@@ -525,9 +528,11 @@ class TestAIService:
 
         # Mock response generator
         mock_response_generator = AsyncMock()
-        mock_response_generator.generate_response.return_value = (
-            "AI response without context"
-        )
+
+        async def mock_stream_response(*args, **kwargs):
+            yield "AI response without context"
+
+        mock_response_generator.stream_model_response = mock_stream_response
         self.service._response_generator = mock_response_generator
 
         with patch.object(self.service, "is_available", return_value=True):
@@ -545,7 +550,7 @@ class TestAIService:
 
         # Mock response generator that fails
         mock_response_generator = AsyncMock()
-        mock_response_generator.generate_response.side_effect = Exception(
+        mock_response_generator.stream_model_response.side_effect = Exception(
             "Generation failed"
         )
         self.service._response_generator = mock_response_generator
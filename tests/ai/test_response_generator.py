@@ -35,6 +35,8 @@ class TestResponseGenerator:
         manager = Mock()
         manager.get_available_models = AsyncMock()
         manager.get_models = Mock()  # This is what _select_model actually calls
+        manager.select_fastest_model = Mock(return_value=None)
+        manager.context_token_budget = Mock(return_value=1024)
         return manager
 
     @pytest.fixture
@@ -21,6 +21,7 @@ from create_project.config.models import (
     OllamaConfig,
     TemplateConfig,
     UIConfig,
+    VenvConfig,
     create_default_config,
     validate_config_dict,
 )
@@ -227,6 +228,32 @@ class TestLoggingConfig:
             LoggingConfig(max_files=101)
 
 
+class TestVenvConfig:
+    """Test cases for VenvConfig model."""
+
+    def test_default_values(self):
+        """Test that default values are properly assigned."""
+        config = VenvConfig()
+        assert config.wheelhouse_dir is None
+        assert config.offline is False
+        assert config.package_cache_dir is None
+        assert config.uv_link_mode == "hardlink"
+
+    def test_offline_requires_wheelhouse(self):
+        """Test offline installs are rejected without a wheelhouse."""
+        with pytest.raises(ValidationError):
+            VenvConfig(offline=True)
+
+        config = VenvConfig(offline=True, wheelhouse_dir="/srv/wheels")
+        assert config.offline is True
+
+    def test_user_path_expansion(self):
+        """Test wheelhouse and cache paths expand ~."""
+        config = VenvConfig(wheelhouse_dir="~/wheels", package_cache_dir="~/cache")
+        assert "~" not in config.wheelhouse_dir
+        assert "~" not in config.package_cache_dir
+
+
 class TestConfig:
     """Test cases for the root Config model."""
 
@@ -0,0 +1,56 @@
+# ABOUTME: Root pytest configuration shared by all test packages
+# ABOUTME: Isolates process-wide caches so tests cannot leak state into each other
+
+"""Root pytest configuration.
+
+Tests mock ``shutil.which`` and ``subprocess.run`` to simulate different tool
+installations, so the process-wide tool probe cache is replaced with a fresh,
+test-local instance for every test. The generation phase history is kept in
+memory so test runs do not feed the user's ETA model. AI response caches
+and model latency statistics default to a per-test directory: cache keys
+are stable across runs, so a shared on-disk cache would serve one test's
+responses to another. Project generation does not preload AI models, which
+would start Ollama detection on a background thread while tests patch it.
+"""
+
+import pytest
+
+from create_project.core.phase_history import PhaseHistory, set_phase_history
+from create_project.core.project_generator import ProjectGenerator
+from create_project.core.tool_probe import ToolProbeCache, set_tool_probe_cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_tool_probe_cache(tmp_path_factory):
+    """Give each test its own empty tool probe cache."""
+    cache = ToolProbeCache(cache_dir=tmp_path_factory.mktemp("tool_probes"))
+    set_tool_probe_cache(cache)
+    yield cache
+    set_tool_probe_cache(None)
+
+
+@pytest.fixture(autouse=True)
+def isolated_phase_history():
+    """Give each test its own in-memory phase history."""
+    history = PhaseHistory(persist=False)
+    set_phase_history(history)
+    yield history
+    set_phase_history(None)
+
+
+@pytest.fixture(autouse=True)
+def isolated_ai_response_cache(tmp_path_factory, monkeypatch):
+    """Point the default AI cache directories at a test-local one."""
+    cache_root = tmp_path_factory.mktemp("ai_cache")
+    for module in ("cache_manager", "model_manager"):
+        monkeypatch.setattr(
+            f"create_project.ai.{module}.user_cache_dir",
+            lambda *args, **kwargs: str(cache_root),
+        )
+    return cache_root
+
+
+@pytest.fixture(autouse=True)
+def no_ai_model_prewarm(monkeypatch):
+    """Keep project generation from preloading AI models in the background."""
+    monkeypatch.setattr(ProjectGenerator, "PREWARM_AI_MODEL", False)
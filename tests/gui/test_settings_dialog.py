@@ -207,6 +207,23 @@ class TestSettingsDialog:
         assert settings_dialog.model_combo.itemText(3) == "phi"
         assert settings_dialog.model_combo.itemText(4) == "neural-chat"
 
+    def test_refresh_models_from_cached_catalog(self, settings_dialog):
+        """Test models persisted by the AI service are listed."""
+        cached = [Mock(), Mock()]
+        cached[0].name, cached[1].name = "llama3.2:3b", "qwen2.5-coder:7b"
+
+        with patch(
+            "create_project.gui.dialogs.settings.load_cached_models",
+            return_value=cached,
+        ) as load:
+            settings_dialog._refresh_models()
+
+        load.assert_called_once_with(settings_dialog.ollama_url_edit.text())
+        assert [
+            settings_dialog.model_combo.itemText(i)
+            for i in range(settings_dialog.model_combo.count())
+        ] == ["llama3.2:3b", "qwen2.5-coder:7b"]
+
     def test_test_connection_success(self, settings_dialog, qtbot):
         """Test successful connection test."""
         # Mock requests
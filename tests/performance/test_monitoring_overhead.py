@@ -0,0 +1,51 @@
+# ABOUTME: Microbenchmark of PerformanceMonitor overhead per monitoring tier
+# ABOUTME: Measures the cost of measure_operation around an empty block
+
+"""Microbenchmarks for performance monitoring overhead.
+
+Run with ``pytest tests/performance/test_monitoring_overhead.py
+--benchmark-only`` and compare the mean time per call of each tier against
+the baseline with monitoring disabled. Results are recorded in
+``docs/performance/benchmarks.md``.
+"""
+
+from typing import Any
+
+import pytest
+
+from create_project.utils.performance import MonitoringTier, PerformanceMonitor
+
+
+def measured_noop(monitor: PerformanceMonitor) -> None:
+    """Measure an operation that does nothing."""
+    with monitor.measure_operation("noop"):
+        pass
+
+
+@pytest.mark.benchmark(group="monitoring-overhead")
+def test_overhead_disabled(benchmark: Any) -> None:
+    """Baseline: monitoring disabled."""
+    monitor = PerformanceMonitor(enabled=False)
+
+    benchmark(measured_noop, monitor)
+
+    assert monitor.get_operation_stats() == {}
+
+
+@pytest.mark.benchmark(group="monitoring-overhead")
+@pytest.mark.parametrize(
+    "tier", [MonitoringTier.COUNTERS, MonitoringTier.SAMPLED, MonitoringTier.FULL]
+)
+def test_overhead_per_tier(benchmark: Any, tier: MonitoringTier) -> None:
+    """Per-call overhead of each monitoring tier."""
+    monitor = PerformanceMonitor(enabled=True, tier=tier)
+
+    benchmark(measured_noop, monitor)
+
+    stats = monitor.get_operation_stats()["noop"]
+    if tier is MonitoringTier.COUNTERS:
+        assert monitor.operations == []
+    elif tier is MonitoringTier.FULL:
+        assert len(monitor.operations) == stats.count
+    else:
+        assert len(monitor.operations) < stats.count
@@ -27,7 +27,7 @@ class TestCommandExecutorSecurity:
         executor = CommandExecutor()
         assert executor is not None
 
-    @patch("subprocess.run")
+    @patch("create_project.core.command_executor.run_streaming")
     def test_safe_command_execution(self, mock_run, security_temp_dir):
         """Test that safe commands can be executed."""
         mock_run.return_value.returncode = 0
@@ -174,7 +174,7 @@ class TestVenvManagerSecurity:
 class TestSubprocessSecurityPatterns:
     """Test general subprocess security patterns."""
 
-    @patch("subprocess.run")
+    @patch("create_project.core.command_executor.run_streaming")
     def test_subprocess_call_patterns(self, mock_run):
         """Test that subprocess calls follow secure patterns."""
         mock_run.return_value.returncode = 0
@@ -29,6 +29,19 @@ from tests.unit.ai.mocks import (
 )
 
 
+def streamed(*chunks, first_delay=0.0, error=None):
+    """Stand-in for ``ResponseGenerator.stream_model_response`` counting its calls."""
+
+    async def stream_model_response(**kwargs):
+        await asyncio.sleep(first_delay)
+        for chunk in chunks:
+            yield chunk
+        if error is not None:
+            raise error
+
+    return MagicMock(side_effect=stream_model_response)
+
+
 class TestAIServiceConfig:
     """Test AIServiceConfig dataclass."""
     
@@ -237,6 +250,28 @@ class TestAIService:
                     # Check again to ensure consistency
                     assert await service.is_available() is True
     
+    @pytest.mark.asyncio
+    async def test_prewarm_is_throttled(self, ai_config):
+        """Test a model is preloaded once per keep-alive window."""
+        ai_config.model_keep_alive_minutes = 5
+        generator = MagicMock()
+        generator.prewarm = AsyncMock(return_value="llama3.2:3b")
+
+        def make_service():
+            service = AIService(ai_config=ai_config)
+            service.is_available = AsyncMock(return_value=True)
+            service._response_generator = generator
+            return service
+
+        with patch.dict("create_project.ai.ai_service._preloaded_at", clear=True):
+            assert await make_service().prewarm() == "llama3.2:3b"
+            # A second service for the same Ollama URL does not reload it
+            assert await make_service().prewarm() is None
+            generator.prewarm.assert_awaited_once_with(keep_alive_minutes=5)
+
+            ai_config.model_keep_alive_minutes = 0
+            assert await AIService(ai_config=ai_config).prewarm() is None
+
     @pytest.mark.asyncio
     async def test_get_available_models_not_initialized(self, ai_config):
         """Test getting models when not initialized."""
@@ -323,7 +358,9 @@ class TestAIService:
                         
                         mock_generator = MockGenerator.return_value
                         expected_response = "Generated help response"
-                        mock_generator.generate_response = AsyncMock(return_value=expected_response)
+                        mock_generator.stream_model_response = streamed(
+                            expected_response
+                        )
                         
                         mock_cache = MockCacheManager(always_miss=True)
                         
@@ -342,6 +379,168 @@ class TestAIService:
         assert response == expected_response
         assert mock_put.called
     
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_help_requests_coalesce(self, ai_config, mock_detector, mock_client):
+        """Test identical help requests in flight share one generation."""
+        ai_config.cache_enabled = False
+        service = AIService(ai_config=ai_config)
+
+        with patch("create_project.ai.ai_service.OllamaDetector", return_value=mock_detector):
+            with patch("create_project.ai.ai_service.OllamaClient", return_value=mock_client):
+                with patch("create_project.ai.ai_service.ModelManager") as MockModelManager:
+                    with patch("create_project.ai.ai_service.ResponseGenerator") as MockGenerator:
+                        MockModelManager.return_value.get_models.return_value = []
+                        await service.initialize()
+
+        mock_generator = MockGenerator.return_value
+        mock_generator.stream_model_response = streamed(
+            "Shared help response", first_delay=0.05
+        )
+        service._response_generator = mock_generator
+
+        responses = await asyncio.gather(
+            *(service.generate_help_response(error=OSError(f"disk {n} full")) for n in range(3))
+        )
+
+        assert responses == ["Shared help response"] * 3
+        assert mock_generator.stream_model_response.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_slow_help_response_is_hedged_then_upgraded(self, ai_config, mock_detector, mock_client):
+        """Test a slow model gets a local answer first and caches its own later."""
+        ai_config.hedge_after_seconds = 0.05
+        service = AIService(ai_config=ai_config)
+
+        with patch("create_project.ai.ai_service.OllamaDetector", return_value=mock_detector):
+            with patch("create_project.ai.ai_service.OllamaClient", return_value=mock_client):
+                with patch("create_project.ai.ai_service.ModelManager") as MockModelManager:
+                    with patch("create_project.ai.ai_service.ResponseGenerator") as MockGenerator:
+                        MockModelManager.return_value.get_models.return_value = []
+                        await service.initialize()
+
+        mock_generator = MockGenerator.return_value
+        mock_generator.stream_model_response = streamed(
+            "Model help ", "response", first_delay=0.2
+        )
+        service._response_generator = mock_generator
+        upgraded = asyncio.Event()
+        upgrades = []
+
+        def on_upgrade(response):
+            upgrades.append(response)
+            upgraded.set()
+
+        error = PermissionError("Permission denied: '/srv/project'")
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        response = await service.generate_help_response(error=error, on_upgrade=on_upgrade)
+
+        assert loop.time() - started < 0.2
+        assert "Error Type: PermissionError" in response
+        assert "Related Guidance:" in response
+
+        await asyncio.wait_for(upgraded.wait(), timeout=2)
+        assert upgrades == ["Model help response"]
+        assert await service.generate_help_response(error=error) == "Model help response"
+        assert mock_generator.stream_model_response.call_count == 1
+
+    async def initialized_service(self, ai_config, mock_detector, mock_client):
+        """Initialize a service whose response generator is a mock."""
+        service = AIService(ai_config=ai_config)
+        with patch(
+            "create_project.ai.ai_service.OllamaDetector", return_value=mock_detector
+        ), patch(
+            "create_project.ai.ai_service.OllamaClient", return_value=mock_client
+        ), patch(
+            "create_project.ai.ai_service.ModelManager"
+        ) as model_manager_cls, patch(
+            "create_project.ai.ai_service.ResponseGenerator"
+        ):
+            model_manager_cls.return_value.get_models.return_value = []
+            await service.initialize()
+        return service
+
+    @pytest.mark.asyncio
+    async def test_help_response_is_bounded_by_deadline(
+        self, ai_config, mock_detector, mock_client
+    ):
+        """Test a model that starts in time but finishes late is answered locally."""
+        ai_config.hedge_after_seconds = 0.05
+        ai_config.help_deadline_seconds = 0.1
+        service = await self.initialized_service(ai_config, mock_detector, mock_client)
+
+        async def slow_finish(**kwargs):
+            yield "Model help "
+            await asyncio.sleep(0.3)
+            yield "response"
+
+        service._response_generator.stream_model_response = slow_finish
+        upgraded = asyncio.Event()
+
+        error = PermissionError("Permission denied: '/srv/project'")
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        response = await service.generate_help_response(
+            error=error, on_upgrade=lambda response: upgraded.set()
+        )
+
+        assert loop.time() - started < 0.3
+        assert "Error Type: PermissionError" in response
+        await asyncio.wait_for(upgraded.wait(), timeout=2)
+        cached = await service.generate_help_response(error=error)
+        assert cached == "Model help response"
+
+    @pytest.mark.asyncio
+    async def test_rejected_help_response_is_not_cached(
+        self, ai_config, mock_detector, mock_client
+    ):
+        """Test a response failing the quality check yields the local answer."""
+        service = await self.initialized_service(ai_config, mock_detector, mock_client)
+        service._response_generator.stream_model_response = streamed(
+            "ok", error=AIError("Response failed quality check")
+        )
+
+        error = ValueError("bad value")
+        response = await service.generate_help_response(error=error)
+
+        assert "Error Type: ValueError" in response
+        cache_key = service._help_cache_key(error, None, None)
+        assert service._cache_manager.get(cache_key) is None
+
+    @pytest.mark.asyncio
+    async def test_slow_help_stream_leads_with_local_answer(self, ai_config, mock_detector, mock_client):
+        """Test a stream that starts slowly is preceded by a local answer."""
+        from create_project.ai.hedging import UPGRADE_SEPARATOR
+
+        ai_config.hedge_after_seconds = 0.05
+        ai_config.context_collection_enabled = False
+        service = AIService(ai_config=ai_config)
+
+        with patch("create_project.ai.ai_service.OllamaDetector", return_value=mock_detector):
+            with patch("create_project.ai.ai_service.OllamaClient", return_value=mock_client):
+                with patch("create_project.ai.ai_service.ModelManager") as MockModelManager:
+                    with patch("create_project.ai.ai_service.ResponseGenerator") as MockGenerator:
+                        MockModelManager.return_value.get_models.return_value = []
+                        await service.initialize()
+
+        async def slow_stream(**kwargs):
+            await asyncio.sleep(0.2)
+            yield "model "
+            yield "answer"
+
+        mock_generator = MockGenerator.return_value
+        mock_generator.stream_response = slow_stream
+        service._response_generator = mock_generator
+
+        chunks = [
+            chunk async for chunk in service.stream_help_response(error=ValueError("bad value"))
+        ]
+
+        assert "Error Type: ValueError" in chunks[0]
+        assert chunks[1:] == [UPGRADE_SEPARATOR, "model ", "answer"]
+        cache_key = service._help_cache_key(ValueError("bad value"), None, None)
+        assert service._cache_manager.get(cache_key) == "model answer"
+
     @pytest.mark.asyncio
     async def test_generate_help_response_with_error_context(self, ai_config, mock_detector, mock_client):
         """Test generating help response with error context."""
@@ -357,7 +556,9 @@ class TestAIService:
                         
                         mock_generator = MockGenerator.return_value
                         expected_response = "Generated help response with context"
-                        mock_generator.generate_response = AsyncMock(return_value=expected_response)
+                        mock_generator.stream_model_response = streamed(
+                            expected_response
+                        )
                         
                         mock_context = MockContextCollector()
                         
@@ -391,7 +592,9 @@ class TestAIService:
                         
                         mock_generator = MockGenerator.return_value
                         expected_response = "Template help response"
-                        mock_generator.generate_response = AsyncMock(return_value=expected_response)
+                        mock_generator.stream_model_response = streamed(
+                            expected_response
+                        )
                         
                         await service.initialize()
                         service._response_generator = mock_generator
@@ -423,8 +626,8 @@ class TestAIService:
                         mock_manager.get_models.return_value = []
                         
                         mock_generator = MockGenerator.return_value
-                        mock_generator.generate_response = AsyncMock(
-                            side_effect=AIError("Connection failed")
+                        mock_generator.stream_model_response = streamed(
+                            error=AIError("Connection failed")
                         )
                         
                         await service.initialize()
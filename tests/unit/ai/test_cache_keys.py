@@ -0,0 +1,116 @@
+# ABOUTME: Unit tests for AI help response cache key derivation
+# ABOUTME: Tests error message normalization and cross-run key stability
+
+"""Unit tests for cache_keys module."""
+
+import subprocess
+import sys
+
+from create_project.ai.cache_keys import (
+    KEY_VERSION,
+    error_help_cache_params,
+    normalize_error_message,
+)
+from create_project.ai.cache_manager import ResponseCacheManager
+from create_project.ai.context_collector import ErrorContextCollector
+
+
+def raise_and_collect(message, target_path, options):
+    """Raise an error and collect its context."""
+    try:
+        raise FileExistsError(message)
+    except FileExistsError as error:
+        context = ErrorContextCollector().collect_context(
+            error=error,
+            target_path=target_path,
+            project_variables={"project_name": target_path.name},
+            options=options,
+            attempted_operations=["create_directories"],
+        )
+        return error, context
+
+
+class TestNormalizeErrorMessage:
+    """Test error message normalization."""
+
+    def test_volatile_details_are_masked(self):
+        """Test paths, temp dirs, numbers, addresses and UUIDs are masked."""
+        message = (
+            "Worker 4242 at 0x7f3a2b1c0d90 failed for job "
+            "123e4567-e89b-12d3-a456-426614174000 in /tmp/tmpab12cd/demo "
+            "writing '/home/alice/demo/setup.py'"
+        )
+
+        assert normalize_error_message(message) == (
+            "Worker <n> at <addr> failed for job <uuid> in <tmp> writing '<path>'"
+        )
+
+    def test_windows_paths(self):
+        """Test Windows temp dirs and drive paths are masked."""
+        message = r"C:\Users\bob\AppData\Local\Temp\x1\p and D:\work\proj"
+
+        assert normalize_error_message(message) == "<tmp> and <path>"
+
+    def test_words_are_kept(self):
+        """Test the descriptive part of a message survives."""
+        assert normalize_error_message("Invalid  value for project_name") == (
+            "Invalid value for project_name"
+        )
+
+
+class TestErrorHelpCacheParams:
+    """Test cache key parameters for error help."""
+
+    def test_same_failure_class_same_key(self, tmp_path):
+        """Test failures differing only in paths and numbers share a key."""
+        cache = ResponseCacheManager(cache_dir=tmp_path, auto_persist=False)
+        failures = [
+            raise_and_collect(
+                f"Directory {tmp_path / name} exists (pid {pid})",
+                tmp_path / name,
+                {"git": pid > 150},
+            )
+            for name, pid in (("one", 100), ("two", 200))
+        ]
+
+        keys = {
+            cache.generate_key(**error_help_cache_params(*failure))
+            for failure in failures
+        }
+
+        assert len(keys) == 1
+
+    def test_different_failures_differ(self, tmp_path):
+        """Test error type, template and context changes change the key."""
+        error, context = raise_and_collect("Directory exists", tmp_path, {"git": True})
+        _, other = raise_and_collect("Directory exists", tmp_path, {"venv": True})
+        value_error = ValueError("Directory exists")
+
+        base = error_help_cache_params(error, context, "python_library")
+
+        assert base["key_version"] == KEY_VERSION
+        assert base != error_help_cache_params(value_error, context, "python_library")
+        assert base != error_help_cache_params(error, context, "cli_app")
+        assert base != error_help_cache_params(error, other, "python_library")
+        assert error_help_cache_params(error)["context_hash"] is None
+
+    def test_key_is_stable_across_processes(self, tmp_path):
+        """Test the key does not depend on per-process hash randomization."""
+        script = (
+            "from create_project.ai.cache_keys import error_help_cache_params;"
+            "from create_project.ai.cache_manager import ResponseCacheManager;"
+            f"cache = ResponseCacheManager(cache_dir={str(tmp_path)!r});"
+            "print(cache.generate_key(**error_help_cache_params(OSError('disk full'))))"
+        )
+
+        keys = {
+            subprocess.run(
+                [sys.executable, "-c", script],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.splitlines()[-1]
+            for _ in range(2)
+        }
+
+        assert len(keys) == 1
@@ -0,0 +1,168 @@
+# ABOUTME: Unit tests for the SQLite cache store and the SQLite cache backend
+# ABOUTME: Tests incremental writes, lazy loading, batched access counts and sharing
+
+"""Unit tests for SQLite response cache storage."""
+
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from create_project.ai.cache_manager import CacheEntry, ResponseCacheManager
+from create_project.ai.cache_store import SQLiteCacheStore
+
+
+def make_entry(key, value="value", hours=1):
+    """Create a cache entry expiring in ``hours``."""
+    now = datetime.now()
+    return CacheEntry(
+        key=key, value=value, created_at=now, expires_at=now + timedelta(hours=hours)
+    )
+
+
+class TestSQLiteCacheStore:
+    """Test SQLiteCacheStore."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        """Create a store in a temporary directory."""
+        store = SQLiteCacheStore(tmp_path / "cache.db")
+        yield store
+        store.close()
+
+    def test_put_and_get(self, store):
+        """Test entries round-trip with their metadata."""
+        entry = make_entry("key", {"text": "answer", "tokens": [1, 2]})
+        store.put(entry)
+
+        assert CacheEntry(*store.get("key")) == entry
+        assert store.get("missing") is None
+        assert store.count() == 1
+
+    def test_wal_mode(self, store):
+        """Test the database uses write-ahead logging."""
+        assert store._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_record_accesses_adds_counts(self, store, tmp_path):
+        """Test access counts from several connections add up."""
+        store.put(make_entry("key"))
+        other = SQLiteCacheStore(tmp_path / "cache.db")
+        try:
+            accessed = datetime.now()
+            store.record_accesses({"key": (2, accessed)})
+            other.record_accesses({"key": (3, accessed)})
+        finally:
+            other.close()
+
+        stored = CacheEntry(*store.get("key"))
+        assert stored.access_count == 5
+        assert stored.last_accessed == accessed
+
+    def test_evict_lru(self, store):
+        """Test eviction removes the least recently used entries."""
+        for key in ("a", "b", "c"):
+            store.put(make_entry(key))
+        store.record_accesses({"a": (1, datetime.now() + timedelta(seconds=1))})
+
+        assert store.evict_lru(2) == ["b"]
+        assert store.evict_lru(2) == []
+        assert sorted(entry[0] for entry in store.entries()) == ["a", "c"]
+
+    def test_delete_expired(self, store):
+        """Test expired entries are removed."""
+        store.put(make_entry("old", hours=-1))
+        store.put(make_entry("new"))
+
+        assert store.delete_expired(datetime.now()) == ["old"]
+        assert store.count() == 1
+
+
+class TestSQLiteBackend:
+    """Test ResponseCacheManager with the SQLite backend."""
+
+    def make_manager(self, cache_dir, **kwargs):
+        """Create a SQLite-backed cache manager."""
+        options = {"max_size": 3, "auto_persist": False, "backend": "sqlite"}
+        options.update(kwargs)
+        return ResponseCacheManager(cache_dir=cache_dir, **options)
+
+    def test_entries_are_written_on_put(self, tmp_path):
+        """Test a put is visible to another manager without persist()."""
+        writer = self.make_manager(tmp_path)
+        writer.put("key", {"answer": 42})
+
+        reader = self.make_manager(tmp_path)
+        assert reader.cache_file.name == "ai_responses.db"
+        assert len(reader._cache) == 0  # Nothing is loaded up front
+        assert reader.get("key") == {"answer": 42}
+        assert reader.get_stats().total_entries == 1
+
+    def test_hits_are_batched(self, tmp_path):
+        """Test hits only reach the database when persisted."""
+        manager = self.make_manager(tmp_path)
+        manager.put("key", "value")
+        manager.get("key")
+        manager.get("key")
+
+        assert manager._store.get("key")[4] == 0
+        assert manager.persist() is True
+        assert manager._store.get("key")[4] == 2
+        assert manager.persist() is False
+
+    def test_eviction_is_shared(self, tmp_path):
+        """Test max_size bounds the shared database, not one process's view."""
+        first = self.make_manager(tmp_path)
+        second = self.make_manager(tmp_path)
+        for i in range(3):
+            first.put(f"first_{i}", i)
+        second.put("second", "x")
+
+        assert second.get_stats().total_entries == 3
+        assert second.get_stats().evictions == 1
+        assert first._store.get("first_0") is None  # Least recently used
+        assert first.get("second") == "x"
+
+    def test_delete_clear_and_expiry(self, tmp_path):
+        """Test removals reach the database."""
+        manager = self.make_manager(tmp_path)
+        manager.put("a", 1)
+        manager.put("b", 2)
+        manager.put("old", 3, ttl=timedelta(seconds=-1))
+
+        assert manager.delete("a") is True
+        assert manager.cleanup_expired() == 1
+        assert self.make_manager(tmp_path).get("b") == 2
+        assert manager.clear() == 1
+        assert manager._store.count() == 0
+
+    def test_imports_json_cache(self, tmp_path):
+        """Test an existing JSON cache is moved into a new database."""
+        json_manager = ResponseCacheManager(cache_dir=tmp_path, auto_persist=False)
+        json_manager.put("key", "from json")
+        json_manager.persist()
+
+        manager = self.make_manager(tmp_path)
+
+        assert manager.get("key") == "from json"
+        assert not (tmp_path / "ai_responses.json").exists()
+        assert json.loads((tmp_path / "ai_responses.json.imported").read_text())
+
+    def test_json_cache_imported_concurrently(self, tmp_path, monkeypatch):
+        """Test losing the import race to another process is not an error."""
+        json_manager = ResponseCacheManager(cache_dir=tmp_path, auto_persist=False)
+        json_manager.put("key", "from json")
+        json_manager.persist()
+
+        def moved_by_other_process(self, target):
+            raise FileNotFoundError(self)
+
+        monkeypatch.setattr(Path, "rename", moved_by_other_process)
+        manager = self.make_manager(tmp_path)
+
+        assert manager.get("key") == "from json"
+
+    def test_unknown_backend(self, tmp_path):
+        """Test an unknown backend is rejected."""
+        with pytest.raises(ValueError):
+            ResponseCacheManager(cache_dir=tmp_path, backend="redis")
@@ -0,0 +1,124 @@
+# ABOUTME: Unit tests for the local BM25 help index
+# ABOUTME: Tests tokenization, ranking, document replacement and index building
+
+"""Unit tests for fallback_index module."""
+
+from create_project.ai.fallback_index import (
+    SOURCE_CACHE,
+    SOURCE_FALLBACK,
+    SOURCE_TEMPLATE,
+    BM25Index,
+    HelpDocument,
+    build_help_index,
+    template_guidance,
+    tokenize,
+)
+from create_project.ai.prompt_manager import PromptManager
+
+
+def make_index(*texts):
+    """Index texts as fallback documents named by position."""
+    index = BM25Index()
+    for number, text in enumerate(texts):
+        index.add(HelpDocument(str(number), text, SOURCE_FALLBACK))
+    return index
+
+
+class TestTokenize:
+    """Test the word tokenizer."""
+
+    def test_splits_camel_case_and_drops_stopwords(self):
+        """Test identifiers are split and filler words removed."""
+        assert tokenize("PermissionError: the path is read-only") == [
+            "permission",
+            "error",
+            "path",
+            "read",
+            "only",
+        ]
+
+
+class TestBM25Index:
+    """Test ranking and maintenance."""
+
+    def test_ranks_relevant_document_first(self):
+        """Test the document sharing rare query words wins."""
+        index = make_index(
+            "Git operation failed. Ensure git is installed.",
+            "Virtual environment creation failed. Check the Python installation.",
+            "Verify permissions and disk space for the target directory.",
+        )
+
+        hits = index.search("VirtualEnvError: venv creation failed")
+
+        assert hits[0].document.doc_id == "1"
+        assert hits[0].score > hits[-1].score
+
+    def test_no_hits_without_shared_words(self):
+        """Test unrelated queries return nothing."""
+        index = make_index("Git operation failed.")
+
+        assert index.search("template syntax") == []
+        assert index.search("") == []
+
+    def test_coverage_is_share_of_query_words(self):
+        """Test coverage reports how much of the query a document contains."""
+        index = make_index("git commit failed")
+
+        hit = index.search("git push failed rejected")[0]
+
+        assert hit.coverage == 0.5
+
+    def test_add_replaces_document_with_same_id(self):
+        """Test re-adding an id replaces its text."""
+        index = make_index("git failed")
+        index.add(HelpDocument("0", "template missing", SOURCE_FALLBACK))
+
+        assert len(index) == 1
+        assert index.search("git") == []
+        assert index.search("template")[0].document.text == "template missing"
+
+    def test_remove(self):
+        """Test removed documents are no longer found."""
+        index = make_index("git failed", "template failed")
+
+        assert index.remove("0") is True
+        assert index.remove("0") is False
+        assert [hit.document.doc_id for hit in index.search("git failed")] == ["1"]
+
+    def test_filter_by_source(self):
+        """Test searches can be limited to some sources."""
+        index = make_index("git failed")
+        index.add(HelpDocument("c", "git failed again", SOURCE_CACHE))
+
+        hits = index.search("git failed", sources=[SOURCE_CACHE])
+
+        assert [hit.document.doc_id for hit in hits] == ["c"]
+
+
+class TestBuildHelpIndex:
+    """Test collecting the local help sources."""
+
+    def test_template_guidance_skips_template_expressions(self):
+        """Test only static list items of the prompt templates are kept."""
+        guidance = template_guidance(PromptManager.DEFAULT_TEMPLATE_DIR)
+        texts = [text for _, text in guidance]
+
+        assert any("Root Cause Analysis" in text for text in texts)
+        assert not any("{" in text or "**" in text for text in texts)
+
+    def test_indexes_all_sources(self, tmp_path):
+        """Test fallbacks, template guidance and string answers are indexed."""
+        (tmp_path / "help.j2").write_text(
+            "## Task\n- Check the git remote configuration\n- {{ error_message }}\n"
+        )
+
+        index = build_help_index(
+            ["Git operation failed."],
+            tmp_path,
+            [("key1", "Run git remote -v to inspect remotes."), ("key2", {"x": 1})],
+        )
+
+        sources = {hit.document.source for hit in index.search("git remote", limit=10)}
+        assert len(index) == 3
+        assert sources == {SOURCE_FALLBACK, SOURCE_TEMPLATE, SOURCE_CACHE}
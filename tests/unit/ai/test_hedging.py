@@ -0,0 +1,153 @@
+# ABOUTME: Unit tests for hedged AI responses
+# ABOUTME: Tests latency budgets, late upgrades and hedged streams
+
+"""Unit tests for hedging module."""
+
+import asyncio
+
+import pytest
+
+from create_project.ai.exceptions import AIError
+from create_project.ai.hedging import (
+    UPGRADE_SEPARATOR,
+    hedge_first_chunk,
+    hedge_stream,
+)
+
+
+async def chunks(values, first_delay=0.0, error=None, chunk_delay=0.0):
+    """Model stream stand-in."""
+    await asyncio.sleep(first_delay)
+    for index, value in enumerate(values):
+        if index:
+            await asyncio.sleep(chunk_delay)
+        yield value
+    if error is not None:
+        raise error
+
+
+class TestHedgeFirstChunk:
+    """Test hedging complete answers on their first streamed chunk."""
+
+    @pytest.mark.asyncio
+    async def test_started_stream_is_waited_for(self):
+        """Test a stream that starts within budget is collected in full."""
+        result = await hedge_first_chunk(
+            chunks(["a", "b"], chunk_delay=0.05), lambda: "local", delay=0.01
+        )
+
+        assert result == ("ab", False)
+
+    @pytest.mark.asyncio
+    async def test_slow_start_is_hedged_and_delivered_later(self):
+        """Test the local answer is returned and the full answer delivered."""
+        late = asyncio.get_running_loop().create_future()
+
+        result = await hedge_first_chunk(
+            chunks(["a", "b"], first_delay=0.05),
+            lambda: "local",
+            delay=0.01,
+            on_late_result=late.set_result,
+        )
+
+        assert result == ("local", True)
+        assert await asyncio.wait_for(late, timeout=1) == "ab"
+
+    @pytest.mark.asyncio
+    async def test_deadline_bounds_a_started_stream(self):
+        """Test a stream still running at the deadline is hedged."""
+        late = asyncio.get_running_loop().create_future()
+
+        result = await hedge_first_chunk(
+            chunks(["a", "b"], chunk_delay=0.2),
+            lambda: "local",
+            delay=0.01,
+            on_late_result=late.set_result,
+            deadline=0.05,
+        )
+
+        assert result == ("local", True)
+        assert await asyncio.wait_for(late, timeout=1) == "ab"
+
+    @pytest.mark.asyncio
+    async def test_stream_within_deadline_is_returned(self):
+        """Test a stream finishing before the deadline is not replaced."""
+        result = await hedge_first_chunk(
+            chunks(["a", "b"], chunk_delay=0.01),
+            lambda: "local",
+            delay=0.01,
+            deadline=0.5,
+        )
+
+        assert result == ("ab", False)
+
+    @pytest.mark.asyncio
+    async def test_late_error_is_not_delivered(self):
+        """Test a failure after the hedge fired is dropped."""
+        delivered = []
+
+        result = await hedge_first_chunk(
+            chunks(["a"], first_delay=0.05, error=AIError("lost")),
+            lambda: "local",
+            delay=0.01,
+            on_late_result=delivered.append,
+        )
+        await asyncio.sleep(0.1)
+
+        assert result == ("local", True)
+        assert delivered == []
+
+    @pytest.mark.asyncio
+    async def test_error_after_start_propagates(self):
+        """Test a stream failing after its first chunk reaches the caller."""
+        with pytest.raises(AIError):
+            await hedge_first_chunk(
+                chunks(["a"], error=AIError("lost")), lambda: "local", delay=0.5
+            )
+
+
+class TestHedgeStream:
+    """Test hedging streamed responses."""
+
+    @pytest.mark.asyncio
+    async def test_fast_stream_passes_through(self):
+        """Test a stream that starts within budget is unchanged."""
+        stream = hedge_stream(chunks(["a", "b"]), lambda: "local", 0.5)
+        result = [chunk async for chunk in stream]
+
+        assert result == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_slow_stream_leads_with_local_answer(self):
+        """Test the local answer and separator precede a slow stream."""
+        result = [
+            chunk
+            async for chunk in hedge_stream(
+                chunks(["a", "b"], first_delay=0.05), lambda: "local", 0.01
+            )
+        ]
+
+        assert result == ["local", UPGRADE_SEPARATOR, "a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_failure_after_local_answer_ends_stream(self):
+        """Test a failing model stream does not undo the local answer."""
+        result = [
+            chunk
+            async for chunk in hedge_stream(
+                chunks(["a"], first_delay=0.05, error=AIError("lost")),
+                lambda: "local",
+                0.01,
+            )
+        ]
+
+        assert result == ["local", UPGRADE_SEPARATOR, "a"]
+
+    @pytest.mark.asyncio
+    async def test_failure_without_hedge_propagates(self):
+        """Test a fast-starting stream's failure reaches the caller."""
+        with pytest.raises(AIError):
+            async for _ in hedge_stream(
+                chunks(["a"], error=AIError("lost")), lambda: "local", 0.5
+            ):
+                pass
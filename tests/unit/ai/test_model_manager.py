@@ -16,8 +16,10 @@ from create_project.ai.model_manager import (
     ModelInfo,
     ModelListResponse,
     ModelManager,
+    load_cached_models,
 )
 from create_project.ai.ollama_client import OllamaClient, OllamaResponse
+from create_project.ai.stream_metrics import StreamMetrics
 
 
 class TestModelCapability:
@@ -738,4 +740,225 @@ class TestModelManager:
 
         assert model_info.family == "llama"
         # Should not parse "latest" as parameter size
-        assert model_info.parameter_size is None
\ No newline at end of file
+        assert model_info.parameter_size is None
+
+    def test_record_stream_metrics(self):
+        """Test stream metrics are averaged per model."""
+        manager = ModelManager(client=Mock())
+
+        manager.record_stream_metrics(
+            StreamMetrics(
+                "llama3.2:3b",
+                time_to_first_token=10.0,
+                inter_token_latencies=[0.1, 0.3],
+                completed=True,
+                eval_count=40,
+                eval_duration=2.0,
+            )
+        )
+        manager.record_stream_metrics(
+            StreamMetrics("llama3.2:3b", time_to_first_token=1.0)
+        )
+
+        stats = manager.get_latency_stats()["llama3.2:3b"]
+        assert stats.samples == 2
+        assert stats.incomplete == 1
+        assert stats.time_to_first_token == pytest.approx(7.3)
+        assert stats.inter_token_latency == pytest.approx(0.2)
+        assert stats.tokens_per_second == pytest.approx(20.0)
+
+        # Returned statistics are copies
+        stats.samples = 0
+        assert manager.get_latency_stats()["llama3.2:3b"].samples == 2
+
+    def test_latency_stats_persist(self, tmp_path):
+        """Test latency statistics survive a new manager."""
+        manager = ModelManager(client=Mock(), cache_dir=tmp_path)
+        manager.record_stream_metrics(
+            StreamMetrics(
+                "llama3.2:3b",
+                time_to_first_token=2.0,
+                completed=True,
+                eval_count=40,
+                eval_duration=2.0,
+            )
+        )
+
+        reloaded = ModelManager(client=Mock(), cache_dir=tmp_path)
+
+        stats = reloaded.get_latency_stats()["llama3.2:3b"]
+        assert stats.samples == 1
+        assert stats.time_to_first_token == pytest.approx(2.0)
+        assert stats.tokens_per_second == pytest.approx(20.0)
+
+    def test_latency_stats_not_persisted(self, tmp_path):
+        """Test persistence can be turned off and bad files are ignored."""
+        (tmp_path / ModelManager.LATENCY_FILENAME).write_text("not json")
+
+        assert ModelManager(client=Mock(), cache_dir=tmp_path).get_latency_stats() == {}
+
+        manager = ModelManager(client=Mock(), persist=False)
+        manager.record_stream_metrics(
+            StreamMetrics("llama3.2:3b", time_to_first_token=1.0)
+        )
+        assert manager.latency_file is None
+
+    def test_select_fastest_model(self):
+        """Test the model with the lowest expected latency is chosen."""
+        manager = ModelManager(client=Mock(), persist=False)
+        models = [
+            ModelInfo(
+                name=name,
+                size=size,
+                digest=name,
+                modified_at=datetime.now(),
+                capabilities={ModelCapability.TEXT_GENERATION},
+            )
+            for name, size in [
+                ("llama3.1:70b", 40_000_000_000),
+                ("llama3.2:3b", 2_000_000_000),
+                ("mistral:7b", 4_000_000_000),
+            ]
+        ]
+
+        assert manager.select_fastest_model(models) is None
+
+        # 1s to first token + 300 tokens at 10/s = 31s
+        manager.record_stream_metrics(
+            StreamMetrics(
+                "llama3.1:70b",
+                time_to_first_token=1.0,
+                completed=True,
+                eval_count=10,
+                eval_duration=1.0,
+            )
+        )
+        # 5s + 300 tokens at 50/s = 11s
+        manager.record_stream_metrics(
+            StreamMetrics(
+                "llama3.2:3b",
+                time_to_first_token=5.0,
+                completed=True,
+                eval_count=50,
+                eval_duration=1.0,
+            )
+        )
+
+        assert manager.select_fastest_model(models).name == "llama3.2:3b"
+        # Short answers favour the quicker first token
+        assert manager.select_fastest_model(models, tokens=10).name == "llama3.1:70b"
+
+    def test_select_fastest_model_estimates_unmeasured_models(self):
+        """Test unmeasured models compete with the measured ones."""
+        manager = ModelManager(client=Mock(), persist=False)
+        large, small, unknown = [
+            ModelInfo(
+                name=name,
+                size=size,
+                digest=name,
+                modified_at=datetime.now(),
+                capabilities={ModelCapability.TEXT_GENERATION},
+            )
+            for name, size in [
+                ("llama3.1:70b", 40_000_000_000),
+                ("llama3.2:3b", 2_000_000_000),
+                ("custom:latest", 0),
+            ]
+        ]
+        # 1s to first token + 300 tokens at 10/s = 31s
+        manager.record_stream_metrics(
+            StreamMetrics(
+                "llama3.1:70b",
+                time_to_first_token=1.0,
+                completed=True,
+                eval_count=10,
+                eval_duration=1.0,
+            )
+        )
+
+        # Scaled by size the small model should take about 1.55s
+        assert manager.select_fastest_model([large, small]) is small
+        # A model of unknown size is tried once to measure it
+        assert manager.select_fastest_model([large, unknown]) is unknown
+
+    @staticmethod
+    def catalog_client(*names):
+        """Client listing ``names`` from /api/tags."""
+        client = Mock(spec=OllamaClient)
+        client.base_url = "http://localhost:11434"
+        client.get_models.return_value = OllamaResponse(
+            success=True,
+            status_code=200,
+            data={
+                "models": [
+                    {
+                        "name": name,
+                        "size": "1000",
+                        "digest": name,
+                        "modified_at": "2024-01-01T12:00:00Z",
+                    }
+                    for name in names
+                ]
+            },
+        )
+        return client
+
+    def test_catalog_served_from_disk_at_startup(self, tmp_path):
+        """Test a persisted catalog is returned before Ollama is asked."""
+        ModelManager(
+            client=self.catalog_client("llama3.2:3b", "codellama:7b"),
+            cache_dir=tmp_path,
+        ).get_models()
+
+        client = self.catalog_client("llama3.2:3b", "codellama:7b")
+        manager = ModelManager(client=client, cache_dir=tmp_path)
+        with patch.object(manager, "refresh_in_background") as refresh:
+            models = manager.get_models()
+
+        assert [m.name for m in models] == ["llama3.2:3b", "codellama:7b"]
+        assert ModelCapability.CODE_GENERATION in models[1].capabilities
+        refresh.assert_called_once()
+        client.get_models.assert_not_called()
+
+    def test_background_refresh_reparses_only_changes(self, tmp_path):
+        """Test an unchanged model list is not parsed again."""
+        ModelManager(
+            client=self.catalog_client("llama3.2:3b"), cache_dir=tmp_path
+        ).get_models()
+
+        manager = ModelManager(
+            client=self.catalog_client("llama3.2:3b"), cache_dir=tmp_path
+        )
+        with patch.object(manager, "_parse_model_info") as parse:
+            manager.get_models()
+            manager._refresh_thread.join(5)
+        parse.assert_not_called()
+        assert manager.get_cache_info()["cached"] is True
+
+        manager.client = self.catalog_client("llama3.2:3b", "mistral:7b")
+        models = manager.get_models(force_refresh=True)
+
+        assert [m.name for m in models] == ["llama3.2:3b", "mistral:7b"]
+        assert [m.name for m in load_cached_models(cache_dir=tmp_path)] == [
+            "llama3.2:3b",
+            "mistral:7b",
+        ]
+        assert load_cached_models("http://other:11434", cache_dir=tmp_path) == []
+
+    def test_context_token_budget(self):
+        """Test the budget follows the measured prompt evaluation speed."""
+        manager = ModelManager(client=Mock(), persist=False)
+        for name, prompt_seconds in [("slow", 20.0), ("medium", 1.0), ("fast", 0.1)]:
+            manager.record_stream_metrics(
+                StreamMetrics(
+                    name,
+                    completed=True,
+                    prompt_eval_count=1000,
+                    prompt_eval_duration=prompt_seconds,
+                )
+            )
+
+        assert manager.context_token_budget("unmeasured") == 1024
+        assert manager.context_token_budget("slow") == ModelManager.MIN_CONTEXT_TOKENS
+        assert manager.context_token_budget("medium") == 2000
+        assert manager.context_token_budget("fast") == ModelManager.MAX_CONTEXT_TOKENS
@@ -22,6 +22,7 @@ from create_project.ai.ollama_client import (
     RequestMethod,
     RetryConfig,
 )
+from create_project.utils.performance import PerformanceMonitor
 
 
 class TestRequestMethod:
@@ -664,4 +665,149 @@ class TestOllamaClient:
             status_code=200,
             data={"message": {"role": "assistant", "content": "Nested content"}},
         )
-        assert response.content == "Nested content"
\ No newline at end of file
+        assert response.content == "Nested content"
+
+
+class TestStreamGenerate:
+    """Test streaming completions."""
+
+    @pytest.fixture
+    def client(self):
+        """Client whose async HTTP client answers from a handler."""
+        OllamaClient.reset_instance()
+        client = OllamaClient()
+        yield client
+        client._async_client = None
+        OllamaClient.reset_instance()
+
+    @staticmethod
+    def serve(client, handler):
+        """Route the client's async requests to ``handler``."""
+        client._async_client = httpx.AsyncClient(
+            base_url="http://ollama.test", transport=httpx.MockTransport(handler)
+        )
+
+    @pytest.mark.asyncio
+    async def test_chunks_are_yielded_as_they_arrive(self, client):
+        """Test NDJSON split across network chunks is decoded incrementally."""
+        requests = []
+
+        async def body():
+            yield b'{"response": "Hel'
+            yield b'lo"}\n{"response": " world"}\n'
+            yield (
+                b'{"response": "", "done": true, "eval_count": 2,'
+                b' "eval_duration": 100000000}'
+            )
+
+        def handler(request):
+            requests.append(json.loads(request.content))
+            return httpx.Response(200, content=body())
+
+        self.serve(client, handler)
+        recorded = []
+        perf_monitor = PerformanceMonitor(enabled=True)
+
+        with patch(
+            "create_project.ai.ollama_client.get_monitor", return_value=perf_monitor
+        ):
+            responses = [
+                response
+                async for response in client.stream_generate(
+                    "llama3.2:3b", "Hi", on_metrics=recorded.append, temperature=0.5
+                )
+            ]
+
+        assert [response.content for response in responses] == ["Hello", " world", ""]
+        assert all(response.success for response in responses)
+        assert requests == [
+            {"model": "llama3.2:3b", "prompt": "Hi", "stream": True, "temperature": 0.5}
+        ]
+
+        metrics = recorded[0]
+        assert metrics.completed is True
+        assert metrics.time_to_first_token is not None
+        assert len(metrics.inter_token_latencies) == 1
+        assert metrics.tokens_per_second == pytest.approx(20.0)
+
+        stats = perf_monitor.get_operation_stats()
+        assert stats["ollama_time_to_first_token:llama3.2:3b"].count == 1
+        assert stats["ollama_inter_token:llama3.2:3b"].count == 1
+
+    @pytest.mark.asyncio
+    async def test_http_error_yields_failed_response(self, client):
+        """Test an HTTP error is reported as a failed response."""
+        self.serve(client, lambda request: httpx.Response(404, text="model not found"))
+
+        responses = [
+            response async for response in client.stream_generate("missing", "Hi")
+        ]
+
+        assert len(responses) == 1
+        assert responses[0].success is False
+        assert responses[0].error_message == "HTTP 404: model not found"
+
+    @pytest.mark.asyncio
+    async def test_error_chunk_raises(self, client):
+        """Test an error reported mid-stream raises."""
+        self.serve(
+            client,
+            lambda request: httpx.Response(
+                200, content=b'{"response": "a"}\n{"error": "out of memory"}\n'
+            ),
+        )
+
+        with pytest.raises(AIError, match="out of memory"):
+            async for _ in client.stream_generate("llama3.2:3b", "Hi"):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_connection_failure(self, client):
+        """Test a refused connection is reported to the circuit breaker."""
+
+        def handler(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        self.serve(client, handler)
+        recorded = []
+
+        with patch.object(client.monitor, "record_failure") as record_failure:
+            with pytest.raises(OllamaNotFoundError):
+                async for _ in client.stream_generate(
+                    "llama3.2:3b", "Hi", on_metrics=recorded.append
+                ):
+                    pass
+
+        record_failure.assert_called_once()
+        assert recorded == []
+
+
+class TestPreloadModel:
+    """Test loading models ahead of use."""
+
+    @pytest.fixture
+    def client(self):
+        """Client whose async HTTP client answers from a handler."""
+        OllamaClient.reset_instance()
+        client = OllamaClient()
+        yield client
+        client._async_client = None
+        OllamaClient.reset_instance()
+
+    @pytest.mark.asyncio
+    async def test_preload_sends_empty_generate(self, client):
+        """Test a preload is a generate request without a prompt."""
+        requests = []
+
+        def handler(request):
+            requests.append((request.url.path, json.loads(request.content)))
+            return httpx.Response(200, json={"model": "llama3.2:3b", "done": True})
+
+        TestStreamGenerate.serve(client, handler)
+
+        response = await client.preload_model("llama3.2:3b", keep_alive="5m")
+
+        assert response.success
+        assert requests == [
+            ("/api/generate", {"model": "llama3.2:3b", "keep_alive": "5m"})
+        ]
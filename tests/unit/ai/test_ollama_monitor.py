@@ -0,0 +1,205 @@
+# ABOUTME: Unit tests for the background Ollama availability monitor
+# ABOUTME: Tests cached status, reused health checks and circuit breaker transitions
+
+"""Unit tests for ollama_monitor module."""
+
+import socket
+import time
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from create_project.ai.exceptions import OllamaNotFoundError
+from create_project.ai.ollama_client import OllamaClient, RetryConfig
+from create_project.ai.ollama_detector import OllamaDetector, OllamaStatus
+from create_project.ai.ollama_monitor import CircuitState, OllamaMonitor
+
+
+def make_status(is_running=True):
+    """Detection result for an installed Ollama."""
+    return OllamaStatus(
+        is_installed=True,
+        is_running=is_running,
+        version="0.1.0",
+        binary_path=Path("/usr/bin/ollama"),
+        service_url="http://localhost:11434",
+        detected_at=datetime.now(),
+    )
+
+
+@pytest.fixture
+def detector():
+    """Detector reporting a running service."""
+    detector = Mock(spec=OllamaDetector)
+    detector.detect.return_value = make_status()
+    detector.check_health.return_value = True
+    return detector
+
+
+@pytest.fixture
+def monitor(detector):
+    """Monitor with a long interval so only explicit refreshes run."""
+    monitor = OllamaMonitor(detector, interval=60, reset_timeout=60)
+    yield monitor
+    monitor.stop()
+
+
+class TestStatus:
+    """Test cached availability."""
+
+    def test_first_status_runs_full_detection(self, monitor, detector):
+        """Test the initial detection result is served from the cache."""
+        assert monitor.is_available() is True
+        assert monitor.is_available() is True
+
+        detector.detect.assert_called_once()
+        detector.check_health.assert_not_called()
+
+    def test_unavailable_when_not_running(self, monitor, detector):
+        """Test a stopped service is reported unavailable."""
+        detector.detect.return_value = make_status(is_running=False)
+
+        assert monitor.is_available() is False
+
+    def test_first_status_waits_only_briefly(self, detector):
+        """Test a slow initial detection does not block callers."""
+        detector.detect.side_effect = lambda: time.sleep(1) or make_status()
+        monitor = OllamaMonitor(detector, interval=60)
+        try:
+            started = time.monotonic()
+            assert monitor.status(wait=0.05) is None
+            assert time.monotonic() - started < 0.5
+        finally:
+            monitor.stop()
+
+    def test_refresh_reuses_health_client(self, monitor, detector):
+        """Test later refreshes only health check, over one client."""
+        monitor.refresh()
+        monitor.refresh()
+        monitor.refresh()
+
+        assert detector.detect.call_count == 1
+        clients = [call.args[0] for call in detector.check_health.call_args_list]
+        assert len(clients) == 2
+        assert clients[0] is clients[1]
+
+    def test_refresh_updates_running_state(self, monitor, detector):
+        """Test a failed health check marks the service as down."""
+        monitor.refresh()
+        detector.check_health.return_value = False
+
+        status = monitor.refresh()
+
+        assert status.is_running is False
+        assert status.version == "0.1.0"
+        assert monitor.is_available() is False
+
+    def test_stop_closes_health_client(self, monitor, detector):
+        """Test stopping releases the thread and the reused client."""
+        monitor.refresh()
+        monitor.refresh()
+        client = detector.check_health.call_args.args[0]
+
+        monitor.stop()
+
+        assert client.is_closed
+
+
+class TestCircuitBreaker:
+    """Test breaker transitions."""
+
+    def test_opens_after_consecutive_failures(self, monitor):
+        """Test the breaker opens at the failure threshold."""
+        monitor.refresh()
+        for _ in range(OllamaMonitor.FAILURE_THRESHOLD - 1):
+            monitor.record_failure()
+        assert monitor.allow_request() is True
+
+        monitor.record_failure()
+
+        assert monitor.state is CircuitState.OPEN
+        assert monitor.allow_request() is False
+        assert monitor.is_available() is False
+
+    def test_success_resets_failure_count(self, monitor):
+        """Test only consecutive failures count."""
+        for _ in range(OllamaMonitor.FAILURE_THRESHOLD - 1):
+            monitor.record_failure()
+        monitor.record_success()
+        monitor.record_failure()
+
+        assert monitor.state is CircuitState.CLOSED
+
+    def test_half_opens_after_reset_timeout(self, detector):
+        """Test an open breaker lets a trial through, then closes or reopens."""
+        monitor = OllamaMonitor(detector, failure_threshold=1, reset_timeout=0.05)
+        try:
+            monitor.record_failure()
+            assert monitor.allow_request() is False
+
+            time.sleep(0.06)
+            assert monitor.state is CircuitState.HALF_OPEN
+            monitor.record_failure()
+            assert monitor.state is CircuitState.OPEN
+
+            time.sleep(0.06)
+            assert monitor.allow_request() is True
+            monitor.record_success()
+            assert monitor.state is CircuitState.CLOSED
+        finally:
+            monitor.stop()
+
+    def test_failed_health_checks_open_breaker(self, monitor, detector):
+        """Test background health check failures feed the breaker."""
+        monitor.refresh()
+        detector.check_health.return_value = False
+
+        for _ in range(OllamaMonitor.FAILURE_THRESHOLD):
+            monitor.refresh()
+
+        assert monitor.state is CircuitState.OPEN
+
+
+class TestClientIntegration:
+    """Test OllamaClient consults and feeds the breaker."""
+
+    @pytest.fixture
+    def dead_url(self):
+        """URL of a local port nothing listens on."""
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        return f"http://127.0.0.1:{port}"
+
+    @pytest.fixture
+    def client(self, dead_url):
+        """Client for a dead service that does not retry."""
+        OllamaClient.reset_instance()
+        client = OllamaClient(
+            base_url=dead_url, retry_config=RetryConfig(max_attempts=1)
+        )
+        yield client
+        OllamaClient.reset_instance()
+
+    def test_connection_failures_open_breaker(self, client):
+        """Test refused connections trip the breaker and later calls fail fast."""
+        for _ in range(OllamaMonitor.FAILURE_THRESHOLD):
+            with pytest.raises(OllamaNotFoundError, match="Unable to connect"):
+                client.request("GET", "tags")
+
+        assert client.monitor.state is CircuitState.OPEN
+        with pytest.raises(OllamaNotFoundError, match="circuit breaker open"):
+            client.request("GET", "tags")
+
+    @pytest.mark.asyncio
+    async def test_async_requests_fail_fast_when_open(self, client):
+        """Test async requests are refused without contacting the service."""
+        for _ in range(OllamaMonitor.FAILURE_THRESHOLD):
+            client.monitor.record_failure()
+
+        started = time.monotonic()
+        with pytest.raises(OllamaNotFoundError, match="circuit breaker open"):
+            await client.request_async("GET", "tags")
+        assert time.monotonic() - started < 0.5
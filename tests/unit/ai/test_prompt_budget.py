@@ -0,0 +1,124 @@
+# ABOUTME: Unit tests for token-budgeted error help prompt context
+# ABOUTME: Tests section ranking by error type, truncation and the kept/dropped report
+
+"""Unit tests for prompt_budget module."""
+
+from create_project.ai.context_collector import ErrorContextCollector
+from create_project.ai.prompt_budget import (
+    PromptSection,
+    assemble_error_context,
+    error_category,
+    estimate_tokens,
+    fit_sections,
+)
+from create_project.core.exceptions import GitError, TemplateError
+
+
+def raise_nested(error, depth):
+    """Raise ``error`` from ``depth`` nested calls."""
+    if depth:
+        raise_nested(error, depth - 1)
+    raise error
+
+
+def collected(error, **kwargs):
+    """Error and its collected context, with a real traceback."""
+    try:
+        raise_nested(error, 8)
+    except Exception as e:
+        return e, ErrorContextCollector().collect_context(e, **kwargs)
+
+
+class TestFitSections:
+    """Test selection and truncation of sections."""
+
+    def test_everything_fits(self):
+        """Test sections are kept in display order when within budget."""
+        sections = [
+            PromptSection("system", ["- OS: Linux"], relevance=0.2),
+            PromptSection("traceback", ["File a.py"], relevance=0.9),
+        ]
+
+        kept, report = fit_sections(sections, budget=100)
+
+        assert [s.name for s in kept] == ["traceback", "system"]
+        assert report.kept == ["traceback", "system"]
+        assert report.dropped == report.truncated == []
+        assert report.used_tokens == sum(s.tokens for s in sections)
+
+    def test_least_relevant_dropped_and_tail_kept(self):
+        """Test the most relevant section is cut, keeping its last lines."""
+        frames = [f'File "module_{n}.py", line {n}, in step_{n}' for n in range(30)]
+        sections = [
+            PromptSection("traceback", frames, relevance=0.9),
+            PromptSection("variables", ["- name: demo"] * 20, relevance=0.1),
+        ]
+
+        kept, report = fit_sections(sections, budget=80)
+
+        assert report.truncated == ["traceback"]
+        assert report.dropped == ["variables"]
+        assert report.used_tokens <= 80
+        lines = kept[0].lines
+        assert lines[0].startswith("... (") and "earlier lines" in lines[0]
+        assert lines[-1] == frames[-1]
+
+    def test_estimate_tokens(self):
+        """Test estimates round up."""
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("abcd") == 2
+
+
+class TestAssembleErrorContext:
+    """Test prompt variables built from collected context."""
+
+    def test_category_ranks_sections(self):
+        """Test template errors favour validation and variables over system."""
+        error, context = collected(
+            TemplateError(
+                "Invalid template",
+                details={"validation_errors": ["author is required"]},
+            ),
+            project_variables={"name": "demo", "description": "x" * 1000},
+        )
+
+        variables, report = assemble_error_context(
+            {"error": error, "error_context": context}, budget=90
+        )
+
+        assert report.category == "template"
+        assert report.kept[0] == "validation"
+        assert "system" in report.dropped
+        assert "author is required" in variables["context_sections"]
+        assert variables["error_type"] == "TemplateError"
+        assert variables["error_message"] == "Invalid template"
+
+    def test_budget_shrinks_prompt(self):
+        """Test smaller budgets give shorter context within the budget."""
+        error, context = collected(
+            GitError("git init failed"),
+            project_variables={f"var_{n}": "value" * 20 for n in range(20)},
+            attempted_operations=["create directories", "render files", "git init"],
+        )
+        sizes = []
+        for budget in (2000, 200, 60):
+            variables, report = assemble_error_context(
+                {"error": error, "error_context": context}, budget
+            )
+            assert estimate_tokens(variables["context_sections"]) <= budget
+            assert variables["error_message"] == "git init failed"
+            sizes.append(len(variables["context_sections"]))
+
+        assert sizes[0] > sizes[1] > sizes[2]
+        assert report.category == "git"
+        assert "error_details" in report.kept
+
+    def test_without_collected_context(self):
+        """Test the error itself still provides type and message."""
+        variables, report = assemble_error_context(
+            {"error": PermissionError("denied")}, budget=100
+        )
+
+        assert variables == {"error_type": "PermissionError", "error_message": "denied"}
+        assert report.category == "filesystem"
+        assert error_category(["RuntimeError"]) == "general"
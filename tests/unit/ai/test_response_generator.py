@@ -9,6 +9,7 @@ from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
+from create_project.ai.context_collector import ErrorContextCollector
 from create_project.ai.exceptions import AIError, ModelNotAvailableError, ResponseTimeoutError
 from create_project.ai.model_manager import ModelCapability, ModelInfo
 from create_project.ai.ollama_client import OllamaResponse
@@ -19,6 +20,7 @@ from create_project.ai.response_generator import (
     ResponseQuality,
 )
 from create_project.ai.types import PromptType
+from create_project.core.exceptions import GitError
 
 
 class TestResponseQuality:
@@ -97,6 +99,8 @@ class TestResponseGenerator:
         """Create mock model manager."""
         manager = Mock()
         manager.get_models = Mock()
+        manager.select_fastest_model = Mock(return_value=None)
+        manager.context_token_budget = Mock(return_value=1024)
         return manager
 
     @pytest.fixture
@@ -375,6 +379,122 @@ class TestResponseGenerator:
         full_response = "".join(chunks)
         assert len(full_response) > 0
 
+    @pytest.mark.asyncio
+    async def test_stream_response_from_client(
+        self, response_generator, mock_ollama_client, mock_model_manager
+    ):
+        """Test chunk text is streamed and metrics go to the model manager."""
+        mock_model_manager.get_models.return_value = []
+        received = {}
+
+        async def stream_generate(model, prompt, on_metrics, **kwargs):
+            received.update(model=model, on_metrics=on_metrics, **kwargs)
+            for text in ["1. Check ", "", "permissions"]:
+                yield OllamaResponse(
+                    success=True, status_code=200, data={"response": text}
+                )
+
+        mock_ollama_client.stream_generate = stream_generate
+
+        chunks = [
+            chunk
+            async for chunk in response_generator.stream_response(
+                PromptType.ERROR_HELP,
+                {"error_message": "Permission denied"},
+                GenerationConfig(model_preference="llama3.2:3b", timeout_seconds=5),
+            )
+        ]
+
+        assert chunks == ["1. Check ", "permissions"]
+        assert received["on_metrics"] == mock_model_manager.record_stream_metrics
+        assert received["timeout"] == 5
+
+    @pytest.mark.asyncio
+    async def test_stream_response_http_error(
+        self, response_generator, mock_ollama_client, mock_model_manager
+    ):
+        """Test a failed stream response falls back."""
+        mock_model_manager.get_models.return_value = []
+
+        async def stream_generate(**kwargs):
+            yield OllamaResponse(
+                success=False,
+                status_code=404,
+                data=None,
+                error_message="HTTP 404: model not found",
+            )
+
+        mock_ollama_client.stream_generate = stream_generate
+
+        chunks = [
+            chunk
+            async for chunk in response_generator.stream_response(
+                PromptType.SUGGESTIONS, {"request": "Test"}
+            )
+        ]
+
+        assert "Consider using a standard Python project structure" in "".join(chunks)
+
+    @pytest.mark.asyncio
+    async def test_stream_model_response_raises_instead_of_falling_back(
+        self, response_generator, mock_ollama_client, mock_model_manager
+    ):
+        """Test model streaming failures reach the caller without fallback text."""
+        mock_model_manager.get_models.return_value = []
+
+        async def stream_generate(**kwargs):
+            yield OllamaResponse(
+                success=False,
+                status_code=404,
+                data=None,
+                error_message="HTTP 404: model not found",
+            )
+
+        mock_ollama_client.stream_generate = stream_generate
+
+        with pytest.raises(AIError):
+            async for _ in response_generator.stream_model_response(
+                PromptType.ERROR_HELP, {"error_message": "Permission denied"}
+            ):
+                pass
+
+        mock_ollama_client.is_available = False
+        with pytest.raises(AIError):
+            async for _ in response_generator.stream_model_response(
+                PromptType.ERROR_HELP, {"error_message": "Permission denied"}
+            ):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_stream_model_response_applies_quality_check(
+        self, response_generator, mock_ollama_client, mock_model_manager
+    ):
+        """Test a complete response failing the quality check raises."""
+        mock_model_manager.get_models.return_value = []
+
+        async def stream_generate(**kwargs):
+            yield OllamaResponse(success=True, status_code=200, data={"response": "ok"})
+
+        mock_ollama_client.stream_generate = stream_generate
+
+        chunks = []
+        with pytest.raises(AIError, match="quality check"):
+            async for chunk in response_generator.stream_model_response(
+                PromptType.ERROR_HELP, {"error_message": "Permission denied"}
+            ):
+                chunks.append(chunk)
+        assert chunks == ["ok"]
+
+        unchecked = [
+            chunk
+            async for chunk in response_generator.stream_model_response(
+                PromptType.ERROR_HELP,
+                {"error_message": "Permission denied"},
+                GenerationConfig(quality_check=False),
+            )
+        ]
+        assert unchecked == ["ok"]
+
     def test_render_prompt_success(self, response_generator):
         """Test successful prompt rendering."""
         context = {"error": "Test error"}
@@ -387,6 +507,39 @@ class TestResponseGenerator:
             validate_required=False,
         )
 
+    def test_render_prompt_budgets_error_context(
+        self, mock_ollama_client, mock_model_manager
+    ):
+        """Test error context is fitted to the model's and the configured limit."""
+        generator = ResponseGenerator(
+            ollama_client=mock_ollama_client,
+            model_manager=mock_model_manager,
+            prompt_manager=PromptManager(),
+            max_context_tokens=100,
+        )
+        try:
+            raise GitError("git init failed")
+        except GitError as e:
+            error = e
+        context = ErrorContextCollector().collect_context(
+            error,
+            project_variables={f"var_{n}": "value" * 20 for n in range(20)},
+        )
+
+        prompt = generator._render_prompt(
+            PromptType.ERROR_HELP,
+            {"error": error, "error_context": context},
+            "llama3.2:3b",
+        )
+
+        mock_model_manager.context_token_budget.assert_called_once_with("llama3.2:3b")
+        report = generator.last_prompt_report
+        assert report.budget_tokens == 100
+        assert "variables" in report.dropped
+        assert "git init failed" in prompt
+        assert "## Detailed Context" in prompt
+        assert "var_19" not in prompt
+
     def test_render_prompt_error(self, response_generator):
         """Test prompt rendering error handling."""
         response_generator._prompt_manager.render_prompt.side_effect = Exception("Render error")
@@ -471,6 +624,67 @@ class TestResponseGenerator:
         model = await response_generator._select_model(None)
         assert model == "llama2:7b"
 
+    @pytest.mark.asyncio
+    async def test_select_model_fastest_measured(
+        self, response_generator, mock_model_manager
+    ):
+        """Test a measured fast model wins over a larger one."""
+        small, large = [
+            ModelInfo(
+                name=name,
+                size=size,
+                digest=name,
+                modified_at=datetime.now(),
+                capabilities={ModelCapability.TEXT_GENERATION},
+            )
+            for name, size in [
+                ("llama3.2:3b", 2_000_000_000),
+                ("llama2:13b", 13_000_000_000),
+            ]
+        ]
+        mock_model_manager.get_models.return_value = [small, large]
+        mock_model_manager.select_fastest_model.return_value = small
+
+        model = await response_generator._select_model(None)
+
+        assert model == "llama3.2:3b"
+        mock_model_manager.select_fastest_model.assert_called_once_with([small, large])
+
+    @pytest.mark.asyncio
+    async def test_prewarm(self, response_generator, mock_ollama_client):
+        """Test prewarming preloads the selected model."""
+        mock_ollama_client.preload_model = AsyncMock(
+            return_value=OllamaResponse(success=True, status_code=200, data={})
+        )
+
+        with patch.object(
+            response_generator, "_select_model", AsyncMock(return_value="llama3.2:3b")
+        ):
+            model = await response_generator.prewarm(keep_alive_minutes=5)
+
+        assert model == "llama3.2:3b"
+        mock_ollama_client.preload_model.assert_awaited_once_with(
+            "llama3.2:3b", keep_alive="5m"
+        )
+
+    @pytest.mark.asyncio
+    async def test_prewarm_unavailable(
+        self, response_generator, mock_ollama_client, mock_model_manager
+    ):
+        """Test nothing is loaded without Ollama or when loading fails."""
+        mock_ollama_client.preload_model = AsyncMock(
+            return_value=OllamaResponse(
+                success=False, status_code=404, data={}, error_message="not found"
+            )
+        )
+        mock_model_manager.get_models.return_value = []
+
+        assert await response_generator.prewarm() is None
+
+        mock_ollama_client.is_available = False
+        assert await response_generator.prewarm() is None
+        mock_ollama_client.preload_model.assert_awaited_once()
+
     def test_validate_response_quality_too_short(self, response_generator):
         """Test quality validation for short responses."""
         assert response_generator._validate_response_quality("") is False
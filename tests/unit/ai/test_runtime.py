@@ -0,0 +1,249 @@
+# ABOUTME: Unit tests for the background AI event loop runtime
+# ABOUTME: Tests coroutine submission, timeouts, pooled clients and shutdown
+
+"""Unit tests for runtime module."""
+
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from create_project.ai.exceptions import ResponseTimeoutError
+from create_project.ai.ollama_client import OllamaClient
+from create_project.ai.runtime import (
+    AIRuntime,
+    current_ai_runtime,
+    get_ai_runtime,
+    set_ai_runtime,
+)
+
+
+@pytest.fixture
+def runtime():
+    """A process-wide runtime that is shut down after the test."""
+    runtime = AIRuntime(name="test-ai-runtime")
+    set_ai_runtime(runtime)
+    yield runtime
+    runtime.shutdown()
+    set_ai_runtime(None)
+
+
+@pytest.fixture
+def keepalive_server():
+    """Local HTTP/1.1 server recording the client port of every request."""
+    ports = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            ports.append(self.client_address[1])
+            body = b'{"models": []}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", ports
+    server.shutdown()
+    server.server_close()
+
+
+class TestSubmit:
+    """Test running coroutines from synchronous code."""
+
+    def test_returns_result_from_loop_thread(self, runtime):
+        """Test coroutines run on the runtime's thread."""
+
+        async def where():
+            return threading.current_thread().name
+
+        assert runtime.submit(where(), timeout=5) == "test-ai-runtime"
+        assert runtime.is_running
+
+    def test_reuses_one_loop(self, runtime):
+        """Test consecutive submissions share the same event loop."""
+
+        async def loop_id():
+            return id(asyncio.get_running_loop())
+
+        assert runtime.submit(loop_id(), timeout=5) == runtime.submit(
+            loop_id(), timeout=5
+        )
+
+    def test_propagates_exceptions(self, runtime):
+        """Test a coroutine's exception reaches the caller."""
+
+        async def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            runtime.submit(fail(), timeout=5)
+
+    def test_timeout_cancels_coroutine(self, runtime):
+        """Test exceeding the timeout raises and cancels the work."""
+        cancelled = threading.Event()
+
+        async def slow():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with pytest.raises(ResponseTimeoutError):
+            runtime.submit(slow(), timeout=0.05)
+
+        assert cancelled.wait(2)
+
+    def test_submit_from_loop_thread_is_rejected(self, runtime):
+        """Test waiting from the loop thread fails instead of deadlocking."""
+
+        async def nested():
+            async def inner():
+                return 1
+
+            with pytest.raises(RuntimeError):
+                runtime.submit(inner())
+            return "ok"
+
+        assert runtime.submit(nested(), timeout=5) == "ok"
+
+    def test_spawn_does_not_wait(self, runtime):
+        """Test spawned coroutines run in the background."""
+        release = threading.Event()
+
+        async def blocked():
+            await asyncio.get_running_loop().run_in_executor(None, release.wait)
+            return "done"
+
+        future = runtime.spawn(blocked())
+
+        assert not future.done()
+        release.set()
+        assert future.result(timeout=5) == "done"
+
+
+class TestHttpClient:
+    """Test the pooled keep-alive HTTP clients."""
+
+    def test_client_persists_between_submissions(self, runtime):
+        """Test the same client is returned for a base URL."""
+
+        async def client_for(url):
+            return runtime.http_client(url)
+
+        first = runtime.submit(client_for("http://localhost:11434"), timeout=5)
+        second = runtime.submit(client_for("http://localhost:11434"), timeout=5)
+        other = runtime.submit(client_for("http://localhost:8080"), timeout=5)
+
+        assert first is second
+        assert other is not first
+        assert not first.is_closed
+
+    def test_client_requires_loop_thread(self, runtime):
+        """Test clients cannot be used outside the runtime's loop."""
+        with pytest.raises(RuntimeError):
+            runtime.http_client("http://localhost:11434")
+
+    def test_connections_are_reused(self, runtime, keepalive_server):
+        """Test consecutive calls reuse one keep-alive connection."""
+        url, ports = keepalive_server
+
+        async def fetch():
+            response = await runtime.http_client(url).get("/api/tags")
+            return response.status_code
+
+        assert [runtime.submit(fetch(), timeout=5) for _ in range(3)] == [200] * 3
+        assert len(ports) == 3
+        assert len(set(ports)) == 1
+
+    def test_ollama_client_uses_runtime_client(self, runtime, keepalive_server):
+        """Test OllamaClient requests on the runtime go through its pool."""
+        url, ports = keepalive_server
+        OllamaClient.reset_instance()
+        client = OllamaClient(base_url=url)
+        try:
+            for _ in range(2):
+                response = runtime.submit(client.get_models_async(), timeout=5)
+                assert response.success
+
+            async def pooled():
+                return client.async_client is runtime.http_client(url)
+
+            assert runtime.submit(pooled(), timeout=5)
+            assert client._async_client is None
+            assert len(set(ports)) == 1
+        finally:
+            OllamaClient.reset_instance()
+
+
+class TestShutdown:
+    """Test stopping the runtime."""
+
+    def test_shutdown_closes_clients_and_stops_thread(self, runtime):
+        """Test shutdown releases the loop thread and pooled clients."""
+
+        async def client():
+            return runtime.http_client("http://localhost:11434")
+
+        pooled = runtime.submit(client(), timeout=5)
+        runtime.shutdown()
+
+        assert not runtime.is_running
+        assert pooled.is_closed
+
+    def test_shutdown_cancels_pending_work(self, runtime):
+        """Test unfinished tasks are cancelled on shutdown."""
+        cancelled = threading.Event()
+
+        async def background():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def spawn():
+            asyncio.get_running_loop().create_task(background())
+
+        runtime.submit(spawn(), timeout=5)
+        runtime.shutdown()
+
+        assert cancelled.is_set()
+
+    def test_restarts_after_shutdown(self, runtime):
+        """Test the runtime starts a new loop when used again."""
+
+        async def answer():
+            return 42
+
+        runtime.submit(answer(), timeout=5)
+        runtime.shutdown()
+
+        assert runtime.submit(answer(), timeout=5) == 42
+
+
+class TestGlobalRuntime:
+    """Test the process-wide runtime accessors."""
+
+    def test_get_returns_singleton(self, runtime):
+        """Test get_ai_runtime returns the installed runtime."""
+        assert get_ai_runtime() is runtime
+
+    def test_current_runtime_only_on_loop_thread(self, runtime):
+        """Test current_ai_runtime is only set for code on the loop."""
+
+        async def current():
+            return current_ai_runtime()
+
+        assert current_ai_runtime() is None
+        assert runtime.submit(current(), timeout=5) is runtime
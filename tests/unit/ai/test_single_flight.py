@@ -0,0 +1,154 @@
+# ABOUTME: Unit tests for single-flight coalescing of AI requests
+# ABOUTME: Tests shared results, errors, cross-loop waiters and stream fan-out
+
+"""Unit tests for single_flight module."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from create_project.ai.exceptions import AIError
+from create_project.ai.single_flight import SingleFlight
+
+
+class TestRun:
+    """Test coalescing of plain calls."""
+
+    @pytest.mark.asyncio
+    async def test_duplicates_share_one_call(self):
+        """Test concurrent calls with one key run the work once."""
+        flight = SingleFlight()
+        calls = []
+
+        async def generate():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "answer"
+
+        results = await asyncio.gather(*(flight.run("key", generate) for _ in range(3)))
+
+        assert results == ["answer"] * 3
+        assert len(calls) == 1
+        assert flight.coalesced == 2
+        assert flight.in_flight() == 0
+
+    @pytest.mark.asyncio
+    async def test_different_keys_run_separately(self):
+        """Test calls with different keys are not coalesced."""
+        flight = SingleFlight()
+
+        async def generate(value):
+            await asyncio.sleep(0.01)
+            return value
+
+        results = await asyncio.gather(
+            flight.run("a", lambda: generate("a")), flight.run("b", lambda: generate("b"))
+        )
+
+        assert results == ["a", "b"]
+        assert flight.coalesced == 0
+
+    @pytest.mark.asyncio
+    async def test_error_reaches_followers(self):
+        """Test every waiter sees the leader's exception."""
+        flight = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.05)
+            raise AIError("model crashed")
+
+        results = await asyncio.gather(
+            flight.run("key", fail), flight.run("key", fail), return_exceptions=True
+        )
+
+        assert all(isinstance(r, AIError) for r in results)
+
+    def test_followers_on_other_event_loops(self):
+        """Test callers driving their own event loops share one call."""
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        async def generate():
+            calls.append(1)
+            started.set()
+            await asyncio.get_running_loop().run_in_executor(None, release.wait)
+            return "answer"
+
+        results = []
+
+        def caller():
+            results.append(asyncio.run(flight.run("key", generate)))
+
+        leader = threading.Thread(target=caller)
+        leader.start()
+        started.wait(timeout=5)
+        followers = [threading.Thread(target=caller) for _ in range(2)]
+        for thread in followers:
+            thread.start()
+        deadline = time.monotonic() + 5
+        while flight.coalesced < 2 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        release.set()
+        for thread in [leader, *followers]:
+            thread.join(timeout=5)
+
+        assert results == ["answer"] * 3
+        assert len(calls) == 1
+
+
+class TestStream:
+    """Test fan-out of shared streams."""
+
+    @staticmethod
+    def upstream(opened, chunks=("a", "b", "c"), error=None):
+        """Create an upstream stream factory that records openings."""
+
+        async def stream():
+            opened.append(1)
+            for chunk in chunks:
+                await asyncio.sleep(0.01)
+                yield chunk
+            if error:
+                raise error
+
+        return stream
+
+    @staticmethod
+    async def collect(iterator, delay=0.0):
+        """Collect all chunks of a stream after an optional delay."""
+        await asyncio.sleep(delay)
+        return [chunk async for chunk in iterator]
+
+    @pytest.mark.asyncio
+    async def test_subscribers_receive_every_chunk(self):
+        """Test a late subscriber gets the chunks it missed, then the rest."""
+        flight = SingleFlight()
+        opened = []
+        factory = self.upstream(opened)
+
+        results = await asyncio.gather(
+            self.collect(flight.stream("key", factory)),
+            self.collect(flight.stream("key", factory), delay=0.015),
+        )
+
+        assert results == [["a", "b", "c"], ["a", "b", "c"]]
+        assert len(opened) == 1
+        assert flight.in_flight() == 0
+
+    @pytest.mark.asyncio
+    async def test_stream_error_reaches_subscribers(self):
+        """Test an upstream failure is raised for every subscriber."""
+        flight = SingleFlight()
+        factory = self.upstream([], error=AIError("stream broke"))
+
+        results = await asyncio.gather(
+            self.collect(flight.stream("key", factory)),
+            self.collect(flight.stream("key", factory), delay=0.005),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, AIError) for r in results)
@@ -0,0 +1,138 @@
+# ABOUTME: Unit tests for Ollama stream decoding and timing
+# ABOUTME: Tests incremental NDJSON parsing and time-to-first-token measurement
+
+"""Unit tests for stream_metrics module."""
+
+import pytest
+
+from create_project.ai.exceptions import AIError
+from create_project.ai.stream_metrics import (
+    NDJSONDecoder,
+    StreamTimer,
+    chunk_text,
+    response_metrics,
+)
+
+
+class FakeClock:
+    """Clock advanced by hand."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestNDJSONDecoder:
+    """Test incremental decoding."""
+
+    def test_line_split_across_chunks(self):
+        """Test a line is decoded once its newline arrives."""
+        decoder = NDJSONDecoder()
+
+        assert decoder.feed(b'{"response": "He') == []
+        assert decoder.feed(b'llo"}\n{"resp') == [{"response": "Hello"}]
+        assert decoder.feed(b'onse": "!"}\n') == [{"response": "!"}]
+
+    def test_several_lines_in_one_chunk(self):
+        """Test every complete line of a chunk is decoded in order."""
+        decoder = NDJSONDecoder()
+
+        objects = decoder.feed(b'{"a": 1}\n\n{"a": 2}\r\n{"a": 3}')
+
+        assert objects == [{"a": 1}, {"a": 2}]
+        assert decoder.flush() == [{"a": 3}]
+        assert decoder.flush() == []
+
+    def test_multibyte_character_split_across_chunks(self):
+        """Test UTF-8 sequences split between chunks survive."""
+        data = b'{"response": "caf\xc3\xa9"}\n'
+        decoder = NDJSONDecoder()
+
+        objects = decoder.feed(data[:-4]) + decoder.feed(data[-4:])
+
+        assert objects == [{"response": "café"}]
+
+    def test_invalid_line_raises(self):
+        """Test malformed lines are reported."""
+        decoder = NDJSONDecoder()
+
+        with pytest.raises(AIError, match="Invalid JSON"):
+            decoder.feed(b"not json\n")
+        with pytest.raises(AIError, match="Unexpected value"):
+            decoder.feed(b"[1, 2]\n")
+
+
+class TestStreamTimer:
+    """Test stream timing."""
+
+    def test_measures_first_token_and_gaps(self):
+        """Test empty chunks do not count as tokens."""
+        clock = FakeClock()
+        timer = StreamTimer("llama3.2:3b", clock=clock)
+
+        clock.now += 2.0
+        timer.record_chunk({"response": ""})
+        clock.now += 0.5
+        timer.record_chunk({"response": "Hi"})
+        clock.now += 0.1
+        timer.record_chunk({"response": " there"})
+        clock.now += 0.3
+        timer.record_chunk({"response": "!"})
+        metrics = timer.finish()
+
+        assert metrics.time_to_first_token == pytest.approx(2.5)
+        assert metrics.inter_token_latencies == pytest.approx([0.1, 0.3])
+        assert metrics.mean_inter_token_latency == pytest.approx(0.2)
+        assert metrics.total_time == pytest.approx(2.9)
+        assert metrics.completed is False
+        assert metrics.tokens_per_second is None
+
+    def test_final_chunk_counts(self):
+        """Test Ollama's counts and nanosecond durations are taken."""
+        timer = StreamTimer("llama3.2:3b", clock=FakeClock())
+
+        timer.record_chunk(
+            {
+                "response": "",
+                "done": True,
+                "prompt_eval_count": 200,
+                "prompt_eval_duration": 500_000_000,
+                "eval_count": 40,
+                "eval_duration": 2_000_000_000,
+                "load_duration": 3_000_000_000,
+            }
+        )
+        metrics = timer.finish()
+
+        assert metrics.completed is True
+        assert metrics.tokens_per_second == pytest.approx(20.0)
+        assert metrics.prompt_tokens_per_second == pytest.approx(400.0)
+        assert metrics.load_duration == pytest.approx(3.0)
+
+    def test_chat_chunks(self):
+        """Test chat stream chunks carry their text in the message."""
+        assert chunk_text({"message": {"role": "assistant", "content": "Hi"}}) == "Hi"
+        assert chunk_text({"response": "Hi"}) == "Hi"
+        assert chunk_text({"done": True}) == ""
+
+    def test_response_metrics(self):
+        """Test a non-streamed response stands in load and prompt time."""
+        metrics = response_metrics(
+            "llama3.2:3b",
+            {
+                "response": "Hi",
+                "done": True,
+                "load_duration": 1_000_000_000,
+                "prompt_eval_duration": 500_000_000,
+                "eval_count": 30,
+                "eval_duration": 1_500_000_000,
+            },
+            total_time=3.0,
+        )
+
+        assert metrics.time_to_first_token == pytest.approx(1.5)
+        assert metrics.tokens_per_second == pytest.approx(20.0)
+        assert metrics.total_time == 3.0
+        assert response_metrics("llama3.2:3b", {"response": "Hi"}, 1.0) is None
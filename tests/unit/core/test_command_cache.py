@@ -0,0 +1,127 @@
+# ABOUTME: Unit tests for the post-creation command result cache
+# ABOUTME: Tests fingerprints, output checks and persistence in the project state directory
+
+"""Unit tests for command cache module."""
+
+import json
+
+import pytest
+
+from create_project.core.command_cache import CommandResultCache
+from create_project.core.command_executor import CommandSpec
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Create a project directory with one input file."""
+    (tmp_path / "requirements.txt").write_text("requests\n")
+    return tmp_path
+
+
+@pytest.fixture
+def spec():
+    """Create a cacheable command spec."""
+    return CommandSpec(
+        name="install",
+        command="pip install -r requirements.txt",
+        inputs=["requirements*.txt"],
+        outputs=["installed.marker"],
+    )
+
+
+class TestFingerprint:
+    """Test command fingerprinting."""
+
+    def test_no_inputs_is_not_cacheable(self, project):
+        """Test commands without inputs always run."""
+        cache = CommandResultCache(project)
+
+        assert cache.fingerprint(CommandSpec(name="a", command="echo a"), project) is None
+
+    def test_stable_for_unchanged_inputs(self, project, spec):
+        """Test the fingerprint only depends on what the command sees."""
+        cache = CommandResultCache(project)
+
+        assert cache.fingerprint(spec, project) == cache.fingerprint(spec, project)
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            lambda project, spec, env: (project / "requirements.txt").write_text("x\n"),
+            lambda project, spec, env: (project / "requirements-dev.txt").write_text(""),
+            lambda project, spec, env: setattr(spec, "command", "pip install ."),
+            lambda project, spec, env: env.update({"PIP_INDEX_URL": "http://mirror"}),
+        ],
+        ids=["content", "new-match", "command", "environment"],
+    )
+    def test_changes_invalidate(self, project, spec, change):
+        """Test input content, matches, command and environment are covered."""
+        cache = CommandResultCache(project)
+        env = {}
+        before = cache.fingerprint(spec, project, env)
+
+        change(project, spec, env)
+
+        assert cache.fingerprint(spec, project, env) != before
+
+    def test_state_directory_is_not_an_input(self, project):
+        """Test recording a result does not change a broad fingerprint."""
+        cache = CommandResultCache(project)
+        spec = CommandSpec(name="all", command="echo all", inputs=["**/*"])
+        before = cache.fingerprint(spec, project)
+
+        cache.record(spec, before, success=True)
+
+        assert cache.fingerprint(spec, project) == before
+
+
+class TestFreshness:
+    """Test skip decisions and persistence."""
+
+    def test_fresh_after_success_with_outputs(self, project, spec):
+        """Test a recorded success with existing outputs can be skipped."""
+        cache = CommandResultCache(project)
+        fingerprint = cache.fingerprint(spec, project)
+        cache.record(spec, fingerprint, success=True)
+
+        assert cache.is_fresh(spec, fingerprint, project) is False
+
+        (project / "installed.marker").touch()
+        assert cache.is_fresh(spec, fingerprint, project) is True
+        assert cache.is_fresh(spec, "other", project) is False
+
+    def test_failure_forgets_command(self, project, spec):
+        """Test a failed rerun makes the command run again next time."""
+        (project / "installed.marker").touch()
+        cache = CommandResultCache(project)
+        fingerprint = cache.fingerprint(spec, project)
+        cache.record(spec, fingerprint, success=True)
+
+        cache.record(spec, fingerprint, success=False)
+
+        assert cache.is_fresh(spec, fingerprint, project) is False
+
+    def test_persisted_in_state_directory(self, project, spec):
+        """Test records survive a new cache and are ignored by git."""
+        (project / "installed.marker").touch()
+        cache = CommandResultCache(project)
+        fingerprint = cache.fingerprint(spec, project)
+        cache.record(spec, fingerprint, success=True)
+
+        state_dir = project / CommandResultCache.STATE_DIR_NAME
+        assert (state_dir / ".gitignore").read_text() == "*\n"
+        data = json.loads((state_dir / "commands.json").read_text())
+        assert data["commands"]["install"]["fingerprint"] == fingerprint
+
+        assert CommandResultCache(project).is_fresh(spec, fingerprint, project)
+
+    def test_invalidate(self, project, spec):
+        """Test invalidation forgets recorded commands."""
+        (project / "installed.marker").touch()
+        cache = CommandResultCache(project)
+        fingerprint = cache.fingerprint(spec, project)
+        cache.record(spec, fingerprint, success=True)
+
+        cache.invalidate()
+
+        assert CommandResultCache(project).is_fresh(spec, fingerprint, project) is False
@@ -4,11 +4,18 @@
 """Unit tests for command executor module."""
 
 import subprocess
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from create_project.core.command_executor import CommandExecutor
+from create_project.core.command_cache import CommandResultCache
+from create_project.core.command_executor import (
+    CommandExecutor,
+    CommandSpec,
+    ExecutionResult,
+)
 from create_project.core.exceptions import ProjectGenerationError, SecurityError
 
 
@@ -22,8 +29,8 @@ class TestCommandExecutor:
 
     @pytest.fixture
     def mock_subprocess_run(self):
-        """Mock subprocess.run for command execution tests."""
-        with patch("subprocess.run") as mock:
+        """Mock the streaming runner for command execution tests."""
+        with patch("create_project.core.command_executor.run_streaming") as mock:
             # Default successful execution
             mock.return_value = MagicMock(
                 returncode=0,
@@ -77,15 +84,28 @@ class TestCommandExecutor:
         assert result.duration > 0
         assert result.timeout is False
 
-        # Verify subprocess.run was called correctly
+        # Verify the streaming runner was called correctly
         mock_subprocess_run.assert_called_once()
         args, kwargs = mock_subprocess_run.call_args
         assert args[0] == ["python", "--version"]
         assert kwargs["cwd"] == temp_dir
-        assert kwargs["capture_output"] is True
-        assert kwargs["text"] is True
+        assert kwargs["line_callback"] is None
         assert kwargs["timeout"] == 300
 
+    def test_execute_command_streams_output(self, executor, temp_dir):
+        """Test output lines reach the callback while the command runs."""
+        lines = []
+
+        result = executor.execute_command(
+            command="echo streamed output",
+            cwd=temp_dir,
+            output_callback=lambda stream, line: lines.append((stream, line)),
+        )
+
+        assert result.success is True
+        assert result.stdout == "streamed output\n"
+        assert lines == [("stdout", "streamed output")]
+
     def test_execute_command_failure(self, executor, mock_subprocess_run, temp_dir):
         """Test command execution failure."""
         mock_subprocess_run.return_value = MagicMock(
@@ -466,3 +486,231 @@ class TestCommandExecutor:
         assert len(results) == 5
         assert all(r.success for r in results)
         assert mock_subprocess_run.call_count == 5
+
+
+class TestCommandGraph:
+    """Test dependency-aware parallel command execution."""
+
+    @pytest.fixture
+    def executor(self):
+        """Create a command executor whose commands sleep instead of running."""
+        executor = CommandExecutor()
+        executor.active = 0
+        executor.peak = 0
+        executor.started = []
+        lock = threading.Lock()
+
+        def fake_execute(
+            command, cwd, timeout=None, env_vars=None, output_callback=None
+        ):
+            if output_callback:
+                output_callback("stdout", command)
+            with lock:
+                executor.active += 1
+                executor.peak = max(executor.peak, executor.active)
+                executor.started.append(command)
+            time.sleep(0.05)
+            with lock:
+                executor.active -= 1
+            failed = "fail" in command
+            return ExecutionResult(
+                success=not failed,
+                command=command,
+                returncode=1 if failed else 0,
+                stdout="",
+                stderr="boom" if failed else "",
+                duration=0.05,
+            )
+
+        executor.execute_command = fake_execute
+        return executor
+
+    def test_independent_commands_run_concurrently(self, executor, tmp_path):
+        """Test commands without dependencies overlap."""
+        specs = [CommandSpec(name=f"c{i}", command=f"echo {i}") for i in range(3)]
+
+        results = executor.execute_command_graph(specs, cwd=tmp_path)
+
+        assert all(result.success for result in results)
+        assert executor.peak == 3
+
+    def test_dependencies_are_respected(self, executor, tmp_path):
+        """Test a command starts only after its dependencies finished."""
+        specs = [
+            CommandSpec(name="docs", command="echo docs", depends_on=["install"]),
+            CommandSpec(name="install", command="echo install"),
+            CommandSpec(name="hooks", command="echo hooks", depends_on=["install"]),
+        ]
+
+        results = executor.execute_command_graph(specs, cwd=tmp_path)
+
+        assert executor.started[0] == "echo install"
+        assert [result.command for result in results] == [
+            "echo docs",
+            "echo install",
+            "echo hooks",
+        ]
+
+    def test_resource_limits(self, executor, tmp_path):
+        """Test commands sharing a resource class respect its limit."""
+        specs = [
+            CommandSpec(name=f"venv{i}", command=f"echo {i}", resources=["writes-venv"])
+            for i in range(3)
+        ]
+
+        executor.execute_command_graph(specs, cwd=tmp_path)
+        assert executor.peak == 1
+
+        executor.peak = 0
+        executor.execute_command_graph(
+            specs, cwd=tmp_path, resource_limits={"writes-venv": 2}
+        )
+        assert executor.peak == 2
+
+    def test_failed_dependency_skips_dependents(self, executor, tmp_path):
+        """Test dependents of a failure are skipped transitively."""
+        specs = [
+            CommandSpec(name="a", command="echo fail"),
+            CommandSpec(name="c", command="echo c", depends_on=["b"]),
+            CommandSpec(name="b", command="echo b", depends_on=["a"]),
+            CommandSpec(name="d", command="echo d"),
+        ]
+
+        results = executor.execute_command_graph(
+            specs, cwd=tmp_path, stop_on_failure=False
+        )
+
+        assert [r.skipped for r in results] == [False, True, True, False]
+        assert "dependency 'b'" in results[1].stderr
+        assert results[3].success
+
+    def test_after_orders_without_requiring_success(self, executor, tmp_path):
+        """Test ordering-only edges run in order and survive failures."""
+        specs = [
+            CommandSpec(name="a", command="echo fail"),
+            CommandSpec(name="b", command="echo b", after=["a"]),
+            CommandSpec(name="c", command="echo c", after=["b"]),
+        ]
+
+        results = executor.execute_command_graph(
+            specs, cwd=tmp_path, stop_on_failure=False
+        )
+
+        assert executor.started == ["echo fail", "echo b", "echo c"]
+        assert executor.peak == 1
+        assert [r.skipped for r in results] == [False, False, False]
+        assert [r.success for r in results] == [False, True, True]
+
+    def test_stop_on_failure(self, executor, tmp_path):
+        """Test no new command starts after a failure."""
+        specs = [
+            CommandSpec(name="a", command="echo fail"),
+            CommandSpec(name="b", command="echo b", depends_on=["a"]),
+            CommandSpec(name="c", command="echo c", depends_on=["a"]),
+        ]
+
+        results = executor.execute_command_graph(
+            specs, cwd=tmp_path, stop_on_failure=True, max_parallel=1
+        )
+
+        assert executor.started == ["echo fail"]
+        assert results[0].success is False
+        assert all(result.skipped for result in results[1:])
+
+    def test_status_callback(self, executor, tmp_path):
+        """Test per-command status is reported from the calling thread."""
+        events = []
+        caller = threading.current_thread()
+
+        def on_status(spec, status, result):
+            assert threading.current_thread() is caller
+            events.append((spec.name, status))
+
+        executor.execute_command_graph(
+            [CommandSpec(name="a", command="echo a")],
+            cwd=tmp_path,
+            status_callback=on_status,
+        )
+
+        assert events == [("a", "running"), ("a", "succeeded")]
+
+    def test_output_callback(self, executor, tmp_path):
+        """Test command output is relayed to the calling thread."""
+        lines = []
+        caller = threading.current_thread()
+
+        def on_output(spec, stream, line):
+            assert threading.current_thread() is caller
+            lines.append((spec.name, stream, line))
+
+        executor.execute_command_graph(
+            [CommandSpec(name=f"c{i}", command=f"echo {i}") for i in range(2)],
+            cwd=tmp_path,
+            output_callback=on_output,
+        )
+
+        assert sorted(lines) == [
+            ("c0", "stdout", "echo 0"),
+            ("c1", "stdout", "echo 1"),
+        ]
+
+    def test_result_cache_skips_up_to_date_commands(self, executor, tmp_path):
+        """Test cached commands are skipped and still satisfy dependents."""
+        (tmp_path / "pyproject.toml").write_text("[project]\n")
+        specs = [
+            CommandSpec(name="install", command="echo install", inputs=["*.toml"]),
+            CommandSpec(name="hooks", command="echo hooks", depends_on=["install"]),
+        ]
+        cache = CommandResultCache(tmp_path)
+
+        executor.execute_command_graph(specs, cwd=tmp_path, result_cache=cache)
+        assert executor.started == ["echo install", "echo hooks"]
+
+        statuses = []
+        executor.started = []
+        results = executor.execute_command_graph(
+            specs,
+            cwd=tmp_path,
+            result_cache=CommandResultCache(tmp_path),
+            status_callback=lambda spec, status, result: statuses.append(status),
+        )
+
+        assert executor.started == ["echo hooks"]
+        assert results[0].cached and results[0].success
+        assert "cached" in statuses
+
+        (tmp_path / "pyproject.toml").write_text("[project]\nname = 'x'\n")
+        executor.started = []
+        executor.execute_command_graph(specs, cwd=tmp_path, result_cache=cache)
+        assert executor.started == ["echo install", "echo hooks"]
+
+    @pytest.mark.parametrize(
+        "specs, message",
+        [
+            (
+                [CommandSpec(name="a", command="echo a", depends_on=["missing"])],
+                "unknown commands",
+            ),
+            (
+                [
+                    CommandSpec(name="a", command="echo a", depends_on=["b"]),
+                    CommandSpec(name="b", command="echo b", depends_on=["a"]),
+                ],
+                "cycle",
+            ),
+            (
+                [
+                    CommandSpec(name="a", command="echo a"),
+                    CommandSpec(name="a", command="echo b"),
+                ],
+                "Duplicate",
+            ),
+        ],
+    )
+    def test_invalid_graph(self, executor, tmp_path, specs, message):
+        """Test invalid graphs are rejected before anything runs."""
+        with pytest.raises(ProjectGenerationError) as exc_info:
+            executor.execute_command_graph(specs, cwd=tmp_path)
+
+        assert message in str(exc_info.value)
+        assert executor.started == []
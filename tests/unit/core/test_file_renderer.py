@@ -94,6 +94,9 @@ class TestFileRenderer:
         rendered_files = renderer.get_rendered_files()
         assert len(rendered_files) == 1
         assert target_file.resolve() in rendered_files
+        assert renderer.rendered_contents[target_file.resolve()] == (
+            b"Hello Alice! Your age is 30."
+        )
 
     def test_render_file_with_encoding(self, renderer, temp_dir):
         """Test rendering file with specific encoding."""
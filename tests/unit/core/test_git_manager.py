@@ -3,6 +3,7 @@
 
 """Unit tests for git manager module."""
 
+import shutil
 import subprocess
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -11,6 +12,7 @@ import pytest
 
 from create_project.core.exceptions import GitError
 from create_project.core.git_manager import GitConfig, GitManager
+from create_project.core.process_runner import DEFAULT_HEAD_LINES, DEFAULT_TAIL_LINES
 
 
 class TestGitConfig:
@@ -49,8 +51,10 @@ class TestGitManager:
 
     @pytest.fixture
     def mock_subprocess_run(self):
-        """Mock subprocess.run for git commands."""
-        with patch("subprocess.run") as mock:
+        """Mock subprocess.run and the streaming runner for git commands."""
+        with patch("subprocess.run") as mock, patch(
+            "create_project.core.git_manager.run_streaming", mock
+        ):
             # Default successful git version check
             mock.return_value = MagicMock(
                 returncode=0,
@@ -505,9 +509,8 @@ class TestGitManager:
         mock_subprocess_run.assert_called_once_with(
             ["/usr/bin/git", "status"],
             cwd=temp_project,
-            capture_output=True,
-            text=True,
             timeout=60,
+            head_lines=DEFAULT_HEAD_LINES,
         )
 
     def test_run_git_command_no_git_path(self, git_manager, temp_project):
@@ -527,3 +530,164 @@ class TestGitManager:
 
         mock_subprocess_run.assert_called_once()
         assert mock_subprocess_run.call_args[1]["timeout"] == 120
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+class TestGitRepositoryStatus:
+    """Test repository status against a real git repository."""
+
+    def test_large_status_is_not_truncated(self, tmp_path):
+        """Test every change is reported when status output is long."""
+        subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+        count = DEFAULT_HEAD_LINES + DEFAULT_TAIL_LINES + 100
+        for i in range(count):
+            (tmp_path / f"file{i}.txt").write_text("x")
+
+        status = GitManager().get_repository_status(tmp_path)
+
+        assert status["changes_count"] == count
+        assert not any("omitted" in change for change in status["changes"])
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+class TestGitBootstrap:
+    """Test single-process repository bootstrap via git fast-import."""
+
+    @pytest.fixture
+    def project(self, tmp_path):
+        """Create a project directory holding rendered files."""
+        files = {
+            "README.md": b"# Demo\n",
+            "src/demo/__init__.py": b'__version__ = "0.1.0"\n',
+            "scripts/run.sh": b"#!/bin/sh\necho run\n",
+        }
+        project_dir = tmp_path / "demo"
+        for relative_path, data in files.items():
+            path = project_dir / relative_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(data)
+        (project_dir / "scripts" / "run.sh").chmod(0o755)
+        return project_dir, files
+
+    @pytest.fixture
+    def git_config(self):
+        """Git configuration with an explicit identity."""
+        return GitConfig(
+            user_name="Test User",
+            user_email="test@example.com",
+            initial_commit_message="Bootstrap commit",
+        )
+
+    def git(self, project_dir, *args):
+        """Run a real git command in the project."""
+        return subprocess.run(
+            ["git", *args], cwd=project_dir, capture_output=True, text=True, check=True
+        ).stdout
+
+    def test_bootstrap_creates_commit_and_clean_index(self, project, git_config):
+        """Test the repository, commit and index match the rendered files."""
+        project_dir, files = project
+
+        GitManager().bootstrap_repository(project_dir, files, git_config=git_config)
+
+        assert self.git(project_dir, "log", "--format=%an <%ae> %s") == (
+            "Test User <test@example.com> Bootstrap commit\n"
+        )
+        assert self.git(project_dir, "status", "--porcelain") == ""
+        assert sorted(self.git(project_dir, "ls-files").split()) == sorted(files)
+        assert "100755" in self.git(project_dir, "ls-files", "-s", "scripts/run.sh")
+        assert self.git(project_dir, "config", "user.email") == "test@example.com\n"
+
+    def test_bootstrap_skips_init_add_and_commit(self, project, git_config):
+        """Test only the ignore check and git fast-import write anything."""
+        project_dir, files = project
+        manager = GitManager()
+
+        with patch("subprocess.run", wraps=subprocess.run) as mock_run:
+            manager.bootstrap_repository(project_dir, files, git_config=git_config)
+
+        assert [call[0][0][1] for call in mock_run.call_args_list] == [
+            "check-ignore",
+            "fast-import",
+        ]
+
+    def test_bootstrap_leaves_out_ignored_files(self, project, git_config):
+        """Test files matched by the rendered .gitignore are not committed."""
+        project_dir, files = project
+        extra = {".gitignore": b".env\nbuild/\n", ".env": b"SECRET=1\n"}
+        extra["build/out.txt"] = b"artifact\n"
+        for relative_path, data in extra.items():
+            path = project_dir / relative_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(data)
+
+        GitManager().bootstrap_repository(
+            project_dir, {**files, **extra}, git_config=git_config
+        )
+
+        committed = self.git(project_dir, "ls-tree", "-r", "--name-only", "HEAD")
+        assert sorted(committed.split()) == sorted([*files, ".gitignore"])
+        assert sorted(self.git(project_dir, "ls-files").split()) == sorted(
+            [*files, ".gitignore"]
+        )
+        assert self.git(project_dir, "status", "--porcelain") == ""
+
+    def test_bootstrap_without_identity_fails(self, project):
+        """Test a missing identity raises so callers can fall back."""
+        project_dir, files = project
+        manager = GitManager()
+
+        with patch.object(manager, "_read_user_config", return_value={}), patch.dict(
+            "os.environ", {"GIT_AUTHOR_NAME": "", "GIT_AUTHOR_EMAIL": ""}
+        ):
+            with pytest.raises(GitError) as exc_info:
+                manager.bootstrap_repository(project_dir, files)
+
+        assert "identity" in str(exc_info.value)
+        assert not (project_dir / ".git").exists()
+
+    def test_bootstrap_changed_file_cleans_up(self, project, git_config):
+        """Test files modified after rendering abort the bootstrap."""
+        project_dir, files = project
+        (project_dir / "README.md").write_bytes(b"# Changed by a hook\n")
+
+        with pytest.raises(GitError) as exc_info:
+            GitManager().bootstrap_repository(project_dir, files, git_config=git_config)
+
+        assert "changed after rendering" in str(exc_info.value)
+        assert not (project_dir / ".git").exists()
+
+    def test_bootstrap_existing_repository(self, project, git_config):
+        """Test an existing repository is never overwritten."""
+        project_dir, files = project
+        (project_dir / ".git").mkdir()
+
+        with pytest.raises(GitError) as exc_info:
+            GitManager().bootstrap_repository(project_dir, files, git_config=git_config)
+
+        assert "already exists" in str(exc_info.value)
+
+    def test_read_user_config_follows_includes(self, tmp_path):
+        """Test identity comes from git, including included config files."""
+        included = tmp_path / "identity"
+        included.write_text(
+            '[user]\n\tname = "Jane Doe"\n\temail = jane@example.com ; work\n'
+        )
+        gitconfig = tmp_path / "gitconfig"
+        gitconfig.write_text(
+            f"[include]\n\tpath = {included}\n[init]\n\tdefaultBranch = main\n"
+        )
+
+        with patch.dict(
+            "os.environ",
+            {
+                "GIT_CONFIG_GLOBAL": str(gitconfig),
+                "GIT_CONFIG_NOSYSTEM": "1",
+                "XDG_CONFIG_HOME": str(tmp_path),
+            },
+        ):
+            values = GitManager()._read_user_config(tmp_path)
+
+        assert values["user.name"] == "Jane Doe"
+        assert values["user.email"] == "jane@example.com"
+        assert values["init.defaultbranch"] == "main"
@@ -0,0 +1,136 @@
+# ABOUTME: Unit tests for the generation phase history
+# ABOUTME: Tests duration recording, regression estimates, persistence and summaries
+
+"""Unit tests for phase history module."""
+
+import pytest
+
+from create_project.core.phase_history import PhaseHistory
+
+
+def record_run(history, files, venv_tool="uv", template="python_library"):
+    """Record a run whose rendering time grows with the file count."""
+    history.record(
+        template,
+        {
+            "validation": 0.1,
+            "file_rendering": 0.02 * files,
+            "venv_creation": 5.0 if venv_tool == "uv" else 20.0,
+        },
+        {"files": files, "directories": 3, "commands": 0, "venv_tool": venv_tool},
+    )
+
+
+class TestPhaseHistory:
+    """Test the PhaseHistory class."""
+
+    def test_estimate_needs_min_samples(self):
+        """Test no estimate is made before enough runs are recorded."""
+        history = PhaseHistory(persist=False)
+        for files in range(PhaseHistory.MIN_SAMPLES - 1):
+            record_run(history, files)
+
+        assert history.estimate("python_library", {"files": 10}) is None
+
+    def test_estimate_scales_with_size(self):
+        """Test phase estimates follow a fit against the size driver."""
+        history = PhaseHistory(persist=False)
+        for files in (10, 20, 30):
+            record_run(history, files)
+
+        estimate = history.estimate("python_library", {"files": 50, "venv_tool": "uv"})
+
+        assert estimate["file_rendering"] == pytest.approx(1.0)
+        assert estimate["validation"] == pytest.approx(0.1)
+        assert "post_commands" not in estimate
+        assert history.estimate("other", {"files": 50}) is None
+
+    def test_venv_estimate_uses_same_tool(self):
+        """Test venv durations are taken from runs with the same tool."""
+        history = PhaseHistory(persist=False)
+        for tool in ("uv", "uv", "venv", "venv"):
+            record_run(history, 10, venv_tool=tool)
+
+        assert history.estimate("python_library", {"venv_tool": "venv"})[
+            "venv_creation"
+        ] == pytest.approx(20.0)
+        assert history.estimate("python_library", {"venv_tool": "uv"})[
+            "venv_creation"
+        ] == pytest.approx(5.0)
+
+    def test_prefers_local_host(self):
+        """Test this host's runs are used once there are enough of them."""
+        remote = PhaseHistory(persist=False, host="remote")
+        for _ in range(3):
+            remote.record("script", {"validation": 9.0}, {})
+
+        history = PhaseHistory(persist=False, host="local")
+        history._records = remote.query()
+        assert history.estimate("script", {})["validation"] == pytest.approx(9.0)
+
+        for _ in range(3):
+            history.record("script", {"validation": 1.0}, {})
+        assert history.estimate("script", {})["validation"] == pytest.approx(1.0)
+
+    def test_persistence(self, tmp_path):
+        """Test runs survive a reload and the store stays bounded."""
+        history = PhaseHistory(history_dir=tmp_path, max_records=3)
+        for files in range(5):
+            record_run(history, files)
+
+        reloaded = PhaseHistory(history_dir=tmp_path, max_records=3)
+        runs = reloaded.query()
+        assert len(runs) == 3
+        assert [r["counts"]["files"] for r in runs] == [2, 3, 4]
+
+        reloaded.clear()
+        assert PhaseHistory(history_dir=tmp_path).query() == []
+
+    def test_corrupt_file_is_ignored(self, tmp_path):
+        """Test an unreadable history file starts an empty history."""
+        (tmp_path / "phases.jsonl").write_text("{not json", encoding="utf-8")
+
+        assert PhaseHistory(history_dir=tmp_path).query() == []
+
+    def test_concurrent_writers_keep_each_others_runs(self, tmp_path):
+        """Test stores in separate processes append instead of overwriting."""
+        first = PhaseHistory(history_dir=tmp_path, host="a")
+        second = PhaseHistory(history_dir=tmp_path, host="b")
+        record_run(first, 10)
+        record_run(second, 20)
+        record_run(first, 30)
+
+        runs = PhaseHistory(history_dir=tmp_path).query()
+        assert [(r["host"], r["counts"]["files"]) for r in runs] == [
+            ("a", 10),
+            ("b", 20),
+            ("a", 30),
+        ]
+
+    def test_load_compacts_oversized_file(self, tmp_path):
+        """Test loading trims the file once it grows past the bound."""
+        history = PhaseHistory(history_dir=tmp_path, max_records=2)
+        for files in range(5):
+            record_run(history, files)
+        history_file = tmp_path / "phases.jsonl"
+        assert len(history_file.read_text().splitlines()) == 5
+
+        reloaded = PhaseHistory(history_dir=tmp_path, max_records=2)
+
+        assert [r["counts"]["files"] for r in reloaded.query()] == [3, 4]
+        assert len(history_file.read_text().splitlines()) == 2
+
+    def test_query_and_summary(self):
+        """Test filtering runs and summarizing them per phase."""
+        history = PhaseHistory(persist=False)
+        for files in (10, 20):
+            record_run(history, files)
+        record_run(history, 10, template="script")
+
+        assert len(history.query(template_name="script")) == 1
+        assert history.query(since=float("inf")) == []
+
+        summary = history.summary("python_library")
+        assert list(summary) == ["python_library"]
+        assert summary["python_library"]["runs"] == 2
+        assert summary["python_library"]["phases"]["file_rendering"]["max"] == 0.4
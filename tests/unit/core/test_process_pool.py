@@ -0,0 +1,131 @@
+# ABOUTME: Unit tests for the process pool batch generation backend
+# ABOUTME: Tests plan execution, progress forwarding and worker crash handling
+
+"""Unit tests for process pool module."""
+
+import multiprocessing
+import os
+from pathlib import Path
+
+import pytest
+
+from create_project.core import process_pool
+from create_project.core.exceptions import TemplateError
+from create_project.core.process_pool import (
+    GenerationPlan,
+    ProcessPoolBackend,
+    _generate_plan,
+    _initialize_worker,
+)
+from create_project.core.project_generator import GenerationResult
+
+
+class FakeGenerator:
+    """Generator that reports progress and creates nothing."""
+
+    def generate_project(self, template, variables, target_path, options, dry_run, progress_callback):
+        if variables.get("crash"):
+            os._exit(1)
+        progress_callback("Rendering files", 50)
+        return GenerationResult(
+            success=True,
+            target_path=Path(target_path),
+            template_name=template,
+            files_created=["a.py", "b.py"],
+            errors=[],
+        )
+
+
+class FakeState:
+    """Worker state without a real template catalog."""
+
+    def __init__(self, config_path, preload):
+        self.generator = FakeGenerator()
+
+    def template(self, name):
+        if name == "missing":
+            raise TemplateError(f"Template '{name}' not found")
+        return name
+
+
+@pytest.fixture
+def fake_state(monkeypatch):
+    """Replace worker state so plans run without templates."""
+    monkeypatch.setattr(process_pool, "_WorkerState", FakeState)
+    monkeypatch.setattr(process_pool, "_worker_state", None)
+    monkeypatch.setattr(process_pool, "_progress_queue", None)
+
+
+def make_plan(tmp_path, name="demo", template="script", **variables):
+    """Create a plan targeting a temporary directory."""
+    return GenerationPlan(
+        template_name=template, variables=variables, target_path=tmp_path / name
+    )
+
+
+class TestGenerationPlan:
+    """Test plan and result helpers."""
+
+    def test_plan_id_defaults_to_target(self, tmp_path):
+        """Test plans are identified by their target path by default."""
+        plan = make_plan(tmp_path)
+
+        assert plan.target_path == str(tmp_path / "demo")
+        assert plan.plan_id == plan.target_path
+
+    def test_generate_plan(self, fake_state, tmp_path):
+        """Test a plan produces a compact result in process."""
+        _initialize_worker(None, False, None, FakeState(None, False))
+
+        result = _generate_plan(make_plan(tmp_path))
+
+        assert result.success is True
+        assert result.files_created == 2
+        assert result.worker_pid == os.getpid()
+
+    def test_generate_plan_missing_template(self, fake_state, tmp_path):
+        """Test lookup errors become failed results."""
+        _initialize_worker(None, False, None, FakeState(None, False))
+
+        result = _generate_plan(make_plan(tmp_path, template="missing"))
+
+        assert result.success is False
+        assert "not found" in result.errors[0]
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="fork start method not available",
+)
+class TestProcessPoolBackend:
+    """Test batches in forked worker processes."""
+
+    def test_unsupported_start_method(self):
+        """Test unknown start methods are rejected."""
+        with pytest.raises(ValueError):
+            ProcessPoolBackend(start_method="teleport")
+
+    def test_generate_batch(self, fake_state, tmp_path):
+        """Test results come back in plan order with progress."""
+        plans = [make_plan(tmp_path, f"project-{i}") for i in range(4)]
+        progress = []
+
+        with ProcessPoolBackend(max_workers=2, start_method="fork") as backend:
+            results = backend.generate(plans, lambda *message: progress.append(message))
+
+        assert [r.plan_id for r in results] == [p.plan_id for p in plans]
+        assert all(r.success and r.files_created == 2 for r in results)
+        assert all(r.worker_pid != os.getpid() for r in results)
+        assert sorted(progress) == sorted(
+            (plan.plan_id, "Rendering files", 50) for plan in plans
+        )
+
+    def test_worker_crash(self, fake_state, tmp_path):
+        """Test a crashed worker fails the batch and the next batch recovers."""
+        with ProcessPoolBackend(max_workers=1, start_method="fork") as backend:
+            crashed = backend.generate([make_plan(tmp_path, crash=True)])
+            recovered = backend.generate([make_plan(tmp_path)])
+
+        assert crashed[0].success is False
+        assert "Worker failed" in crashed[0].errors[0]
+        assert recovered[0].success is True
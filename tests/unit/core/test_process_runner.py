@@ -0,0 +1,107 @@
+# ABOUTME: Unit tests for the streaming subprocess runner
+# ABOUTME: Tests bounded head/tail capture, line callbacks and process group kills
+
+"""Unit tests for process runner module."""
+
+import subprocess
+import sys
+import time
+
+import pytest
+
+from create_project.core.process_runner import OutputBuffer, run_streaming
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="Uses POSIX shell process groups"
+)
+
+
+class TestOutputBuffer:
+    """Test OutputBuffer functionality."""
+
+    def test_keeps_everything_below_limits(self):
+        """Test short output is captured unchanged."""
+        buffer = OutputBuffer(head_lines=2, tail_lines=2)
+        for line in ["a\n", "b\n", "c\n"]:
+            buffer.append(line)
+
+        assert buffer.getvalue() == "a\nb\nc\n"
+        assert buffer.truncated is False
+
+    def test_drops_middle_lines(self):
+        """Test only head and tail lines are kept."""
+        buffer = OutputBuffer(head_lines=2, tail_lines=2)
+        for i in range(10):
+            buffer.append(f"{i}\n")
+
+        assert buffer.dropped_lines == 6
+        assert buffer.getvalue() == "0\n1\n\n... [6 lines omitted] ...\n8\n9\n"
+
+
+class TestRunStreaming:
+    """Test run_streaming functionality."""
+
+    def test_captures_both_streams(self):
+        """Test stdout and stderr are returned like subprocess.run."""
+        result = run_streaming(
+            [
+                sys.executable,
+                "-c",
+                "import sys; print('out'); print('err', file=sys.stderr); sys.exit(3)",
+            ]
+        )
+
+        assert isinstance(result, subprocess.CompletedProcess)
+        assert result.returncode == 3
+        assert result.stdout == "out\n"
+        assert result.stderr == "err\n"
+
+    def test_line_callback_and_bounded_capture(self):
+        """Test every line is forwarded while only head and tail are kept."""
+        lines = []
+
+        result = run_streaming(
+            [sys.executable, "-c", "for i in range(1000): print(i)"],
+            line_callback=lambda stream, line: lines.append(line),
+            head_lines=5,
+            tail_lines=5,
+        )
+
+        assert len(lines) == 1000
+        assert lines[-1] == "999"
+        assert result.stdout.startswith("0\n1\n2\n3\n4\n")
+        assert "[990 lines omitted]" in result.stdout
+        assert result.stdout.endswith("995\n996\n997\n998\n999\n")
+
+    def test_unbounded_capture(self):
+        """Test head_lines=None keeps output that will be parsed intact."""
+        result = run_streaming(
+            [sys.executable, "-c", "for i in range(1000): print(i)"],
+            head_lines=None,
+            tail_lines=5,
+        )
+
+        assert result.stdout.splitlines() == [str(i) for i in range(1000)]
+
+    def test_timeout_kills_process_group(self, tmp_path):
+        """Test a timeout kills children and keeps captured output."""
+        marker = tmp_path / "survived"
+        script = f"echo started; (sleep 2; touch {marker}) & sleep 30"
+
+        start = time.monotonic()
+        with pytest.raises(subprocess.TimeoutExpired) as exc_info:
+            run_streaming(["sh", "-c", script], timeout=0.5)
+
+        assert time.monotonic() - start < 5
+        assert exc_info.value.output == "started\n"
+        time.sleep(2.5)
+        assert not marker.exists()
+
+    def test_background_children_do_not_block(self):
+        """Test processes left holding the pipes are cleaned up after exit."""
+        start = time.monotonic()
+        result = run_streaming(["sh", "-c", "(sleep 30 &); echo done"])
+
+        assert result.returncode == 0
+        assert result.stdout == "done\n"
+        assert time.monotonic() - start < 10
@@ -1,14 +1,17 @@
 # ABOUTME: Unit tests for the ProjectGenerator class
 # ABOUTME: Tests orchestration of project creation, template integration, and atomic operations
 
+import asyncio
 import shutil
 import tempfile
+import threading
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from create_project.config.config_manager import ConfigManager
+from create_project.core.command_executor import ExecutionResult
 from create_project.core.exceptions import (
     ProjectGenerationError,
     TemplateError,
@@ -21,6 +24,21 @@ from create_project.core.project_generator import (
     ProjectOptions,
 )
 from create_project.templates.loader import TemplateLoader
+from create_project.templates.schema.actions import (
+    ActionType,
+    TemplateAction,
+    TemplateHooks,
+)
+from create_project.templates.schema.base_template import (
+    TemplateCategory,
+    TemplateMetadata,
+)
+from create_project.templates.schema.structure import (
+    DirectoryItem,
+    FileItem,
+    ProjectStructure,
+)
+from create_project.templates.schema.template import Template
 
 
 class TestProjectGenerator:
@@ -146,6 +164,9 @@ class TestProjectGenerator:
         project_generator._create_virtual_environment = Mock(return_value=True)
         project_generator._execute_post_commands = Mock(return_value=2)
         project_generator._create_initial_commit = Mock()
+        sample_template.hooks = self.command_template(
+            "pip install -e .", "pre-commit install"
+        ).hooks
 
         # Execute
         result = project_generator.generate_project(
@@ -814,6 +835,45 @@ class TestProjectGenerator:
         assert result is False
         project_generator.git_manager.init_repository.assert_not_called()
 
+    def test_git_bootstrap_uses_rendered_contents(self, project_generator, temp_dir):
+        """Test git bootstrap streams the renderer's in-memory files."""
+        target_path = temp_dir / "test_project"
+        target_path.mkdir()
+        project_generator.file_renderer.rendered_contents = {
+            target_path / "README.md": b"# Test\n",
+            target_path / "src" / "main.py": b"print('hi')\n",
+            temp_dir / "other" / "stale.txt": b"previous project\n",
+        }
+        project_generator.git_manager.bootstrap_repository = Mock()
+
+        result = project_generator._bootstrap_git_repository(target_path, None)
+
+        assert result is True
+        args, kwargs = project_generator.git_manager.bootstrap_repository.call_args
+        assert args == (
+            target_path,
+            {"README.md": b"# Test\n", "src/main.py": b"print('hi')\n"},
+        )
+        assert kwargs["message"] == "Initial commit"
+
+    def test_git_bootstrap_failure_falls_back(self, project_generator, temp_dir):
+        """Test a failed bootstrap is not reported as a generation error."""
+        from create_project.core.exceptions import GitError
+
+        target_path = temp_dir / "test_project"
+        target_path.mkdir()
+        project_generator.file_renderer.rendered_contents = {
+            target_path / "README.md": b"# Test\n"
+        }
+        project_generator.git_manager.bootstrap_repository = Mock(
+            side_effect=GitError("Git identity is not configured")
+        )
+
+        result = project_generator._bootstrap_git_repository(target_path, None)
+
+        assert result is False
+        assert project_generator.generation_errors == []
+
     def test_git_initialization_error(self, project_generator, temp_dir):
         """Test git initialization with error."""
         from create_project.core.exceptions import GitError
@@ -915,6 +975,177 @@ class TestProjectGenerator:
         assert result == 1  # Only one command succeeded
         assert project_generator.command_executor.execute_command.call_count == 2
 
+    def command_template(self, *commands):
+        """Build a template whose post_generate hook runs the given commands."""
+        return Template(
+            metadata=TemplateMetadata(
+                name="Command Template",
+                description="Template with post-generation commands",
+                version="1.0.0",
+                category=TemplateCategory.SCRIPT,
+                author="Test Author",
+            ),
+            structure=ProjectStructure(
+                root_directory=DirectoryItem(
+                    name="project_root",
+                    files=[FileItem(name="README.md", content="# Test")],
+                )
+            ),
+            hooks=TemplateHooks(
+                post_generate=[
+                    TemplateAction(
+                        name=f"step-{index}",
+                        type=ActionType.COMMAND,
+                        command=command,
+                        description=f"Run {command}",
+                    )
+                    for index, command in enumerate(commands, start=1)
+                ]
+            ),
+        )
+
+    def test_generation_counts_include_post_generate_commands(
+        self, project_generator
+    ):
+        """Test phase history sizes post_commands by the template's actions."""
+        template = self.command_template("pip install -e .", "pre-commit install")
+
+        counts = project_generator._generation_counts(template, ProjectOptions())
+        skipped = project_generator._generation_counts(
+            template, ProjectOptions(execute_post_commands=False)
+        )
+
+        assert counts["commands"] == 2
+        assert skipped["commands"] == 0
+
+    def test_build_command_specs_chains_plain_commands(self, project_generator, temp_dir):
+        """Test commands without declarations keep sequential ordering."""
+        specs = project_generator._build_command_specs(
+            ["pip install -e .", "pre-commit install"], temp_dir
+        )
+
+        assert [spec.name for spec in specs] == ["command-1", "command-2"]
+        assert specs[0].after == []
+        assert specs[1].after == ["command-1"]
+        assert specs[1].depends_on == []
+
+    def test_failed_plain_command_does_not_skip_the_rest(
+        self, project_generator, temp_dir
+    ):
+        """Test a failing legacy post-command still lets later ones run."""
+        target_path = temp_dir / "test_project"
+        target_path.mkdir()
+
+        template = self.command_template(
+            "git status-nonexistent", "python --version", "python -c print(1)"
+        )
+
+        def fake_execute(command, cwd, timeout=None, env_vars=None, **kwargs):
+            failed = "nonexistent" in command
+            return ExecutionResult(
+                success=not failed,
+                command=command,
+                returncode=1 if failed else 0,
+                stdout="",
+                stderr="boom" if failed else "",
+                duration=0.0,
+            )
+
+        project_generator.command_executor.execute_command = Mock(
+            side_effect=fake_execute
+        )
+
+        result = project_generator._execute_post_commands(template, target_path)
+
+        assert result == 2
+        execute_command = project_generator.command_executor.execute_command
+        called = [call.kwargs["command"] for call in execute_command.call_args_list]
+        assert called == [
+            "git status-nonexistent",
+            "python --version",
+            "python -c print(1)",
+        ]
+        assert not any(
+            "skipped" in error for error in project_generator.generation_errors
+        )
+
+    def test_build_command_specs_uses_declared_graph(self, project_generator, temp_dir):
+        """Test declared dependencies and resources are passed through."""
+        actions = [
+            TemplateAction(
+                name="install",
+                type=ActionType.COMMAND,
+                command="pip install -e .",
+                description="Install package",
+                resources=["network", "writes-venv"],
+                working_directory="src",
+                inputs=["pyproject.toml"],
+                outputs=["*.egg-info"],
+            ),
+            TemplateAction(
+                name="docs",
+                type=ActionType.COMMAND,
+                command="mkdir docs",
+                description="Scaffold docs",
+            ),
+        ]
+
+        specs = project_generator._build_command_specs(actions, temp_dir)
+
+        assert specs[0].resources == ["network", "writes-venv"]
+        assert specs[0].cwd == temp_dir / "src"
+        assert specs[0].inputs == ["pyproject.toml"]
+        assert specs[0].outputs == ["*.egg-info"]
+        assert specs[1].depends_on == []
+        assert specs[1].inputs == []
+
+    def test_cached_post_command_is_skipped_on_second_run(
+        self, project_generator, temp_dir
+    ):
+        """Test an action with inputs and outputs is not rerun when up to date."""
+        (temp_dir / "pyproject.toml").write_text("[project]\nname = 'demo'\n")
+        template = self.command_template("pip install -e .")
+        template.hooks.post_generate[0].inputs = ["pyproject.toml"]
+        template.hooks.post_generate[0].outputs = ["*.egg-info"]
+
+        def fake_execute(command, cwd, timeout=None, env_vars=None, **kwargs):
+            (temp_dir / "demo.egg-info").mkdir(exist_ok=True)
+            return ExecutionResult(
+                success=True,
+                command=command,
+                returncode=0,
+                stdout="",
+                stderr="",
+                duration=0.0,
+            )
+
+        project_generator.command_executor.execute_command = Mock(
+            side_effect=fake_execute
+        )
+
+        first = project_generator._execute_post_commands(
+            template, temp_dir, use_cache=True
+        )
+        second = project_generator._execute_post_commands(
+            template, temp_dir, use_cache=True
+        )
+
+        assert first == second == 1
+        assert project_generator.command_executor.execute_command.call_count == 1
+
+    def test_output_reporter_throttles_progress(self, project_generator):
+        """Test live command output is shown as throttled progress messages."""
+        tracker = Mock()
+        report = project_generator._output_reporter(tracker)
+
+        report(0.5, "install", "Collecting requests")
+        report(0.5, "install", "Collecting urllib3")
+        report(0.5, "install", "   ")
+
+        tracker.update_phase_progress.assert_called_once_with(
+            0.5, "install: Collecting requests"
+        )
+
     def test_initial_commit_creation(self, project_generator, temp_dir):
         """Test creation of initial git commit."""
         target_path = temp_dir / "test_project"
@@ -987,6 +1218,106 @@ class TestProjectGenerator:
 
         assert result is None  # Should handle error gracefully
 
+    def test_ai_assistance_runs_on_shared_runtime(self, project_generator, temp_dir):
+        """Test AI help runs on the persistent AI runtime loop."""
+        from create_project.ai.runtime import AIRuntime, set_ai_runtime
+
+        loops = []
+
+        async def generate_help_response(**kwargs):
+            loops.append(asyncio.get_running_loop())
+            return "AI suggestion"
+
+        project_generator.ai_service = Mock()
+        project_generator.ai_service.generate_help_response = generate_help_response
+        runtime = AIRuntime(name="test-ai-runtime")
+        set_ai_runtime(runtime)
+        try:
+            results = [
+                project_generator._get_ai_assistance(
+                    RuntimeError("failed"),
+                    None,
+                    {},
+                    temp_dir,
+                    ProjectOptions(),
+                    {},
+                )
+                for _ in range(2)
+            ]
+        finally:
+            runtime.shutdown()
+            set_ai_runtime(None)
+
+        assert results == ["AI suggestion"] * 2
+        assert loops[0] is loops[1]
+
+    def test_ai_assistance_waits_for_slow_but_live_model(
+        self, project_generator, temp_dir, monkeypatch
+    ):
+        """Test a model that starts within the hedge budget is not replaced."""
+        from create_project.ai.ai_service import AIService, AIServiceConfig
+        from create_project.ai.runtime import AIRuntime, set_ai_runtime
+
+        async def stream_response(**kwargs):
+            await asyncio.sleep(0.01)
+            yield "Model "
+            # Finishing takes far longer than the hedge budget
+            await asyncio.sleep(0.3)
+            yield "help"
+
+        ai_service = AIService(
+            ai_config=AIServiceConfig(
+                cache_enabled=False,
+                context_collection_enabled=False,
+                hedge_after_seconds=0.1,
+            )
+        )
+        monkeypatch.setattr(ai_service, "is_available", AsyncMock(return_value=True))
+        ai_service._response_generator = Mock()
+        ai_service._response_generator.stream_model_response = stream_response
+        project_generator.ai_service = ai_service
+        monkeypatch.setattr(ProjectGenerator, "AI_ASSISTANCE_TIMEOUT", 2.0)
+        runtime = AIRuntime(name="test-ai-runtime")
+        set_ai_runtime(runtime)
+        try:
+            result = project_generator._get_ai_assistance(
+                RuntimeError("slow model"),
+                None,
+                {},
+                temp_dir,
+                ProjectOptions(),
+                {},
+            )
+        finally:
+            runtime.shutdown()
+            set_ai_runtime(None)
+
+        assert result == "Model help"
+
+    def test_prewarm_ai_model_in_background(self, project_generator, monkeypatch):
+        """Test the AI model preload is started without waiting for it."""
+        from create_project.ai.runtime import AIRuntime, set_ai_runtime
+
+        monkeypatch.setattr(ProjectGenerator, "PREWARM_AI_MODEL", True)
+        started = threading.Event()
+        release = threading.Event()
+
+        async def prewarm():
+            started.set()
+            await asyncio.get_running_loop().run_in_executor(None, release.wait, 5)
+
+        project_generator.ai_service = Mock()
+        project_generator.ai_service.prewarm = prewarm
+        runtime = AIRuntime(name="test-ai-runtime")
+        set_ai_runtime(runtime)
+        try:
+            project_generator._prewarm_ai_model()
+            assert started.wait(5)
+        finally:
+            release.set()
+            runtime.shutdown()
+            set_ai_runtime(None)
+
     def test_generate_project_with_ai_assistance(
         self, project_generator, sample_template, sample_variables, temp_dir
     ):
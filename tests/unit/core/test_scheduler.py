@@ -0,0 +1,178 @@
+# ABOUTME: Unit tests for the priority operation scheduler
+# ABOUTME: Tests priority order, resource caps, admission control and metrics
+
+"""Unit tests for scheduler module."""
+
+import threading
+
+import pytest
+
+from create_project.core.exceptions import QueueFullError, ThreadingError
+from create_project.core.scheduler import OperationScheduler, Priority
+
+
+@pytest.fixture
+def scheduler():
+    """Create a single worker scheduler."""
+    scheduler = OperationScheduler(max_workers=1)
+    yield scheduler
+    scheduler.shutdown(wait=False, cancel_pending=True)
+
+
+def block(scheduler, **kwargs):
+    """Occupy a worker until the returned event is set."""
+    release = threading.Event()
+    started = threading.Event()
+
+    def blocker():
+        started.set()
+        release.wait(5)
+
+    future = scheduler.schedule(blocker, **kwargs)
+    assert started.wait(5)
+    return release, future
+
+
+class TestOperationScheduler:
+    """Test OperationScheduler class."""
+
+    def test_runs_task(self, scheduler):
+        """Test a task runs and its result is returned."""
+        future = scheduler.schedule(lambda a, b: a + b, args=(1,), kwargs={"b": 2})
+
+        assert future.result(timeout=5) == 3
+
+    def test_exception_propagates(self, scheduler):
+        """Test task exceptions are set on the future."""
+
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            scheduler.submit(fail).result(timeout=5)
+
+        assert scheduler.metrics()["failed"] == 1
+
+    def test_priority_order(self, scheduler):
+        """Test higher priority tasks run first, ties in submission order."""
+        release, blocker = block(scheduler)
+        order = []
+
+        futures = [
+            scheduler.schedule(order.append, args=(name,), priority=priority)
+            for name, priority in [
+                ("batch", Priority.BATCH),
+                ("normal-1", Priority.NORMAL),
+                ("interactive", Priority.INTERACTIVE),
+                ("normal-2", Priority.NORMAL),
+            ]
+        ]
+        release.set()
+        for future in futures:
+            future.result(timeout=5)
+
+        assert order == ["interactive", "normal-1", "normal-2", "batch"]
+
+    def test_aging_promotes_waiting_tasks(self):
+        """Test long waiting tasks overtake newer higher priority work."""
+        scheduler = OperationScheduler(max_workers=1, aging_seconds=0.05)
+        try:
+            release, _ = block(scheduler)
+            order = []
+            batch = scheduler.schedule(order.append, args=("batch",), priority=Priority.BATCH)
+            threading.Event().wait(0.15)
+            normal = scheduler.schedule(order.append, args=("normal",))
+
+            release.set()
+            batch.result(timeout=5)
+            normal.result(timeout=5)
+
+            assert order == ["batch", "normal"]
+        finally:
+            scheduler.shutdown(wait=False)
+
+    def test_resource_limit(self):
+        """Test a saturated resource class does not block other work."""
+        scheduler = OperationScheduler(max_workers=2, resource_limits={"disk": 1})
+        try:
+            release, _ = block(scheduler, resources=["disk"])
+            disk = scheduler.schedule(lambda: "disk", resources=["disk"])
+            other = scheduler.schedule(lambda: "other", resources=["network"])
+
+            assert other.result(timeout=5) == "other"
+            assert not disk.done()
+            assert scheduler.metrics()["resources_in_use"] == {"disk": 1}
+
+            release.set()
+            assert disk.result(timeout=5) == "disk"
+        finally:
+            scheduler.shutdown(wait=False)
+
+    def test_queue_full(self):
+        """Test admission control rejects non-interactive work."""
+        scheduler = OperationScheduler(max_workers=1, max_queue_depth=1)
+        try:
+            release, _ = block(scheduler)
+            scheduler.schedule(lambda: None)
+
+            with pytest.raises(QueueFullError) as exc_info:
+                scheduler.schedule(lambda: None, priority=Priority.BATCH)
+            assert exc_info.value.details["max_queue_depth"] == 1
+
+            interactive = scheduler.schedule(lambda: "ok", priority=Priority.INTERACTIVE)
+            release.set()
+            assert interactive.result(timeout=5) == "ok"
+            assert scheduler.metrics()["rejected"] == 1
+        finally:
+            scheduler.shutdown(wait=False)
+
+    def test_cancel_queued_task(self, scheduler):
+        """Test cancelling a queued task removes it from the queue."""
+        release, _ = block(scheduler)
+        ran = []
+        future = scheduler.schedule(ran.append, args=(True,))
+
+        assert future.cancel()
+        assert scheduler.metrics()["queue_depth"] == 0
+
+        release.set()
+        scheduler.schedule(lambda: None).result(timeout=5)
+        assert ran == []
+        assert scheduler.metrics()["cancelled"] == 1
+
+    def test_metrics(self, scheduler):
+        """Test counters and timing statistics are reported per priority."""
+        scheduler.schedule(lambda: None, priority=Priority.BATCH).result(timeout=5)
+        scheduler.schedule(lambda: None).result(timeout=5)
+
+        metrics = scheduler.metrics()
+
+        assert metrics["submitted"] == 2
+        assert metrics["completed"] == 2
+        assert metrics["queue_depth"] == 0
+        assert metrics["queue_wait"]["batch"]["count"] == 1
+        assert metrics["run_time"]["normal"]["count"] == 1
+
+    def test_shutdown_waits_for_queued_tasks(self):
+        """Test shutdown with wait drains the queue."""
+        scheduler = OperationScheduler(max_workers=1)
+        release, _ = block(scheduler)
+        queued = scheduler.schedule(lambda: "done")
+
+        threading.Timer(0.05, release.set).start()
+        scheduler.shutdown(wait=True)
+
+        assert queued.result(timeout=0) == "done"
+        with pytest.raises(ThreadingError):
+            scheduler.schedule(lambda: None)
+
+    def test_shutdown_cancels_pending(self):
+        """Test shutdown without wait cancels tasks that have not started."""
+        scheduler = OperationScheduler(max_workers=1)
+        release, _ = block(scheduler)
+        queued = scheduler.schedule(lambda: None)
+
+        scheduler.shutdown(wait=False)
+        release.set()
+
+        assert queued.cancelled()
@@ -10,7 +10,9 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from create_project.core.exceptions import ThreadingError
+from create_project.core.exceptions import QueueFullError, ThreadingError
+from create_project.core.progress import ProgressBus
+from create_project.core.scheduler import Priority
 from create_project.core.threading_model import (
     BackgroundOperation,
     OperationStatus,
@@ -209,6 +211,26 @@ class TestBackgroundOperation:
         assert update.percentage == 10.0
         assert update.details == {"key": "value"}
 
+    def test_progress_updates_are_coalesced(self):
+        """Test history is bounded and callbacks are rate limited."""
+        delivered = []
+        operation = BackgroundOperation(
+            operation_id="test-123",
+            operation_func=lambda: "result",
+            operation_args=(),
+            operation_kwargs={},
+            progress_callback=delivered.append,
+        )
+
+        for step in range(1, 1001):
+            operation.add_progress_update(f"Step {step}", step, 1000)
+
+        assert len(operation.progress_updates) == ProgressBus.DEFAULT_HISTORY_SIZE
+        assert operation.progress_updates[-1].message == "Step 1000"
+        assert delivered[0].message == "Step 1"
+        assert delivered[-1].percentage == 100.0
+        assert len(delivered) < 1000
+
     def test_progress_callback_exception(self):
         """Test that progress callback exceptions don't break operation."""
         def bad_callback(update):
@@ -350,7 +372,11 @@ class TestThreadingModel:
 
         # Status could be RUNNING or already COMPLETED depending on timing
         status = threading_model.get_operation_status("gen-123")
-        assert status in [OperationStatus.RUNNING, OperationStatus.COMPLETED]
+        assert status in [
+            OperationStatus.QUEUED,
+            OperationStatus.RUNNING,
+            OperationStatus.COMPLETED,
+        ]
 
     def test_start_project_generation_duplicate_id(
         self,
@@ -541,7 +567,12 @@ class TestThreadingModel:
 
         status = threading_model.get_operation_status(operation_id)
         # Could be PENDING, RUNNING, or already COMPLETED
-        assert status in [OperationStatus.PENDING, OperationStatus.RUNNING, OperationStatus.COMPLETED]
+        assert status in [
+            OperationStatus.PENDING,
+            OperationStatus.QUEUED,
+            OperationStatus.RUNNING,
+            OperationStatus.COMPLETED,
+        ]
 
         # Wait for completion
         threading_model.get_operation_result(operation_id, timeout=5.0)
@@ -701,3 +732,76 @@ class TestThreadingModel:
         # All should complete successfully
         assert all(r.status == OperationStatus.COMPLETED for r in results)
         assert len(results) == 5
+
+    def test_queue_full_rejects_generation(self, mock_template, tmp_path):
+        """Test rejected operations are not kept around."""
+        release = threading.Event()
+        generator = MagicMock()
+        generator.generate_project.side_effect = lambda *args, **kwargs: release.wait(5)
+        model = ThreadingModel(max_workers=1, max_queue_depth=1)
+
+        def start(operation_id, **kwargs):
+            return model.start_project_generation(
+                operation_id=operation_id,
+                project_generator=generator,
+                template=mock_template,
+                variables={},
+                target_path=tmp_path / operation_id,
+                **kwargs,
+            )
+
+        try:
+            start("gen-1")
+            start("gen-2")
+            with pytest.raises(QueueFullError):
+                start("gen-3")
+            assert "gen-3" not in model.operations
+
+            # Interactive work bypasses admission control
+            start("gen-4", priority=Priority.INTERACTIVE)
+            assert model.get_operation_status("gen-4") == OperationStatus.QUEUED
+        finally:
+            release.set()
+            model.shutdown(wait=True)
+
+    def test_expired_operations_are_evicted(
+        self, mock_project_generator, mock_template, tmp_path
+    ):
+        """Test finished operations older than the TTL are dropped."""
+        model = ThreadingModel(max_workers=1, operation_ttl=0)
+        try:
+            model.start_project_generation(
+                operation_id="gen-1",
+                project_generator=mock_project_generator,
+                template=mock_template,
+                variables={},
+                target_path=tmp_path,
+            )
+            model.operations["gen-1"].future.result(timeout=5.0)
+            time.sleep(0.01)
+
+            assert model.list_active_operations() == {}
+            assert "gen-1" not in model.operations
+            assert model.get_metrics()["evicted_operations"] == 1
+        finally:
+            model.shutdown(wait=False)
+
+    def test_get_metrics(
+        self, threading_model, mock_project_generator, mock_template, tmp_path
+    ):
+        """Test metrics include scheduler counters and operation count."""
+        threading_model.start_project_generation(
+            operation_id="gen-1",
+            project_generator=mock_project_generator,
+            template=mock_template,
+            variables={},
+            target_path=tmp_path,
+        )
+        threading_model.get_operation_result("gen-1", timeout=5.0, remove_completed=False)
+
+        metrics = threading_model.get_metrics()
+
+        assert metrics["operations"] == 1
+        assert metrics["submitted"] == 1
+        assert metrics["max_workers"] == 2
+        assert "normal" in metrics["queue_wait"]
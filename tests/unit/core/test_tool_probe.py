@@ -0,0 +1,163 @@
+# ABOUTME: Unit tests for the external tool probe cache
+# ABOUTME: Tests fingerprint keying, persistence, PATH invalidation and concurrency
+
+"""Unit tests for tool probe cache module."""
+
+import os
+import subprocess
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from create_project.core.git_manager import GitManager
+from create_project.core.tool_probe import ToolProbeCache, prewarm_tool_probes
+from create_project.core.venv_manager import VenvManager
+
+
+class TestToolProbeCache:
+    """Test ToolProbeCache functionality."""
+
+    @pytest.fixture
+    def fake_tool(self, tmp_path):
+        """Create a fake executable to fingerprint."""
+        tool = tmp_path / "faketool"
+        tool.write_text("#!/bin/sh\necho 'faketool 1.0'\n")
+        tool.chmod(0o755)
+        return tool
+
+    @pytest.fixture
+    def mock_run(self):
+        """Mock subprocess.run with a successful version check."""
+        with patch("subprocess.run") as mock:
+            mock.return_value = MagicMock(
+                returncode=0, stdout="faketool 1.0\n", stderr=""
+            )
+            yield mock
+
+    def test_probe_runs_once_and_caches(self, tmp_path, fake_tool, mock_run):
+        """Test repeated probes are served from memory."""
+        cache = ToolProbeCache(cache_dir=tmp_path / "cache")
+
+        first = cache.probe([str(fake_tool), "--version"])
+        second = cache.probe([str(fake_tool), "--version"])
+
+        assert first.success and not first.cached
+        assert second.success and second.cached
+        assert second.stdout == "faketool 1.0\n"
+        mock_run.assert_called_once()
+
+    def test_probe_persists_across_instances(self, tmp_path, fake_tool, mock_run):
+        """Test warm runs in a new process read probes from disk."""
+        ToolProbeCache(cache_dir=tmp_path / "cache").probe([str(fake_tool), "--version"])
+
+        result = ToolProbeCache(cache_dir=tmp_path / "cache").probe(
+            [str(fake_tool), "--version"]
+        )
+
+        assert result.cached is True
+        mock_run.assert_called_once()
+
+    def test_binary_change_invalidates_entry(self, tmp_path, fake_tool, mock_run):
+        """Test a modified binary is probed again."""
+        cache = ToolProbeCache(cache_dir=tmp_path / "cache")
+        cache.probe([str(fake_tool), "--version"])
+
+        fake_tool.write_text("#!/bin/sh\necho 'faketool 2.0 with a longer banner'\n")
+
+        result = cache.probe([str(fake_tool), "--version"])
+
+        assert result.cached is False
+        assert mock_run.call_count == 2
+
+    def test_path_change_invalidates_cache(self, tmp_path, fake_tool, mock_run):
+        """Test changing PATH drops all cached probes."""
+        cache = ToolProbeCache(cache_dir=tmp_path / "cache")
+        cache.probe([str(fake_tool), "--version"])
+
+        with patch.dict(os.environ, {"PATH": str(tmp_path)}):
+            result = cache.probe([str(fake_tool), "--version"])
+
+        assert result.cached is False
+        assert mock_run.call_count == 2
+
+    def test_ttl_expiry(self, tmp_path, fake_tool, mock_run):
+        """Test expired probes are executed again."""
+        cache = ToolProbeCache(cache_dir=tmp_path / "cache", ttl_seconds=0)
+        cache.probe([str(fake_tool), "--version"])
+
+        with patch("time.time", return_value=10**12):
+            result = cache.probe([str(fake_tool), "--version"])
+
+        assert result.cached is False
+        assert mock_run.call_count == 2
+
+    def test_timeout_is_not_cached(self, tmp_path, fake_tool):
+        """Test transient probe failures are retried."""
+        cache = ToolProbeCache(cache_dir=tmp_path / "cache")
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.side_effect = subprocess.TimeoutExpired("faketool", 10)
+            result = cache.probe([str(fake_tool), "--version"])
+
+            assert result.success is False
+            assert "timed out" in result.error
+
+            cache.probe([str(fake_tool), "--version"])
+            assert mock_run.call_count == 2
+
+    def test_missing_binary_is_not_cached(self, tmp_path, mock_run):
+        """Test binaries that cannot be fingerprinted are always probed."""
+        cache = ToolProbeCache(cache_dir=tmp_path / "cache")
+
+        cache.probe([str(tmp_path / "missing"), "--version"])
+        cache.probe([str(tmp_path / "missing"), "--version"])
+
+        assert mock_run.call_count == 2
+
+    def test_probe_many_preserves_order(self, tmp_path, fake_tool):
+        """Test concurrent probes return results in request order."""
+        cache = ToolProbeCache(persist=False)
+
+        def run_side_effect(args, **kwargs):
+            return MagicMock(returncode=0, stdout=" ".join(args), stderr="")
+
+        with patch("subprocess.run", side_effect=run_side_effect):
+            results = cache.probe_many(
+                [[str(fake_tool), "--version"], [str(fake_tool), "--help"]]
+            )
+
+        assert [r.stdout for r in results] == [
+            f"{fake_tool} --version",
+            f"{fake_tool} --help",
+        ]
+
+    def test_invalidate(self, tmp_path, fake_tool, mock_run):
+        """Test explicit invalidation clears memory and disk."""
+        cache = ToolProbeCache(cache_dir=tmp_path / "cache")
+        cache.probe([str(fake_tool), "--version"])
+
+        cache.invalidate()
+
+        assert ToolProbeCache(cache_dir=tmp_path / "cache").probe(
+            [str(fake_tool), "--version"]
+        ).cached is False
+
+    def test_warm_managers_spawn_no_subprocesses(self, tmp_path):
+        """Test managers built after a prewarm do not run any probes."""
+        cache = ToolProbeCache(cache_dir=tmp_path / "cache")
+
+        with patch("shutil.which", return_value=sys.executable), patch(
+            "subprocess.run"
+        ) as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="1.0", stderr="")
+            prewarm_tool_probes(cache)
+            prewarm_calls = mock_run.call_count
+
+            git_manager = GitManager(probe_cache=cache)
+            venv_manager = VenvManager(probe_cache=cache)
+
+        assert prewarm_calls == 4
+        assert mock_run.call_count == prewarm_calls
+        assert git_manager._git_available is True
+        assert venv_manager.preferred_tool is not None
@@ -11,7 +11,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from create_project.core.exceptions import VirtualEnvError
-from create_project.core.venv_manager import VenvManager, VenvTool
+from create_project.core.venv_manager import InstallOptions, VenvManager, VenvTool
 
 
 class TestVenvManager:
@@ -36,8 +36,10 @@ class TestVenvManager:
 
     @pytest.fixture
     def mock_subprocess_run(self):
-        """Mock subprocess.run for venv commands."""
-        with patch("subprocess.run") as mock:
+        """Mock subprocess.run and the streaming runner for venv commands."""
+        with patch("subprocess.run") as mock, patch(
+            "create_project.core.venv_manager.run_streaming", mock
+        ):
             # Default successful version check
             mock.return_value = MagicMock(
                 returncode=0,
@@ -397,7 +399,13 @@ class TestVenvManager:
 
         mock_subprocess_run.reset_mock()
 
-        venv_manager._install_requirements(venv_path, requirements_file)
+        # Without uv the environment's own pip is used
+        venv_manager.available_tools.pop(VenvTool.UV)
+        result = venv_manager._install_requirements(venv_path, requirements_file)
+
+        assert result["success"] is True
+        assert result["installer"] == "pip"
+        assert "duration" in result
 
         # Verify pip install was called
         mock_subprocess_run.assert_called_once()
@@ -445,6 +453,72 @@ class TestVenvManager:
         # Should log error but not raise exception
         venv_manager._install_requirements(venv_path, requirements_file)
 
+    def test_install_requirements_uses_uv_when_available(
+        self, venv_manager, mock_subprocess_run, temp_project
+    ):
+        """Test uv installs into the venv interpreter with hardlinks and cache."""
+        venv_path = temp_project / ".venv"
+        bin_dir = venv_path / ("Scripts" if sys.platform == "win32" else "bin")
+        bin_dir.mkdir(parents=True)
+        python_path = bin_dir / ("python.exe" if sys.platform == "win32" else "python")
+        python_path.touch()
+
+        requirements_file = temp_project / "requirements.txt"
+        requirements_file.write_text("requests==2.28.0\n")
+
+        mock_subprocess_run.reset_mock()
+
+        result = venv_manager._install_requirements(venv_path, requirements_file)
+
+        args = mock_subprocess_run.call_args[0][0]
+        assert result["installer"] == "uv"
+        assert args[:3] == ["/usr/local/bin/uv", "pip", "install"]
+        assert args[args.index("--python") + 1] == str(python_path)
+        assert args[args.index("--link-mode") + 1] == "hardlink"
+        assert args[args.index("--cache-dir") + 1] == str(
+            venv_manager.install_options.cache_dir
+        )
+        assert "--no-index" not in args
+
+    def test_install_requirements_offline_wheelhouse(
+        self, mock_which, mock_subprocess_run, mock_sys_executable, temp_project
+    ):
+        """Test wheelhouse and offline options reach the installer."""
+        wheelhouse = temp_project / "wheels"
+        cache_dir = temp_project / "cache"
+        manager = VenvManager(
+            install_options=InstallOptions(
+                wheelhouse_dir=wheelhouse, offline=True, cache_dir=cache_dir
+            )
+        )
+        manager.available_tools.pop(VenvTool.UV)
+
+        venv_path = temp_project / ".venv"
+        pip_dir = venv_path / ("Scripts" if sys.platform == "win32" else "bin")
+        pip_dir.mkdir(parents=True)
+        (pip_dir / ("pip.exe" if sys.platform == "win32" else "pip")).touch()
+        requirements_file = temp_project / "requirements.txt"
+        requirements_file.write_text("requests==2.28.0\n")
+
+        mock_subprocess_run.reset_mock()
+        result = manager._install_requirements(venv_path, requirements_file)
+
+        args = mock_subprocess_run.call_args[0][0]
+        assert args[args.index("--find-links") + 1] == str(wheelhouse)
+        assert "--no-index" in args
+        assert args[args.index("--cache-dir") + 1] == str(cache_dir)
+        assert cache_dir.is_dir()
+        assert result["offline"] is True
+
+    def test_create_venv_reports_timings(
+        self, venv_manager, mock_subprocess_run, temp_project
+    ):
+        """Test creation timing is reported in the result."""
+        result = venv_manager.create_venv(temp_project)
+
+        assert result["timings"]["creation"] >= 0
+        assert "install" not in result["timings"]
+
     def test_tool_priority_order(self):
         """Test that tool priority order is correct."""
         assert VenvManager.TOOL_PRIORITY == [
@@ -0,0 +1,141 @@
+# ABOUTME: Unit tests for the prewarmed virtual environment pool
+# ABOUTME: Tests filling, atomic claiming, relocation and VenvManager integration
+
+"""Unit tests for venv pool module."""
+
+import os
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from create_project.core.venv_manager import VenvManager, VenvTool
+from create_project.core.venv_pool import VenvPool
+
+
+def fake_create_with_tool(tool, project_path, venv_name, python_version=None):
+    """Create a minimal venv layout embedding its absolute path."""
+    venv_path = Path(project_path) / venv_name
+    bin_dir = venv_path / ("Scripts" if os.name == "nt" else "bin")
+    bin_dir.mkdir(parents=True)
+    (venv_path / "pyvenv.cfg").write_text("home = /usr/bin\n")
+    (bin_dir / "activate").write_text(f'VIRTUAL_ENV="{venv_path}"\n')
+    pip = bin_dir / "pip"
+    pip.write_text(f"#!{venv_path}/bin/python\n")
+    pip.chmod(0o755)
+    return {"success": True, "venv_path": str(venv_path), "tool": tool.value}
+
+
+class TestVenvPool:
+    """Test VenvPool functionality."""
+
+    @pytest.fixture
+    def manager(self):
+        """Create a mock VenvManager that builds fake environments."""
+        manager = MagicMock(spec=VenvManager)
+        manager.preferred_tool = VenvTool.VENV
+        manager._create_with_tool.side_effect = fake_create_with_tool
+        manager.get_activation_instructions.return_value = {}
+        return manager
+
+    @pytest.fixture
+    def pool(self, manager, tmp_path):
+        """Create a pool staged inside the test directory."""
+        pool = VenvPool(manager, pool_dir=tmp_path / "pool", size=2, idle_delay=0.1)
+        yield pool
+        pool.stop()
+
+    def test_fill_creates_ready_environments(self, pool):
+        """Test fill tops each Python version up to the pool size."""
+        assert pool.fill() == 2
+        assert pool.available() == 2
+        assert pool.fill() == 0
+
+    def test_fill_per_python_version(self, manager, tmp_path):
+        """Test each configured Python version gets its own slots."""
+        pool = VenvPool(
+            manager, pool_dir=tmp_path / "pool", size=1, python_versions=["3.11", "3.12"]
+        )
+
+        assert pool.fill() == 2
+        assert pool.available("3.11") == 1
+        assert pool.available("3.12") == 1
+        assert pool.available() == 0
+
+    def test_claim_moves_and_relocates(self, pool, tmp_path):
+        """Test claiming renames the venv and rewrites embedded paths."""
+        pool.fill()
+        project = tmp_path / "project"
+        project.mkdir()
+        venv_path = project / ".venv"
+
+        result = pool.claim(venv_path)
+
+        assert result["success"] is True
+        assert result["pooled"] is True
+        assert result["tool"] == "venv"
+        assert pool.available() == 1
+        activate = (venv_path / "bin" / "activate").read_text()
+        assert activate == f'VIRTUAL_ENV="{venv_path}"\n'
+        assert str(pool.pool_dir) not in (venv_path / "bin" / "pip").read_text()
+        assert os.access(venv_path / "bin" / "pip", os.X_OK)
+
+    def test_claim_empty_pool(self, pool, tmp_path):
+        """Test claiming from an empty pool returns None."""
+        assert pool.claim(tmp_path / ".venv") is None
+
+    def test_claim_rejects_other_venv_names(self, pool, tmp_path):
+        """Test only the pooled directory name can be claimed."""
+        pool.fill()
+        assert pool.claim(tmp_path / "env") is None
+        assert pool.available() == 2
+
+    def test_claim_cross_device_declined(self, pool, tmp_path):
+        """Test claims across filesystems fall back to normal creation."""
+        pool.fill()
+
+        with patch("os.rename", side_effect=OSError(18, "Invalid cross-device link")):
+            assert pool.claim(tmp_path / ".venv") is None
+
+        assert pool.available() == 2
+
+    def test_background_refill(self, pool, tmp_path):
+        """Test the background thread refills after a claim."""
+        pool.start()
+        deadline = time.monotonic() + 5
+        while pool.available() < 2 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert pool.available() == 2
+
+        pool.claim(tmp_path / ".venv")
+        deadline = time.monotonic() + 5
+        while pool.available() < 2 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert pool.available() == 2
+
+    def test_failed_build_is_cleaned_up(self, manager, pool):
+        """Test failed creations leave no staging directories behind."""
+        manager._create_with_tool.side_effect = None
+        manager._create_with_tool.return_value = {"success": False, "error": "boom"}
+
+        assert pool.fill() == 0
+        assert not any(pool.pool_dir.glob("*/.building-*"))
+
+    def test_venv_manager_claims_from_pool(self, pool, tmp_path):
+        """Test VenvManager.create_venv uses a pooled environment."""
+        pool.fill()
+        project = tmp_path / "project"
+        project.mkdir()
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="1.0", stderr="")
+            manager = VenvManager(pool=pool)
+            mock_run.reset_mock()
+
+            result = manager.create_venv(project)
+
+        assert result["pooled"] is True
+        assert "creation" in result["timings"]
+        assert (project / ".venv" / "pyvenv.cfg").exists()
+        mock_run.assert_not_called()
@@ -202,6 +202,28 @@ class TestTemplateAction:
         errors = exc_info.value.errors()
         assert any("cannot contain '..'" in str(e) for e in errors)
 
+    def test_file_glob_validation(self):
+        """Test input and output globs must stay inside the project."""
+        action = TemplateAction(
+            name="test",
+            type=ActionType.COMMAND,
+            command="pip install -e .",
+            description="Test",
+            inputs=["pyproject.toml", "src/**/*.py"],
+            outputs=["*.egg-info"],
+        )
+        assert action.inputs == ["pyproject.toml", "src/**/*.py"]
+
+        for glob in ["/etc/*", "C:\\*", "../secrets", "src/../../x", ""]:
+            with pytest.raises(ValidationError):
+                TemplateAction(
+                    name="test",
+                    type=ActionType.COMMAND,
+                    command="ls",
+                    description="Test",
+                    inputs=[glob],
+                )
+
     def test_timeout_validation(self):
         """Test timeout validation."""
         # Valid timeout
@@ -628,6 +650,38 @@ class TestTemplateHooks:
         assert "Duplicate action names across hooks" in errors[0]
         assert "'duplicate'" in errors[0]
 
+    def test_validate_hooks_unknown_dependency(self):
+        """Test validate_hooks reports dependencies outside the stage."""
+        install = TemplateAction(
+            name="install",
+            type=ActionType.COMMAND,
+            command="pip install -e .",
+            description="Install package",
+            resources=["network", "writes-venv"],
+        )
+        hooks_install = TemplateAction(
+            name="hooks",
+            type=ActionType.COMMAND,
+            command="pre-commit install",
+            description="Install git hooks",
+            depends_on=["install", "setup"],
+        )
+
+        hooks = TemplateHooks(
+            pre_generate=[
+                TemplateAction(
+                    name="setup",
+                    type=ActionType.COMMAND,
+                    command="echo setup",
+                    description="Setup",
+                )
+            ],
+            post_generate=[install, hooks_install],
+        )
+
+        errors = hooks.validate_hooks()
+        assert errors == ["Action 'hooks' depends on unknown actions: ['setup']"]
+
     def test_hooks_with_all_stages(self):
         """Test hooks with actions in all stages."""
         # Create actions for each stage
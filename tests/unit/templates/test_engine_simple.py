@@ -234,6 +234,21 @@ class TestTemplateEngine:
         # Cache should start empty
         assert initial_stats.get("size", 0) == 0
 
+    def test_compiled_template_cache(self, template_engine):
+        """Test template strings are compiled once and evicted by age."""
+        template_engine.COMPILED_CACHE_SIZE = 2
+
+        first = template_engine.compile_template_string("Hello {{name}}!")
+        assert template_engine.compile_template_string("Hello {{name}}!") is first
+        assert template_engine.render_template_string("Hello {{name}}!", {"name": "x"}) == "Hello x!"
+
+        template_engine.compile_template_string("a")
+        template_engine.compile_template_string("b")
+        assert template_engine.compile_template_string("Hello {{name}}!") is not first
+
+        template_engine.clear_cache()
+        assert template_engine.get_cache_stats()["compiled_templates"] == 0
+
     def test_thread_safety_basic(self, template_engine):
         """Test basic thread safety of template engine."""
         import threading
@@ -326,6 +326,24 @@ class TestPerformanceMonitor:
             # Should have logged several info messages
             assert mock_logger.info.call_count >= 2
 
+    def test_record_duration(self):
+        """Test durations measured elsewhere update counters only."""
+        monitor = PerformanceMonitor(enabled=True)
+
+        monitor.record_duration("ollama_inter_token:llama3.2:3b", 0.05)
+        monitor.record_duration("ollama_inter_token:llama3.2:3b", 0.15, success=False)
+
+        stats = monitor.get_operation_stats()["ollama_inter_token:llama3.2:3b"]
+        assert stats.count == 2
+        assert stats.failures == 1
+        assert stats.max_duration == 0.15
+        assert monitor.operations == []
+
+        monitor.enabled = False
+        monitor.record_duration("ollama_inter_token:llama3.2:3b", 0.05)
+        stats = monitor.get_operation_stats()["ollama_inter_token:llama3.2:3b"]
+        assert stats.count == 2
+
 
 class TestGlobalFunctions:
     """Test global performance monitoring functions."""
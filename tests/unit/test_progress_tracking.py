@@ -10,7 +10,14 @@ ProgressTracker, and StepTracker for accurate progress calculation and reporting
 
 from unittest.mock import MagicMock, patch
 
-from create_project.core.progress import DetailedProgress, ProgressTracker, StepTracker
+import pytest
+
+from create_project.core.progress import (
+    DetailedProgress,
+    ProgressBus,
+    ProgressTracker,
+    StepTracker,
+)
 
 
 class TestDetailedProgress:
@@ -122,6 +129,38 @@ class TestProgressTracker:
             assert progress.estimated_remaining is not None
             assert 25 <= progress.estimated_remaining <= 35
 
+    def test_expected_durations_set_weights(self):
+        """Test expected durations replace the fixed phase weights."""
+        tracker = ProgressTracker()
+        tracker.set_expected_durations({"validation": 1.0, "file_rendering": 3.0})
+
+        assert tracker.phase_weights["validation"] == 25.0
+        assert tracker.phase_weights["file_rendering"] == 75.0
+        assert tracker.phase_weights["venv_creation"] == 0.0
+
+        tracker.start_phase("validation")
+        tracker.complete_phase()
+        assert "validation" in tracker.phase_durations
+        assert tracker.get_overall_progress().percentage == 25
+
+    def test_expected_remaining_counts_down(self):
+        """Test remaining time follows expected durations within a phase."""
+        tracker = ProgressTracker()
+        tracker.set_expected_durations({"validation": 2.0, "venv_creation": 20.0})
+        tracker.start_time = 0
+        tracker.start_phase("validation")
+        tracker.phase_start_times["validation"] = 0
+        tracker.complete_phase()
+        tracker.start_phase("venv_creation")
+        tracker.phase_start_times["venv_creation"] = 2
+
+        with patch("create_project.core.progress.time.time", return_value=12):
+            progress = tracker.get_overall_progress()
+
+        # Halfway through a phase that reports no progress of its own
+        assert progress.estimated_remaining == pytest.approx(10.0)
+        assert progress.percentage == 54
+
     def test_progress_callback(self):
         """Test progress callback functionality."""
         callback = MagicMock()
@@ -203,6 +242,109 @@ class TestStepTracker:
         assert tracker.get_progress() == 1.0  # Uses max(1, total_items)
 
 
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestProgressBus:
+    """Test ProgressBus coalescing."""
+
+    def test_coalesces_to_max_rate(self):
+        """Test updates within the interval are replaced by the latest."""
+        clock = FakeClock()
+        bus = ProgressBus(max_rate=10, clock=clock)
+        delivered = []
+        bus.subscribe(delivered.append)
+
+        assert bus.publish(1) is True
+        assert bus.publish(2) is False
+        assert bus.publish(3) is False
+        clock.now = 0.1
+        assert bus.publish(4) is True
+
+        assert delivered == [1, 4]
+        assert bus.stats() == {"published": 4, "delivered": 2, "coalesced": 2}
+
+    def test_flush_delivers_latest(self):
+        """Test flushing delivers the final coalesced event once."""
+        bus = ProgressBus(max_rate=10, clock=FakeClock())
+        delivered = []
+        bus.subscribe(delivered.append)
+
+        bus.publish("start")
+        bus.publish("middle")
+        bus.publish("last")
+        bus.flush()
+        bus.flush()
+
+        assert delivered == ["start", "last"]
+
+    def test_force_and_transitions(self):
+        """Test forced events and transition key changes bypass the limit."""
+        bus = ProgressBus(max_rate=1, clock=FakeClock(), transition_key=lambda e: e[0])
+        delivered = []
+        bus.subscribe(delivered.append)
+
+        bus.publish(("a", 1))
+        bus.publish(("a", 2))
+        bus.publish(("b", 1))
+        bus.publish(("b", 2), force=True)
+        bus.publish(("b", 3))
+
+        assert delivered == [("a", 1), ("b", 1), ("b", 2)]
+
+    def test_history_is_bounded(self):
+        """Test only the most recent events are kept."""
+        bus = ProgressBus(history_size=3)
+
+        for i in range(10):
+            bus.publish(i)
+
+        assert bus.recent() == [7, 8, 9]
+
+    def test_subscriber_errors_propagate(self):
+        """Test subscriber exceptions reach the publisher."""
+        bus = ProgressBus()
+
+        def cancel(event):
+            raise RuntimeError("cancelled")
+
+        bus.subscribe(cancel)
+        with pytest.raises(RuntimeError):
+            bus.publish(1)
+
+        bus.unsubscribe(cancel)
+        bus.publish(2)
+
+    def test_step_tracker_cost_is_flat(self):
+        """Test thousands of files produce a bounded number of deliveries."""
+        clock = FakeClock()
+        bus = ProgressBus(
+            max_rate=20,
+            clock=clock,
+            transition_key=lambda p: (p.phase, p.current_step),
+        )
+        delivered = []
+        bus.subscribe(delivered.append)
+        tracker = ProgressTracker(progress_callback=bus.publish)
+
+        tracker.start_phase("file_rendering")
+        steps = StepTracker(5000, "file_rendering", tracker)
+        for i in range(5000):
+            clock.now = i * 0.0001  # 0.5 seconds in total
+            steps.complete_item(f"file{i}.py")
+        tracker.complete_phase()
+
+        assert len(delivered) <= 15
+        assert delivered[-1].message == "Completed File Rendering"
+
+
 class TestIntegration:
     """Test integration between progress tracking components."""
 
@@ -0,0 +1,93 @@
+# ABOUTME: Unit tests for the log-linear latency histogram
+# ABOUTME: Tests bucketing accuracy, percentiles, merging and cumulative buckets
+
+"""Unit tests for histogram module."""
+
+import random
+
+import pytest
+
+from create_project.utils.histogram import LatencyHistogram
+
+
+class TestLatencyHistogram:
+    """Test the LatencyHistogram class."""
+
+    def test_empty(self):
+        """Test an empty histogram reports zeros."""
+        hist = LatencyHistogram()
+
+        assert hist.percentile(99) == 0.0
+        assert hist.summary()["count"] == 0
+        assert hist.summary()["mean"] == 0.0
+
+    @pytest.mark.parametrize("value", [2e-6, 0.00137, 0.25, 1.0, 3.7, 900.0])
+    def test_relative_error(self, value):
+        """Test a single value is reported within one sub-bucket."""
+        hist = LatencyHistogram()
+        hist.record(value)
+        hist.record(value * 10)
+
+        assert hist.percentile(50) == pytest.approx(
+            value, rel=1 / LatencyHistogram.SUB_BUCKETS
+        )
+        assert hist.percentile(50) >= value
+
+    def test_percentiles_match_sorted_values(self):
+        """Test percentiles track exact ones on a skewed distribution."""
+        rng = random.Random(7)
+        values = [rng.lognormvariate(-4, 1.5) for _ in range(5000)]
+        hist = LatencyHistogram()
+        for value in values:
+            hist.record(value)
+
+        ordered = sorted(values)
+        for percent in (50, 90, 99):
+            exact = ordered[int(len(ordered) * percent / 100) - 1]
+            assert hist.percentile(percent) == pytest.approx(exact, rel=0.1)
+        assert hist.percentile(100) == hist.max == ordered[-1]
+        assert hist.min == ordered[0]
+        assert hist.total == pytest.approx(sum(values))
+
+    def test_out_of_range_values(self):
+        """Test tiny, negative and huge durations are clamped to the range."""
+        hist = LatencyHistogram()
+        for value in (-1.0, 0.0, 1e-9, 1e6):
+            hist.record(value)
+
+        assert hist.count == 4
+        assert hist.max == 1e6
+        assert hist.percentile(100) == 1e6
+        assert list(hist.cumulative_buckets())[-1][1] == 3
+        assert hist.percentile(25) < 2.0 ** (LatencyHistogram.MIN_EXPONENT + 1)
+
+    def test_merge_copy_and_reset(self):
+        """Test histograms combine and copies are independent."""
+        first = LatencyHistogram()
+        second = LatencyHistogram()
+        first.record(0.01)
+        second.record(1.0)
+
+        merged = first.copy()
+        merged.merge(second)
+        first.reset()
+
+        assert merged.count == 2
+        assert merged.min == 0.01
+        assert merged.max == 1.0
+        assert first.count == 0
+
+    def test_cumulative_buckets(self):
+        """Test exported buckets are fixed, increasing and cumulative."""
+        hist = LatencyHistogram()
+        for value in (0.001, 0.001, 0.1, 2.0):
+            hist.record(value)
+
+        buckets = list(hist.cumulative_buckets())
+        bounds = [bound for bound, _ in buckets]
+
+        assert bounds == sorted(bounds)
+        assert len(buckets) == LatencyHistogram.MAX_EXPONENT - LatencyHistogram.MIN_EXPONENT
+        assert dict(buckets)[2.0 ** -9] == 2
+        assert dict(buckets)[0.125] == 3
+        assert buckets[-1][1] == 4
@@ -7,12 +7,14 @@ import gc
 import os
 import threading
 import time
+import tracemalloc
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
 from create_project.utils.performance import (
     MemorySnapshot,
+    MonitoringTier,
     OperationMetrics,
     PerformanceMonitor,
     PerformanceReport,
@@ -570,6 +572,171 @@ class TestPerformanceMonitor:
                     assert len(operation_logs) == 1
 
 
+class TestMonitoringTiers:
+    """Test monitoring overhead tiers."""
+
+    def test_counters_tier(self):
+        """Test the counters tier records call counts without snapshots."""
+        monitor = PerformanceMonitor(enabled=True, tier="counters")
+
+        with patch.object(monitor, "take_memory_snapshot") as mock_snapshot:
+            for _ in range(3):
+                with monitor.measure_operation("render"):
+                    pass
+            with pytest.raises(ValueError):
+                with monitor.measure_operation("render"):
+                    raise ValueError("bad")
+
+        mock_snapshot.assert_not_called()
+        assert monitor.operations == []
+        stats = monitor.get_operation_stats()["render"]
+        assert stats.count == 4
+        assert stats.failures == 1
+        assert stats.max_duration >= stats.mean_duration > 0
+
+    def test_sampled_tier(self):
+        """Test the sampled tier takes full metrics for 1 in N calls."""
+        monitor = PerformanceMonitor(
+            enabled=True, tier=MonitoringTier.SAMPLED, sample_rate=3
+        )
+
+        for _ in range(7):
+            with monitor.measure_operation("render"):
+                pass
+
+        assert len(monitor.operations) == 3
+        assert monitor.get_operation_stats()["render"].count == 7
+        assert monitor.generate_report().operation_stats["render"].count == 7
+
+        monitor.reset()
+        assert monitor.get_operation_stats() == {}
+
+    def test_global_monitor_is_sampled(self):
+        """Test the global monitor defaults to the sampled tier."""
+        import create_project.utils.performance as perf_module
+        perf_module._global_monitor = None
+
+        assert get_monitor().tier is MonitoringTier.SAMPLED
+        enable_monitoring(MonitoringTier.FULL)
+        assert get_monitor().tier is MonitoringTier.FULL
+        perf_module._global_monitor = None
+
+
+class TestLatencyExport:
+    """Test latency histograms and OpenMetrics export."""
+
+    def test_latency_summary(self):
+        """Test every call feeds the operation's histogram."""
+        monitor = PerformanceMonitor(enabled=True, tier=MonitoringTier.COUNTERS)
+        for _ in range(5):
+            with monitor.measure_operation("render"):
+                pass
+
+        summary = monitor.get_latency_summary()["render"]
+        assert summary["count"] == 5
+        assert summary["failures"] == 0
+        assert 0 < summary["p50"] <= summary["p99"] <= summary["max"]
+        assert monitor.generate_report().latency["render"]["count"] == 5
+
+    def test_operations_are_bounded(self):
+        """Test only the most recent full measurements are kept."""
+        monitor = PerformanceMonitor(enabled=True, max_operations=2)
+        with patch.object(monitor, "take_memory_snapshot") as mock_snapshot:
+            mock_snapshot.return_value = Mock(spec=MemorySnapshot, rss_mb=100.0)
+            for name in ("a", "b", "c"):
+                with monitor.measure_operation(name):
+                    pass
+
+        assert [op.operation_name for op in monitor.operations] == ["b", "c"]
+        assert monitor.get_latency_summary()["a"]["count"] == 1
+
+    def test_openmetrics(self, tmp_path):
+        """Test the OpenMetrics exposition for one operation."""
+        monitor = PerformanceMonitor(enabled=True, tier=MonitoringTier.COUNTERS)
+        with monitor.measure_operation('say "hi"'):
+            pass
+        with pytest.raises(RuntimeError):
+            with monitor.measure_operation('say "hi"'):
+                raise RuntimeError("boom")
+
+        text = monitor.to_openmetrics()
+        lines = text.splitlines()
+
+        assert lines[0] == "# TYPE create_project_operation_duration_seconds histogram"
+        assert lines[-1] == "# EOF"
+        label = 'operation="say \\"hi\\""'
+        assert f'create_project_operation_duration_seconds_bucket{{{label},le="+Inf"}} 2' in lines
+        assert f"create_project_operation_duration_seconds_count{{{label}}} 2" in lines
+        assert f'create_project_operation_latency_seconds{{{label},quantile="0.99"}}' in text
+        assert f"create_project_operation_failures_total{{{label}}} 1" in lines
+
+        path = monitor.write_openmetrics(tmp_path / "metrics.prom")
+        assert path.read_text(encoding="utf-8") == text
+
+
+def allocate_blocks(count):
+    """Allocate ``count`` 4 KB buffers."""
+    return [bytearray(4096) for _ in range(count)]
+
+
+class TestAllocationTracing:
+    """Test per-operation tracemalloc allocation sites."""
+
+    @pytest.fixture
+    def monitor(self):
+        """Monitor with allocation tracing, stopped after the test."""
+        monitor = PerformanceMonitor(
+            enabled=True, trace_allocations=True, allocation_top_n=3, traceback_depth=4
+        )
+        yield monitor
+        monitor.stop_allocation_tracing()
+
+    def test_top_site_is_recorded(self, monitor):
+        """Test the largest allocation site is attributed with its traceback."""
+        with monitor.measure_operation("build"):
+            data = allocate_blocks(200)
+
+        sites = monitor.operations[0].allocations
+        assert 0 < len(sites) <= 3
+        top = sites[0]
+        assert top.filename == __file__
+        assert top.size_diff >= 200 * 4096
+        assert top.count_diff >= 200
+        assert top.location == top.traceback[-1]
+        assert 1 < len(top.traceback) <= 4
+        assert not any("utils/performance.py" in site.location for site in sites)
+        del data
+
+    def test_disabled_by_default(self):
+        """Test operations carry no allocation sites unless opted in."""
+        monitor = PerformanceMonitor(enabled=True)
+        with monitor.measure_operation("build"):
+            allocate_blocks(10)
+
+        assert monitor.operations[0].allocations == []
+        assert not tracemalloc.is_tracing()
+
+    def test_only_fully_measured_calls(self, monitor):
+        """Test counter-only calls skip the snapshots."""
+        monitor.tier = MonitoringTier.COUNTERS
+        with patch.object(tracemalloc, "take_snapshot") as mock_snapshot:
+            with monitor.measure_operation("build"):
+                allocate_blocks(10)
+
+        mock_snapshot.assert_not_called()
+
+    def test_stop_leaves_foreign_tracing_running(self):
+        """Test tracemalloc started elsewhere is not stopped by the monitor."""
+        tracemalloc.start()
+        try:
+            monitor = PerformanceMonitor(enabled=True, trace_allocations=True)
+            monitor.stop_allocation_tracing()
+            assert tracemalloc.is_tracing()
+            assert not monitor.trace_allocations
+        finally:
+            tracemalloc.stop()
+
+
 class TestGlobalFunctions:
     """Test global performance monitoring functions."""
 
@@ -0,0 +1,180 @@
+# ABOUTME: Unit tests for the tracing utilities
+# ABOUTME: Tests span nesting, thread propagation, decorators and Chrome trace export
+
+"""Unit tests for tracing module."""
+
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from create_project.core.scheduler import OperationScheduler
+from create_project.utils.tracing import (
+    Tracer,
+    current_span,
+    get_tracer,
+    propagate,
+    set_tracer,
+    span,
+    traced,
+)
+
+
+@pytest.fixture
+def tracer():
+    """Install an enabled global tracer for one test."""
+    tracer = Tracer(enabled=True)
+    set_tracer(tracer)
+    yield tracer
+    set_tracer(None)
+
+
+def by_name(tracer):
+    """Map span names to the recorded spans."""
+    return {s.name: s for s in tracer.spans()}
+
+
+class TestTracer:
+    """Test the Tracer class."""
+
+    def test_disabled_records_nothing(self):
+        """Test spans are no-ops while tracing is disabled."""
+        tracer = Tracer()
+
+        with tracer.span("work") as opened:
+            assert opened is None
+
+        assert tracer.spans() == []
+
+    def test_nested_spans(self, tracer):
+        """Test spans nest under the span that was open when they started."""
+        with span("outer", "test", size=3) as outer:
+            assert current_span() is outer
+            with span("inner", "test"):
+                pass
+        assert current_span() is None
+
+        spans = by_name(tracer)
+        assert spans["inner"].parent_id == spans["outer"].span_id
+        assert spans["outer"].parent_id is None
+        assert spans["outer"].args == {"size": 3}
+        assert spans["outer"].duration >= spans["inner"].duration
+
+    def test_error_is_recorded(self, tracer):
+        """Test a failing block marks its span and re-raises."""
+        with pytest.raises(ValueError):
+            with span("broken"):
+                raise ValueError("bad input")
+
+        assert by_name(tracer)["broken"].error == "ValueError: bad input"
+
+    def test_max_spans(self):
+        """Test the buffer keeps only the most recent spans."""
+        tracer = Tracer(enabled=True, max_spans=2)
+        for name in "abc":
+            with tracer.span(name):
+                pass
+
+        assert [s.name for s in tracer.spans()] == ["b", "c"]
+        assert tracer.dropped == 1
+
+    def test_propagate_across_threads(self, tracer):
+        """Test work submitted to other threads keeps its parent span."""
+        def child():
+            with span("child"):
+                pass
+
+        with span("parent"):
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                executor.submit(propagate(child)).result()
+            thread = threading.Thread(target=child)
+            thread.start()
+            thread.join()
+
+        children = [s for s in tracer.spans() if s.name == "child"]
+        assert children[0].parent_id == by_name(tracer)["parent"].span_id
+        assert children[1].parent_id is None
+
+    def test_scheduler_propagates_context(self, tracer):
+        """Test scheduled tasks run under the scheduling span."""
+        scheduler = OperationScheduler(max_workers=1)
+        try:
+            with span("submit"):
+                scheduler.schedule(self._traced_task).result(timeout=5)
+        finally:
+            scheduler.shutdown()
+
+        spans = by_name(tracer)
+        assert spans["task"].parent_id == spans["submit"].span_id
+
+    @staticmethod
+    @traced("task")
+    def _traced_task():
+        return None
+
+
+class TestTraced:
+    """Test the traced decorator."""
+
+    def test_sync_function(self, tracer):
+        """Test calls become spans with captured arguments."""
+        @traced("render", "render", capture=("path",))
+        def render(path, content=""):
+            return len(content)
+
+        assert render("a.py", content="xyz") == 3
+        assert by_name(tracer)["render"].args == {"path": "a.py"}
+
+    def test_async_function(self, tracer):
+        """Test coroutine calls are timed until they finish."""
+        @traced(category="ai")
+        async def request():
+            await asyncio.sleep(0.01)
+            return "ok"
+
+        assert asyncio.run(request()) == "ok"
+        recorded = tracer.spans()[0]
+        assert recorded.name.endswith("request")
+        assert recorded.duration >= 0.01
+
+    def test_disabled_calls_through(self):
+        """Test decorated functions work with the default disabled tracer."""
+        set_tracer(None)
+
+        @traced("noop")
+        def add(a, b):
+            return a + b
+
+        assert add(1, 2) == 3
+        assert get_tracer().spans() == []
+
+
+class TestChromeTrace:
+    """Test Chrome trace-event export."""
+
+    def test_export(self, tracer, tmp_path):
+        """Test spans export as complete events with thread names and flows."""
+        def child():
+            with span("child", "render", path=tmp_path):
+                pass
+
+        with span("parent", "generator"):
+            thread = threading.Thread(target=propagate(child), name="render-1")
+            thread.start()
+            thread.join()
+
+        path = tracer.export(tmp_path / "trace.json")
+        events = json.loads(path.read_text())["traceEvents"]
+
+        complete = {e["name"]: e for e in events if e["ph"] == "X"}
+        assert set(complete) == {"parent", "child"}
+        assert complete["child"]["args"] == {"path": str(tmp_path)}
+        assert complete["child"]["ts"] >= complete["parent"]["ts"]
+        assert complete["parent"]["dur"] >= complete["child"]["dur"]
+
+        thread_names = {e["args"]["name"] for e in events if e["name"] == "thread_name"}
+        assert "render-1" in thread_names
+        flows = [e for e in events if e.get("cat") == "flow"]
+        assert sorted(e["ph"] for e in flows) == ["f", "s"]